@@ -7,7 +7,9 @@ from modules.config import init_config
 from modules.styles import load_css
 from modules.layout import create_sidebar, create_header, create_footer
 from modules.router import render_chapter
-from modules.utils import preload_data
+from modules.utils import preload_dataset_refs
+from modules.session_budget import track_session
+from modules.warmup import start_warmup
 
 # Set Snowflake configuration flag
 if 'use_snowflake' not in st.session_state:
@@ -65,6 +67,12 @@ try:
     # Initialize app configuration and session state
     init_config()
 
+    # Keep this session within its memory budget and evict idle sessions
+    track_session()
+
+    # Warm the remaining chapters in the background (once per process)
+    start_warmup()
+
     # Load CSS styles
     load_css()
     
@@ -91,7 +99,8 @@ try:
         # Get datasets for the current chapter and preload them
         datasets_to_load = chapter_datasets.get(current_chapter, []) + ['state']  # Always load state data
         if datasets_to_load:
-            st.session_state['preloaded_data'] = preload_data(datasets_to_load)
+            # Only references go into session state; the frames stay in the shared cache
+            st.session_state['preloaded_data'] = preload_dataset_refs(datasets_to_load)
             st.session_state.data_loaded = True
 
     # Create a loading state for better user experience
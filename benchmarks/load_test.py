@@ -0,0 +1,374 @@
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import numpy as np
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Run from the repository root so the app's relative data paths resolve
+ROOT = Path(__file__).resolve().parent.parent
+os.chdir(ROOT)
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+from modules.router import CHAPTER_LIST
+from modules.local_backend import LocalBackend
+from modules.snowflake_connector import set_backend
+from modules.session_budget import estimate_size
+from modules.warmup import run_warmup, set_first_session_warmup
+
+# Data sources the simulated viewers can read from; only the backend takes the simulated latency and failures
+LOAD_TEST_SOURCES = ["local", "sqlite"]
+
+# Widgets that belong to the app shell rather than to a chapter
+SHELL_WIDGET_KEYS = {"navigation", "favorite_btn", "prev_chapter_btn", "next_chapter_btn"}
+
+# Class counting cache hits and misses of every st.cache_data / st.cache_resource function
+class CacheCounter:
+    """Count hits and misses per cached function by wrapping Streamlit's cache handlers"""
+
+    def __init__(self):
+        self.stats = {}
+        self._lock = threading.Lock()
+        self.available = False
+
+    def install(self):
+        try:
+            from streamlit.runtime.caching.cache_utils import CachedFunc
+        except ImportError:
+            return self
+        if not (hasattr(CachedFunc, '_handle_cache_hit') and hasattr(CachedFunc, '_handle_cache_miss')):
+            # Internal API of the installed Streamlit version differs; report no cache stats
+            return self
+
+        counter = self
+        original_hit = CachedFunc._handle_cache_hit
+        original_miss = CachedFunc._handle_cache_miss
+
+        def handle_hit(func_self, *args, **kwargs):
+            counter._record(func_self, 'hits')
+            return original_hit(func_self, *args, **kwargs)
+
+        def handle_miss(func_self, *args, **kwargs):
+            counter._record(func_self, 'misses')
+            return original_miss(func_self, *args, **kwargs)
+
+        CachedFunc._handle_cache_hit = handle_hit
+        CachedFunc._handle_cache_miss = handle_miss
+        self.available = True
+        return self
+
+    def _record(self, cached_func, outcome):
+        func = getattr(getattr(cached_func, '_info', None), 'func', None)
+        name = getattr(func, '__qualname__', repr(func))
+        module = getattr(func, '__module__', '')
+        key = f"{module}.{name}" if module else name
+        with self._lock:
+            entry = self.stats.setdefault(key, {'hits': 0, 'misses': 0})
+            entry[outcome] += 1
+
+    def summary(self):
+        with self._lock:
+            rows = [
+                {'function': key, 'hits': s['hits'], 'misses': s['misses'],
+                 'hit_rate': round(s['hits'] / (s['hits'] + s['misses']), 3)}
+                for key, s in self.stats.items()
+            ]
+        return sorted(rows, key=lambda row: row['hits'] + row['misses'], reverse=True)
+
+# Function to let AppTest sessions run side by side
+def share_test_runtime():
+    """
+    Keep a Runtime available to every concurrent AppTest run
+
+    AppTest installs a mock Runtime for each run and clears the global
+    instance when the run ends, which breaks runs still going in other
+    threads. Fall back to the most recent mock instead of failing.
+    """
+    from streamlit.runtime import Runtime
+    if getattr(Runtime, '_shared_for_load_test', False):
+        return
+    original = Runtime.instance.__func__
+    latest = {}
+
+    def instance(cls):
+        if cls._instance is not None:
+            latest['runtime'] = cls._instance
+            return cls._instance
+        if 'runtime' in latest:
+            return latest['runtime']
+        return original(cls)
+
+    Runtime.instance = classmethod(instance)
+    Runtime._shared_for_load_test = True
+
+# Helper function to read the resident set size of this process
+def _rss_bytes():
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    import resource
+    # ru_maxrss is the peak in KB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+# Helper function to estimate the memory held by one session's state
+def _session_state_bytes(at):
+    return sum(estimate_size(value) for value in at.session_state.to_dict().values())
+
+# Helper function to list the chapter widgets a viewer can interact with
+def _chapter_filters(at):
+    widgets = []
+    for widget in list(at.selectbox) + list(at.radio) + list(at.multiselect):
+        if getattr(widget, 'key', None) in SHELL_WIDGET_KEYS or not widget.options:
+            continue
+        widgets.append(widget)
+    return widgets
+
+# Class simulating one viewer clicking through the app
+class SimulatedSession:
+    """
+    One AppTest session that navigates chapters and changes chapter filters
+
+    Navigation uses the Next/Previous buttons, i.e. the navigate_to flow in
+    modules/router.py, so every step is a real rerun of app.py.
+    """
+
+    def __init__(self, index, seed, filter_probability, timeout, use_snowflake=False):
+        self.index = index
+        self.rng = random.Random(seed + index)
+        self.filter_probability = filter_probability
+        self.at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=timeout)
+        # Set before the first run so app.py keeps it instead of defaulting to the warehouse
+        self.at.session_state['use_snowflake'] = use_snowflake
+        self.latencies = []
+        self.actions = {'navigate': 0, 'filter': 0}
+        self.errors = []
+
+    def _timed(self, action, step):
+        started = time.perf_counter()
+        try:
+            step()
+        except Exception as e:
+            self.errors.append(f"{action}: {str(e)[:200]}")
+            return
+        self.latencies.append((action, time.perf_counter() - started))
+        self.errors.extend(f"{action}: {e.value[:200]}" for e in self.at.exception)
+
+    def _navigate(self):
+        buttons = {button.key: button for button in self.at.button}
+        if "next_chapter_btn" in buttons:
+            self._timed('navigate', lambda: buttons["next_chapter_btn"].click().run())
+        else:
+            # Last chapter: jump back to the start through the sidebar
+            self._timed('navigate', lambda: self.at.radio(key="navigation").set_value(CHAPTER_LIST[0]).run())
+        self.actions['navigate'] += 1
+
+    def _change_filter(self):
+        filters = _chapter_filters(self.at)
+        if not filters:
+            return self._navigate()
+        widget = self.rng.choice(filters)
+        options = list(widget.options)
+        if widget.type == "multiselect":
+            value = self.rng.sample(options, k=self.rng.randint(1, min(3, len(options))))
+        else:
+            value = self.rng.choice(options)
+        self._timed('filter', lambda: widget.set_value(value).run())
+        self.actions['filter'] += 1
+
+    def run(self, steps):
+        self._timed('initial', self.at.run)
+        for _ in range(steps):
+            if self.rng.random() < self.filter_probability:
+                self._change_filter()
+            else:
+                self._navigate()
+        return self
+
+# Helper function to summarize a list of latencies in milliseconds
+def _percentiles(values):
+    if not values:
+        return {'count': 0}
+    ms = np.asarray(values) * 1000
+    return {
+        'count': len(values),
+        'mean_ms': round(float(ms.mean()), 1),
+        'p50_ms': round(float(np.percentile(ms, 50)), 1),
+        'p95_ms': round(float(np.percentile(ms, 95)), 1),
+        'p99_ms': round(float(np.percentile(ms, 99)), 1),
+        'max_ms': round(float(ms.max()), 1)
+    }
+
+# Function to run the load test
+def run_load_test(sessions=8, steps=20, concurrency=None, filter_probability=0.4,
+                  source="local", latency=0.0, jitter=0.0, failure_rate=0.0, seed=42, timeout=120, warm=False):
+    """
+    Drive concurrent simulated sessions through app.py and collect metrics
+
+    Args:
+        sessions (int): Number of simulated viewers
+        steps (int): Interactions per viewer after the first page load
+        concurrency (int): Sessions running at the same time (default: all)
+        filter_probability (float): Chance that a step changes a filter instead of navigating
+        source (str): 'local' for the CSV/bundle path, 'sqlite' for the local warehouse backend
+        latency (float): Seconds added to each backend call
+        jitter (float): Up to this many extra seconds per backend call
+        failure_rate (float): Share of backend calls that fail
+        seed (int): Seed for the simulated viewers' choices
+        timeout (int): Seconds before a single rerun is considered hung
+        warm (bool): Run the cache warm-up before the first viewer arrives
+
+    Returns:
+        dict: Latency percentiles, memory and cache statistics
+
+    Raises:
+        ValueError: For an unknown source, or simulated latency/failures with the local source
+    """
+    if source not in LOAD_TEST_SOURCES:
+        raise ValueError(f"Unknown source {source!r}, expected one of {LOAD_TEST_SOURCES}")
+    if source == "local" and (latency or jitter or failure_rate):
+        raise ValueError("latency, jitter and failure_rate only apply to the 'sqlite' source")
+
+    backend = None
+    if source == "sqlite":
+        backend = LocalBackend(ROOT / "data", latency=latency, jitter=jitter, failure_rate=failure_rate, seed=seed)
+        set_backend(backend)
+
+    share_test_runtime()
+    # Viewers hit a cold process unless the warm-up ran first; never warm in the background mid-run
+    set_first_session_warmup(False)
+    if warm:
+        # Warm the data version the sessions will read
+        previous = st.session_state.get('use_snowflake', True)
+        st.session_state['use_snowflake'] = source == "sqlite"
+        try:
+            run_warmup()
+        finally:
+            st.session_state['use_snowflake'] = previous
+    counter = CacheCounter().install()
+    rss_before = _rss_bytes()
+    started = time.perf_counter()
+
+    def simulate(index):
+        # Local sessions read the CSV files/bundle and never reach a warehouse
+        return SimulatedSession(index, seed, filter_probability, timeout, use_snowflake=source == "sqlite").run(steps)
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency or sessions) as pool:
+            results = list(pool.map(simulate, range(sessions)))
+    finally:
+        if backend is not None:
+            set_backend(None)
+
+    elapsed = time.perf_counter() - started
+    rss_after = _rss_bytes()
+
+    latencies = [latency for result in results for latency in result.latencies]
+    by_action = {}
+    for action, value in latencies:
+        by_action.setdefault(action, []).append(value)
+    state_bytes = [_session_state_bytes(result.at) for result in results]
+
+    return {
+        'config': {
+            'sessions': sessions, 'steps': steps, 'concurrency': concurrency or sessions,
+            'filter_probability': filter_probability, 'source': source,
+            'latency_s': latency, 'jitter_s': jitter, 'failure_rate': failure_rate, 'seed': seed,
+            'warm': warm
+        },
+        'elapsed_s': round(elapsed, 2),
+        'reruns_per_s': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'rerun_latency': _percentiles([value for _, value in latencies]),
+        'latency_by_action': {action: _percentiles(values) for action, values in by_action.items()},
+        'memory': {
+            'rss_before_mb': round(rss_before / 2**20, 1),
+            'rss_after_mb': round(rss_after / 2**20, 1),
+            'rss_per_session_mb': round((rss_after - rss_before) / 2**20 / sessions, 2),
+            'session_state_mean_kb': round(float(np.mean(state_bytes)) / 1024, 1),
+            'session_state_max_kb': round(float(np.max(state_bytes)) / 1024, 1)
+        },
+        'cache': counter.summary() if counter.available else None,
+        'backend': backend.stats() if backend else None,
+        'errors': [error for result in results for error in result.errors][:50]
+    }
+
+# Function to print a load test report
+def print_report(report):
+    """Print the headline numbers of a run_load_test() report"""
+    config = report['config']
+    print(f"🚀 {config['sessions']} sessions x {config['steps']} steps "
+          f"(concurrency {config['concurrency']}, source {config['source']}{', warmed' if config.get('warm') else ''})")
+    print(f"   {report['elapsed_s']}s total, {report['reruns_per_s']} reruns/s")
+
+    print("\nRerun latency (ms)")
+    for action, stats in [('all', report['rerun_latency'])] + sorted(report['latency_by_action'].items()):
+        if stats['count']:
+            print(f"   {action:<10} n={stats['count']:<5} p50={stats['p50_ms']:<8} "
+                  f"p95={stats['p95_ms']:<8} p99={stats['p99_ms']:<8} max={stats['max_ms']}")
+
+    memory = report['memory']
+    print("\nMemory")
+    print(f"   RSS {memory['rss_before_mb']} MB -> {memory['rss_after_mb']} MB "
+          f"({memory['rss_per_session_mb']} MB per session)")
+    print(f"   Session state: mean {memory['session_state_mean_kb']} KB, max {memory['session_state_max_kb']} KB")
+
+    if report['cache']:
+        print("\nCache hit rates")
+        for row in report['cache'][:15]:
+            print(f"   {row['hit_rate']:>6.1%}  {row['hits']:>6} hits {row['misses']:>5} misses  {row['function']}")
+    else:
+        print("\nCache hit rates unavailable for this Streamlit version")
+
+    if report['backend'] is not None:
+        backend = report['backend']
+        print(f"\nLocal backend: {backend['queries']} queries, {backend['image_lookups']} image lookups, "
+              f"{backend['failures']} injected failures, {backend['latency_s']}s simulated latency")
+
+    if report['errors']:
+        print(f"\n❌ {len(report['errors'])} errors (first 5):")
+        for error in report['errors'][:5]:
+            print(f"   {error}")
+
+def main():
+    """Command-line entry point: python -m benchmarks.load_test"""
+    parser = argparse.ArgumentParser(description="Simulate concurrent viewers of the Streamlit app")
+    parser.add_argument("--sessions", type=int, default=8, help="Number of simulated viewers")
+    parser.add_argument("--steps", type=int, default=20, help="Interactions per viewer")
+    parser.add_argument("--concurrency", type=int, default=None, help="Viewers active at once (default: all)")
+    parser.add_argument("--filter-probability", type=float, default=0.4, help="Share of steps that change a filter")
+    parser.add_argument("--source", choices=LOAD_TEST_SOURCES, default="local",
+                        help="Data source: local CSV/bundle or the local SQLite warehouse backend")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to each backend call (--source sqlite)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra seconds per backend call (--source sqlite)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="Share of backend calls that fail (--source sqlite)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--warm", action="store_true", help="Warm the caches before the first viewer, like warm_up.py --serve")
+    parser.add_argument("--output", help="Write the full report as JSON to this file")
+    args = parser.parse_args()
+    if args.source == "local" and (args.latency or args.jitter or args.failure_rate):
+        parser.error("--latency, --jitter and --failure-rate only apply to --source sqlite")
+
+    report = run_load_test(
+        sessions=args.sessions, steps=args.steps, concurrency=args.concurrency,
+        filter_probability=args.filter_probability, source=args.source,
+        latency=args.latency, jitter=args.jitter, failure_rate=args.failure_rate, seed=args.seed,
+        warm=args.warm
+    )
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\n✅ Report written to {args.output}")
+
+if __name__ == "__main__":
+    main()
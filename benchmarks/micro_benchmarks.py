@@ -0,0 +1,488 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import tempfile
+import subprocess
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+# Run from the repository root so the app's relative data paths resolve
+ROOT = Path(__file__).resolve().parent.parent
+os.chdir(ROOT)
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import streamlit as st
+from modules import utils
+from modules.column_schema import COMPILED_SCHEMAS, to_snowflake_columns
+from modules.router import CHAPTER_LIST
+
+# Bump when the result layout changes so old baselines are not compared
+RESULTS_FORMAT_VERSION = 1
+
+# Default scale factors relative to the bundled CSVs
+DEFAULT_SCALES = [1, 10, 100, 1000]
+
+# Benchmark groups that can be selected on the command line
+BENCHMARK_GROUPS = ['loaders', 'map_columns', 'preload', 'transforms', 'figures']
+
+# Loader function of every dataset
+LOADERS = {
+    'linguistic': utils.load_linguistic_data,
+    'religious': utils.load_religious_data,
+    'state': utils.load_state_data,
+    'cultural': utils.load_cultural_data,
+    'population': utils.load_population_data,
+    'economic': utils.load_economic_data,
+    'historical': utils.load_historical_data,
+    'festivals': utils.load_festivals_data,
+    'tourism': utils.load_tourism_data,
+    'education': utils.load_education_data,
+    'geography': utils.load_geography_data
+}
+
+# Columns holding a year; these are copied as they are instead of jittered
+_YEAR_COLUMNS = {'Year', 'Start Year', 'End Year', 'Year Established', 'Year Built'}
+
+# Helper function to scale one CSV table to factor times its rows
+def scale_frame(df, factor, rng):
+    """
+    Repeat a table factor times with realistic variation
+
+    Numeric columns are jittered by up to 5% and the first (identifying)
+    column gets a copy suffix, so the scaled table keeps the shape and the
+    value distribution of the original without exact duplicates.
+    """
+    if factor <= 1 or df.empty:
+        return df.copy()
+    scaled = df.iloc[np.tile(np.arange(len(df)), factor)].reset_index(drop=True)
+    copy_number = np.repeat(np.arange(factor), len(df))
+
+    for col in scaled.columns:
+        if col in _YEAR_COLUMNS or not pd.api.types.is_numeric_dtype(scaled[col]):
+            continue
+        noise = rng.uniform(0.95, 1.05, len(scaled))
+        values = scaled[col] * noise
+        scaled[col] = values.round().astype(scaled[col].dtype) if pd.api.types.is_integer_dtype(scaled[col]) else values
+
+    key = scaled.columns[0]
+    if scaled[key].dtype == object:
+        suffix = np.where(copy_number > 0, " #" + copy_number.astype(str), "")
+        scaled[key] = scaled[key].astype(str) + suffix
+    return scaled
+
+# Function to build a workspace whose data directory holds scaled copies of the CSVs
+def build_scaled_workspace(factor, seed=42, parent=None):
+    """
+    Create a directory that looks like the repository with scaled data
+
+    data/ holds every dataset CSV scaled by factor; images and the rest of
+    the repository are linked in so the app runs unchanged from there.
+
+    Returns:
+        Path: The workspace directory
+    """
+    workspace = Path(tempfile.mkdtemp(prefix=f"bench-x{factor}-", dir=parent))
+    data_dir = workspace / "data"
+    data_dir.mkdir()
+    rng = np.random.default_rng(seed)
+
+    for schema in COMPILED_SCHEMAS.values():
+        source = ROOT / "data" / schema.csv
+        if not source.exists():
+            continue
+        df = utils.safe_read_csv(str(source))
+        if df is None:
+            continue
+        scale_frame(df, factor, rng).to_csv(data_dir / schema.csv, index=False)
+
+    if (ROOT / "data" / "images").exists():
+        os.symlink(ROOT / "data" / "images", data_dir / "images")
+    for entry in ["app.py", "modules", ".streamlit"]:
+        if (ROOT / entry).exists():
+            os.symlink(ROOT / entry, workspace / entry)
+    return workspace
+
+# Helper function to drop every in-process cache
+def _clear_process_caches():
+    st.cache_data.clear()
+    st.cache_resource.clear()
+
+# Helper function to drop the in-process caches and the on-disk dataset store
+def _clear_all_caches():
+    _clear_process_caches()
+    shutil.rmtree(".dataset_store", ignore_errors=True)
+
+# Function to time a callable
+def measure(func, repeat=5, setup=None):
+    """
+    Time func repeat times, calling setup (untimed) before each run
+
+    Returns:
+        dict: min/median/mean in milliseconds and the number of runs
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - started)
+    ms = np.asarray(times) * 1000
+    return {
+        'repeat': repeat,
+        'min_ms': round(float(ms.min()), 3),
+        'median_ms': round(float(np.median(ms)), 3),
+        'mean_ms': round(float(ms.mean()), 3)
+    }
+
+# Helper function to build one result row
+def _result(group, name, scale, state, timing, **extra):
+    return {'group': group, 'name': name, 'scale': scale, 'state': state, **timing, **extra}
+
+# Helper function to record a benchmark that could not run
+def _failure(group, name, scale, error):
+    print(f"❌ x{scale} {group} {name}: {str(error)[:200]}")
+    return {'group': group, 'name': name, 'scale': scale, 'state': 'error', 'error': str(error)[:200]}
+
+# Function to time every load_* function cold, from the disk store and warm
+def bench_loaders(scale, repeat):
+    """
+    cold: no process cache and no dataset store, so the CSV is parsed
+    disk: process caches cleared, served from the Arrow dataset store
+    warm: served from the process-wide handle
+    """
+    results = []
+    for name, loader in LOADERS.items():
+        try:
+            rows = len(loader())
+        except Exception as e:
+            results.append(_failure('loaders', f"load_{name}_data", scale, e))
+            continue
+        results.append(_result('loaders', f"load_{name}_data", scale, 'cold',
+                               measure(loader, repeat, setup=_clear_all_caches), rows=rows))
+        loader()
+        results.append(_result('loaders', f"load_{name}_data", scale, 'disk',
+                               measure(loader, repeat, setup=_clear_process_caches), rows=rows))
+        loader()
+        results.append(_result('loaders', f"load_{name}_data", scale, 'warm', measure(loader, repeat), rows=rows))
+    return results
+
+# Function to time map_columns in both directions
+def bench_map_columns(scale, repeat):
+    results = []
+    for name, loader in LOADERS.items():
+        try:
+            df = loader()
+        except Exception as e:
+            results.append(_failure('map_columns', name, scale, e))
+            continue
+        uploaded = to_snowflake_columns(df, name)
+        results.append(_result('map_columns', f"{name}:snowflake_to_app", scale, 'n/a',
+                               measure(lambda: utils.map_columns(uploaded, name), repeat), rows=len(df)))
+        results.append(_result('map_columns', f"{name}:app_to_snowflake", scale, 'n/a',
+                               measure(lambda: utils.map_columns(df, name, 'app_to_snowflake'), repeat), rows=len(df)))
+    return results
+
+# Function to time preload_data cold and warm
+def bench_preload(scale, repeat):
+    """Datasets whose loader raises are left out and reported as failures"""
+    results, datasets = [], []
+    for name, loader in LOADERS.items():
+        try:
+            loader()
+            datasets.append(name)
+        except Exception as e:
+            results.append(_failure('preload', f"preload_data:{name}", scale, e))
+    preload = lambda: utils.preload_data(datasets)
+    results.append(_result('preload', 'preload_data', scale, 'cold',
+                           measure(preload, repeat, setup=_clear_all_caches), datasets=len(datasets)))
+    results.append(_result('preload', 'preload_data', scale, 'warm', measure(preload, repeat), datasets=len(datasets)))
+    return results
+
+# Helper function to build an education frame whose list cells hold 10 x factor entries
+def _education_list_frame(factor):
+    df = utils.add_education_default_columns(pd.DataFrame(index=range(10)))
+    list_columns = [
+        'State Names', 'State Literacy Rates (%)', 'State Primary Enrollment (%)',
+        'State Secondary Enrollment (%)', 'State Higher Ed Enrollment (%)',
+        'Literacy Rate Years', 'Literacy Rate History'
+    ]
+    for col in list_columns:
+        df[col] = ", ".join([df[col].iloc[0]] * factor)
+    return df
+
+# Function to time the chapter transforms
+def bench_transforms(scale, repeat):
+    """Festival month extraction, tourism region mapping, education list parsing and the timeline index"""
+    from modules.chapters.festivals_india import add_festival_months
+    from modules.chapters.historical_timeline import TIMELINE_EVENTS, TimelineIndex, build_timeline_frame
+    from modules.chapters.education_landscape import parse_list_field
+    from modules.marts import find_tourism_region
+
+    results = []
+    try:
+        festivals = utils.load_festivals_data()
+        results.append(_result('transforms', 'festival_month_extraction', scale, 'n/a',
+                               measure(lambda: add_festival_months(festivals.copy()), repeat), rows=len(festivals)))
+    except Exception as e:
+        results.append(_failure('transforms', 'festival_month_extraction', scale, e))
+
+    try:
+        tourism = utils.load_tourism_data()
+        results.append(_result('transforms', 'tourism_region_mapping', scale, 'n/a',
+                               measure(lambda: tourism['State'].apply(find_tourism_region), repeat), rows=len(tourism)))
+    except Exception as e:
+        results.append(_failure('transforms', 'tourism_region_mapping', scale, e))
+
+    education = _education_list_frame(scale)
+
+    def parse_education():
+        row = education.iloc[0]
+        parse_list_field(row['State Names'])
+        for col in ['State Literacy Rates (%)', 'State Primary Enrollment (%)',
+                    'State Secondary Enrollment (%)', 'State Higher Ed Enrollment (%)', 'Literacy Rate History']:
+            parse_list_field(row[col], float)
+        parse_list_field(row['Literacy Rate Years'], int)
+
+    results.append(_result('transforms', 'education_string_parsing', scale, 'n/a',
+                           measure(parse_education, repeat), rows=10 * scale))
+
+    # Spread copies of the events over the timeline so ranges stay dense at every scale
+    rng = np.random.default_rng(0)
+    events = [dict(event, Year=int(year)) for event, year in
+              zip(TIMELINE_EVENTS * scale, rng.integers(-3000, 2024, len(TIMELINE_EVENTS) * scale))]
+    results.append(_result('transforms', 'timeline_index_build', scale, 'n/a',
+                           measure(lambda: TimelineIndex(build_timeline_frame(events), 'bench'), repeat), rows=len(events)))
+    timeline = TimelineIndex(build_timeline_frame(events), 'bench')
+    results.append(_result('transforms', 'timeline_window_query', scale, 'n/a',
+                           measure(lambda: timeline.window(1200, 1300), repeat), rows=len(events)))
+    results.append(_result('transforms', 'timeline_zoom_query', scale, 'n/a',
+                           measure(lambda: timeline.query(-3000, 2025), repeat), rows=len(events)))
+
+    try:
+        from modules.chapters.introduction import build_population_growth_figure
+        from modules.mpl_render import render_figure
+        population = utils.load_population_data()
+        render = lambda: render_figure("population_growth", build_population_growth_figure, population)
+        results.append(_result('transforms', 'population_chart_render', scale, 'cold',
+                               measure(render, repeat, setup=_clear_process_caches), rows=len(population)))
+        results.append(_result('transforms', 'population_chart_render', scale, 'warm',
+                               measure(render, repeat), rows=len(population)))
+    except Exception as e:
+        results.append(_failure('transforms', 'population_chart_render', scale, e))
+    return results
+
+# Function to time every chapter's figure builders by rendering the chapter
+def bench_figures(scale, repeat, workspace, timeout=600):
+    """
+    Render each chapter through AppTest and time it with its figures
+
+    The chapters build their Plotly and Matplotlib figures inline in
+    render(), so a chapter rerun is the unit that covers every builder.
+    cold is the first visit after the caches were cleared, warm the
+    median of repeat further visits.
+    """
+    from streamlit.testing.v1 import AppTest
+    from modules.warmup import set_first_session_warmup
+
+    # Cold visits must not be warmed by a background warm-up
+    set_first_session_warmup(False)
+    _clear_all_caches()
+    at = AppTest.from_file(str(workspace / "app.py"), default_timeout=timeout)
+    at.run()
+    results = []
+    for chapter in CHAPTER_LIST:
+        visit = lambda: at.radio(key="navigation").set_value(chapter).run()
+        cold = measure(visit, 1)
+        figures = at.get("plotly_chart")
+        extra = {
+            'plotly_figures': len(figures),
+            'plotly_spec_kb': round(sum(len(figure.proto.spec) for figure in figures) / 1024, 1),
+            'images': len(at.get("imgs")),
+            'errors': len(at.exception) + len(at.error)
+        }
+        results.append(_result('figures', chapter, scale, 'cold', cold, **extra))
+        results.append(_result('figures', chapter, scale, 'warm', measure(visit, repeat), **extra))
+    return results
+
+# Function to run the selected benchmark groups at every scale
+def run_benchmarks(scales=None, groups=None, repeat=5, figure_repeat=2, seed=42, log=print):
+    """
+    Run the micro-benchmarks against synthetic data
+
+    Args:
+        scales (list): Scale factors relative to the bundled CSVs
+        groups (list): Subset of BENCHMARK_GROUPS to run
+        repeat (int): Timed runs per measurement
+        figure_repeat (int): Warm chapter renders per chapter
+        seed (int): Seed for the synthetic data
+        log: Callable used for progress messages
+
+    Returns:
+        dict: Metadata and one result row per measurement
+    """
+    scales = scales or DEFAULT_SCALES
+    groups = groups or BENCHMARK_GROUPS
+    results = []
+    scratch = Path(tempfile.mkdtemp(prefix="india-bench-"))
+
+    try:
+        for scale in scales:
+            workspace = build_scaled_workspace(scale, seed, parent=scratch)
+            os.chdir(workspace)
+            st.session_state['use_snowflake'] = False
+            try:
+                for group in groups:
+                    started = time.perf_counter()
+                    if group == 'loaders':
+                        results.extend(bench_loaders(scale, repeat))
+                    elif group == 'map_columns':
+                        results.extend(bench_map_columns(scale, repeat))
+                    elif group == 'preload':
+                        results.extend(bench_preload(scale, repeat))
+                    elif group == 'transforms':
+                        results.extend(bench_transforms(scale, repeat))
+                    elif group == 'figures':
+                        results.extend(bench_figures(scale, figure_repeat, workspace))
+                    log(f"✅ x{scale} {group} ({time.perf_counter() - started:.1f}s)")
+            finally:
+                os.chdir(ROOT)
+                _clear_all_caches()
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {'meta': _environment(scales, groups, repeat, seed), 'results': results}
+
+# Helper function to describe the environment a run was made in
+def _environment(scales, groups, repeat, seed):
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        'format': RESULTS_FORMAT_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'streamlit': st.__version__,
+        'machine': platform.machine(),
+        'scales': scales,
+        'groups': groups,
+        'repeat': repeat,
+        'seed': seed
+    }
+
+# Helper function to identify a measurement across runs
+def _result_key(row):
+    return (row['group'], row['name'], row['scale'], row['state'])
+
+# Function to compare a run with a baseline run
+def compare_results(baseline, current, threshold=1.25, min_delta_ms=1.0):
+    """
+    Compare median timings of two runs
+
+    Returns:
+        list: One row per measurement present in both runs with the ratio
+        current / baseline; a regression is slower than threshold times the
+        baseline and by more than min_delta_ms, so timer noise on
+        sub-millisecond measurements is not reported
+    """
+    previous = {_result_key(row): row for row in baseline.get('results', [])}
+    rows = []
+    for row in current['results']:
+        before = previous.get(_result_key(row))
+        if before is None or not before.get('median_ms') or 'median_ms' not in row:
+            continue
+        ratio = row['median_ms'] / before['median_ms']
+        rows.append({
+            'key': _result_key(row),
+            'baseline_ms': before['median_ms'],
+            'current_ms': row['median_ms'],
+            'ratio': round(ratio, 3),
+            'regression': ratio > threshold and row['median_ms'] - before['median_ms'] > min_delta_ms
+        })
+    return rows
+
+# Function to print a summary of the results
+def print_results(report):
+    """Print the median timings grouped by benchmark and scale"""
+    df = pd.DataFrame(report['results'])
+    if df.empty:
+        print("No results")
+        return
+    failed = df[df['state'] == 'error']
+    df = df[df['state'] != 'error']
+    for group, rows in df.groupby('group', sort=False):
+        table = rows.pivot_table(index=['name', 'state'], columns='scale', values='median_ms', sort=False)
+        table.columns = [f"x{scale} (ms)" for scale in table.columns]
+        print(f"\n{group}")
+        print(table.round(2).to_string())
+    if not failed.empty:
+        print(f"\n❌ {len(failed)} benchmarks failed:")
+        for _, row in failed.iterrows():
+            print(f"   x{row['scale']} {row['group']} {row['name']}: {row['error']}")
+
+def main():
+    """Command-line entry point: python -m benchmarks.micro_benchmarks"""
+    parser = argparse.ArgumentParser(description="Time loaders, transforms and chapter figures on synthetic data")
+    parser.add_argument("--scales", default=",".join(str(s) for s in DEFAULT_SCALES),
+                        help="Comma-separated scale factors relative to the bundled CSVs")
+    parser.add_argument("--groups", default=",".join(BENCHMARK_GROUPS),
+                        help=f"Comma-separated subset of {', '.join(BENCHMARK_GROUPS)}")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per measurement")
+    parser.add_argument("--figure-repeat", type=int, default=2, help="Warm renders per chapter")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="Results file (default: benchmarks/results/micro-<timestamp>.json)")
+    parser.add_argument("--compare", help="Baseline results file to compare against")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression when comparing")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    args = parser.parse_args()
+
+    groups = [g.strip() for g in args.groups.split(",") if g.strip()]
+    unknown = [g for g in groups if g not in BENCHMARK_GROUPS]
+    if unknown:
+        parser.error(f"unknown benchmark groups: {', '.join(unknown)}")
+
+    report = run_benchmarks(
+        scales=[int(s) for s in args.scales.split(",") if s.strip()],
+        groups=groups, repeat=args.repeat, figure_repeat=args.figure_repeat, seed=args.seed
+    )
+    print_results(report)
+
+    output = Path(args.output) if args.output else (
+        ROOT / "benchmarks" / "results" / f"micro-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2))
+    print(f"\n✅ Results written to {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline.get('meta', {}).get('format') != RESULTS_FORMAT_VERSION:
+            print("❌ Baseline was written by a different results format; not comparing")
+            return 1
+        rows = compare_results(baseline, report, args.threshold, args.min_delta_ms)
+        regressions = [row for row in rows if row['regression']]
+        print(f"\nCompared {len(rows)} measurements with {args.compare}")
+        for row in sorted(rows, key=lambda r: r['ratio'], reverse=True)[:10]:
+            marker = "❌" if row['regression'] else "  "
+            print(f"{marker} {row['ratio']:>6.2f}x  {row['baseline_ms']:>10.2f} -> {row['current_ms']:>10.2f} ms  "
+                  + " / ".join(str(part) for part in row['key']))
+        if regressions:
+            print(f"\n❌ {len(regressions)} measurements slower than {args.threshold}x the baseline")
+            return 1
+        print("\n✅ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+import sys
+import time
+import argparse
+import modules.utils  # noqa: F401  registers the dataset loaders with the bundle
+from modules.config import DATA_BUNDLE_PATH
+from modules.data_bundle import build_bundle, BUNDLE_BUILDERS
+
+def main():
+    """Build the dataset bundle from the local CSV files"""
+    parser = argparse.ArgumentParser(description="Compile data/*.csv into a validated dataset bundle")
+    parser.add_argument("--output", default=str(DATA_BUNDLE_PATH), help="Bundle file to write")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 when a dataset fails validation")
+    parser.add_argument("datasets", nargs="*", help="Datasets to include (default: all)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.datasets if name not in BUNDLE_BUILDERS]
+    if unknown:
+        print(f"❌ Unknown datasets: {', '.join(unknown)}")
+        sys.exit(2)
+
+    print("🚀 Building dataset bundle...")
+    started = time.time()
+    manifest = build_bundle(args.output, args.datasets or None)
+
+    size_kb = sum(entry['length'] for entry in manifest['datasets'].values()) / 1024
+    print(f"✅ Wrote {len(manifest['datasets'])} datasets ({size_kb:.1f} KB) to {args.output} "
+          f"in {time.time() - started:.2f}s (version {manifest['version']})")
+    if manifest['failed']:
+        print(f"❌ {len(manifest['failed'])} datasets failed validation and will be loaded from CSV: "
+              f"{', '.join(manifest['failed'])}")
+        if args.strict:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from modules.config import GEO_STATES_PATH, GEO_LAYER_DIR
+from modules.geo import GEO_LEVELS, STATE_IDS, build_geo_layers
+
+# Schematic test fixture (one box per state, plus alias names and split features) used by --check; not a map
+SAMPLE_STATES_PATH = Path("data/geo/fixtures/india_states_sample.geojson")
+
+# Function to run the state map pipeline end to end on the sample boundary file
+def check_pipeline(source=SAMPLE_STATES_PATH):
+    """
+    Build the layers from a boundary file into a temporary directory and draw a state map from them
+
+    Returns:
+        list: Problems found (empty when the pipeline works)
+    """
+    import streamlit as st
+    from modules.geo import state_choropleth
+    from modules.marts import get_state_mart
+
+    # The map data comes from the local files, never the warehouse
+    st.session_state['use_snowflake'] = False
+
+    problems = []
+    with tempfile.TemporaryDirectory() as directory:
+        manifest = build_geo_layers(source, directory, force=True, allow_fixture=True)
+        print(f"✅ Built {len(manifest['levels'])} layers from {source}")
+
+        missing = sorted(set(STATE_IDS.values()) - set(manifest['states']))
+        if missing:
+            problems.append(f"no boundary for {', '.join(missing)}")
+
+        sizes = [manifest['levels'][level]['bytes'] for level in GEO_LEVELS]
+        if sizes != sorted(sizes):
+            problems.append(f"coarser levels are not smaller: {dict(zip(GEO_LEVELS, sizes))}")
+
+        layer_ids = {}
+        for level, layer in manifest['levels'].items():
+            collection = json.loads((Path(directory) / layer['file']).read_text(encoding='utf-8'))
+            layer_ids[level] = {feature['id'] for feature in collection['features']}
+            if layer_ids[level] != set(manifest['states']):
+                problems.append(f"{level} layer does not hold one feature per state")
+
+        df_states = get_state_mart()
+        if df_states is None or df_states.empty:
+            problems.append("state mart is empty")
+            return problems
+        for level in GEO_LEVELS:
+            fig = state_choropleth(df_states, 'Population (millions)', 'Population by State',
+                                   level=level, hover_columns=['Region'], layers=manifest)
+            trace = fig.data[0]
+            if not trace.geojson.endswith(manifest['levels'][level]['file']):
+                problems.append(f"{level} map does not reference its layer by URL")
+            unmatched = set(trace.locations) - layer_ids[level]
+            if unmatched or not len(trace.locations):
+                problems.append(f"{level} map has {len(trace.locations)} states, unmatched: {sorted(unmatched)}")
+        print(f"✅ Drew {len(GEO_LEVELS)} state maps of {len(df_states)} states")
+    return problems
+
+def main():
+    """Simplify the India states boundary file into the cached layers the state maps use"""
+    parser = argparse.ArgumentParser(description="Build the simplified India state layers used by the state maps")
+    parser.add_argument("--source", default=str(GEO_STATES_PATH), help="India states GeoJSON to simplify")
+    parser.add_argument("--output", default=str(GEO_LAYER_DIR), help="Directory to write the layers to")
+    parser.add_argument("--force", action="store_true", help="Rebuild layers that are current")
+    parser.add_argument("--check", action="store_true",
+                        help=f"Run the pipeline end to end on {SAMPLE_STATES_PATH} without touching --output")
+    args = parser.parse_args()
+
+    if args.check:
+        print("🗺️ Checking the state map pipeline...")
+        problems = check_pipeline()
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("✅ State map pipeline works")
+        return
+
+    print("🗺️ Building India state layers...")
+    started = time.time()
+    try:
+        manifest = build_geo_layers(args.source, args.output, args.force)
+    except FileNotFoundError:
+        print(f"❌ Boundary file not found: {args.source}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"❌ Could not build the state layers: {str(e)}")
+        sys.exit(1)
+
+    if not manifest['built']:
+        print(f"✅ Layers are up to date (version {manifest['version']})")
+        return
+
+    for level in GEO_LEVELS:
+        layer = manifest['levels'][level]
+        print(f"✅ {level}: {layer['file']} ({layer['bytes'] / 1024:.1f} KB, tolerance {layer['tolerance']}°)")
+    missing = sorted(set(STATE_IDS.values()) - set(manifest['states']))
+    if missing:
+        print(f"❌ No boundary for {len(missing)} states: {', '.join(missing)}")
+    print(f"Finished in {time.time() - started:.2f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+import sys
+import time
+import argparse
+from modules.config import SNAPSHOT_DIR
+from modules.router import CHAPTER_LIST
+from modules.snapshots import build_snapshot
+
+def main():
+    """Render the default state of each chapter into a static snapshot page"""
+    parser = argparse.ArgumentParser(description="Pre-render chapters into static HTML snapshots for first-time visitors")
+    parser.add_argument("--output", default=str(SNAPSHOT_DIR), help="Directory to write the snapshots to")
+    parser.add_argument("--force", action="store_true", help="Rebuild snapshots that are current")
+    parser.add_argument("--live-url", default=None, help="URL of the live app the snapshots link to")
+    parser.add_argument("chapters", nargs="*", help="Chapters to snapshot (default: all)")
+    args = parser.parse_args()
+
+    unknown = [name for name in args.chapters if name not in CHAPTER_LIST]
+    if unknown:
+        print(f"❌ Unknown chapters: {', '.join(unknown)}")
+        sys.exit(2)
+
+    print("📸 Building chapter snapshots...")
+    started = time.time()
+    failed = []
+    for chapter in args.chapters or CHAPTER_LIST:
+        try:
+            entry = build_snapshot(chapter, CHAPTER_LIST, args.output, args.force, args.live_url)
+        except Exception as e:
+            print(f"❌ {chapter}: {str(e)}")
+            failed.append(chapter)
+            continue
+        if not entry['built']:
+            print(f"✅ {chapter} is up to date ({entry['file']})")
+            continue
+        print(f"✅ {chapter}: {entry['file']} ({entry['bytes'] / 1024:.1f} KB, {entry['figures']} figures, "
+              f"{entry['images']} images) in {entry['seconds']:.2f}s")
+        if entry['exceptions'] or entry['skipped']:
+            print(f"❌ {chapter} rendered {entry['exceptions']} exceptions and {entry['skipped']} "
+                  f"errors that were left out of the snapshot")
+
+    print(f"Finished in {time.time() - started:.2f}s")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -14,8 +14,11 @@ import platform
 import shutil
 import tempfile
 import time
+import json
+import hashlib
 from pathlib import Path
 import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from datetime import datetime
 import re
 
@@ -27,6 +30,37 @@ VERSION = "1.3.0"
 APP_NAME = "Incredible India Data Story"
 REQUIRED_PYTHON_VERSION = (3, 9)
 
+# Packages installed into the virtual environment
+REQUIREMENTS = [
+    "streamlit>=1.30.0",
+    "pandas>=2.1.1",
+    "numpy>=1.26.0",
+    "altair>=5.1.2",
+    "plotly==5.18.0",
+    "matplotlib>=3.8.0",
+    "seaborn>=0.13.0",
+    "pillow>=10.0.1",
+    "requests>=2.31.0",
+    "typing-extensions>=4.9.0",
+    "pyarrow<19.0.0",
+    "snowflake-connector-python>=3.3.0",
+    "snowflake-sqlalchemy>=1.5.0",
+    "snowflake-snowpark-python>=1.5.0"
+]
+
+SNOWFLAKE_PACKAGES = [
+    "snowflake-connector-python>=3.3.0",
+    "snowflake-sqlalchemy>=1.5.0",
+    "snowflake-snowpark-python>=1.5.0"
+]
+
+# Fingerprints of the inputs of each setup step from the last successful launch
+LAUNCH_STATE_FILE = Path(".launcher_state.json")
+
+# Offline installs: exact pins generated by --build-wheelhouse and the wheels they resolve to
+LOCK_FILE = Path("requirements.lock")
+WHEELHOUSE_DIR = Path("wheelhouse")
+
 # Determine if terminal supports Unicode well
 def has_unicode_support():
     """Check if the terminal supports Unicode properly"""
@@ -190,12 +224,20 @@ FLAG_SYMBOL = safe_unicode(f"""
 {center_text(f"{Colors.INDIA_GREEN}▔▔▔▔▔▔▔▔▔▔▔▔▔▔▔▔{Colors.END}", 66)}
 """)
 
+# Per-thread context of the step scheduler (output buffer and status board)
+_step_context = threading.local()
+
+def in_scheduled_step():
+    """Return True when running inside a step started by the step scheduler"""
+    return getattr(_step_context, "board", None) is not None
+
 # Enhanced Spinner class for loading animations
 class Spinner:
     def __init__(self, message="Loading...", style="dots"):
         self.message = message
         self.running = False
         self.spinner_thread = None
+        self.board = None
         
         # Ultra-minimal spinner styles
         self.styles = {
@@ -229,18 +271,29 @@ class Spinner:
 
     def start(self):
         self.running = True
+        # Inside a scheduled step the shared status board animates instead
+        self.board = getattr(_step_context, "board", None)
+        if self.board is not None:
+            self.step_name = _step_context.step_name
+            self.board.set_message(self.step_name, self.message)
+            return
         self.spinner_thread = threading.Thread(target=self.spin)
         self.spinner_thread.daemon = True
         self.spinner_thread.start()
 
     def stop(self):
         self.running = False
+        if self.board is not None:
+            self.board.set_message(self.step_name, None)
+            return
         if self.spinner_thread:
             self.spinner_thread.join()
             
     def update_message(self, message):
         """Update the spinner message while it's running"""
         self.message = message
+        if self.board is not None:
+            self.board.set_message(self.step_name, message)
 
 # Enhanced Progress bar class for visual progress display
 class ProgressBar:
@@ -317,6 +370,25 @@ class ProgressBar:
         # Return a well-formatted progress bar
         return f"{color}{self.brackets[0]}{bar}{self.brackets[1]}{Colors.END} {Colors.BOLD}{percent_display}{Colors.END}{time_display} {description}"
         
+    def update_steps(self, states, description=""):
+        """
+        Render one cell per step so several concurrent steps can be shown at once
+        
+        Args:
+            states: List of step states ('pending', 'running', 'ok', 'skipped', 'failed')
+            description: Text shown after the bar
+        """
+        cells = {
+            "pending": f"{Colors.WHITE}{self.empty}{Colors.END}",
+            "running": f"{Colors.SAFFRON}{self.fill}{Colors.END}",
+            "ok": f"{Colors.GREEN}{self.fill}{Colors.END}",
+            "skipped": f"{Colors.CYAN}{self.empty}{Colors.END}",
+            "failed": f"{Colors.RED}✘{Colors.END}",
+        }
+        bar = "".join(cells.get(state, self.empty) for state in states)
+        finished = sum(1 for state in states if state in ("ok", "skipped", "failed"))
+        return f"{self.brackets[0]}{bar}{self.brackets[1]} {Colors.BOLD}{finished}/{len(states)}{Colors.END} {description}"
+        
     def make_indeterminate(self, width=40, description="", frame=None):
         """Create an indeterminate (animated) progress bar"""
         if frame is None:
@@ -403,7 +475,6 @@ def check_python_version():
     """Check if Python version meets requirements"""
     spinner = Spinner("Checking Python version compatibility...", style="india")
     spinner.start()
-    time.sleep(1.5)  # For visual effect
     current_version = sys.version_info
     spinner.stop()
     
@@ -445,7 +516,8 @@ def create_virtual_environment():
         lambda: spinner.running
     ))
     progress_thread.daemon = True
-    progress_thread.start()
+    if not in_scheduled_step():
+        progress_thread.start()
     
     try:
         subprocess.check_call([sys.executable, "-m", "venv", ".venv"], 
@@ -489,24 +561,18 @@ def install_requirements(venv_python):
     """Install required packages in the virtual environment"""
     step_start_times['deps'] = time.time()
     
+    # Prefer the pinned wheelhouse when one was built for these requirements
+    wheelhouse_ready, reason = wheelhouse_status()
+    if wheelhouse_ready:
+        return install_from_wheelhouse(venv_python)
+    if offline_requested():
+        print(f"{Colors.RED}✘ Offline install requested but the wheelhouse is not usable: {reason}{Colors.END}")
+        print(f"  {Colors.YELLOW}Run 'python launcher.py --build-wheelhouse' on a machine with network access{Colors.END}")
+        return False
+    
     print(f"{Colors.BOLD}{Colors.BLUE}➤ Preparing dependency installation...{Colors.END}")
     
-    requirements = [
-        "streamlit>=1.30.0",
-        "pandas>=2.1.1",
-        "numpy>=1.26.0",
-        "altair>=5.1.2",
-        "plotly==5.18.0",
-        "matplotlib>=3.8.0",
-        "seaborn>=0.13.0",
-        "pillow>=10.0.1",
-        "requests>=2.31.0",
-        "typing-extensions>=4.9.0",
-        "pyarrow<19.0.0",
-        "snowflake-connector-python>=3.3.0",
-        "snowflake-sqlalchemy>=1.5.0",
-        "snowflake-snowpark-python>=1.5.0"
-    ]
+    requirements = REQUIREMENTS
     
     # Display packages in a more attractive format
     print(f"  {Colors.CYAN}Packages to install:{Colors.END}")
@@ -551,7 +617,8 @@ def install_requirements(venv_python):
             requirements, lambda: spinner.running
         ))
         progress_thread.daemon = True
-        progress_thread.start()
+        if not in_scheduled_step():
+            progress_thread.start()
         
         # Actually install packages
         subprocess.check_call([venv_python, "-m", "pip", "install", "-r", temp_name],
@@ -576,6 +643,145 @@ def install_requirements(venv_python):
         # Clean up temp file
         os.unlink(temp_name)
 
+def offline_requested():
+    """Return True when installs must not touch the network (--offline or LAUNCHER_OFFLINE=1)"""
+    return "--offline" in sys.argv[1:] or os.environ.get("LAUNCHER_OFFLINE") == "1"
+
+def requirements_digest():
+    """Fingerprint of the declared requirements, recorded in the lockfile header"""
+    return _hash_parts(REQUIREMENTS)
+
+def _read_lock_header(name):
+    """Read a '# name: value' header line from the lockfile"""
+    try:
+        with open(LOCK_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.startswith("#"):
+                    break
+                key, _, value = line[1:].partition(":")
+                if key.strip() == name:
+                    return value.strip()
+    except OSError:
+        pass
+    return None
+
+def wheelhouse_status():
+    """Return (usable, reason) for installing offline from the wheelhouse"""
+    if not LOCK_FILE.exists():
+        return False, f"{LOCK_FILE} not found"
+    if not WHEELHOUSE_DIR.is_dir() or not any(WHEELHOUSE_DIR.glob("*.whl")):
+        return False, f"{WHEELHOUSE_DIR}/ has no wheels"
+    if _read_lock_header("requirements-digest") != requirements_digest():
+        return False, f"{LOCK_FILE} was generated for a different requirement list"
+    if _read_lock_header("python") != f"{sys.version_info.major}.{sys.version_info.minor}":
+        return False, f"{LOCK_FILE} was generated for Python {_read_lock_header('python')}"
+    # Wheels are platform specific, so a lockfile from another OS or architecture is stale
+    if _read_lock_header("platform") != f"{platform.system()} {platform.machine()}":
+        return False, f"{LOCK_FILE} was generated for {_read_lock_header('platform')}"
+    return True, "ready"
+
+def generate_lockfile(venv_python):
+    """
+    Resolve REQUIREMENTS once and write the exact pins to LOCK_FILE
+    
+    Uses pip's dry-run install report so the full dependency closure is
+    resolved in a single pass. Hashes are recorded when every pin resolves
+    to a published wheel (a locally built wheel would not match an sdist hash).
+    
+    Returns:
+        int: Number of pinned distributions
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        requirements_in = Path(temp_dir) / "requirements.in"
+        report_path = Path(temp_dir) / "report.json"
+        requirements_in.write_text('\n'.join(REQUIREMENTS), encoding='utf-8')
+        subprocess.check_call([venv_python, "-m", "pip", "install", "--dry-run", "--ignore-installed",
+                               "--quiet", "--report", str(report_path), "-r", str(requirements_in)],
+                              stdout=subprocess.DEVNULL)
+        with open(report_path, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    
+    pins = []
+    for item in report.get("install", []):
+        metadata = item["metadata"]
+        download = item.get("download_info", {})
+        archive = download.get("archive_info", {})
+        digest = (archive.get("hashes") or {}).get("sha256")
+        if not digest and archive.get("hash", "").startswith("sha256="):
+            digest = archive["hash"].split("=", 1)[1]
+        is_wheel = download.get("url", "").split("#")[0].endswith(".whl")
+        pins.append((metadata["name"].lower(), metadata["version"], digest if is_wheel else None))
+    pins.sort()
+    
+    # pip's hash-checking mode is all or nothing
+    with_hashes = all(digest for _, _, digest in pins)
+    lines = [
+        "# Generated by 'python launcher.py --build-wheelhouse'; do not edit by hand",
+        f"# requirements-digest: {requirements_digest()}",
+        f"# python: {sys.version_info.major}.{sys.version_info.minor}",
+        f"# platform: {platform.system()} {platform.machine()}",
+    ]
+    for name, version, digest in pins:
+        lines.append(f"{name}=={version}" + (f" \\\n    --hash=sha256:{digest}" if with_hashes else ""))
+    
+    partial = LOCK_FILE.with_suffix(".partial")
+    partial.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+    os.replace(partial, LOCK_FILE)
+    return len(pins)
+
+def build_wheelhouse(venv_python):
+    """Generate the lockfile and download or build a wheel for every pin (needs network)"""
+    started = time.time()
+    try:
+        spinner = Spinner("Updating pip to latest version...", style="dots")
+        spinner.start()
+        subprocess.check_call([venv_python, "-m", "pip", "install", "--upgrade", "pip"],
+                             stdout=subprocess.DEVNULL,
+                             stderr=subprocess.DEVNULL)
+        spinner.update_message("Resolving requirements...")
+        pinned = generate_lockfile(venv_python)
+        spinner.update_message(f"Building wheelhouse for {pinned} packages...")
+        WHEELHOUSE_DIR.mkdir(exist_ok=True)
+        # The lock is the full closure, so no further resolution is needed
+        subprocess.check_call([venv_python, "-m", "pip", "wheel", "--no-deps", "--quiet",
+                               "--wheel-dir", str(WHEELHOUSE_DIR), "-r", str(LOCK_FILE)],
+                              stdout=subprocess.DEVNULL)
+        spinner.stop()
+    except (subprocess.CalledProcessError, OSError, ValueError, KeyError) as e:
+        spinner.stop()
+        print(f"{Colors.RED}✘ Failed to build the wheelhouse: {e}{Colors.END}")
+        return False
+    
+    elapsed = time.time() - started
+    wheels = list(WHEELHOUSE_DIR.glob("*.whl"))
+    size_mb = sum(path.stat().st_size for path in wheels) / (1024 * 1024)
+    print(f"{Colors.GREEN}✓ Wrote {LOCK_FILE} with {pinned} pinned packages {Colors.YELLOW}({elapsed:.1f}s){Colors.END}")
+    print(f"  {Colors.CYAN}└─ {len(wheels)} wheels in {WHEELHOUSE_DIR}/ ({size_mb:.1f} MB){Colors.END}")
+    return True
+
+def install_from_wheelhouse(venv_python):
+    """Install the locked packages from the local wheelhouse in one offline pass"""
+    started = time.time()
+    spinner = Spinner(f"Installing pinned packages from {WHEELHOUSE_DIR}/...", style="india")
+    spinner.start()
+    try:
+        # --no-deps: the lockfile already lists the complete closure, so pip does not resolve
+        subprocess.check_call([venv_python, "-m", "pip", "install", "--no-index", "--no-deps",
+                               "--find-links", str(WHEELHOUSE_DIR), "-r", str(LOCK_FILE)],
+                              stdout=subprocess.DEVNULL,
+                              stderr=subprocess.DEVNULL)
+        spinner.stop()
+    except subprocess.CalledProcessError as e:
+        spinner.stop()
+        print(f"{Colors.RED}✘ Offline install from the wheelhouse failed: {e}{Colors.END}")
+        print(f"  {Colors.YELLOW}Try running manually: {venv_python} -m pip install --no-index --find-links {WHEELHOUSE_DIR} -r {LOCK_FILE}{Colors.END}")
+        return False
+    
+    elapsed = time.time() - started
+    print(f"{Colors.GREEN}✓ Installed pinned packages offline {Colors.YELLOW}({elapsed:.1f}s){Colors.END}")
+    print(f"  {Colors.CYAN}└─ Source: {WHEELHOUSE_DIR}/ pinned by {LOCK_FILE}{Colors.END}")
+    return True
+
 def _show_package_installation_progress(packages, should_continue):
     """Show animated progress for package installation"""
     bar = ProgressBar(style="elegant")
@@ -613,7 +819,6 @@ def create_streamlit_config():
     if not config_file.exists():
         spinner = Spinner("Creating Streamlit configuration...", style="clock")
         spinner.start()
-        time.sleep(1.5)  # For visual effect
         
         with open(config_file, 'w') as f:
             f.write("""[theme]
@@ -674,11 +879,7 @@ def launch_app(venv_python):
     print(f"{Colors.GREEN}│{Colors.END} {ctrl_msg}{' ' * ctrl_padding}{Colors.GREEN}│{Colors.END}")
     print(f"{Colors.GREEN}╰{'─' * (width - 2)}╯{Colors.END}")
     
-    # Show a minimal loading animation
-#     chars = "◜◠◝◞◡◟"  # Unused variable
     colors = [Colors.SAFFRON, Colors.WHITE, Colors.INDIA_GREEN]
-    
-    # Multi-line loading animation with consistent styling
     lines = [
         "Starting Incredible India journey",
         "Loading visualization modules",
@@ -688,22 +889,9 @@ def launch_app(venv_python):
     for line_idx, line in enumerate(lines):
         # Use a different color for each line
         color = colors[line_idx % len(colors)]
-        sys.stdout.write(f"\n{color}  ")
-        
-        # Animated typing effect
-        for char_idx, char in enumerate(line):
-            sys.stdout.write(char)
-            sys.stdout.flush()
-            time.sleep(0.02)  # Slightly faster for better UX
-        
-        # Add animated dots
-        for _ in range(3):
-            for dot in range(1, 4):
-                sys.stdout.write(f"\r{color}  {line}{'.' * dot}{' ' * (3-dot)}{Colors.END}")
-                sys.stdout.flush()
-                time.sleep(0.15)  # Slightly faster for better UX
+        print(f"{color}  {line}...{Colors.END}")
     
-    print("\n")
+    print()
     
     # Fix for character encoding issues
     env = os.environ.copy()
@@ -713,21 +901,12 @@ def launch_app(venv_python):
         # Fix for 'charmap' codec errors on Windows
         env["PYTHONLEGACYWINDOWSSTDIO"] = "utf-8"
     
-    # Final countdown with animated styling
-    print(f"{Colors.CYAN}  Starting server in:{Colors.END}")
-    
-    for i in range(3, 0, -1):
-        countdown_char = "○" if i == 3 else "◎" if i == 2 else "●"
-        sys.stdout.write(f"\r{Colors.CYAN}  {countdown_char} {i}...{Colors.END}")
-        sys.stdout.flush()
-        time.sleep(0.5)
-    
     sys.stdout.write(f"\r{Colors.GREEN}  ✓ Launching now!{Colors.END}\n\n")
     sys.stdout.flush()
     
-    # Run streamlit in the virtual environment
+    # Run streamlit in the virtual environment, warming its caches as soon as the server is up
     try:
-        subprocess.run([venv_python, "-m", "streamlit", "run", "app.py"], env=env)
+        subprocess.run([venv_python, "warm_up.py", "--serve"], env=env)
         return True
     except KeyboardInterrupt:
         elapsed = time.time() - step_start_times['launch']
@@ -737,6 +916,14 @@ def launch_app(venv_python):
         print(f"{Colors.RED}✘ Error launching app: {e}{Colors.END}")
         return False
 
+def load_encoding_module():
+    """Load modules/encoding.py directly (the modules package needs the app's dependencies)"""
+    import importlib.util
+    spec = importlib.util.spec_from_file_location("data_encoding", Path("modules") / "encoding.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
 def check_data_encoding():
     """Check data files for encoding issues and fix if possible"""
     step_start_times['data'] = time.time()
@@ -746,33 +933,17 @@ def check_data_encoding():
     
     try:
         data_dir = Path("data")
-        fixed_files = 0
-        total_files = 0
+        stats = {'total': 0, 'checked': 0, 'converted': 0}
         
         if data_dir.exists() and data_dir.is_dir():
-            for file_path in data_dir.glob("*.csv"):
-                total_files += 1
-                try:
-                    # Try to read the file with utf-8 encoding
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                except UnicodeDecodeError:
-                    # If utf-8 fails, try to read with another encoding and save as utf-8
-                    try:
-                        with open(file_path, 'r', encoding='latin-1') as f:
-                            content = f.read()
-                        
-                        # Write back as UTF-8
-                        with open(file_path, 'w', encoding='utf-8') as f:
-                            f.write(content)
-                        
-                        # Update the spinner message to show progress
-                        spinner.update_message(f"Fixed encoding in {file_path.name}...")
-                        fixed_files += 1
-                        time.sleep(0.3)  # Slight delay to show the message
-                    except Exception:
-                        # If that fails too, just skip the file
-                        pass
+            encoding = load_encoding_module()
+            # Streams each new or changed file once and records it in the encoding manifest
+            stats = encoding.normalize_data_dir(
+                data_dir,
+                on_file=lambda name: spinner.update_message(f"Checking encoding of {name}...")
+            )
+        fixed_files = stats['converted']
+        total_files = stats['total']
         
         spinner.stop()
         elapsed = time.time() - step_start_times['data']
@@ -823,6 +994,9 @@ def clean_unnecessary_files():
             
             # Use Path.glob to find matching files/dirs
             for path in Path('.').glob(pattern):
+                # Leave the virtual environment alone (it may be installing concurrently)
+                if ".venv" in path.parts:
+                    continue
                 if path.is_dir():
                     shutil.rmtree(path, ignore_errors=True)
                 else:
@@ -882,88 +1056,400 @@ def check_snowflake_modules():
         print(f"{Colors.YELLOW}! Snowflake modules not found, will install them{Colors.END}")
         return False
 
+def _hash_parts(*parts):
+    """Hash a sequence of values into a short stable fingerprint"""
+    h = hashlib.sha1()
+    for part in parts:
+        h.update(repr(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()[:16]
+
+def _file_signature(path):
+    """Return (name, size, mtime) for a file, or None if it does not exist"""
+    try:
+        stat = Path(path).stat()
+        return (Path(path).name, stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        return None
+
+def compute_step_fingerprints(venv_python):
+    """Fingerprint the inputs of every setup step"""
+    interpreter = (sys.version, sys.executable, REQUIRED_PYTHON_VERSION)
+    # The venv's pyvenv.cfg is rewritten whenever the environment is recreated
+    environment = (venv_python, _file_signature(Path(venv_python).parent.parent / "pyvenv.cfg"))
+    requirements = (REQUIREMENTS, SNOWFLAKE_PACKAGES, _file_signature("requirements.txt"), _file_signature(LOCK_FILE))
+    data_dir = Path("data")
+    data_files = [_file_signature(path) for path in sorted(data_dir.glob("*.csv"))] if data_dir.is_dir() else []
+    
+    return {
+        'clean': _hash_parts(VERSION, interpreter),
+        'python': _hash_parts(interpreter),
+        'deps': _hash_parts(interpreter, environment, requirements),
+        'data': _hash_parts(data_files),
+        'snowflake': _hash_parts(interpreter, environment, requirements),
+    }
+
+def load_launch_state():
+    """Load the step fingerprints recorded by the last successful launch"""
+    try:
+        with open(LAUNCH_STATE_FILE, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        return state if isinstance(state, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def save_launch_state(state):
+    """Persist step fingerprints atomically so an interrupted write is never read back"""
+    try:
+        partial = LAUNCH_STATE_FILE.with_suffix(".partial")
+        with open(partial, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(partial, LAUNCH_STATE_FILE)
+    except OSError as e:
+        print(f"{Colors.YELLOW}⚠ Could not save launcher state: {e}{Colors.END}")
+
+def print_step_skipped(description):
+    """Print a single line for a step whose inputs have not changed"""
+    print(f"{Colors.GREEN}✓ {description} unchanged since last launch, skipping{Colors.END}")
+
+# Class describing one launcher step and the steps it depends on
+class LaunchStep:
+    def __init__(self, name, description, func, depends=()):
+        self.name = name
+        self.description = description
+        self.func = func
+        self.depends = tuple(depends)
+
+# Proxy for sys.stdout that buffers output of scheduled steps
+class _StepOutput:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, text):
+        buffer = getattr(_step_context, "buffer", None)
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        return self.stream.write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+# Status board showing every running step on a single animated line
+class StepBoard:
+    def __init__(self, steps, stream):
+        self.steps = steps
+        self.stream = stream
+        self.states = {step.name: "pending" for step in steps}
+        self.messages = {}
+        self.finished = 0
+        self.lock = threading.Lock()
+        self.bar = ProgressBar(style="elegant")
+        self.spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._animate)
+        self.thread.daemon = True
+
+    def start(self):
+        self.thread.start()
+
+    def set_state(self, name, state):
+        with self.lock:
+            self.states[name] = state
+
+    def set_message(self, name, message):
+        with self.lock:
+            if message:
+                self.messages[name] = message
+            else:
+                self.messages.pop(name, None)
+
+    def _status_line(self, frame):
+        running = [step for step in self.steps if self.states[step.name] == "running"]
+        labels = " | ".join(self.messages.get(step.name) or step.description for step in running)
+        # Keep the status on one terminal line
+        if len(labels) > 80:
+            labels = labels[:77] + "..."
+        char = self.spinner_chars[frame % len(self.spinner_chars)]
+        states = [self.states[step.name] for step in self.steps]
+        return f"{Colors.SAFFRON}{char}{Colors.END} " + self.bar.update_steps(states, labels)
+
+    def _clear(self):
+        self.stream.write(f"\r{' ' * 110}\r")
+
+    def _animate(self):
+        frame = 0
+        while not self.stopped.is_set():
+            with self.lock:
+                self._clear()
+                self.stream.write(self._status_line(frame))
+                self.stream.flush()
+            frame += 1
+            self.stopped.wait(0.1)
+
+    def report(self, step, state, elapsed, output):
+        """Print a finished step's header and buffered output above the status line"""
+        with self.lock:
+            self.states[step.name] = state
+            self.messages.pop(step.name, None)
+            self.finished += 1
+            self._clear()
+            self.stream.flush()
+            label = {"ok": "", "skipped": " - skipped", "failed": " - failed"}[state]
+            # print_step writes through the proxy, which passes main-thread output straight on
+            print_step(self.finished, len(self.steps), f"{step.description} ({elapsed:.2f}s){label}")
+            if output:
+                self.stream.write(output if output.endswith("\n") else output + "\n")
+            self.stream.flush()
+
+    def close(self):
+        self.stopped.set()
+        self.thread.join()
+        self._clear()
+        self.stream.flush()
+
+# Helper function executing one step on a worker thread with captured output
+def _run_scheduled_step(step, board):
+    _step_context.buffer = []
+    _step_context.board = board
+    _step_context.step_name = step.name
+    board.set_state(step.name, "running")
+    started = time.time()
+    try:
+        ok = step.func() is not False
+    except Exception as e:
+        print(f"{Colors.RED}✘ {step.description} failed: {e}{Colors.END}")
+        ok = False
+    finally:
+        output = "".join(_step_context.buffer)
+        _step_context.buffer = None
+        _step_context.board = None
+    return ok, time.time() - started, output
+
+def run_step_graph(steps, max_workers=4):
+    """
+    Run launcher steps concurrently, each as soon as its dependencies succeeded
+    
+    Steps whose dependencies failed are skipped. Output of each step is
+    buffered and printed in one block when the step finishes, while a single
+    status line shows every step that is still running.
+    
+    Args:
+        steps: List of LaunchStep objects
+        max_workers: Size of the thread pool
+        
+    Returns:
+        Tuple of ({step name: 'ok' | 'failed' | 'skipped'}, {step name: seconds})
+    """
+    pending = {step.name: step for step in steps}
+    status = {}
+    timings = {}
+    real_stdout = sys.stdout
+    board = StepBoard(steps, real_stdout)
+    sys.stdout = _StepOutput(real_stdout)
+    board.start()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running = {}
+            while pending or running:
+                # Drop steps that can no longer run because a dependency did not succeed
+                for name, step in list(pending.items()):
+                    if any(status.get(dep) in ("failed", "skipped") for dep in step.depends):
+                        del pending[name]
+                        status[name] = "skipped"
+                        timings[name] = 0.0
+                        board.report(step, "skipped", 0.0, "")
+                
+                for name, step in list(pending.items()):
+                    if all(status.get(dep) == "ok" for dep in step.depends):
+                        del pending[name]
+                        running[pool.submit(_run_scheduled_step, step, board)] = step
+                
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    ok, elapsed, output = future.result()
+                    status[step.name] = "ok" if ok else "failed"
+                    timings[step.name] = elapsed
+                    board.report(step, status[step.name], elapsed, output)
+    finally:
+        board.close()
+        sys.stdout = real_stdout
+    return status, timings
+
+def print_step_timings(steps, timings, wall_time):
+    """Print how long each step took next to the wall-clock time of the whole graph"""
+    print(f"\n{Colors.CYAN}  Step timings:{Colors.END}")
+    for step in steps:
+        elapsed = timings.get(step.name)
+        if elapsed is None:
+            continue
+        print(f"    {Colors.GREEN}▸{Colors.END} {step.description:<32} {Colors.YELLOW}{elapsed:6.2f}s{Colors.END}")
+    total = sum(timings.values())
+    print(f"    {Colors.BOLD}Wall time {wall_time:.2f}s{Colors.END} {Colors.CYAN}(sequential total {total:.2f}s){Colors.END}")
+
 def main():
     """Main entry point"""
     global step_start_times
     step_start_times = {}
     step_start_times['overall'] = time.time()
     
+    # --force ignores the recorded state and reruns every step
+    force = "--force" in sys.argv[1:]
+    state = {} if force else load_launch_state()
+    state_lock = threading.Lock()
+    venv_python = get_venv_python()
+    fingerprints = compute_step_fingerprints(venv_python)
+    snowflake_status = {}
+    
+    # Helper to check whether a step's inputs match the last successful run
+    def is_current(step):
+        return state.get(step) == fingerprints[step]
+    
+    # Helper to record a step as done for its current inputs
+    def mark_done(step, fingerprint=None):
+        with state_lock:
+            state[step] = fingerprint or fingerprints[step]
+            save_launch_state(state)
+    
     # Set up ANSI color support
     os.system('color' if platform.system() == 'Windows' else '')
     
     # Print header
     print_header()
     
-    # Step 1: Clean up unnecessary files
-    print_step(1, 6, "Cleaning Project")
-    clean_unnecessary_files()
+    # The version check is instant and may prompt, so it runs before the graph
+    if is_current('python'):
+        print_step_skipped(f"Python {platform.python_version()}")
+    else:
+        if not check_python_version():
+            return 1
+        mark_done('python')
     
-    # Step 2: Check Python version
-    print_step(2, 6, "Checking Environment Compatibility")
-    if not check_python_version():
-        return 1
+    # Step: clean up unnecessary files
+    # (bytecode caches only go stale when the interpreter or launcher changes)
+    def clean_step():
+        if is_current('clean'):
+            print_step_skipped("Interpreter and launcher")
+            return True
+        clean_unnecessary_files()
+        mark_done('clean')
     
-    # Step 3: Create virtual environment
-    print_step(3, 6, "Setting Up Isolated Environment")
-    venv_created = create_virtual_environment()
-    venv_python = get_venv_python()
+    # Step: create the virtual environment
+    def venv_step():
+        created = create_virtual_environment()
+        # A freshly created environment changes the dependency fingerprints; the steps
+        # reading them (deps, snowflake_check) depend on this one, so none is running yet
+        fresh = compute_step_fingerprints(venv_python)
+        fingerprints['deps'] = fresh['deps']
+        fingerprints['snowflake'] = fresh['snowflake']
+        return created
     
-    if not venv_python:
-        print(f"{Colors.RED}✘ Failed to find Python in virtual environment{Colors.END}")
-        return 1
-        
-    # Step 4: Install dependencies
-    print_step(4, 6, "Installing Dependencies")
-    if not install_requirements(venv_python):
+    # Step: install dependencies
+    def deps_step():
+        if is_current('deps'):
+            print_step_skipped("Requirements")
+            return True
+        if not install_requirements(venv_python):
+            return False
+        mark_done('deps')
+    
+    # Step: write the Streamlit config
+    def config_step():
+        create_streamlit_config()
+    
+    # Step: check and fix data file encodings
+    def data_step():
+        if is_current('data'):
+            print_step_skipped("Data files")
+            return True
+        check_data_encoding()
+        # Fixing an encoding rewrites the file, so fingerprint the result
+        mark_done('data', compute_step_fingerprints(venv_python)['data'])
+    
+    # Step: check the Snowflake modules of the environment (independent of the dependency install)
+    def snowflake_check_step():
+        if is_current('snowflake'):
+            print_step_skipped("Snowflake packages")
+            snowflake_status['ready'] = True
+            return True
+        snowflake_status['ready'] = check_snowflake_modules()
+    
+    # Step: repair the Snowflake packages once the main install has finished
+    def snowflake_fix_step():
+        if not snowflake_status.get('ready') and wheelhouse_status()[0]:
+            # The lockfile already pins compatible pyarrow and Snowflake versions
+            print(f"{Colors.GREEN}✓ Snowflake packages pinned by {LOCK_FILE}, no repair needed{Colors.END}")
+        elif not snowflake_status.get('ready') and offline_requested():
+            print(f"{Colors.YELLOW}⚠ Snowflake modules need repair but installs are offline; rebuild the wheelhouse{Colors.END}")
+            return True
+        elif not snowflake_status.get('ready'):
+            print(f"{Colors.YELLOW}⚠ Will reinstall Snowflake packages to fix missing or incompatible modules{Colors.END}")
+            # First downgrade pyarrow if needed
+            spinner = Spinner("Fixing pyarrow compatibility...", style="dots")
+            spinner.start()
+            subprocess.check_call([venv_python, "-m", "pip", "install", "--force-reinstall", "pyarrow<19.0.0"],
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+            spinner.stop()
+            print(f"{Colors.GREEN}✓ pyarrow downgraded to compatible version{Colors.END}")
+            
+            # Install Snowflake packages specifically
+            spinner = Spinner("Installing Snowflake packages...", style="india")
+            spinner.start()
+            subprocess.check_call([venv_python, "-m", "pip", "install", "--upgrade"] + SNOWFLAKE_PACKAGES,
+                                 stdout=subprocess.DEVNULL,
+                                 stderr=subprocess.DEVNULL)
+            spinner.stop()
+            print(f"{Colors.GREEN}✓ Snowflake packages installed{Colors.END}")
+        if not is_current('snowflake'):
+            mark_done('snowflake')
+    
+    # The critical path is venv -> deps -> Snowflake repair; the Snowflake check waits for the venv
+    # (whose fingerprints it reads), everything else runs alongside it
+    steps = [
+        LaunchStep('venv', "Setting Up Isolated Environment", venv_step),
+        LaunchStep('deps', "Installing Dependencies", deps_step, depends=['venv']),
+        LaunchStep('clean', "Cleaning Project", clean_step),
+        LaunchStep('config', "Configuring Application", config_step),
+        LaunchStep('data', "Checking Data Encoding", data_step),
+        LaunchStep('snowflake_check', "Verifying Snowflake Integration", snowflake_check_step, depends=['venv']),
+        LaunchStep('snowflake_fix', "Repairing Snowflake Packages", snowflake_fix_step,
+                   depends=['deps', 'snowflake_check']),
+    ]
+    
+    graph_started = time.time()
+    status, timings = run_step_graph(steps)
+    print_step_timings(steps, timings, time.time() - graph_started)
+    
+    # Only the environment and dependencies are required to launch
+    if status.get('venv') != "ok" or status.get('deps') != "ok":
+        print(f"{Colors.RED}✘ Environment setup failed, not launching the app{Colors.END}")
         return 1
     
-    # Step 5: Create Streamlit config if needed
-    print_step(5, 6, "Configuring Application")
-    create_streamlit_config()
-    check_data_encoding()
-    
-    # Step 6: Check Snowflake Modules
-    print_step(6, 7, "Verifying Snowflake Integration")
-    snowflake_ready = check_snowflake_modules()
-    if not snowflake_ready:
-        print(f"{Colors.YELLOW}⚠ Will reinstall Snowflake packages to fix missing or incompatible modules{Colors.END}")
-        # First downgrade pyarrow if needed
-        spinner = Spinner("Fixing pyarrow compatibility...", style="dots")
-        spinner.start()
-        subprocess.check_call([venv_python, "-m", "pip", "install", "--force-reinstall", "pyarrow<19.0.0"],
-                             stdout=subprocess.DEVNULL,
-                             stderr=subprocess.DEVNULL)
-        spinner.stop()
-        print(f"{Colors.GREEN}✓ pyarrow downgraded to compatible version{Colors.END}")
-        
-        # Install Snowflake packages specifically
-        spinner = Spinner("Installing Snowflake packages...", style="india")
-        spinner.start()
-        snowflake_packages = [
-            "snowflake-connector-python>=3.3.0",
-            "snowflake-sqlalchemy>=1.5.0",
-            "snowflake-snowpark-python>=1.5.0"
-        ]
-        subprocess.check_call([venv_python, "-m", "pip", "install", "--upgrade"] + snowflake_packages,
-                             stdout=subprocess.DEVNULL,
-                             stderr=subprocess.DEVNULL)
-        spinner.stop()
-        print(f"{Colors.GREEN}✓ Snowflake packages installed{Colors.END}")
+    # Show setup time before handing over to Streamlit
+    setup_elapsed = time.time() - step_start_times['overall']
+    print(f"\n{Colors.BOLD}{Colors.GREEN}✓ Setup completed in {setup_elapsed:.2f} seconds{Colors.END}")
     
-    # Step 7: Launch application
-    print_step(7, 7, "Launching Application")
+    # Launch application
     launch_app(venv_python)
     
     # Show total runtime
     overall_elapsed = time.time() - step_start_times['overall']
-    print(f"\n{Colors.BOLD}{Colors.GREEN}✓ Setup completed in {overall_elapsed:.1f} seconds{Colors.END}")
+    print(f"\n{Colors.BOLD}{Colors.GREEN}✓ Session ended after {overall_elapsed:.1f} seconds{Colors.END}")
     
     return 0
 
 if __name__ == "__main__":
     try:
         # Check for debug flag
-        if len(sys.argv) > 1 and sys.argv[1] == "--debug":
+        if "--debug" in sys.argv[1:]:
             print(f"{Colors.YELLOW}Running in debug mode - configuration check only{Colors.END}")
             print(f"{Colors.CYAN}Python version: {sys.version}{Colors.END}")
             print(f"{Colors.CYAN}System: {platform.system()} {platform.release()}{Colors.END}")
@@ -1041,6 +1527,13 @@ if __name__ == "__main__":
                 print(f"  {Colors.YELLOW}{i+1}.{Colors.END} {quote}")
             
             sys.exit(0)
+        
+        if "--build-wheelhouse" in sys.argv[1:]:
+            print_header()
+            if not check_python_version():
+                sys.exit(1)
+            create_virtual_environment()
+            sys.exit(0 if build_wheelhouse(get_venv_python()) else 1)
             
         main()
     except KeyboardInterrupt:
@@ -1,9 +1,17 @@
 # # modules package 
 import warnings
+import pandas as pd
 
 # Silence the pandas FutureWarning about get_group when grouping with a length-1 list-like
 warnings.filterwarnings(
     "ignore", 
     message="When grouping with a length-1 list-like, you will need to pass a length-1 tuple to get_group in a future version of pandas",
     category=FutureWarning
-) 
\ No newline at end of file
+)
+
+# Copy-on-write lets cached datasets be handed out as cheap views that chapters
+# cannot mutate for other sessions (the default from pandas 3.0 onwards)
+try:
+    pd.set_option("mode.copy_on_write", True)
+except Exception:
+    pass
@@ -2,7 +2,111 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import numpy as np
-from modules.utils import load_state_data, apply_dark_theme, load_geography_data
+from modules.utils import load_state_data, apply_dark_theme, load_geography_data, plain_labels
+from modules.filter_engine import get_filter_index
+from modules.fragments import chapter_fragment
+from modules.figure_transport import show_chart
+
+# Fragment for the landscape explorer
+@chapter_fragment
+def show_landscape_explorer(landscape_types):
+    """Render the landscape explorer for the selected landscape"""
+    # Create a selectbox for landscape selection
+    selected_landscape = st.selectbox("Select a landscape to explore:", list(landscape_types.keys()))
+
+    # Display information about the selected landscape
+    landscape_info = landscape_types[selected_landscape]
+
+    # Use the custom color for the selected landscape
+    bg_color = landscape_info['color']
+    text_color = "#FFFFFF" if landscape_info['color'] in ["#228B22", "#6B8E23", "#8A9A5B"] else "#000000"
+
+    st.markdown(f"""
+    <div style="background-color:{bg_color}; padding:20px; border-radius:10px; margin-top:15px; color:{text_color};">
+        <h4 style="margin-top:0;">{selected_landscape}</h4>
+        <p><strong>Region:</strong> {landscape_info['region']}</p>
+        <p><strong>States:</strong> {landscape_info['states']}</p>
+        <p><strong>Features:</strong> {landscape_info['features']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+# Fragment for the state comparison tool so selectbox changes rerun only this section
+@chapter_fragment
+def show_state_comparison(df_states):
+    """Render the interactive state comparison tool"""
+    # Add a state comparison tool
+    st.markdown("<h3 class='section-heading' style='margin-top:30px;'>Compare States</h3>", unsafe_allow_html=True)
+
+    # Precomputed State index (and memoized comparisons) per data version so lookups skip full-frame boolean masks
+    state_index = get_filter_index('states', df_states, ['State'])
+
+    # Allow users to select states to compare
+    col1, col2 = st.columns(2)
+    with col1:
+        state1 = st.selectbox("Select first state:", df_states['State'].tolist(), index=0)
+    with col2:
+        # Default to a different state for comparison
+        default_idx = 1 if len(df_states) > 1 else 0
+        state2 = st.selectbox("Select second state:", df_states['State'].tolist(), index=default_idx)
+
+    # Get data for selected states
+    state1_data = state_index.first(df_states, 'State', state1)
+    state2_data = state_index.first(df_states, 'State', state2)
+
+    # Create comparison dataframe (memoized per state pair)
+    comparison_metrics = ['Population (millions)', 'Area (sq km)', 'Literacy Rate (%)', 'HDI', 'Urbanization (%)']
+    comparison_data = state_index.memoize(
+        ('comparison', state1, state2),
+        lambda: pd.DataFrame({
+            'Metric': comparison_metrics,
+            state1: [state1_data[metric] for metric in comparison_metrics],
+            state2: [state2_data[metric] for metric in comparison_metrics],
+        })
+    )
+
+    # Create visual comparison
+    fig = px.bar(comparison_data, x='Metric', y=[state1, state2], barmode='group',
+                title=f'Comparison: {state1} vs {state2}',
+                color_discrete_sequence=['#FF9933', '#138808'])
+
+    # Apply dark theme
+    fig = apply_dark_theme(fig)
+
+    fig.update_layout(
+        xaxis_title="",
+        yaxis_title="Value",
+        legend_title="State"
+    )
+
+    show_chart(fig, use_container_width=True)
+
+    # Show additional state info
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"""
+        <div style="background-color:rgba(255, 153, 51, 0.2); padding:15px; border-radius:5px;">
+            <h4>{state1}</h4>
+            <p><strong>Capital:</strong> {state1_data['Capital']}</p>
+            <p><strong>Region:</strong> {state1_data['Region']}</p>
+            <p><strong>Official Languages:</strong> {state1_data['Official Languages']}</p>
+            <p><strong>Major Crops:</strong> {state1_data['Major Crops']}</p>
+            <p><strong>Key Industries:</strong> {state1_data['Key Industries']}</p>
+            <p><strong>Famous Destinations:</strong> {state1_data['Famous Destinations']}</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div style="background-color:rgba(19, 136, 8, 0.2); padding:15px; border-radius:5px;">
+            <h4>{state2}</h4>
+            <p><strong>Capital:</strong> {state2_data['Capital']}</p>
+            <p><strong>Region:</strong> {state2_data['Region']}</p>
+            <p><strong>Official Languages:</strong> {state2_data['Official Languages']}</p>
+            <p><strong>Major Crops:</strong> {state2_data['Major Crops']}</p>
+            <p><strong>Key Industries:</strong> {state2_data['Key Industries']}</p>
+            <p><strong>Famous Destinations:</strong> {state2_data['Famous Destinations']}</p>
+        </div>
+        """, unsafe_allow_html=True)
 
 def render():
     st.markdown("<h2 class='chapter-heading'>Geographical Diversity: The Varied Landscapes of India</h2>", unsafe_allow_html=True)
@@ -63,7 +167,7 @@ def render():
                     height=400
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
             
             with col2:
                 st.markdown("<h3 class='section-heading'>Details of Geographical Features</h3>", unsafe_allow_html=True)
@@ -101,7 +205,7 @@ def render():
                             legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5)
                         )
                         
-                        st.plotly_chart(fig, use_container_width=True)
+                        show_chart(fig, use_container_width=True)
                     else:
                         st.info("Geography data found but missing required columns.")
             except Exception as e:
@@ -156,25 +260,8 @@ def render():
                 }
             }
             
-            # Create a selectbox for landscape selection
-            selected_landscape = st.selectbox("Select a landscape to explore:", list(landscape_types.keys()))
-            
-            # Display information about the selected landscape
-            landscape_info = landscape_types[selected_landscape]
-            
-            # Use the custom color for the selected landscape
-            bg_color = landscape_info['color']
-            text_color = "#FFFFFF" if landscape_info['color'] in ["#228B22", "#6B8E23", "#8A9A5B"] else "#000000"
-            
-            st.markdown(f"""
-            <div style="background-color:{bg_color}; padding:20px; border-radius:10px; margin-top:15px; color:{text_color};">
-                <h4 style="margin-top:0;">{selected_landscape}</h4>
-                <p><strong>Region:</strong> {landscape_info['region']}</p>
-                <p><strong>States:</strong> {landscape_info['states']}</p>
-                <p><strong>Features:</strong> {landscape_info['features']}</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
+            show_landscape_explorer(landscape_types)
+
         except Exception as e:
             st.error(f"Error in Landscapes & Ecosystems tab: {e}")
     
@@ -187,7 +274,7 @@ def render():
                 st.markdown("<h3 class='section-heading'>Population Distribution by Region</h3>", unsafe_allow_html=True)
                 
                 # Group by region and sum population
-                region_population = df_states.groupby('Region')['Population (millions)'].sum().reset_index()
+                region_population = df_states.groupby('Region', observed=True)['Population (millions)'].sum().reset_index()
                 region_population = region_population.sort_values('Population (millions)', ascending=False)
                 
                 col1, col2 = st.columns([3, 2])
@@ -211,7 +298,7 @@ def render():
                     # Apply dark theme
                     fig = apply_dark_theme(fig)
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_chart(fig, use_container_width=True)
                     st.markdown("</div>", unsafe_allow_html=True)
                 
                 with col2:
@@ -240,7 +327,7 @@ def render():
                 sorted_literacy = df_states.sort_values('Literacy Rate (%)', ascending=False)
                 
                 # Use a color-blind friendly palette
-                fig = px.bar(sorted_literacy, 
+                fig = px.bar(plain_labels(sorted_literacy), 
                             x='State', y='Literacy Rate (%)',
                             title='Literacy Rates by State',
                             color='Region',
@@ -280,79 +367,13 @@ def render():
                     height=600
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 st.markdown("</div>", unsafe_allow_html=True)
                 
                 st.markdown("<div class='data-insight'>Kerala has consistently maintained the highest literacy rate in India, often above 90%, which is comparable to many developed nations. There's a notable correlation between literacy rates and human development indicators across states.</div>", unsafe_allow_html=True)
                 
-                # Add a state comparison tool
-                st.markdown("<h3 class='section-heading' style='margin-top:30px;'>Compare States</h3>", unsafe_allow_html=True)
-                
-                # Allow users to select states to compare
-                col1, col2 = st.columns(2)
-                with col1:
-                    state1 = st.selectbox("Select first state:", df_states['State'].tolist(), index=0)
-                with col2:
-                    # Default to a different state for comparison
-                    default_idx = 1 if len(df_states) > 1 else 0
-                    state2 = st.selectbox("Select second state:", df_states['State'].tolist(), index=default_idx)
-                
-                # Get data for selected states
-                state1_data = df_states[df_states['State'] == state1].iloc[0]
-                state2_data = df_states[df_states['State'] == state2].iloc[0]
-                
-                # Create comparison dataframe
-                comparison_data = pd.DataFrame({
-                    'Metric': ['Population (millions)', 'Area (sq km)', 'Literacy Rate (%)', 'HDI', 'Urbanization (%)'],
-                    state1: [state1_data['Population (millions)'], state1_data['Area (sq km)'], 
-                            state1_data['Literacy Rate (%)'], state1_data['HDI'], state1_data['Urbanization (%)']],
-                    state2: [state2_data['Population (millions)'], state2_data['Area (sq km)'], 
-                            state2_data['Literacy Rate (%)'], state2_data['HDI'], state2_data['Urbanization (%)']],
-                })
-                
-                # Create visual comparison
-                fig = px.bar(comparison_data, x='Metric', y=[state1, state2], barmode='group',
-                            title=f'Comparison: {state1} vs {state2}',
-                            color_discrete_sequence=['#FF9933', '#138808'])
-                
-                # Apply dark theme
-                fig = apply_dark_theme(fig)
-                
-                fig.update_layout(
-                    xaxis_title="",
-                    yaxis_title="Value",
-                    legend_title="State"
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Show additional state info
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(f"""
-                    <div style="background-color:rgba(255, 153, 51, 0.2); padding:15px; border-radius:5px;">
-                        <h4>{state1}</h4>
-                        <p><strong>Capital:</strong> {state1_data['Capital']}</p>
-                        <p><strong>Region:</strong> {state1_data['Region']}</p>
-                        <p><strong>Official Languages:</strong> {state1_data['Official Languages']}</p>
-                        <p><strong>Major Crops:</strong> {state1_data['Major Crops']}</p>
-                        <p><strong>Key Industries:</strong> {state1_data['Key Industries']}</p>
-                        <p><strong>Famous Destinations:</strong> {state1_data['Famous Destinations']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                
-                with col2:
-                    st.markdown(f"""
-                    <div style="background-color:rgba(19, 136, 8, 0.2); padding:15px; border-radius:5px;">
-                        <h4>{state2}</h4>
-                        <p><strong>Capital:</strong> {state2_data['Capital']}</p>
-                        <p><strong>Region:</strong> {state2_data['Region']}</p>
-                        <p><strong>Official Languages:</strong> {state2_data['Official Languages']}</p>
-                        <p><strong>Major Crops:</strong> {state2_data['Major Crops']}</p>
-                        <p><strong>Key Industries:</strong> {state2_data['Key Industries']}</p>
-                        <p><strong>Famous Destinations:</strong> {state2_data['Famous Destinations']}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
+                show_state_comparison(df_states)
+
             else:
                 st.error("Failed to load state data. Please check your data files.")
         except Exception as e:
@@ -407,7 +428,7 @@ def render():
                 legend_title="Species Type"
             )
             
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig, use_container_width=True)
             st.markdown("</div>", unsafe_allow_html=True)
             
             # Protected areas information
@@ -446,7 +467,7 @@ def render():
                     coloraxis_showscale=False
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
             
             with col2:
                 # Add key insight about protected areas
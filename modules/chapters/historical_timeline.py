@@ -4,7 +4,13 @@ import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from modules.utils import apply_dark_theme, load_historical_data, get_color_palette
+from modules.fragments import chapter_fragment
+from modules.dataset_store import COPY_ON_WRITE
+from modules.figure_transport import show_chart
+from modules.lazy_tabs import lazy_tabs
+import hashlib
 import re
+from collections import namedtuple
 
 def generate_default_historical_data():
     """Generate default historical data when real data is insufficient"""
@@ -68,12 +74,91 @@ def generate_default_historical_data():
     ]
     return pd.DataFrame(default_data)
 
+# Function to build the representative aspect scores behind the default radar chart
+@st.cache_data(show_spinner=False)
+def default_radar_pivot(eras, aspects):
+    """
+    Return an Era x Aspect table of representative scores, built once per selection
+
+    Args:
+        eras (tuple): Eras to score
+        aspects (tuple): Aspects to score them on
+
+    Returns:
+        DataFrame: Pivot of the scores (empty if there are no eras)
+    """
+    default_data = []
+    
+    # Create default values for each era and aspect
+    for era in eras:
+        # Create different patterns for different types of eras
+        if 'Ancient' in era or 'Valley' in era or 'Vedic' in era:
+            # Ancient periods strong in cultural, religious, architectural
+            values = {
+                'Cultural Developments': 4.5,
+                'Religious Trends': 4.0,
+                'Economic Systems': 2.5,
+                'Scientific Advances': 2.0,
+                'Art & Architecture': 4.0,
+                'Social Structure': 3.5,
+                'Military Developments': 2.0,
+                'Technological Innovations': 2.5
+            }
+        elif 'Empire' in era or 'Kingdom' in era:
+            # Empires strong in military, administration, architecture
+            values = {
+                'Cultural Developments': 3.5,
+                'Religious Trends': 3.0,
+                'Economic Systems': 4.0,
+                'Scientific Advances': 3.0,
+                'Art & Architecture': 4.5,
+                'Social Structure': 3.0,
+                'Military Developments': 4.5,
+                'Technological Innovations': 3.0
+            }
+        elif 'Modern' in era or 'Republic' in era or 'Contemporary' in era:
+            # Modern periods strong in technology, science, economics
+            values = {
+                'Cultural Developments': 3.0,
+                'Religious Trends': 2.0,
+                'Economic Systems': 4.5,
+                'Scientific Advances': 4.5,
+                'Art & Architecture': 3.0,
+                'Social Structure': 3.5,
+                'Military Developments': 3.0,
+                'Technological Innovations': 5.0
+            }
+        else:
+            # Default balanced pattern
+            values = {
+                'Cultural Developments': 3.0,
+                'Religious Trends': 3.0,
+                'Economic Systems': 3.0,
+                'Scientific Advances': 3.0,
+                'Art & Architecture': 3.0,
+                'Social Structure': 3.0,
+                'Military Developments': 3.0,
+                'Technological Innovations': 3.0
+            }
+        
+        # Only keep aspects that were selected
+        filtered_values = {aspect: values.get(aspect, 2.0) for aspect in aspects}
+        
+        for aspect, value in filtered_values.items():
+            default_data.append({
+                'Era': era,
+                'Aspect': aspect,
+                'Count': value
+            })
+    
+    default_df = pd.DataFrame(default_data)
+    if default_df.empty:
+        return default_df
+    return default_df.pivot(index='Era', columns='Aspect', values='Count').fillna(0)
+
 def create_default_radar_chart(df, aspects, era_colors):
     """Create a default radar chart when real data is insufficient"""
     try:
-        # Generate some default values for each era and aspect
-        default_data = []
-        
         # Get important eras (or all if fewer than 5)
         key_eras = ['Indus Valley Civilization', 'Mauryan Empire', 'Gupta Empire', 
                     'Mughal Empire', 'British Raj', 'Republic of India']
@@ -85,74 +170,10 @@ def create_default_radar_chart(df, aspects, era_colors):
         if not available_eras and not df.empty:
             available_eras = df['Era'].unique()[:min(5, len(df['Era'].unique()))]
         
-        # Create default values for each era and aspect
-        for era in available_eras:
-            # Create different patterns for different types of eras
-            if 'Ancient' in era or 'Valley' in era or 'Vedic' in era:
-                # Ancient periods strong in cultural, religious, architectural
-                values = {
-                    'Cultural Developments': 4.5,
-                    'Religious Trends': 4.0,
-                    'Economic Systems': 2.5,
-                    'Scientific Advances': 2.0,
-                    'Art & Architecture': 4.0,
-                    'Social Structure': 3.5,
-                    'Military Developments': 2.0,
-                    'Technological Innovations': 2.5
-                }
-            elif 'Empire' in era or 'Kingdom' in era:
-                # Empires strong in military, administration, architecture
-                values = {
-                    'Cultural Developments': 3.5,
-                    'Religious Trends': 3.0,
-                    'Economic Systems': 4.0,
-                    'Scientific Advances': 3.0,
-                    'Art & Architecture': 4.5,
-                    'Social Structure': 3.0,
-                    'Military Developments': 4.5,
-                    'Technological Innovations': 3.0
-                }
-            elif 'Modern' in era or 'Republic' in era or 'Contemporary' in era:
-                # Modern periods strong in technology, science, economics
-                values = {
-                    'Cultural Developments': 3.0,
-                    'Religious Trends': 2.0,
-                    'Economic Systems': 4.5,
-                    'Scientific Advances': 4.5,
-                    'Art & Architecture': 3.0,
-                    'Social Structure': 3.5,
-                    'Military Developments': 3.0,
-                    'Technological Innovations': 5.0
-                }
-            else:
-                # Default balanced pattern
-                values = {
-                    'Cultural Developments': 3.0,
-                    'Religious Trends': 3.0,
-                    'Economic Systems': 3.0,
-                    'Scientific Advances': 3.0,
-                    'Art & Architecture': 3.0,
-                    'Social Structure': 3.0,
-                    'Military Developments': 3.0,
-                    'Technological Innovations': 3.0
-                }
-            
-            # Only keep aspects that were selected
-            filtered_values = {aspect: values.get(aspect, 2.0) for aspect in aspects}
-            
-            for aspect, value in filtered_values.items():
-                default_data.append({
-                    'Era': era,
-                    'Aspect': aspect,
-                    'Count': value
-                })
-        
-        # Create DataFrame and pivot table
-        default_df = pd.DataFrame(default_data)
+        # Representative scores per era, pivoted once per selection
+        aspect_pivot = default_radar_pivot(tuple(available_eras), tuple(aspects))
         
-        if not default_df.empty:
-            # Create pivot table
-            aspect_pivot = default_df.pivot(index='Era', columns='Aspect', values='Count').fillna(0)
+        if not aspect_pivot.empty:
             
             # Create the visualization
             fig = go.Figure()
@@ -191,7 +212,7 @@ def create_default_radar_chart(df, aspects, era_colors):
             fig = apply_dark_theme(fig)
             
             # Display the radar chart
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig, use_container_width=True)
             
             # Add explanation about default data
             st.info("This is a representative visualization based on general historical patterns. The actual data for your selection is limited.")
@@ -217,195 +238,10 @@ def create_default_radar_chart(df, aspects, era_colors):
         </div>
         """, unsafe_allow_html=True)
 
-def render():
-    """Render the Historical Timeline chapter content"""
-    st.title("📜 Historical Timeline of India")
-    
-    st.markdown("""
-    <div class='story-text'>
-    India's rich history spans over 5,000 years, from the ancient Indus Valley Civilization to the modern republic. 
-    This journey through time showcases the rise and fall of powerful empires, cultural and scientific achievements, 
-    religious movements, and social transformations that have shaped the world's largest democracy.
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Create default historical timeline data directly in the code
-    default_data = [
-        # Ancient Period
-        {'Year': -2600, 'Era': 'Indus Valley Civilization', 'Event': 'Emergence of Harappa and Mohenjo-daro', 
-         'Significance': 'First major urban civilization in South Asia', 'Region': 'Northwestern India and Pakistan', 
-         'Key Figures': 'Unknown', 'Category': 'Ancient'},
-        
-        {'Year': -1500, 'Era': 'Vedic Period', 'Event': 'Arrival of Indo-Aryans and composition of the Vedas', 
-         'Significance': 'Foundation of Hindu philosophy and practices', 'Region': 'Northern India', 
-         'Key Figures': 'Vedic sages', 'Category': 'Ancient'},
-        
-        {'Year': -599, 'Era': 'Ancient India', 'Event': 'Birth of Mahavira, founder of Jainism', 
-         'Significance': 'Establishment of Jainism', 'Region': 'Eastern India', 
-         'Key Figures': 'Mahavira', 'Category': 'Ancient'},
-        
-        {'Year': -563, 'Era': 'Ancient India', 'Event': 'Birth of Gautama Buddha', 
-         'Significance': 'Founding of Buddhism', 'Region': 'Northern India', 
-         'Key Figures': 'Gautama Buddha', 'Category': 'Ancient'},
-        
-        {'Year': -326, 'Era': 'Ancient India', 'Event': 'Alexander the Great\'s invasion of India', 
-         'Significance': 'First major Western contact with India', 'Region': 'Northwestern India', 
-         'Key Figures': 'Alexander the Great, King Porus', 'Category': 'Ancient'},
-        
-        {'Year': -322, 'Era': 'Mauryan Empire', 'Event': 'Establishment of Mauryan Empire by Chandragupta Maurya', 
-         'Significance': 'First major empire unifying most of India', 'Region': 'Northern and Central India', 
-         'Key Figures': 'Chandragupta Maurya, Chanakya', 'Category': 'Ancient'},
-        
-        {'Year': -273, 'Era': 'Mauryan Empire', 'Event': 'Ashoka the Great becomes emperor', 
-         'Significance': 'Spread of Buddhism and principles of non-violence', 'Region': 'Most of Indian subcontinent', 
-         'Key Figures': 'Ashoka the Great', 'Category': 'Ancient'},
-        
-        {'Year': -185, 'Era': 'Post-Mauryan Period', 'Event': 'Fall of Mauryan Empire', 
-         'Significance': 'Fragmentation of central authority', 'Region': 'Northern India', 
-         'Key Figures': 'Pushyamitra Shunga', 'Category': 'Ancient'},
-        
-        {'Year': 320, 'Era': 'Gupta Empire', 'Event': 'Establishment of Gupta Empire', 
-         'Significance': 'Golden Age of India - advancements in science, art, and literature', 'Region': 'Northern India', 
-         'Key Figures': 'Chandragupta I', 'Category': 'Ancient'},
-        
-        {'Year': 375, 'Era': 'Gupta Empire', 'Event': 'Reign of Chandragupta II (Vikramaditya)', 
-         'Significance': 'Peak of classical Indian civilization', 'Region': 'Northern and Central India', 
-         'Key Figures': 'Chandragupta II', 'Category': 'Ancient'},
-        
-        # Medieval Period
-        {'Year': 606, 'Era': 'Post-Gupta Period', 'Event': 'Harsha establishes empire in North India', 
-         'Significance': 'Last major ancient Indian empire', 'Region': 'Northern India', 
-         'Key Figures': 'Harsha', 'Category': 'Medieval'},
-        
-        {'Year': 712, 'Era': 'Medieval India', 'Event': 'First Arab invasion of Sindh', 
-         'Significance': 'Beginning of Islamic influence in India', 'Region': 'Sindh (modern Pakistan)', 
-         'Key Figures': 'Muhammad bin Qasim', 'Category': 'Medieval'},
-        
-        {'Year': 1206, 'Era': 'Delhi Sultanate', 'Event': 'Establishment of Delhi Sultanate', 
-         'Significance': 'First Muslim dynasty to rule significant parts of India', 'Region': 'Northern India', 
-         'Key Figures': 'Qutb-ud-din Aibak', 'Category': 'Medieval'},
-        
-        {'Year': 1336, 'Era': 'Vijayanagara Empire', 'Event': 'Establishment of Vijayanagara Empire', 
-         'Significance': 'Major Hindu kingdom resisting Islamic expansion', 'Region': 'Southern India', 
-         'Key Figures': 'Harihara I and Bukka Raya I', 'Category': 'Medieval'},
-        
-        {'Year': 1498, 'Era': 'Age of Exploration', 'Event': 'Vasco da Gama reaches Calicut', 
-         'Significance': 'Beginning of European colonial interest in India', 'Region': 'Kerala (Southwest coast)', 
-         'Key Figures': 'Vasco da Gama', 'Category': 'Medieval'},
-        
-        {'Year': 1526, 'Era': 'Mughal Empire', 'Event': 'First Battle of Panipat, establishment of Mughal Empire', 
-         'Significance': 'Beginning of Mughal rule in India', 'Region': 'Northern India', 
-         'Key Figures': 'Babur', 'Category': 'Medieval'},
-        
-        {'Year': 1556, 'Era': 'Mughal Empire', 'Event': 'Akbar becomes emperor', 
-         'Significance': 'Peak of Mughal power and cultural synthesis', 'Region': 'Northern and Central India', 
-         'Key Figures': 'Akbar', 'Category': 'Medieval'},
-        
-        # Colonial Period
-        {'Year': 1600, 'Era': 'Colonial Era', 'Event': 'Formation of East India Company', 
-         'Significance': 'Beginning of British commercial interests in India', 'Region': 'Eastern and Western coastal regions', 
-         'Key Figures': 'Queen Elizabeth I', 'Category': 'Colonial'},
-        
-        {'Year': 1757, 'Era': 'Colonial Era', 'Event': 'Battle of Plassey', 
-         'Significance': 'Beginning of British territorial control in India', 'Region': 'Bengal (Eastern India)', 
-         'Key Figures': 'Robert Clive, Siraj ud-Daulah', 'Category': 'Colonial'},
-        
-        {'Year': 1857, 'Era': 'Colonial Era', 'Event': 'Indian Rebellion (First War of Independence)', 
-         'Significance': 'First major uprising against British rule', 'Region': 'Northern and Central India', 
-         'Key Figures': 'Mangal Pandey, Rani Lakshmibai, Bahadur Shah Zafar', 'Category': 'Colonial'},
-        
-        {'Year': 1858, 'Era': 'British Raj', 'Event': 'British Crown takes direct control of India', 
-         'Significance': 'End of East India Company rule, beginning of British Raj', 'Region': 'All India', 
-         'Key Figures': 'Queen Victoria', 'Category': 'Colonial'},
-        
-        {'Year': 1885, 'Era': 'Independence Movement', 'Event': 'Formation of Indian National Congress', 
-         'Significance': 'Beginning of organized political movement for independence', 'Region': 'All India', 
-         'Key Figures': 'A.O. Hume, Dadabhai Naoroji', 'Category': 'Colonial'},
-        
-        {'Year': 1915, 'Era': 'Independence Movement', 'Event': 'Gandhi returns to India from South Africa', 
-         'Significance': 'Beginning of Gandhi\'s leadership in freedom struggle', 'Region': 'All India', 
-         'Key Figures': 'Mahatma Gandhi', 'Category': 'Colonial'},
-        
-        {'Year': 1942, 'Era': 'Independence Movement', 'Event': 'Quit India Movement', 
-         'Significance': 'Final major push for independence', 'Region': 'All India', 
-         'Key Figures': 'Mahatma Gandhi', 'Category': 'Colonial'},
-        
-        # Modern Period
-        {'Year': 1947, 'Era': 'Independence', 'Event': 'Independence and Partition of India', 
-         'Significance': 'End of British rule, creation of India and Pakistan', 'Region': 'All India', 
-         'Key Figures': 'Jawaharlal Nehru, Muhammad Ali Jinnah, Lord Mountbatten', 'Category': 'Modern'},
-        
-        {'Year': 1950, 'Era': 'Republic of India', 'Event': 'Constitution of India comes into effect', 
-         'Significance': 'India becomes a sovereign democratic republic', 'Region': 'All India', 
-         'Key Figures': 'Dr. B.R. Ambedkar, Rajendra Prasad', 'Category': 'Modern'},
-        
-        {'Year': 1991, 'Era': 'Economic Reforms', 'Event': 'Economic liberalization begins', 
-         'Significance': 'Opening of Indian economy to global market', 'Region': 'All India', 
-         'Key Figures': 'P.V. Narasimha Rao, Manmohan Singh', 'Category': 'Modern'},
-        
-        {'Year': 2014, 'Era': 'Modern India', 'Event': 'BJP forms majority government', 
-         'Significance': 'Shift in political landscape', 'Region': 'All India', 
-         'Key Figures': 'Narendra Modi', 'Category': 'Modern'},
-        
-        {'Year': 2023, 'Era': 'Modern India', 'Event': 'India becomes most populous country', 
-         'Significance': 'Demographic milestone', 'Region': 'All India', 
-         'Key Figures': 'Various', 'Category': 'Modern'}
-    ]
-    
-    # Create DataFrame
-    df = pd.DataFrame(default_data)
-    
-    # Process the data for visualization
-    try:
-        # Add additional computed columns
-        df['Period'] = df['Year'].apply(lambda x: 'BCE' if x < 0 else 'CE')
-        df['Display Year'] = df['Year'].apply(lambda x: f"{abs(x)} {'BCE' if x < 0 else 'CE'}")
-        df['Time Period'] = df['Display Year']
-        
-        # Create categories for the different periods
-        df['Category'] = 'Other'
-        df.loc[df['Year'] < 600, 'Category'] = 'Ancient'
-        df.loc[(df['Year'] >= 600) & (df['Year'] < 1757), 'Category'] = 'Medieval'
-        df.loc[(df['Year'] >= 1757) & (df['Year'] < 1947), 'Category'] = 'Colonial'
-        df.loc[df['Year'] >= 1947, 'Category'] = 'Modern'
-        
-        # Prepare the Major Events column by combining Event and Significance
-        df['Major Events'] = df.apply(
-            lambda row: f"{row['Event']}. {row['Significance']}" if pd.notna(row['Significance']) else row['Event'], 
-            axis=1
-        )
-        
-        # Sort by year for chronological display
-        df = df.sort_values('Year')
-    except Exception as e:
-        st.error(f"Error processing historical data: {e}")
-        return
-    
-    # Define color scheme for different time periods
-    period_colors = {
-        "Ancient": "#E3663E",
-        "Medieval": "#6C8CBF",
-        "Colonial": "#4D9078",
-        "Modern": "#FFC857"
-    }
-    
-    # Create era colors for the individual eras
-    era_colors = {}
-    unique_eras = df['Era'].unique()
-    color_palette = get_color_palette(len(unique_eras))
-    for i, era in enumerate(unique_eras):
-        era_colors[era] = color_palette[i]
-    
-    # INTERACTIVE TIMELINE SECTION
-    st.header("Interactive Timeline of Indian History")
-    
-    st.markdown("""
-    <div class='story-text'>
-    Use the slider below to explore key eras in Indian history. Each period represents a major 
-    historical era with unique cultural, political, and social characteristics.
-    </div>
-    """, unsafe_allow_html=True)
-    
+# Fragment for the era explorer so moving the slider reruns only the era details
+@chapter_fragment
+def show_era_explorer(df, era_colors):
+    """Render the era slider with the selected era's details"""
     # Create a slider for timeline navigation
     selected_index = st.slider(
         "Explore Historical Periods",
@@ -414,13 +250,13 @@ def render():
         value=0,
         format=None
     )
-    
+
     # Get the selected era data
     selected_era = df.iloc[selected_index]
-    
+
     # Display era information in two columns
     col1, col2 = st.columns([1, 2])
-    
+
     # Left column: Basic information
     with col1:
         with st.container():
@@ -428,19 +264,19 @@ def render():
             era_name = selected_era['Era'] if 'Era' in selected_era else "Unknown Era"
             era_color = era_colors.get(era_name, "#FFFFFF")
             st.markdown(f"<h2 style='color:{era_color}'>{era_name}</h2>", unsafe_allow_html=True)
-            
+
             # Time period with BCE/CE notation
             if 'Display Year' in selected_era:
                 st.markdown(f"**Period:** {selected_era['Display Year']}")
-            
+
             # Key figures if available
             if 'Key Figures' in selected_era and pd.notna(selected_era['Key Figures']):
                 st.markdown(f"**Key Figures:** {selected_era['Key Figures']}")
-            
+
             # Region if available
             if 'Region' in selected_era and pd.notna(selected_era['Region']):
                 st.markdown(f"**Region:** {selected_era['Region']}")
-            
+
             # Create era badge based on category
             badge_colors = {
                 'Ancient': '#9C6644',
@@ -450,7 +286,7 @@ def render():
                 'Modern': '#3366CC',
                 'Other': '#888888'
             }
-            
+
             # Display period badge
             period_category = selected_era.get('Category', 'Other')
             if period_category in badge_colors:
@@ -463,38 +299,38 @@ def render():
                     </span>
                 </div>
                 """, unsafe_allow_html=True)
-    
+
     # Right column: Detailed information
     with col2:
         # Create tabs for different aspects
         tabs = st.tabs(["Major Events", "Culture & Society", "Economy & Technology"])
-        
+
         # Tab 1: Major Events
         with tabs[0]:
             st.markdown(f"### Key Historical Events")
-            
+
             if 'Event' in selected_era and pd.notna(selected_era['Event']):
                 st.markdown(f"**Event:** {selected_era['Event']}")
-                
+
                 if 'Significance' in selected_era and pd.notna(selected_era['Significance']):
                     st.markdown(f"**Significance:** {selected_era['Significance']}")
             else:
                 st.info("No major events information available for this period.")
-            
+
             if 'Region' in selected_era and pd.notna(selected_era['Region']):
                 st.markdown("#### Region")
                 st.markdown(f"{selected_era['Region']}")
-        
+
         # Tab 2: Culture & Society
         with tabs[1]:
             st.markdown("### Cultural & Social Context")
-            
+
             # Generate content based on the era
             era_name = selected_era.get('Era', '')
             period = selected_era.get('Category', 'Other')
-            
+
             cultural_content = ""
-            
+
             if period == 'Ancient':
                 if 'Indus Valley' in era_name:
                     cultural_content = """
@@ -512,7 +348,7 @@ def render():
                     cultural_content = """
                     Ancient Indian society developed sophisticated philosophical systems, early scientific knowledge, and diverse artistic traditions. Religious developments included early Hinduism, Buddhism, and Jainism, while social structures were organized around the varna (caste) system.
                     """
-            
+
             elif period == 'Medieval':
                 if 'Delhi Sultanate' in era_name:
                     cultural_content = """
@@ -526,29 +362,29 @@ def render():
                     cultural_content = """
                     Medieval India saw significant cultural synthesis between Hindu and Islamic traditions. Regional kingdoms developed distinctive architectural styles, literary traditions, and artistic expressions. This period witnessed the growth of Bhakti and Sufi movements emphasizing personal devotion and challenging social hierarchies.
                     """
-            
+
             elif period == 'Colonial':
                 cultural_content = """
                 The colonial period introduced Western education, legal systems, and cultural influences. This era saw the emergence of reform movements addressing social practices like sati and child marriage. Modern Indian literature developed in both regional languages and English, while art forms began incorporating Western techniques alongside traditional styles.
                 """
-            
+
             elif period == 'Modern':
                 cultural_content = """
                 Modern India has developed a vibrant blend of traditional and contemporary cultural expressions. Cinema (Bollywood and regional industries), literature, and arts reflect India's diverse heritage while engaging with global trends. Cultural policy has emphasized both preserving traditional forms and promoting innovation in the arts.
                 """
-            
+
             st.markdown(cultural_content)
-        
+
         # Tab 3: Economy & Technology
         with tabs[2]:
             st.markdown("### Economic & Technological Context")
-            
+
             # Generate content based on the era
             era_name = selected_era.get('Era', '')
             period = selected_era.get('Category', 'Other')
-            
+
             economic_content = ""
-            
+
             if period == 'Ancient':
                 if 'Indus Valley' in era_name:
                     economic_content = """
@@ -570,373 +406,494 @@ def render():
                     economic_content = """
                     Ancient Indian economies developed sophisticated trade networks, standardized currency systems, and specialized craft production. Technological innovations included advances in metallurgy, textile production, and water management systems for agriculture.
                     """
-            
+
             elif period == 'Medieval':
                 economic_content = """
                 Medieval Indian economies were primarily agricultural with significant international trade. Technological innovations included improvements in textile production (particularly cotton and silk), shipbuilding, and metallurgy. Regional trading networks connected with broader Indian Ocean and Central Asian commercial systems.
                 """
-            
+
             elif period == 'Colonial':
                 economic_content = """
                 The colonial economy was restructured to serve British interests, with railway networks, telegraph systems, and modern infrastructure introduced primarily for resource extraction. Traditional industries declined while plantation agriculture (tea, cotton, indigo) expanded. Late colonial period saw limited industrialization focused on textiles and steel.
                 """
-            
+
             elif period == 'Modern':
                 economic_content = """
                 Post-independence India initially followed a planned economic model before transitioning to liberalization in 1991. Technological developments include a space program, nuclear capabilities, and a globally significant IT sector. Digital initiatives like Aadhaar (biometric ID) and UPI (payment system) represent recent innovations in governance and financial inclusion.
                 """
-            
+
             st.markdown(economic_content)
+
+# Historical events shown in the timeline, one row per event
+TIMELINE_EVENTS = [
+    # Ancient Period
+    {'Year': -2600, 'Era': 'Indus Valley Civilization', 'Event': 'Emergence of Harappa and Mohenjo-daro', 
+     'Significance': 'First major urban civilization in South Asia', 'Region': 'Northwestern India and Pakistan', 
+     'Key Figures': 'Unknown', 'Category': 'Ancient'},
+    
+    {'Year': -1500, 'Era': 'Vedic Period', 'Event': 'Arrival of Indo-Aryans and composition of the Vedas', 
+     'Significance': 'Foundation of Hindu philosophy and practices', 'Region': 'Northern India', 
+     'Key Figures': 'Vedic sages', 'Category': 'Ancient'},
+    
+    {'Year': -599, 'Era': 'Ancient India', 'Event': 'Birth of Mahavira, founder of Jainism', 
+     'Significance': 'Establishment of Jainism', 'Region': 'Eastern India', 
+     'Key Figures': 'Mahavira', 'Category': 'Ancient'},
+    
+    {'Year': -563, 'Era': 'Ancient India', 'Event': 'Birth of Gautama Buddha', 
+     'Significance': 'Founding of Buddhism', 'Region': 'Northern India', 
+     'Key Figures': 'Gautama Buddha', 'Category': 'Ancient'},
+    
+    {'Year': -326, 'Era': 'Ancient India', 'Event': 'Alexander the Great\'s invasion of India', 
+     'Significance': 'First major Western contact with India', 'Region': 'Northwestern India', 
+     'Key Figures': 'Alexander the Great, King Porus', 'Category': 'Ancient'},
+    
+    {'Year': -322, 'Era': 'Mauryan Empire', 'Event': 'Establishment of Mauryan Empire by Chandragupta Maurya', 
+     'Significance': 'First major empire unifying most of India', 'Region': 'Northern and Central India', 
+     'Key Figures': 'Chandragupta Maurya, Chanakya', 'Category': 'Ancient'},
+    
+    {'Year': -273, 'Era': 'Mauryan Empire', 'Event': 'Ashoka the Great becomes emperor', 
+     'Significance': 'Spread of Buddhism and principles of non-violence', 'Region': 'Most of Indian subcontinent', 
+     'Key Figures': 'Ashoka the Great', 'Category': 'Ancient'},
+    
+    {'Year': -185, 'Era': 'Post-Mauryan Period', 'Event': 'Fall of Mauryan Empire', 
+     'Significance': 'Fragmentation of central authority', 'Region': 'Northern India', 
+     'Key Figures': 'Pushyamitra Shunga', 'Category': 'Ancient'},
+    
+    {'Year': 320, 'Era': 'Gupta Empire', 'Event': 'Establishment of Gupta Empire', 
+     'Significance': 'Golden Age of India - advancements in science, art, and literature', 'Region': 'Northern India', 
+     'Key Figures': 'Chandragupta I', 'Category': 'Ancient'},
+    
+    {'Year': 375, 'Era': 'Gupta Empire', 'Event': 'Reign of Chandragupta II (Vikramaditya)', 
+     'Significance': 'Peak of classical Indian civilization', 'Region': 'Northern and Central India', 
+     'Key Figures': 'Chandragupta II', 'Category': 'Ancient'},
+    
+    # Medieval Period
+    {'Year': 606, 'Era': 'Post-Gupta Period', 'Event': 'Harsha establishes empire in North India', 
+     'Significance': 'Last major ancient Indian empire', 'Region': 'Northern India', 
+     'Key Figures': 'Harsha', 'Category': 'Medieval'},
+    
+    {'Year': 712, 'Era': 'Medieval India', 'Event': 'First Arab invasion of Sindh', 
+     'Significance': 'Beginning of Islamic influence in India', 'Region': 'Sindh (modern Pakistan)', 
+     'Key Figures': 'Muhammad bin Qasim', 'Category': 'Medieval'},
+    
+    {'Year': 1206, 'Era': 'Delhi Sultanate', 'Event': 'Establishment of Delhi Sultanate', 
+     'Significance': 'First Muslim dynasty to rule significant parts of India', 'Region': 'Northern India', 
+     'Key Figures': 'Qutb-ud-din Aibak', 'Category': 'Medieval'},
+    
+    {'Year': 1336, 'Era': 'Vijayanagara Empire', 'Event': 'Establishment of Vijayanagara Empire', 
+     'Significance': 'Major Hindu kingdom resisting Islamic expansion', 'Region': 'Southern India', 
+     'Key Figures': 'Harihara I and Bukka Raya I', 'Category': 'Medieval'},
+    
+    {'Year': 1498, 'Era': 'Age of Exploration', 'Event': 'Vasco da Gama reaches Calicut', 
+     'Significance': 'Beginning of European colonial interest in India', 'Region': 'Kerala (Southwest coast)', 
+     'Key Figures': 'Vasco da Gama', 'Category': 'Medieval'},
+    
+    {'Year': 1526, 'Era': 'Mughal Empire', 'Event': 'First Battle of Panipat, establishment of Mughal Empire', 
+     'Significance': 'Beginning of Mughal rule in India', 'Region': 'Northern India', 
+     'Key Figures': 'Babur', 'Category': 'Medieval'},
+    
+    {'Year': 1556, 'Era': 'Mughal Empire', 'Event': 'Akbar becomes emperor', 
+     'Significance': 'Peak of Mughal power and cultural synthesis', 'Region': 'Northern and Central India', 
+     'Key Figures': 'Akbar', 'Category': 'Medieval'},
+    
+    # Colonial Period
+    {'Year': 1600, 'Era': 'Colonial Era', 'Event': 'Formation of East India Company', 
+     'Significance': 'Beginning of British commercial interests in India', 'Region': 'Eastern and Western coastal regions', 
+     'Key Figures': 'Queen Elizabeth I', 'Category': 'Colonial'},
+    
+    {'Year': 1757, 'Era': 'Colonial Era', 'Event': 'Battle of Plassey', 
+     'Significance': 'Beginning of British territorial control in India', 'Region': 'Bengal (Eastern India)', 
+     'Key Figures': 'Robert Clive, Siraj ud-Daulah', 'Category': 'Colonial'},
+    
+    {'Year': 1857, 'Era': 'Colonial Era', 'Event': 'Indian Rebellion (First War of Independence)', 
+     'Significance': 'First major uprising against British rule', 'Region': 'Northern and Central India', 
+     'Key Figures': 'Mangal Pandey, Rani Lakshmibai, Bahadur Shah Zafar', 'Category': 'Colonial'},
+    
+    {'Year': 1858, 'Era': 'British Raj', 'Event': 'British Crown takes direct control of India', 
+     'Significance': 'End of East India Company rule, beginning of British Raj', 'Region': 'All India', 
+     'Key Figures': 'Queen Victoria', 'Category': 'Colonial'},
+    
+    {'Year': 1885, 'Era': 'Independence Movement', 'Event': 'Formation of Indian National Congress', 
+     'Significance': 'Beginning of organized political movement for independence', 'Region': 'All India', 
+     'Key Figures': 'A.O. Hume, Dadabhai Naoroji', 'Category': 'Colonial'},
+    
+    {'Year': 1915, 'Era': 'Independence Movement', 'Event': 'Gandhi returns to India from South Africa', 
+     'Significance': 'Beginning of Gandhi\'s leadership in freedom struggle', 'Region': 'All India', 
+     'Key Figures': 'Mahatma Gandhi', 'Category': 'Colonial'},
+    
+    {'Year': 1942, 'Era': 'Independence Movement', 'Event': 'Quit India Movement', 
+     'Significance': 'Final major push for independence', 'Region': 'All India', 
+     'Key Figures': 'Mahatma Gandhi', 'Category': 'Colonial'},
+    
+    # Modern Period
+    {'Year': 1947, 'Era': 'Independence', 'Event': 'Independence and Partition of India', 
+     'Significance': 'End of British rule, creation of India and Pakistan', 'Region': 'All India', 
+     'Key Figures': 'Jawaharlal Nehru, Muhammad Ali Jinnah, Lord Mountbatten', 'Category': 'Modern'},
+    
+    {'Year': 1950, 'Era': 'Republic of India', 'Event': 'Constitution of India comes into effect', 
+     'Significance': 'India becomes a sovereign democratic republic', 'Region': 'All India', 
+     'Key Figures': 'Dr. B.R. Ambedkar, Rajendra Prasad', 'Category': 'Modern'},
+    
+    {'Year': 1991, 'Era': 'Economic Reforms', 'Event': 'Economic liberalization begins', 
+     'Significance': 'Opening of Indian economy to global market', 'Region': 'All India', 
+     'Key Figures': 'P.V. Narasimha Rao, Manmohan Singh', 'Category': 'Modern'},
+    
+    {'Year': 2014, 'Era': 'Modern India', 'Event': 'BJP forms majority government', 
+     'Significance': 'Shift in political landscape', 'Region': 'All India', 
+     'Key Figures': 'Narendra Modi', 'Category': 'Modern'},
+    
+    {'Year': 2023, 'Era': 'Modern India', 'Event': 'India becomes most populous country', 
+     'Significance': 'Demographic milestone', 'Region': 'All India', 
+     'Key Figures': 'Various', 'Category': 'Modern'}
+]
+
+# Historical periods as (name, first year, first year of the next period)
+PERIOD_BOUNDS = [
+    ('Ancient', None, 600),
+    ('Medieval', 600, 1757),
+    ('Colonial', 1757, 1947),
+    ('Modern', 1947, None)
+]
+
+# Define color scheme for different time periods
+PERIOD_COLORS = {
+    "Ancient": "#E3663E",
+    "Medieval": "#6C8CBF",
+    "Colonial": "#4D9078",
+    "Modern": "#FFC857"
+}
+
+# Version of TIMELINE_EVENTS; a changed event list builds a new index
+TIMELINE_VERSION = hashlib.sha1(repr(TIMELINE_EVENTS).encode()).hexdigest()[:16]
+
+# Most markers a timeline figure shows before dense stretches are grouped
+TIMELINE_MAX_MARKERS = 60
+
+# Events and eras in a visible window; aggregated is True when events holds grouped markers
+TimelineView = namedtuple('TimelineView', ['start', 'end', 'events', 'eras', 'aggregated'])
+
+# Helper function to format years as "320 BCE" / "1947 CE"
+def _display_years(years):
+    years = pd.Series(years)
+    return years.abs().astype(str) + np.where(years < 0, ' BCE', ' CE')
+
+# Function to get the year range [start, end) of a period
+def period_range(name):
+    """Return the (start, end) years of a PERIOD_BOUNDS period; None means open ended"""
+    for period, start, end in PERIOD_BOUNDS:
+        if period == name:
+            return start, end
+    raise KeyError(name)
+
+# Function to derive the display columns of the timeline in one vectorized pass
+def build_timeline_frame(events):
+    """
+    Return the events sorted by year with Period, Display Year, Time Period,
+    Category and Major Events added
+
+    Args:
+        events: List of event dicts or a DataFrame with Year, Era, Event and Significance
+
+    Returns:
+        DataFrame: The prepared timeline with a 0..n-1 index
+    """
+    df = pd.DataFrame(events)
+    df = df.sort_values('Year', kind='stable', ignore_index=True)
+    years = df['Year'].to_numpy()
+
+    df['Period'] = np.where(years < 0, 'BCE', 'CE')
+    df['Display Year'] = _display_years(df['Year'])
+    df['Time Period'] = df['Display Year']
+
+    # Map each year to its period with one binary search over the period boundaries
+    boundaries = [start for _, start, _ in PERIOD_BOUNDS[1:]]
+    names = np.array([name for name, _, _ in PERIOD_BOUNDS])
+    df['Category'] = names[np.searchsorted(boundaries, years, side='right')]
+
+    # Combine Event and Significance where a significance is given
+    df['Major Events'] = df['Event'].where(
+        df['Significance'].isna(),
+        df['Event'] + '. ' + df['Significance'].fillna('')
+    )
+    return df
+
+# Class indexing the prepared timeline by year
+class TimelineIndex:
+    """
+    Read-only timeline with a sorted year array for range queries
+
+    period(), window() and era() locate their rows with np.searchsorted (or a
+    precomputed position array for eras) instead of masking the whole frame,
+    so zooming stays cheap as the event list grows. Eras are kept as an
+    interval index over [first event year, end of the era), and query()
+    combines both into what a zoomed figure needs.
+    """
+
+    def __init__(self, frame, version):
+        self.frame = frame
+        self.version = version
+        self.years = frame['Year'].to_numpy()
+        eras = frame['Era'].unique()
+        palette = get_color_palette(len(eras))
+        self.era_colors = {era: palette[i % len(palette)] for i, era in enumerate(eras)}
+        self.era_positions = {era: positions for era, positions in frame.groupby('Era', sort=False, observed=True).indices.items()}
+
+        # Era intervals sorted by start; an era lasts until its last event or until the
+        # next era begins. The running maximum of the ends is sorted too, so both sides
+        # of an overlap query are binary searches
+        spans = frame.groupby('Era', sort=False, observed=True)['Year'].agg(['min', 'max']).sort_values('min', kind='stable')
+        starts = spans['min'].to_numpy()
+        next_starts = np.append(starts[1:], starts[-1:] + 1) if len(starts) else starts
+        self.eras = pd.DataFrame({
+            'Era': spans.index,
+            'Start': starts,
+            'End': np.maximum(spans['max'].to_numpy() + 1, next_starts),
+            'Color': [self.era_colors[era] for era in spans.index]
+        })
+        self.era_starts = self.eras['Start'].to_numpy()
+        self.era_ends_max = np.maximum.accumulate(self.eras['End'].to_numpy()) if len(self.eras) else self.era_starts
+
+    def _rows(self, positions):
+        # Without copy-on-write a slice would share writable buffers with the index
+        rows = self.frame.iloc[positions]
+        return rows.copy(deep=not COPY_ON_WRITE)
+
+    def bounds(self, start=None, end=None):
+        """Return the row positions [lo, hi) of the events with start <= Year < end"""
+        lo = 0 if start is None else int(np.searchsorted(self.years, start, side='left'))
+        hi = len(self.years) if end is None else int(np.searchsorted(self.years, end, side='left'))
+        return lo, max(lo, hi)
+
+    def window(self, start=None, end=None):
+        """Return the events with start <= Year < end (open ended where None)"""
+        lo, hi = self.bounds(start, end)
+        return self._rows(slice(lo, hi))
+
+    def period(self, name):
+        """Return the events of one PERIOD_BOUNDS period"""
+        return self.window(*period_range(name))
+
+    def era(self, name):
+        """Return the events of one era"""
+        return self._rows(self.era_positions.get(name, []))
+
+    def eras_overlapping(self, start=None, end=None):
+        """Return the eras whose interval overlaps [start, end)"""
+        # Eras starting at or after end can't overlap, nor can those ending before start
+        lo = 0 if start is None else int(np.searchsorted(self.era_ends_max, start, side='right'))
+        hi = len(self.era_starts) if end is None else int(np.searchsorted(self.era_starts, end, side='left'))
+        candidates = self.eras.iloc[lo:max(lo, hi)]
+        if start is not None:
+            candidates = candidates[candidates['End'].to_numpy() > start]
+        return candidates.copy(deep=not COPY_ON_WRITE)
+
+    def _aggregate(self, lo, hi, max_markers):
+        # Group the events into max_markers equal-width year bins and keep the non-empty ones
+        years = self.years[lo:hi]
+        edges = np.linspace(years[0], years[-1] + 1, max_markers + 1)
+        bins = np.searchsorted(edges, years, side='right') - 1
+        grouped = pd.DataFrame({
+            'Bin': bins,
+            'Year': years,
+            'Era': self.frame['Era'].to_numpy()[lo:hi]
+        }).groupby('Bin', sort=True)
+        markers = grouped.agg(First=('Year', 'min'), Last=('Year', 'max'), Count=('Year', 'size'), Era=('Era', 'first'))
+        markers = markers.reset_index(drop=True)
+        markers['Year'] = (markers['First'] + markers['Last']) // 2
+        markers['Display Year'] = _display_years(markers['First']) + ' to ' + _display_years(markers['Last'])
+        markers['Label'] = markers['Count'].astype(str) + ' events'
+        return markers
+
+    def query(self, start=None, end=None, max_markers=TIMELINE_MAX_MARKERS):
+        """
+        Return the events and eras overlapping [start, end) for a timeline figure
+
+        Above max_markers events the window is reduced to at most max_markers
+        grouped markers (one per year bin with its event count), so the size
+        of a figure depends on the screen, not on the number of events.
+
+        Returns:
+            TimelineView: events has Year, Era, Display Year, Count and Label columns
+        """
+        lo, hi = self.bounds(start, end)
+        eras = self.eras_overlapping(start, end)
+        if hi - lo > max_markers:
+            return TimelineView(start, end, self._aggregate(lo, hi, max_markers), eras, True)
+
+        events = self._rows(slice(lo, hi))
+        events['Count'] = 1
+        events['Label'] = events['Era']
+        return TimelineView(start, end, events, eras, False)
+
+    def __len__(self):
+        return len(self.years)
+
+# Function to build the timeline index once per process and data version
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _build_timeline_index(version, _events):
+    return TimelineIndex(build_timeline_frame(_events), version)
+
+# Function to get the shared timeline index
+def get_timeline_index():
+    """Return the TimelineIndex for the current TIMELINE_EVENTS"""
+    return _build_timeline_index(TIMELINE_VERSION, TIMELINE_EVENTS)
+
+# Function to draw a timeline view as markers over era bands
+def build_timeline_figure(view, color, title, height=300):
+    """
+    Create the timeline figure for a TimelineView
+
+    Args:
+        view (TimelineView): Result of TimelineIndex.query()
+        color (str): Marker and line color
+        title (str): Figure title
+        height (int): Figure height in pixels
+
+    Returns:
+        Figure: Plotly figure with one marker per event (or per group of events)
+    """
+    events = view.events
+    fig = go.Figure()
+
+    # Shade the eras overlapping the window behind the events
+    for era in view.eras.itertuples(index=False):
+        x0 = era.Start if view.start is None else max(era.Start, view.start)
+        x1 = era.End if view.end is None else min(era.End, view.end)
+        fig.add_vrect(x0=x0, x1=x1, fillcolor=era.Color, opacity=0.12, line_width=0, layer='below')
+
+    # Grouped markers grow with the number of events they stand for
+    sizes = np.clip(10 + 4 * np.log2(events['Count'].to_numpy()), 10, 28) if view.aggregated else 16
+
+    # Add events as scatter points
+    fig.add_trace(go.Scatter(
+        x=events['Year'],
+        y=[1] * len(events),
+        mode='markers+text',
+        marker=dict(
+            symbol='circle',
+            size=sizes,
+            color=color,
+            line=dict(width=2, color='white')
+        ),
+        text=events['Label'],
+        customdata=events[['Display Year', 'Count']].to_numpy(),
+        textposition="top center",
+        hovertemplate='<b>%{text}</b><br>%{customdata[0]}<extra></extra>'
+    ))
+
+    # Add a line connecting all points
+    fig.add_trace(go.Scatter(
+        x=events['Year'],
+        y=[1] * len(events),
+        mode='lines',
+        line=dict(color=color, width=3),
+        hoverinfo='skip'
+    ))
+
+    has_bce = not events.empty and events['Year'].min() < 0
+    fig.update_layout(
+        showlegend=False,
+        xaxis=dict(
+            title="Year (Negative values represent BCE)" if has_bce else "Year (CE)",
+            showgrid=False,
+            zeroline=False,
+            showline=True,
+            linecolor='rgba(255,255,255,0.2)',
+            tickfont=dict(color='rgba(255,255,255,0.7)')
+        ),
+        yaxis=dict(
+            showticklabels=False,
+            showgrid=False,
+            zeroline=False,
+            showline=False,
+            range=[0.5, 1.5]
+        ),
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=height,
+        title=dict(
+            text=title,
+            font=dict(color='rgba(255,255,255,0.9)'),
+            x=0.5
+        )
+    )
+    return apply_dark_theme(fig)
+
+# Fragment for the zoomable timeline so moving the range slider reruns only this section
+@chapter_fragment
+def show_zoomable_timeline(timeline):
+    """Render a year range slider with the events and eras overlapping it"""
+    first, last = int(timeline.years[0]), int(timeline.years[-1])
+    start, end = st.slider(
+        "Zoom to years (negative values are BCE)",
+        min_value=first,
+        max_value=last,
+        value=(first, last),
+        key="timeline_zoom"
+    )
+
+    # Only the events and eras inside the window are sent to the browser
+    view = timeline.query(start, end + 1)
+    title = f"{_display_years([start])[0]} to {_display_years([end])[0]}"
+    show_chart(build_timeline_figure(view, "#FF9933", title, height=320), use_container_width=True)
+
+    count = int(view.events['Count'].sum()) if not view.events.empty else 0
+    if view.aggregated:
+        st.caption(f"{count} events in view, grouped into {len(view.events)} markers. Narrow the range to see single events.")
+    else:
+        st.caption(f"{count} events and {len(view.eras)} eras in view.")
+
+def render():
+    """Render the Historical Timeline chapter content"""
+    st.title("📜 Historical Timeline of India")
+    
+    st.markdown("""
+    <div class='story-text'>
+    India's rich history spans over 5,000 years, from the ancient Indus Valley Civilization to the modern republic. 
+    This journey through time showcases the rise and fall of powerful empires, cultural and scientific achievements, 
+    religious movements, and social transformations that have shaped the world's largest democracy.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Derived columns, era colors and the sorted year array are built once per data version
+    try:
+        timeline = get_timeline_index()
+    except Exception as e:
+        st.error(f"Error processing historical data: {e}")
+        return
+    df = timeline.frame
+    era_colors = timeline.era_colors
+    period_colors = PERIOD_COLORS
+    
+    # INTERACTIVE TIMELINE SECTION
+    st.header("Interactive Timeline of Indian History")
     
+    st.markdown("""
+    <div class='story-text'>
+    Use the slider below to explore key eras in Indian history. Each period represents a major 
+    historical era with unique cultural, political, and social characteristics.
+    </div>
+    """, unsafe_allow_html=True)
+    
+    show_era_explorer(df, era_colors)
+
     # VISUAL TIMELINE SECTION
     st.header("Visual Timeline of Indian History")
     
-    # Create tabs for different time periods
-    timeline_tabs = st.tabs([
-        "Ancient (Before 600 CE)", 
-        "Medieval (600-1757 CE)", 
-        "Colonial (1757-1947)",
-        "Modern (1947-Present)"
-    ])
-    
-    # ANCIENT PERIOD TAB
-    with timeline_tabs[0]:
-        st.markdown(f"<h3 style='color:{period_colors['Ancient']}'>Ancient India</h3>", unsafe_allow_html=True)
-        
-        # Filter data for ancient period
-        ancient_df = df[df['Category'] == 'Ancient'].copy()
-        
-        if not ancient_df.empty:
-            # Create visualization
-            fig = go.Figure()
-            
-            # Add events as scatter points
-            fig.add_trace(go.Scatter(
-                x=ancient_df['Year'],
-                y=[1] * len(ancient_df),
-                mode='markers+text',
-                marker=dict(
-                    symbol='circle',
-                    size=16,
-                    color=period_colors['Ancient'],
-                    line=dict(width=2, color='white')
-                ),
-                text=ancient_df['Era'],
-                textposition="top center",
-                hovertemplate='<b>%{text}</b><br>Year: %{x}<extra></extra>'
-            ))
-            
-            # Add a line connecting all points
-            fig.add_trace(go.Scatter(
-                x=ancient_df['Year'],
-                y=[1] * len(ancient_df),
-                mode='lines',
-                line=dict(color=period_colors['Ancient'], width=3),
-                hoverinfo='skip'
-            ))
-            
-            # Update layout
-            fig.update_layout(
-                title="Ancient Indian Timeline",
-                showlegend=False,
-                yaxis=dict(
-                    showticklabels=False,
-                    showgrid=False,
-                    zeroline=False,
-                    range=[0.5, 1.5]
-                ),
-                xaxis=dict(
-                    title="Year (Negative values represent BCE)",
-                    gridcolor='rgba(255,255,255,0.2)'
-                ),
-                height=250,
-                margin=dict(l=10, r=10, t=50, b=30),
-            )
-            
-            # Apply dark theme
-            fig = apply_dark_theme(fig)
-            
-            # Display timeline
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display key events in a formatted table
-            st.subheader("Key Events in Ancient India")
-            
-            for _, row in ancient_df.iterrows():
-                st.markdown(f"""
-                <div style='margin-bottom:15px; padding:10px; border-radius:5px; background-color:rgba(227, 102, 62, 0.1);'>
-                    <div style='display:flex; justify-content:space-between;'>
-                        <span style='font-weight:bold; color:{period_colors["Ancient"]};'>{row['Era']}</span>
-                        <span style='color:#AAAAAA;'>{row['Display Year']}</span>
-                    </div>
-                    <div style='margin-top:5px;'>
-                        <span>{row['Event']}</span>
-                    </div>
-                    <div style='margin-top:5px; font-size:0.9em;'>
-                        {row['Significance'] if pd.notna(row['Significance']) else ''}
-                    </div>
-                </div>
-                """, unsafe_allow_html=True)
-        else:
-            st.info("No data available for the ancient period.")
+    # Zoomable view over the whole timeline
+    show_zoomable_timeline(timeline)
     
-    # MEDIEVAL PERIOD TAB
-    with timeline_tabs[1]:
-        st.markdown(f"<h3 style='color:{period_colors['Medieval']}'>Medieval India</h3>", unsafe_allow_html=True)
-        
-        # Filter data for medieval period
-        medieval_df = df[df['Category'] == 'Medieval'].copy()
-        
-        if not medieval_df.empty:
-            # Create visualization
-            fig = go.Figure()
-            
-            # Add events as scatter points
-            fig.add_trace(go.Scatter(
-                x=medieval_df['Year'],
-                y=[1] * len(medieval_df),
-                mode='markers+text',
-                marker=dict(
-                    symbol='circle',
-                    size=16,
-                    color=period_colors['Medieval'],
-                    line=dict(width=2, color='white')
-                ),
-                text=medieval_df['Era'],
-                textposition="top center",
-                hovertemplate='<b>%{text}</b><br>Year: %{x}<extra></extra>'
-            ))
-            
-            # Add a line connecting all points
-            fig.add_trace(go.Scatter(
-                x=medieval_df['Year'],
-                y=[1] * len(medieval_df),
-                mode='lines',
-                line=dict(color=period_colors['Medieval'], width=3),
-                hoverinfo='skip'
-            ))
-            
-            # Configure the layout
-            fig.update_layout(
-                showlegend=False,
-                xaxis=dict(
-                    title="Year (CE)",
-                    showgrid=False,
-                    zeroline=False,
-                    showline=True,
-                    linecolor='rgba(255,255,255,0.2)',
-                    tickfont=dict(color='rgba(255,255,255,0.7)')
-                ),
-                yaxis=dict(
-                    showticklabels=False,
-                    showgrid=False,
-                    zeroline=False,
-                    showline=False,
-                    range=[0.5, 1.5]
-                ),
-                margin=dict(l=20, r=20, t=40, b=20),
-                height=300,
-                title=dict(
-                    text="Medieval Period in India (600-1757 CE)",
-                    font=dict(color='rgba(255,255,255,0.9)'),
-                    x=0.5
-                )
-            )
-            
-            # Apply dark theme
-            fig = apply_dark_theme(fig)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display era summaries
-            st.markdown("### Key Developments in Medieval India")
-            st.markdown("""
-            Medieval India saw the establishment of Islamic sultanates and the Mughal Empire, with significant cultural synthesis between Hindu and Islamic traditions. 
-            This period witnessed remarkable developments in art, architecture, and religious philosophy, including the growth of Bhakti and Sufi movements.
-            """)
-            
-            # Show the main events in a table format
-            st.markdown("### Timeline of Major Events")
-            
-            # Create a dataframe for display
-            display_df = medieval_df[['Display Year', 'Era', 'Major Events']].copy()
-            display_df.columns = ['Year', 'Era', 'Major Events']
-            
-            # Show the table
-            st.table(display_df)
-        else:
-            st.info("No data available for the medieval period.")
-    
-    # COLONIAL PERIOD TAB
-    with timeline_tabs[2]:
-        st.markdown(f"<h3 style='color:{period_colors['Colonial']}'>Colonial India</h3>", unsafe_allow_html=True)
-        
-        # Filter data for colonial period
-        colonial_df = df[df['Category'] == 'Colonial'].copy()
-        
-        if not colonial_df.empty:
-            # Create visualization
-            fig = go.Figure()
-            
-            # Add events as scatter points
-            fig.add_trace(go.Scatter(
-                x=colonial_df['Year'],
-                y=[1] * len(colonial_df),
-                mode='markers+text',
-                marker=dict(
-                    symbol='circle',
-                    size=16,
-                    color=period_colors['Colonial'],
-                    line=dict(width=2, color='white')
-                ),
-                text=colonial_df['Era'],
-                textposition="top center",
-                hovertemplate='<b>%{text}</b><br>Year: %{x}<extra></extra>'
-            ))
-            
-            # Add a line connecting all points
-            fig.add_trace(go.Scatter(
-                x=colonial_df['Year'],
-                y=[1] * len(colonial_df),
-                mode='lines',
-                line=dict(color=period_colors['Colonial'], width=3),
-                hoverinfo='skip'
-            ))
-            
-            # Configure the layout
-            fig.update_layout(
-                showlegend=False,
-                xaxis=dict(
-                    title="Year (CE)",
-                    showgrid=False,
-                    zeroline=False,
-                    showline=True,
-                    linecolor='rgba(255,255,255,0.2)',
-                    tickfont=dict(color='rgba(255,255,255,0.7)')
-                ),
-                yaxis=dict(
-                    showticklabels=False,
-                    showgrid=False,
-                    zeroline=False,
-                    showline=False,
-                    range=[0.5, 1.5]
-                ),
-                margin=dict(l=20, r=20, t=40, b=20),
-                height=300,
-                title=dict(
-                    text="Colonial Period in India (1757-1947)",
-                    font=dict(color='rgba(255,255,255,0.9)'),
-                    x=0.5
-                )
-            )
-            
-            # Apply dark theme
-            fig = apply_dark_theme(fig)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display era summaries
-            st.markdown("### Key Developments in Colonial India")
-            st.markdown("""
-            The Colonial period marked British rule over the Indian subcontinent, beginning with East India Company rule and later direct British Crown control.
-            This era saw significant social, economic, and political transformations, including the freedom struggle led by figures like Mahatma Gandhi.
-            """)
-            
-            # Show the main events in a table format
-            st.markdown("### Timeline of Major Events")
-            
-            # Create a dataframe for display
-            display_df = colonial_df[['Display Year', 'Era', 'Major Events']].copy()
-            display_df.columns = ['Year', 'Era', 'Major Events']
-            
-            # Show the table
-            st.table(display_df)
-        else:
-            st.info("No data available for the colonial period.")
+    # Create tabs for different time periods; only the open tab is computed
+    tabs = lazy_tabs(
+        ["Ancient (Before 600 CE)", "Medieval (600-1757 CE)", "Colonial (1757-1947)", "Modern (1947-Present)"],
+        key="historical_timeline_tab"
+    )
     
-    # MODERN PERIOD TAB
-    with timeline_tabs[3]:
-        st.markdown(f"<h3 style='color:{period_colors['Modern']}'>Modern India</h3>", unsafe_allow_html=True)
-        
-        # Filter data for modern period
-        modern_df = df[df['Category'] == 'Modern'].copy()
-        
-        if not modern_df.empty:
-            # Create visualization
-            fig = go.Figure()
-            
-            # Add events as scatter points
-            fig.add_trace(go.Scatter(
-                x=modern_df['Year'],
-                y=[1] * len(modern_df),
-                mode='markers+text',
-                marker=dict(
-                    symbol='circle',
-                    size=16,
-                    color=period_colors['Modern'],
-                    line=dict(width=2, color='white')
-                ),
-                text=modern_df['Era'],
-                textposition="top center",
-                hovertemplate='<b>%{text}</b><br>Year: %{x}<extra></extra>'
-            ))
-            
-            # Add a line connecting all points
-            fig.add_trace(go.Scatter(
-                x=modern_df['Year'],
-                y=[1] * len(modern_df),
-                mode='lines',
-                line=dict(color=period_colors['Modern'], width=3),
-                hoverinfo='skip'
-            ))
-            
-            # Configure the layout
-            fig.update_layout(
-                showlegend=False,
-                xaxis=dict(
-                    title="Year (CE)",
-                    showgrid=False,
-                    zeroline=False,
-                    showline=True,
-                    linecolor='rgba(255,255,255,0.2)',
-                    tickfont=dict(color='rgba(255,255,255,0.7)')
-                ),
-                yaxis=dict(
-                    showticklabels=False,
-                    showgrid=False,
-                    zeroline=False,
-                    showline=False,
-                    range=[0.5, 1.5]
-                ),
-                margin=dict(l=20, r=20, t=40, b=20),
-                height=300,
-                title=dict(
-                    text="Modern India (1947-Present)",
-                    font=dict(color='rgba(255,255,255,0.9)'),
-                    x=0.5
-                )
-            )
-            
-            # Apply dark theme
-            fig = apply_dark_theme(fig)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            # Display era summaries
-            st.markdown("### Key Developments in Modern India")
-            st.markdown("""
-            Modern India has transformed from a newly independent nation to a major global power with significant economic, technological, and cultural influence.
-            Key developments include the adoption of the Constitution, economic liberalization, technological advances, and growing international prominence.
-            """)
-            
-            # Show the main events in a table format
-            st.markdown("### Timeline of Major Events")
-            
-            # Create a dataframe for display
-            display_df = modern_df[['Display Year', 'Era', 'Major Events']].copy()
-            display_df.columns = ['Year', 'Era', 'Major Events']
-            
-            # Show the table
-            st.table(display_df)
-        else:
-            st.info("No data available for the modern period.")
+    tabs.render({
+        "Ancient (Before 600 CE)": render_ancient_tab,
+        "Medieval (600-1757 CE)": render_medieval_tab,
+        "Colonial (1757-1947)": render_colonial_tab,
+        "Modern (1947-Present)": render_modern_tab
+    }, timeline, period_colors)
     
     # Add final summary section
     st.header("The Legacy of Indian History")
@@ -952,4 +909,146 @@ def render():
     and scientific achievements flourishing - forms the foundation for understanding the complexity and resilience 
     of modern India.
     </div>
-    """, unsafe_allow_html=True) 
\ No newline at end of file
+    """, unsafe_allow_html=True) 
+
+# Function to render the Ancient (Before 600 CE) tab
+def render_ancient_tab(timeline, period_colors):
+    """Renders the Ancient (Before 600 CE) tab"""
+    st.markdown(f"<h3 style='color:{period_colors['Ancient']}'>Ancient India</h3>", unsafe_allow_html=True)
+    
+    # Filter data for ancient period
+    ancient_df = timeline.period('Ancient')
+    
+    if not ancient_df.empty:
+        # Events of the period, grouped where they are too dense to show one by one
+        view = timeline.query(*period_range('Ancient'))
+        fig = build_timeline_figure(view, period_colors['Ancient'], "Ancient Indian Timeline", height=250)
+        
+        # Display timeline
+        show_chart(fig, use_container_width=True)
+        
+        # Display key events in a formatted table
+        st.subheader("Key Events in Ancient India")
+        
+        for _, row in ancient_df.iterrows():
+            st.markdown(f"""
+            <div style='margin-bottom:15px; padding:10px; border-radius:5px; background-color:rgba(227, 102, 62, 0.1);'>
+                <div style='display:flex; justify-content:space-between;'>
+                    <span style='font-weight:bold; color:{period_colors["Ancient"]};'>{row['Era']}</span>
+                    <span style='color:#AAAAAA;'>{row['Display Year']}</span>
+                </div>
+                <div style='margin-top:5px;'>
+                    <span>{row['Event']}</span>
+                </div>
+                <div style='margin-top:5px; font-size:0.9em;'>
+                    {row['Significance'] if pd.notna(row['Significance']) else ''}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    else:
+        st.info("No data available for the ancient period.")
+
+# Function to render the Medieval (600-1757 CE) tab
+def render_medieval_tab(timeline, period_colors):
+    """Renders the Medieval (600-1757 CE) tab"""
+    st.markdown(f"<h3 style='color:{period_colors['Medieval']}'>Medieval India</h3>", unsafe_allow_html=True)
+    
+    # Filter data for medieval period
+    medieval_df = timeline.period('Medieval')
+    
+    if not medieval_df.empty:
+        # Events of the period, grouped where they are too dense to show one by one
+        view = timeline.query(*period_range('Medieval'))
+        fig = build_timeline_figure(view, period_colors['Medieval'], "Medieval Period in India (600-1757 CE)")
+        
+        # Display timeline
+        show_chart(fig, use_container_width=True)
+        
+        # Display era summaries
+        st.markdown("### Key Developments in Medieval India")
+        st.markdown("""
+        Medieval India saw the establishment of Islamic sultanates and the Mughal Empire, with significant cultural synthesis between Hindu and Islamic traditions. 
+        This period witnessed remarkable developments in art, architecture, and religious philosophy, including the growth of Bhakti and Sufi movements.
+        """)
+        
+        # Show the main events in a table format
+        st.markdown("### Timeline of Major Events")
+        
+        # Create a dataframe for display
+        display_df = medieval_df[['Display Year', 'Era', 'Major Events']].copy()
+        display_df.columns = ['Year', 'Era', 'Major Events']
+        
+        # Show the table
+        st.table(display_df)
+    else:
+        st.info("No data available for the medieval period.")
+
+# Function to render the Colonial (1757-1947) tab
+def render_colonial_tab(timeline, period_colors):
+    """Renders the Colonial (1757-1947) tab"""
+    st.markdown(f"<h3 style='color:{period_colors['Colonial']}'>Colonial India</h3>", unsafe_allow_html=True)
+    
+    # Filter data for colonial period
+    colonial_df = timeline.period('Colonial')
+    
+    if not colonial_df.empty:
+        # Events of the period, grouped where they are too dense to show one by one
+        view = timeline.query(*period_range('Colonial'))
+        fig = build_timeline_figure(view, period_colors['Colonial'], "Colonial Period in India (1757-1947)")
+        
+        # Display timeline
+        show_chart(fig, use_container_width=True)
+        
+        # Display era summaries
+        st.markdown("### Key Developments in Colonial India")
+        st.markdown("""
+        The Colonial period marked British rule over the Indian subcontinent, beginning with East India Company rule and later direct British Crown control.
+        This era saw significant social, economic, and political transformations, including the freedom struggle led by figures like Mahatma Gandhi.
+        """)
+        
+        # Show the main events in a table format
+        st.markdown("### Timeline of Major Events")
+        
+        # Create a dataframe for display
+        display_df = colonial_df[['Display Year', 'Era', 'Major Events']].copy()
+        display_df.columns = ['Year', 'Era', 'Major Events']
+        
+        # Show the table
+        st.table(display_df)
+    else:
+        st.info("No data available for the colonial period.")
+
+# Function to render the Modern (1947-Present) tab
+def render_modern_tab(timeline, period_colors):
+    """Renders the Modern (1947-Present) tab"""
+    st.markdown(f"<h3 style='color:{period_colors['Modern']}'>Modern India</h3>", unsafe_allow_html=True)
+    
+    # Filter data for modern period
+    modern_df = timeline.period('Modern')
+    
+    if not modern_df.empty:
+        # Events of the period, grouped where they are too dense to show one by one
+        view = timeline.query(*period_range('Modern'))
+        fig = build_timeline_figure(view, period_colors['Modern'], "Modern India (1947-Present)")
+        
+        # Display timeline
+        show_chart(fig, use_container_width=True)
+        
+        # Display era summaries
+        st.markdown("### Key Developments in Modern India")
+        st.markdown("""
+        Modern India has transformed from a newly independent nation to a major global power with significant economic, technological, and cultural influence.
+        Key developments include the adoption of the Constitution, economic liberalization, technological advances, and growing international prominence.
+        """)
+        
+        # Show the main events in a table format
+        st.markdown("### Timeline of Major Events")
+        
+        # Create a dataframe for display
+        display_df = modern_df[['Display Year', 'Era', 'Major Events']].copy()
+        display_df.columns = ['Year', 'Era', 'Major Events']
+        
+        # Show the table
+        st.table(display_df)
+    else:
+        st.info("No data available for the modern period.")
@@ -1,9 +1,39 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
 import plotly.express as px
 import numpy as np
-from modules.utils import load_population_data, load_state_data, load_cultural_data, load_festivals_data, style_matplotlib_for_dark, apply_dark_theme
+from modules.utils import load_state_data, load_cultural_data, load_festivals_data, style_matplotlib_for_dark, apply_dark_theme, plain_labels
+from modules.marts import get_population_mart
+from modules.chart_data import show_series_chart
+from modules.figure_transport import show_chart
+from modules.mpl_render import new_figure, show_matplotlib
+
+# Function to draw the population growth chart (runs on the Matplotlib render pool)
+def build_population_growth_figure(df_population):
+    fig, ax = new_figure(figsize=(8, 6))
+    ax.plot(df_population['Year'], df_population['Population (millions)'],
+            marker='o', linestyle='-', color='#FF9933', linewidth=2, markersize=8)
+    ax.set_title('India Population Growth (in millions)')
+    ax.set_xlabel('Year')
+    ax.set_ylabel('Population (millions)')
+
+    # Add grid for better readability
+    ax.grid(True, linestyle='--', alpha=0.3)
+
+    # Apply dark theme styling to the matplotlib figure
+    fig, ax = style_matplotlib_for_dark(fig, ax)
+
+    # Add value labels on points
+    for x, y in zip(df_population['Year'], df_population['Population (millions)']):
+        # Only label certain years to avoid clutter
+        if x % 20 == 0 or x in [2021]:
+            ax.annotate(f'{y:.1f}',
+                        (x, y),
+                        textcoords="offset points",
+                        xytext=(0, 10),
+                        ha='center',
+                        color='#FAFAFA')
+    return fig
 
 def render():
     with st.spinner("Preparing Introduction chapter..."):
@@ -76,42 +106,14 @@ def render():
                 # Population Growth visualization with better formatting
                 with st.spinner("Loading population data visualization..."):
                     try:
-                        df_population = load_population_data()
+                        df_population = get_population_mart()
                         
                         with st.container():
                             st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
                             # Check if data is loaded correctly
                             if df_population is not None and not df_population.empty:
-                                # Convert to appropriate types if needed
-                                df_population['Year'] = df_population['Year'].astype(int)
-                                df_population['Population (millions)'] = df_population['Population (millions)'].astype(float)
-                                
-                                # Create a responsive figure size
-                                fig, ax = plt.subplots(figsize=(8, 6))
-                                ax.plot(df_population['Year'], df_population['Population (millions)'], 
-                                        marker='o', linestyle='-', color='#FF9933', linewidth=2, markersize=8)
-                                ax.set_title('India Population Growth (in millions)')
-                                ax.set_xlabel('Year')
-                                ax.set_ylabel('Population (millions)')
-                                
-                                # Add grid for better readability
-                                ax.grid(True, linestyle='--', alpha=0.3)
-                                
-                                # Apply dark theme styling to the matplotlib figure
-                                fig, ax = style_matplotlib_for_dark(fig, ax)
-                                
-                                # Add value labels on points
-                                for x, y in zip(df_population['Year'], df_population['Population (millions)']):
-                                    # Only label certain years to avoid clutter
-                                    if x % 20 == 0 or x in [2021]:
-                                        ax.annotate(f'{y:.1f}', 
-                                                   (x, y), 
-                                                   textcoords="offset points",
-                                                   xytext=(0, 10), 
-                                                   ha='center',
-                                                   color='#FAFAFA')
-                                
-                                st.pyplot(fig)
+                                # Rasterized once per data version and shared by every session
+                                show_matplotlib("population_growth", build_population_growth_figure, df_population)
                             else:
                                 st.error("Failed to load population data. Please check your data files.")
                             st.markdown("</div>", unsafe_allow_html=True)
@@ -279,7 +281,7 @@ def render():
         try:
             # Ensure df_population is loaded successfully
             if 'df_population' not in locals() or df_population is None or df_population.empty:
-                df_population = load_population_data()
+                df_population = get_population_mart()
                 
             if df_population is not None and not df_population.empty:
                 # Ensure the required columns exist
@@ -401,7 +403,7 @@ def render():
                             )
                         )
                     
-                    st.plotly_chart(fig, use_container_width=True)
+                    show_series_chart(fig, key="intro_urbanization_zoom")
                     st.markdown("</div>", unsafe_allow_html=True)
                 else:
                     st.error("Required columns not found in population data. Please check the CSV format.")
@@ -475,7 +477,7 @@ def render():
                 # Apply dark theme for better visualization
                 fig = apply_dark_theme(fig)
 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 st.markdown("</div>", unsafe_allow_html=True)
             else:
                 st.error("Failed to load state data.")
@@ -490,7 +492,7 @@ def render():
             
             if df_states is not None and not df_states.empty:
                 # Group by region for population analysis
-                region_pop = df_states.groupby(['Region'])['Population (millions)'].sum().reset_index()
+                region_pop = df_states.groupby(['Region'], observed=True)['Population (millions)'].sum().reset_index()
                 region_pop = region_pop.sort_values('Population (millions)', ascending=False)
                 
                 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
@@ -526,7 +528,7 @@ def render():
                 # Apply dark theme for better visualization
                 fig = apply_dark_theme(fig)
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 st.markdown("</div>", unsafe_allow_html=True)
             else:
                 st.error("Failed to load state data for regional distribution.")
@@ -585,7 +587,7 @@ def render():
                 # Apply dark theme for better visualization
                 fig = apply_dark_theme(fig)
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 st.markdown("</div>", unsafe_allow_html=True)
             
             with cult_tab2:
@@ -593,7 +595,7 @@ def render():
                 st.markdown("<div class='chart-container'>", unsafe_allow_html=True)
                 
                 # Create a treemap chart for cultural elements by region
-                fig = px.treemap(df_culture, 
+                fig = px.treemap(plain_labels(df_culture), 
                                 path=['Region of Origin', 'Cultural Element'], 
                                 values='Count',
                                 color='Count',
@@ -613,7 +615,7 @@ def render():
                     hovertemplate='<b>%{label}</b><br>Count: %{value}<extra></extra>'
                 )
                 
-                st.plotly_chart(fig, use_container_width=True)
+                show_chart(fig, use_container_width=True)
                 st.markdown("</div>", unsafe_allow_html=True)
                 
                 # Add explanatory text
@@ -740,7 +742,7 @@ def render():
             # Apply dark theme for better visualization
             fig = apply_dark_theme(fig)
             
-            st.plotly_chart(fig, use_container_width=True)
+            show_chart(fig, use_container_width=True)
             st.markdown("</div>", unsafe_allow_html=True)
     except Exception as e:
         st.error(f"Error loading cultural data: {e}")
@@ -788,7 +790,7 @@ def render():
         # Apply dark theme for better visualization
         fig = apply_dark_theme(fig)
         
-        st.plotly_chart(fig, use_container_width=True)
+        show_chart(fig, use_container_width=True)
         st.markdown("</div>", unsafe_allow_html=True)
     
     # Add a section on Festivals of India
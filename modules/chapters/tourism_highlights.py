@@ -1,8 +1,225 @@
 import streamlit as st
 import pandas as pd
 import plotly.express as px
-import numpy as np
-from modules.utils import apply_dark_theme, load_tourism_data, style_matplotlib_for_dark, get_color_palette
+from modules.utils import apply_dark_theme, style_matplotlib_for_dark, get_color_palette, plain_labels
+from modules.lazy_tabs import lazy_tabs
+from modules.marts import get_tourism_mart
+from modules.filter_engine import get_filter_index
+from modules.fragments import chapter_fragment
+from modules.figure_transport import show_chart, cached_figure
+from modules.dataset_store import dataset_ref
+
+# Fragment for the destination explorer so filter changes rerun only the explorer
+@chapter_fragment
+def show_destination_explorer(df):
+    """Render the filterable destination explorer cards"""
+    # Create an interactive destination explorer
+    st.subheader("Explore Destinations")
+
+    # Create filters
+    col1, col2 = st.columns(2)
+
+    # Column the tourism type filter works on
+    type_column = 'Primary Tourism Type' if 'Primary Tourism Type' in df.columns else 'Tourism Type'
+
+    # Precomputed region/type index shared across reruns and sessions
+    filter_index = None
+    try:
+        filter_index = get_filter_index('tourism', df, ['Region', type_column])
+    except Exception as e:
+        st.warning(f"Could not build the destination filter index: {e}")
+
+    with col1:
+        # Use safe method to get unique regions with error handling
+        region_options = ['All Regions']
+        try:
+            if filter_index is not None and 'Region' in filter_index.columns:
+                region_options += filter_index.options('Region')
+            elif 'Region' in df.columns:
+                region_options += sorted(df['Region'].unique().tolist())
+        except Exception:
+            st.warning("Could not retrieve unique regions for filtering.")
+
+        selected_region = st.selectbox(
+            "Filter by region:",
+            options=region_options
+        )
+
+    with col2:
+        # Use safe method to get unique tourism types with error handling
+        type_options = ['All Types']
+        try:
+            if filter_index is not None and type_column in filter_index.columns:
+                type_options += filter_index.options(type_column)
+            elif type_column in df.columns:
+                type_options += sorted(df[type_column].unique().tolist())
+        except Exception:
+            st.warning("Could not retrieve unique tourism types for filtering.")
+
+        selected_type = st.selectbox(
+            "Filter by tourism type:",
+            options=type_options
+        )
+
+    # Apply filters
+    region_filter = None if selected_region == 'All Regions' else selected_region
+    type_filter = None if selected_type == 'All Types' else selected_type
+    try:
+        if filter_index is not None:
+            # Index lookup memoized by the (region, type) widget state
+            filtered_df = filter_index.filter(df, **{'Region': region_filter, type_column: type_filter})
+        else:
+            filtered_df = df
+            if region_filter is not None and 'Region' in filtered_df.columns:
+                filtered_df = filtered_df[filtered_df['Region'] == region_filter]
+            if type_filter is not None and type_column in filtered_df.columns:
+                filtered_df = filtered_df[filtered_df[type_column] == type_filter]
+    except Exception as e:
+        st.error(f"Error applying filters: {e}")
+        filtered_df = df
+
+    # Display filtered destinations
+    if len(filtered_df) > 0:
+        # Sort by visitors
+        try:
+            if 'Annual Visitors (millions)' in filtered_df.columns:
+                filtered_df = filtered_df.sort_values('Annual Visitors (millions)', ascending=False)
+        except Exception:
+            pass  # Continue without sorting if there's an error
+
+        # Display as cards with error handling
+        for i in range(0, len(filtered_df), 3):
+            cols = st.columns(3)
+            for j in range(3):
+                if i + j < len(filtered_df):
+                    with cols[j]:
+                        try:
+                            dest = filtered_df.iloc[i + j]
+
+                            # Tourism type icon mapping
+                            type_icons = {
+                                'Cultural': '🏛️',
+                                'Cultural Tourism': '🏛️',
+                                'Religious': '🕌',
+                                'Religious Tourism': '🕌',
+                                'Beach': '🏖️',
+                                'Beach Tourism': '🏖️',
+                                'Hill Station': '⛰️',
+                                'Hill Station Tourism': '⛰️',
+                                'Wildlife': '🐅',
+                                'Wildlife Tourism': '🐅',
+                                'Historical': '🏰',
+                                'Historical Tourism': '🏰',
+                                'Heritage': '🏯',
+                                'Heritage Tourism': '🏯',
+                                'Adventure': '🧗',
+                                'Adventure Tourism': '🧗',
+                                'Urban': '🏙️',
+                                'Rural': '🌾',
+                                'Rural Tourism': '🌾',
+                                'Wellness': '💆',
+                                'Wellness Tourism': '💆',
+                                'Eco-Tourism': '🌿'
+                            }
+
+                            # Get tourism type with fallback
+                            tourism_type = 'Unknown'
+                            if 'Primary Tourism Type' in dest and not pd.isna(dest['Primary Tourism Type']):
+                                tourism_type = dest['Primary Tourism Type']
+                            elif 'Tourism Type' in dest and not pd.isna(dest['Tourism Type']):
+                                tourism_type = dest['Tourism Type']
+
+                            icon = type_icons.get(tourism_type, '🗺️')
+
+                            # Get destination name with fallback
+                            destination = 'Unknown Destination'
+                            if 'Destination' in dest and not pd.isna(dest['Destination']):
+                                destination = dest['Destination']
+                            elif 'Popular Destinations' in dest and not pd.isna(dest['Popular Destinations']):
+                                destination = dest['Popular Destinations'].split(',')[0].strip()
+
+                            # Get state with fallback
+                            state = 'Unknown'
+                            if 'State' in dest and not pd.isna(dest['State']):
+                                state = dest['State']
+                            elif 'Key States' in dest and not pd.isna(dest['Key States']):
+                                state = dest['Key States'].split(',')[0].strip()
+
+                            # Get region with fallback
+                            region = 'Unknown'
+                            if 'Region' in dest and not pd.isna(dest['Region']):
+                                region = dest['Region']
+
+                            # Get visitors with fallback
+                            visitors = 0.0
+                            if 'Annual Visitors (millions)' in dest and not pd.isna(dest['Annual Visitors (millions)']):
+                                visitors = dest['Annual Visitors (millions)']
+
+                            # Get key features with fallback
+                            features = ''
+                            if 'Key Attraction Features' in dest and not pd.isna(dest['Key Attraction Features']):
+                                features = dest['Key Attraction Features']
+                            elif 'Key Challenges' in dest and not pd.isna(dest['Key Challenges']):
+                                features = dest['Key Challenges']
+
+                            st.markdown(f"""
+                            <div style='border:1px solid rgba(255,255,255,0.1); border-radius:10px; padding:10px; margin-bottom:10px;'>
+                                <h3 style='margin:0; font-size:1.2rem;'>{icon} {destination}</h3>
+                                <p style='color:#CCCCCC; margin:2px 0;'>{state} ({region})</p>
+                                <p style='margin:2px 0;'><strong>Visitors:</strong> {visitors:.1f}M/year</p>
+                                <p style='margin:2px 0;'><strong>Type:</strong> {tourism_type}</p>
+                                <p style='margin:2px 0;'><small>{features}</small></p>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        except Exception as e:
+                            st.warning(f"Could not display destination card: {e}")
+    else:
+        st.info("No destinations match your selected filters.")
+
+# Fragment for the top attractions by type selector
+@chapter_fragment
+def show_top_attractions_by_type(df):
+    """Render the top five attractions for the selected tourism type"""
+    # Create type filter
+    if 'Tourism Type' in df.columns:
+        tourism_types = ['All Types'] + sorted(df['Tourism Type'].unique().tolist())
+        selected_type = st.selectbox("Select Tourism Type", options=tourism_types)
+
+        # Filter data based on selection
+        if selected_type != 'All Types':
+            filtered_df = df[df['Tourism Type'] == selected_type]
+        else:
+            filtered_df = df
+
+        # Display top 5 attractions for the selected type
+        if 'Annual Visitors (millions)' in filtered_df.columns:
+            top_attractions = filtered_df.sort_values('Annual Visitors (millions)', ascending=False).head(5)
+
+            # Create cards for top attractions
+            st.markdown("<div style='display: flex; flex-wrap: wrap; gap: 10px;'>", unsafe_allow_html=True)
+
+            for _, row in top_attractions.iterrows():
+                destination = row['Destination']
+                visitors = row['Annual Visitors (millions)']
+                tourism_type = row['Tourism Type']
+                state = row['State']
+                description = row['Description'] if 'Description' in row and not pd.isna(row['Description']) else "No description available."
+
+                # Create card with consistent style
+                st.markdown(f"""
+                <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 10px; width: 100%;">
+                    <h4 style="margin-top: 0; color: #FF9933;">{destination}</h4>
+                    <p><strong>Type:</strong> {tourism_type} | <strong>State:</strong> {state}</p>
+                    <p><strong>Annual Visitors:</strong> {visitors:.1f} million</p>
+                    <p>{description}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
+        else:
+            st.warning("Visitor data is not available.")
+    else:
+        st.warning("Tourism Type data is not available.")
 
 def render():
     """Render the Tourism Highlights chapter content"""
@@ -20,145 +237,13 @@ def render():
     # Load and prepare data
     with st.spinner("Analyzing tourism data..."):
         try:
-            df = load_tourism_data()
+            # Derived columns (regions, categories, estimates) come from the cached mart
+            df = get_tourism_mart()
             
             if df is None or df.empty:
                 st.error("Tourism data could not be loaded. Please check the data file.")
                 return
             
-            # Ensure expected columns exist with proper names based on the actual CSV structure
-            # First, check what columns actually exist in the dataframe
-            actual_columns = df.columns.tolist()
-            st.write(f"Found columns: {', '.join(actual_columns)}")
-            
-            # Define direct mappings based on the actual CSV file
-            direct_mappings = {
-                'Destination': 'Destination',
-                'State': 'State',
-                'Type': 'Tourism Type',
-                'Visitors_Annual': 'Annual Visitors (millions)',
-                'Best Season': 'Peak Season',
-                'UNESCO Status': 'UNESCO Status',
-                'Year Established': 'Year Established',
-                'Entry Fee (INR)': 'Entry Fee (INR)',
-                'Description': 'Description'
-            }
-            
-            # Create new columns based on actual data
-            for orig_col, new_col in direct_mappings.items():
-                if orig_col in df.columns:
-                    df[new_col] = df[orig_col]
-                elif new_col not in df.columns:
-                    # Create missing columns with appropriate default values
-                    if 'Visitors' in new_col:
-                        df[new_col] = np.random.uniform(0.1, 5.0, len(df))  # Random values for demonstration
-                    elif 'Season' in new_col:
-                        df[new_col] = 'Year-round'
-                    elif 'Fee' in new_col:
-                        df[new_col] = 0
-                    elif 'Year' in new_col:
-                        df[new_col] = 1900
-                    else:
-                        df[new_col] = 'Unknown'
-            
-            # Create additional columns needed for visualizations
-            if 'Tourism Revenue (USD millions)' not in df.columns:
-                # Estimate revenue based on visitors (rough approximation)
-                if 'Annual Visitors (millions)' in df.columns:
-                    df['Tourism Revenue (USD millions)'] = df['Annual Visitors (millions)'] * np.random.uniform(50, 150, len(df))
-                else:
-                    df['Tourism Revenue (USD millions)'] = np.random.uniform(10, 500, len(df))
-            
-            if 'International Visitors (%)' not in df.columns:
-                # Add estimated international visitor percentages
-                df['International Visitors (%)'] = np.random.uniform(10, 60, len(df))
-                
-            if 'Growth Potential (%)' not in df.columns:
-                # Add estimated growth potential
-                df['Growth Potential (%)'] = np.random.uniform(3, 15, len(df))
-                
-            if 'Infrastructure Quality (1-10)' not in df.columns:
-                # Add infrastructure quality ratings
-                df['Infrastructure Quality (1-10)'] = np.random.randint(4, 10, len(df))
-                
-            if 'Employment Generated (thousands)' not in df.columns:
-                # Estimate employment based on visitors
-                if 'Annual Visitors (millions)' in df.columns:
-                    df['Employment Generated (thousands)'] = df['Annual Visitors (millions)'] * np.random.uniform(10, 30, len(df))
-                else:
-                    df['Employment Generated (thousands)'] = np.random.uniform(5, 100, len(df))
-            
-            # Create region grouping
-            region_mapping = {
-                'North': ['Delhi', 'Rajasthan', 'Uttar Pradesh', 'Himachal Pradesh', 'Jammu and Kashmir', 'Uttarakhand', 'Punjab', 'Haryana', 'Ladakh'],
-                'South': ['Kerala', 'Tamil Nadu', 'Karnataka', 'Andhra Pradesh', 'Telangana', 'Puducherry'],
-                'East': ['West Bengal', 'Odisha', 'Bihar', 'Jharkhand'],
-                'West': ['Maharashtra', 'Gujarat', 'Goa', 'Daman & Diu'],
-                'Central': ['Madhya Pradesh', 'Chhattisgarh'],
-                'Northeast': ['Assam', 'Sikkim', 'Arunachal Pradesh', 'Meghalaya', 'Nagaland', 'Manipur', 'Mizoram', 'Tripura'],
-                'Islands': ['Andaman and Nicobar Islands', 'Lakshadweep']
-            }
-            
-            # Map states to regions with error handling
-            try:
-                # Function to find the region for a state
-                def find_region(state_name):
-                    if pd.isna(state_name) or not isinstance(state_name, str):
-                        return 'Other'
-                    
-                    for region, states in region_mapping.items():
-                        # Check for exact match
-                        if state_name in states:
-                            return region
-                        # Check for partial match
-                        for state in states:
-                            if state.lower() in state_name.lower():
-                                return region
-                    return 'Other'
-                
-                df['Region'] = df['State'].apply(find_region)
-            except Exception as e:
-                st.warning(f"Could not map states to regions: {e}")
-                df['Region'] = 'Other'
-                
-            # Create tourism type categorization if needed
-            if 'Tourism Type' in df.columns:
-                # Clean up and categorize tourism types
-                tourism_type_mapping = {
-                    'Monument': 'Heritage',
-                    'Palace': 'Heritage',
-                    'Temple': 'Religious',
-                    'Religious': 'Religious',
-                    'Beach': 'Nature',
-                    'Nature': 'Nature',
-                    'Hill Station': 'Nature',
-                    'Wildlife': 'Nature',
-                    'Adventure': 'Adventure',
-                    'Caves': 'Heritage',
-                    'Archaeological Site': 'Heritage',
-                    'City': 'Urban',
-                    'Desert': 'Nature'
-                }
-                
-                # Map specific types to broader categories
-                def map_tourism_type(type_name):
-                    if pd.isna(type_name) or not isinstance(type_name, str):
-                        return 'Other'
-                    
-                    for specific, broad in tourism_type_mapping.items():
-                        if specific.lower() in type_name.lower():
-                            return broad
-                    return 'Other'
-                
-                df['Primary Tourism Category'] = df['Tourism Type'].apply(map_tourism_type)
-            
-            # Set an ID column for reference if needed
-            df['ID'] = df.index
-            
-            # Sort by visitors for default display
-            if 'Annual Visitors (millions)' in df.columns:
-                df = df.sort_values('Annual Visitors (millions)', ascending=False)
-            
         except Exception as e:
             st.error(f"Error preparing tourism data: {e}")
             return
@@ -166,818 +251,708 @@ def render():
     # Tourism Map visualization
     st.header("Tourism Landscape Across India")
     
-    # Create a tab view for different tourism perspectives
-    tabs = st.tabs(["Top Destinations", "Tourism Types", "International Appeal", "Economic Impact", "Seasonal Patterns"])
+    # Create a tab view for different tourism perspectives; only the open tab is computed
+    tabs = lazy_tabs(
+        ["Top Destinations", "Tourism Types", "International Appeal", "Economic Impact", "Seasonal Patterns"],
+        key="tourism_highlights_tab"
+    )
+    tabs.render({
+        "Top Destinations": render_top_destinations_tab,
+        "Tourism Types": render_tourism_types_tab,
+        "International Appeal": render_international_appeal_tab,
+        "Economic Impact": render_economic_impact_tab,
+        "Seasonal Patterns": render_seasonal_patterns_tab
+    }, df)
+    
+    # Add a conclusive insight section about overall tourism trends
+    st.header("Key Tourism Trends and Future Outlook")
+    
+    st.markdown("""
+    <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 20px; margin: 20px 0;">
+    <h4 style="margin-top: 0; color: #FF9933;">India's Tourism Landscape: Present and Future</h4>
+    
+    <p>India's tourism sector has shown remarkable resilience and growth potential, with several key trends shaping its future:</p>
+    
+    <ol>
+        <li><strong>Digital Transformation:</strong> The rise of online booking platforms, virtual tours, and digital marketing is revolutionizing how tourists discover and experience India.</li>
+        <li><strong>Sustainable Tourism:</strong> Growing emphasis on eco-friendly practices, conservation efforts, and responsible tourism across destinations.</li>
+        <li><strong>Experiential Travel:</strong> Shift from sightseeing to immersive experiences like village stays, cooking classes, and cultural workshops.</li>
+        <li><strong>Infrastructure Development:</strong> Major investments in airports, highways, and tourist facilities are improving accessibility and comfort.</li>
+        <li><strong>Emerging Destinations:</strong> Lesser-known locations like Northeast India, Gujarat's Rann of Kutch, and Madhya Pradesh's heritage sites are gaining popularity.</li>
+    </ol>
+    
+    <p>With the implementation of initiatives like e-Visa facilities, the Incredible India campaign, and development of thematic circuits, India is positioned to significantly increase its share in the global tourism market in the coming years.</p>
+    </div>
+    """, unsafe_allow_html=True) 
+
+# Function to build the Top 10 Tourist Destinations in India chart
+def build_top_destinations_figure(df):
+    """Return the Top 10 Tourist Destinations in India (Annual Visitors in Millions) chart"""
+    top_destinations = df.sort_values('Annual Visitors (millions)', ascending=False).head(10)
+
+    fig = px.bar(
+        top_destinations,
+        x='Destination',
+        y='Annual Visitors (millions)',
+        color='Region',
+        title='Top 10 Tourist Destinations in India (Annual Visitors in Millions)',
+        color_discrete_sequence=get_color_palette(len(top_destinations['Region'].unique())),
+        text='Annual Visitors (millions)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='%{text:.1f}M', textposition='outside')
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+# Function to build the Tourism Distribution by Region chart
+def build_region_visitors_figure(df):
+    """Return the Tourism Distribution by Region chart"""
+    # Map destinations to regions
+    region_visitors = df.groupby(['Region'], observed=True)['Annual Visitors (millions)'].sum().reset_index()
+    region_visitors = region_visitors.sort_values('Annual Visitors (millions)', ascending=False)
+
+    # Create a bar chart for top regions
+    fig = px.bar(
+        region_visitors,
+        x='Region',
+        y='Annual Visitors (millions)',
+        color='Region',
+        title='Tourism Distribution by Region',
+        color_discrete_sequence=get_color_palette(len(region_visitors)),
+        text='Annual Visitors (millions)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='%{text:.1f}M', textposition='outside')
+    return fig
+
+# Function to render the Top Destinations tab
+def render_top_destinations_tab(df):
+    """Renders the Top Destinations tab"""
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Top destinations by visitor count
+        try:
+            # Safely extract top destinations
+            if 'Annual Visitors (millions)' in df.columns and 'Destination' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_top_destinations_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Required columns for top destinations chart are missing.")
+        except Exception as e:
+            st.error(f"Error creating top destinations chart: {e}")
     
-    # Tab 1: Top Destinations
-    with tabs[0]:
-        col1, col2 = st.columns([2, 1])
+    with col2:
+        # Regional distribution of tourism
+        try:
+            if 'Region' in df.columns and 'Annual Visitors (millions)' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_region_visitors_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Required columns for regional distribution chart are missing.")
+        except Exception as e:
+            st.error(f"Error creating regional distribution chart: {e}")
         
-        with col1:
-            # Top destinations by visitor count
-            try:
-                # Safely extract top destinations
-                if 'Annual Visitors (millions)' in df.columns and 'Destination' in df.columns:
-                    top_destinations = df.sort_values('Annual Visitors (millions)', ascending=False).head(10)
-                    
-                    fig = px.bar(
-                        top_destinations,
-                        x='Destination',
-                        y='Annual Visitors (millions)',
-                        color='Region',
-                        title='Top 10 Tourist Destinations in India (Annual Visitors in Millions)',
-                        color_discrete_sequence=get_color_palette(len(top_destinations['Region'].unique())),
-                        text='Annual Visitors (millions)'
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(texttemplate='%{text:.1f}M', textposition='outside')
-                    fig.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Required columns for top destinations chart are missing.")
-            except Exception as e:
-                st.error(f"Error creating top destinations chart: {e}")
+        # Display total destinations
+        st.metric("Total Major Destinations", f"{len(df)}")
         
+    # Key insights
+    st.markdown("""
+    <div class='insight-box'>
+    <strong>Destination Insights:</strong>
+    <ul>
+      <li><strong>North India Dominance:</strong> The Taj Mahal, Golden Temple, and Red Fort are among the most visited sites.</li>
+      <li><strong>Regional Diversity:</strong> Each region offers unique tourism experiences - from Rajasthan's palaces to Kerala's backwaters.</li>
+      <li><strong>UNESCO Sites:</strong> India has 40 UNESCO World Heritage Sites, ranking 6th globally.</li>
+      <li><strong>Growing Destinations:</strong> Newer tourist circuits like the Northeast and tribal areas are gaining popularity.</li>
+    </ul>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    show_destination_explorer(df)
+
+# Function to build the Distribution of Tourism Types chart
+def build_tourism_types_figure(df):
+    """Return the Distribution of Tourism Types chart"""
+    # Group by tourism type
+    type_counts = df.groupby('Tourism Type', observed=True).size().reset_index(name='Count')
+    type_counts = type_counts.sort_values('Count', ascending=False)
+
+    # Create pie chart
+    fig = px.pie(
+        type_counts, 
+        values='Count', 
+        names='Tourism Type',
+        title='Distribution of Tourism Types',
+        color_discrete_sequence=get_color_palette(len(type_counts)),
+        hole=0.4
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(textinfo='percent+label')
+    return fig
+
+# Function to build the Tourism Categories by Region chart
+def build_region_categories_figure(df):
+    """Return the Tourism Categories by Region chart"""
+    # Group by region and tourism category
+    region_type = df.groupby(['Region', 'Primary Tourism Category'], observed=True).size().reset_index(name='Count')
+
+    # Create bar chart
+    fig = px.bar(
+        region_type,
+        x='Region',
+        y='Count',
+        color='Primary Tourism Category',
+        title='Tourism Categories by Region',
+        color_discrete_sequence=get_color_palette(len(region_type['Primary Tourism Category'].unique()))
+    )
+    fig = apply_dark_theme(fig)
+    return fig
+
+# Function to render the Tourism Types tab
+def render_tourism_types_tab(df):
+    """Renders the Tourism Types tab"""
+    st.subheader("Distribution of Tourism Types across India")
+    
+    try:
+        # Create two columns for visualization
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Create a pie chart of tourism types
+            if 'Tourism Type' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_tourism_types_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Tourism Type data is not available.")
+                
         with col2:
-            # Regional distribution of tourism
-            try:
-                if 'Region' in df.columns and 'Annual Visitors (millions)' in df.columns:
-                    # Map destinations to regions
-                    region_visitors = df.groupby(['Region'])['Annual Visitors (millions)'].sum().reset_index()
-                    region_visitors = region_visitors.sort_values('Annual Visitors (millions)', ascending=False)
-                    
-                    # Create a bar chart for top regions
-                    fig = px.bar(
-                        region_visitors,
-                        x='Region',
-                        y='Annual Visitors (millions)',
-                        color='Region',
-                        title='Tourism Distribution by Region',
-                        color_discrete_sequence=get_color_palette(len(region_visitors)),
-                        text='Annual Visitors (millions)'
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(texttemplate='%{text:.1f}M', textposition='outside')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Required columns for regional distribution chart are missing.")
-            except Exception as e:
-                st.error(f"Error creating regional distribution chart: {e}")
-            
-            # Display total destinations
-            st.metric("Total Major Destinations", f"{len(df)}")
-            
-        # Key insights
+            # Create a bar chart showing tourism categories by region
+            if 'Primary Tourism Category' in df.columns and 'Region' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_region_categories_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Tourism Category or Region data is not available.")
+        
+        # Add a section showing top attractions by type
+        st.subheader("Top Attractions by Type")
+        
+        show_top_attractions_by_type(df)
+
+        # Add insights about tourism types
         st.markdown("""
         <div class='insight-box'>
-        <strong>Destination Insights:</strong>
+        <strong>Tourism Type Insights:</strong>
         <ul>
-          <li><strong>North India Dominance:</strong> The Taj Mahal, Golden Temple, and Red Fort are among the most visited sites.</li>
-          <li><strong>Regional Diversity:</strong> Each region offers unique tourism experiences - from Rajasthan's palaces to Kerala's backwaters.</li>
-          <li><strong>UNESCO Sites:</strong> India has 40 UNESCO World Heritage Sites, ranking 6th globally.</li>
-          <li><strong>Growing Destinations:</strong> Newer tourist circuits like the Northeast and tribal areas are gaining popularity.</li>
+          <li><strong>Heritage Tourism:</strong> India's monuments and historical sites attract the largest share of tourists, with the Taj Mahal being the crown jewel.</li>
+          <li><strong>Religious Tourism:</strong> Temples, mosques, and other religious sites see massive footfall, with Tirupati Temple receiving over 25 million visitors annually.</li>
+          <li><strong>Nature Tourism:</strong> From the beaches of Goa to the mountains of Himachal Pradesh, nature tourism is growing rapidly with increased environmental awareness.</li>
+          <li><strong>Adventure Tourism:</strong> The Himalayan region and coastal areas are seeing a boom in adventure tourism including trekking, rafting, and water sports.</li>
         </ul>
         </div>
         """, unsafe_allow_html=True)
-        
-        # Create an interactive destination explorer
-        st.subheader("Explore Destinations")
-        
-        # Create filters
+            
+    except Exception as e:
+        st.error(f"Error displaying tourism types: {e}")
+
+# Function to build the Top 10 Destinations by International Visitor Percentage chart
+def build_international_share_figure(df):
+    """Return the Top 10 Destinations by International Visitor Percentage chart"""
+    # Sort by international visitor percentage
+    top_international = df.sort_values('International Visitors (%)', ascending=False).head(10)
+
+    # Create bar chart
+    fig = px.bar(
+        top_international,
+        x='Destination',
+        y='International Visitors (%)',
+        color='Region',
+        title='Top 10 Destinations by International Visitor Percentage',
+        color_discrete_sequence=get_color_palette(len(top_international['Region'].unique())),
+        text='International Visitors (%)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    fig.update_layout(xaxis_tickangle=-45)
+    return fig
+
+# Function to build the Average International Visitors by Region chart
+def build_region_international_share_figure(df):
+    """Return the Average International Visitors by Region chart"""
+    # Calculate average international visitor percentage by region
+    region_international = df.groupby('Region', observed=True)['International Visitors (%)'].mean().reset_index()
+    region_international = region_international.sort_values('International Visitors (%)', ascending=False)
+
+    # Create bar chart
+    fig = px.bar(
+        region_international,
+        x='Region',
+        y='International Visitors (%)',
+        color='Region',
+        title='Average International Visitors by Region',
+        color_discrete_sequence=get_color_palette(len(region_international)),
+        text='International Visitors (%)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+    return fig
+
+# Function to build the UNESCO Sites by Type chart
+def build_unesco_types_figure(unesco_sites):
+    """Return the UNESCO Sites by Type chart"""
+    unesco_types = unesco_sites.groupby('Tourism Type', observed=True).size().reset_index(name='Count')
+
+    fig = px.pie(
+        unesco_types,
+        values='Count',
+        names='Tourism Type',
+        title='UNESCO Sites by Type',
+        color_discrete_sequence=get_color_palette(len(unesco_types))
+    )
+    fig = apply_dark_theme(fig)
+    return fig
+
+# Function to render the International Appeal tab
+def render_international_appeal_tab(df):
+    """Renders the International Appeal tab"""
+    st.subheader("International Tourism Appeal")
+    
+    try:
+        # Create two columns for visualizations
         col1, col2 = st.columns(2)
         
         with col1:
-            # Use safe method to get unique regions with error handling
-            region_options = ['All Regions']
-            try:
-                if 'Region' in df.columns:
-                    region_options += sorted(df['Region'].unique().tolist())
-            except Exception:
-                st.warning("Could not retrieve unique regions for filtering.")
-                
-            selected_region = st.selectbox(
-                "Filter by region:",
-                options=region_options
-            )
+            # Create a bar chart showing international visitor percentages for top destinations
+            if 'International Visitors (%)' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_international_share_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("International Visitor data is not available.")
         
         with col2:
-            # Use safe method to get unique tourism types with error handling
-            type_options = ['All Types']
-            try:
-                if 'Primary Tourism Type' in df.columns:
-                    type_options += sorted(df['Primary Tourism Type'].unique().tolist())
-                elif 'Tourism Type' in df.columns:
-                    type_options += sorted(df['Tourism Type'].unique().tolist())
-            except Exception:
-                st.warning("Could not retrieve unique tourism types for filtering.")
-                
-            selected_type = st.selectbox(
-                "Filter by tourism type:",
-                options=type_options
-            )
-        
-        # Apply filters
-        filtered_df = df.copy()
-        try:
-            if selected_region != 'All Regions' and 'Region' in filtered_df.columns:
-                filtered_df = filtered_df[filtered_df['Region'] == selected_region]
-                
-            if selected_type != 'All Types':
-                if 'Primary Tourism Type' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['Primary Tourism Type'] == selected_type]
-                elif 'Tourism Type' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['Tourism Type'] == selected_type]
-        except Exception as e:
-            st.error(f"Error applying filters: {e}")
+            # Create a map or chart showing international appeal by region
+            if 'Region' in df.columns and 'International Visitors (%)' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_region_international_share_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("International Visitor data is not available.")
         
-        # Display filtered destinations
-        if len(filtered_df) > 0:
-            # Sort by visitors
-            try:
-                if 'Annual Visitors (millions)' in filtered_df.columns:
-                    filtered_df = filtered_df.sort_values('Annual Visitors (millions)', ascending=False)
-            except Exception:
-                pass  # Continue without sorting if there's an error
-            
-            # Display as cards with error handling
-            for i in range(0, len(filtered_df), 3):
-                cols = st.columns(3)
-                for j in range(3):
-                    if i + j < len(filtered_df):
-                        with cols[j]:
-                            try:
-                                dest = filtered_df.iloc[i + j]
-                                
-                                # Tourism type icon mapping
-                                type_icons = {
-                                    'Cultural': '🏛️',
-                                    'Cultural Tourism': '🏛️',
-                                    'Religious': '🕌',
-                                    'Religious Tourism': '🕌',
-                                    'Beach': '🏖️',
-                                    'Beach Tourism': '🏖️',
-                                    'Hill Station': '⛰️',
-                                    'Hill Station Tourism': '⛰️',
-                                    'Wildlife': '🐅',
-                                    'Wildlife Tourism': '🐅',
-                                    'Historical': '🏰',
-                                    'Historical Tourism': '🏰',
-                                    'Heritage': '🏯',
-                                    'Heritage Tourism': '🏯',
-                                    'Adventure': '🧗',
-                                    'Adventure Tourism': '🧗',
-                                    'Urban': '🏙️',
-                                    'Rural': '🌾',
-                                    'Rural Tourism': '🌾',
-                                    'Wellness': '💆',
-                                    'Wellness Tourism': '💆',
-                                    'Eco-Tourism': '🌿'
-                                }
-                                
-                                # Get tourism type with fallback
-                                tourism_type = 'Unknown'
-                                if 'Primary Tourism Type' in dest and not pd.isna(dest['Primary Tourism Type']):
-                                    tourism_type = dest['Primary Tourism Type']
-                                elif 'Tourism Type' in dest and not pd.isna(dest['Tourism Type']):
-                                    tourism_type = dest['Tourism Type']
-                                
-                                icon = type_icons.get(tourism_type, '🗺️')
-                                
-                                # Get destination name with fallback
-                                destination = 'Unknown Destination'
-                                if 'Destination' in dest and not pd.isna(dest['Destination']):
-                                    destination = dest['Destination']
-                                elif 'Popular Destinations' in dest and not pd.isna(dest['Popular Destinations']):
-                                    destination = dest['Popular Destinations'].split(',')[0].strip()
-                                
-                                # Get state with fallback
-                                state = 'Unknown'
-                                if 'State' in dest and not pd.isna(dest['State']):
-                                    state = dest['State']
-                                elif 'Key States' in dest and not pd.isna(dest['Key States']):
-                                    state = dest['Key States'].split(',')[0].strip()
-                                
-                                # Get region with fallback
-                                region = 'Unknown'
-                                if 'Region' in dest and not pd.isna(dest['Region']):
-                                    region = dest['Region']
-                                
-                                # Get visitors with fallback
-                                visitors = 0.0
-                                if 'Annual Visitors (millions)' in dest and not pd.isna(dest['Annual Visitors (millions)']):
-                                    visitors = dest['Annual Visitors (millions)']
-                                
-                                # Get key features with fallback
-                                features = ''
-                                if 'Key Attraction Features' in dest and not pd.isna(dest['Key Attraction Features']):
-                                    features = dest['Key Attraction Features']
-                                elif 'Key Challenges' in dest and not pd.isna(dest['Key Challenges']):
-                                    features = dest['Key Challenges']
-                                
-                                st.markdown(f"""
-                                <div style='border:1px solid rgba(255,255,255,0.1); border-radius:10px; padding:10px; margin-bottom:10px;'>
-                                    <h3 style='margin:0; font-size:1.2rem;'>{icon} {destination}</h3>
-                                    <p style='color:#CCCCCC; margin:2px 0;'>{state} ({region})</p>
-                                    <p style='margin:2px 0;'><strong>Visitors:</strong> {visitors:.1f}M/year</p>
-                                    <p style='margin:2px 0;'><strong>Type:</strong> {tourism_type}</p>
-                                    <p style='margin:2px 0;'><small>{features}</small></p>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            except Exception as e:
-                                st.warning(f"Could not display destination card: {e}")
-        else:
-            st.info("No destinations match your selected filters.")
-    
-    # Tab 2: Tourism Types
-    with tabs[1]:
-        st.subheader("Distribution of Tourism Types across India")
+        # Add a section on UNESCO World Heritage Sites
+        st.subheader("UNESCO World Heritage Sites")
         
-        try:
-            # Create two columns for visualization
-            col1, col2 = st.columns(2)
+        if 'UNESCO Status' in df.columns:
+            # Filter for UNESCO sites
+            unesco_sites = df[df['UNESCO Status'] == 'World Heritage Site']
             
-            with col1:
-                # Create a pie chart of tourism types
-                if 'Tourism Type' in df.columns:
-                    # Group by tourism type
-                    type_counts = df.groupby('Tourism Type').size().reset_index(name='Count')
-                    type_counts = type_counts.sort_values('Count', ascending=False)
-                    
-                    # Create pie chart
-                    fig = px.pie(
-                        type_counts, 
-                        values='Count', 
-                        names='Tourism Type',
-                        title='Distribution of Tourism Types',
-                        color_discrete_sequence=get_color_palette(len(type_counts)),
-                        hole=0.4
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(textinfo='percent+label')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Tourism Type data is not available.")
-                    
-            with col2:
-                # Create a bar chart showing tourism categories by region
-                if 'Primary Tourism Category' in df.columns and 'Region' in df.columns:
-                    # Group by region and tourism category
-                    region_type = df.groupby(['Region', 'Primary Tourism Category']).size().reset_index(name='Count')
-                    
-                    # Create bar chart
-                    fig = px.bar(
-                        region_type,
-                        x='Region',
-                        y='Count',
-                        color='Primary Tourism Category',
-                        title='Tourism Categories by Region',
-                        color_discrete_sequence=get_color_palette(len(region_type['Primary Tourism Category'].unique()))
-                    )
-                    fig = apply_dark_theme(fig)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Tourism Category or Region data is not available.")
-            
-            # Add a section showing top attractions by type
-            st.subheader("Top Attractions by Type")
-            
-            # Create type filter
-            if 'Tourism Type' in df.columns:
-                tourism_types = ['All Types'] + sorted(df['Tourism Type'].unique().tolist())
-                selected_type = st.selectbox("Select Tourism Type", options=tourism_types)
+            if not unesco_sites.empty:
+                # Display count of UNESCO sites
+                st.metric("Total UNESCO World Heritage Sites", f"{len(unesco_sites)}")
                 
-                # Filter data based on selection
-                if selected_type != 'All Types':
-                    filtered_df = df[df['Tourism Type'] == selected_type]
-                else:
-                    filtered_df = df
+                # Create a pie chart of UNESCO sites by type
+                if 'Tourism Type' in unesco_sites.columns:
+                    # Built and encoded once per data version
+                    show_chart(cached_figure(build_unesco_types_figure, dataset_ref(unesco_sites), unesco_sites), use_container_width=True)
                 
-                # Display top 5 attractions for the selected type
-                if 'Annual Visitors (millions)' in filtered_df.columns:
-                    top_attractions = filtered_df.sort_values('Annual Visitors (millions)', ascending=False).head(5)
-                    
-                    # Create cards for top attractions
-                    st.markdown("<div style='display: flex; flex-wrap: wrap; gap: 10px;'>", unsafe_allow_html=True)
-                    
-                    for _, row in top_attractions.iterrows():
-                        destination = row['Destination']
-                        visitors = row['Annual Visitors (millions)']
-                        tourism_type = row['Tourism Type']
-                        state = row['State']
-                        description = row['Description'] if 'Description' in row and not pd.isna(row['Description']) else "No description available."
-                        
-                        # Create card with consistent style
-                        st.markdown(f"""
-                        <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 10px; width: 100%;">
-                            <h4 style="margin-top: 0; color: #FF9933;">{destination}</h4>
-                            <p><strong>Type:</strong> {tourism_type} | <strong>State:</strong> {state}</p>
-                            <p><strong>Annual Visitors:</strong> {visitors:.1f} million</p>
-                            <p>{description}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                    
-                    st.markdown("</div>", unsafe_allow_html=True)
-                else:
-                    st.warning("Visitor data is not available.")
-            else:
-                st.warning("Tourism Type data is not available.")
-                
-            # Add insights about tourism types
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>Tourism Type Insights:</strong>
-            <ul>
-              <li><strong>Heritage Tourism:</strong> India's monuments and historical sites attract the largest share of tourists, with the Taj Mahal being the crown jewel.</li>
-              <li><strong>Religious Tourism:</strong> Temples, mosques, and other religious sites see massive footfall, with Tirupati Temple receiving over 25 million visitors annually.</li>
-              <li><strong>Nature Tourism:</strong> From the beaches of Goa to the mountains of Himachal Pradesh, nature tourism is growing rapidly with increased environmental awareness.</li>
-              <li><strong>Adventure Tourism:</strong> The Himalayan region and coastal areas are seeing a boom in adventure tourism including trekking, rafting, and water sports.</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
+                # Display UNESCO sites in a table
+                st.markdown("### List of UNESCO World Heritage Sites")
                 
-        except Exception as e:
-            st.error(f"Error displaying tourism types: {e}")
+                for _, row in unesco_sites.iterrows():
+                    st.markdown(f"""
+                    <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 10px;">
+                        <h4 style="margin-top: 0; color: #FF9933;">{row['Destination']}</h4>
+                        <p><strong>Type:</strong> {row['Tourism Type']} | <strong>State:</strong> {row['State']}</p>
+                        <p><strong>Year Established:</strong> {row['Year Established'] if 'Year Established' in row and not pd.isna(row['Year Established']) else 'Unknown'}</p>
+                        <p>{row['Description'] if 'Description' in row and not pd.isna(row['Description']) else 'No description available.'}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            else:
+                st.warning("No UNESCO World Heritage Sites found in the data.")
+        else:
+            st.warning("UNESCO Status data is not available.")
+        
+        # Add insights about international tourism
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>International Tourism Insights:</strong>
+        <ul>
+          <li><strong>Golden Triangle:</strong> Delhi-Agra-Jaipur circuit attracts the highest number of international tourists.</li>
+          <li><strong>Source Countries:</strong> USA, UK, and European countries are the top sources of international tourists, followed by Southeast Asian countries.</li>
+          <li><strong>UNESCO Appeal:</strong> India's World Heritage Sites are major draws for international tourists seeking cultural experiences.</li>
+          <li><strong>Medical Tourism:</strong> India is becoming a hub for medical tourism, with visitors coming for affordable, high-quality medical treatments.</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    except Exception as e:
+        st.error(f"Error displaying international appeal: {e}")
+
+# Function to build the Tourism Revenue by Type chart
+def build_type_revenue_figure(df):
+    """Return the Tourism Revenue by Type (USD Millions) chart"""
+    # Group by tourism type and sum revenue
+    type_revenue = df.groupby('Tourism Type', observed=True)['Tourism Revenue (USD millions)'].sum().reset_index()
+    type_revenue = type_revenue.sort_values('Tourism Revenue (USD millions)', ascending=False)
+
+    # Create bar chart
+    fig = px.bar(
+        plain_labels(type_revenue),
+        x='Tourism Type',
+        y='Tourism Revenue (USD millions)',
+        color='Tourism Type',
+        title='Tourism Revenue by Type (USD Millions)',
+        color_discrete_sequence=get_color_palette(len(type_revenue)),
+        text='Tourism Revenue (USD millions)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='$%{text:.0f}M', textposition='outside')
+    return fig
+
+# Function to build the Tourism Revenue Distribution by Region chart
+def build_region_revenue_figure(df):
+    """Return the Tourism Revenue Distribution by Region chart"""
+    # Group by region and sum revenue
+    region_revenue = df.groupby('Region', observed=True)['Tourism Revenue (USD millions)'].sum().reset_index()
+    region_revenue = region_revenue.sort_values('Tourism Revenue (USD millions)', ascending=False)
+
+    # Create pie chart
+    fig = px.pie(
+        region_revenue,
+        values='Tourism Revenue (USD millions)',
+        names='Region',
+        title='Tourism Revenue Distribution by Region',
+        color_discrete_sequence=get_color_palette(len(region_revenue)),
+        hole=0.3
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(textinfo='percent+label')
+    return fig
+
+# Function to build the Employment Generation by Tourism Type chart
+def build_type_employment_figure(df):
+    """Return the Employment Generation by Tourism Type (Thousands of Jobs) chart"""
+    # Group by tourism type and sum employment
+    type_employment = df.groupby('Tourism Type', observed=True)['Employment Generated (thousands)'].sum().reset_index()
+    type_employment = type_employment.sort_values('Employment Generated (thousands)', ascending=False)
+
+    # Create bar chart
+    fig = px.bar(
+        plain_labels(type_employment),
+        x='Tourism Type',
+        y='Employment Generated (thousands)',
+        color='Tourism Type',
+        title='Employment Generation by Tourism Type (Thousands of Jobs)',
+        color_discrete_sequence=get_color_palette(len(type_employment)),
+        text='Employment Generated (thousands)'
+    )
+    fig = apply_dark_theme(fig)
+    fig.update_traces(texttemplate='%{text:.0f}K', textposition='outside')
+    return fig
+
+# Function to render the Economic Impact tab
+def render_economic_impact_tab(df):
+    """Renders the Economic Impact tab"""
+    st.subheader("Economic Impact of Tourism in India")
     
-    # Tab 3: International Appeal
-    with tabs[2]:
-        st.subheader("International Tourism Appeal")
+    try:
+        # Create main metrics row
+        col1, col2, col3, col4 = st.columns(4)
         
-        try:
-            # Create two columns for visualizations
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Create a bar chart showing international visitor percentages for top destinations
-                if 'International Visitors (%)' in df.columns:
-                    # Sort by international visitor percentage
-                    top_international = df.sort_values('International Visitors (%)', ascending=False).head(10)
-                    
-                    # Create bar chart
-                    fig = px.bar(
-                        top_international,
-                        x='Destination',
-                        y='International Visitors (%)',
-                        color='Region',
-                        title='Top 10 Destinations by International Visitor Percentage',
-                        color_discrete_sequence=get_color_palette(len(top_international['Region'].unique())),
-                        text='International Visitors (%)'
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                    fig.update_layout(xaxis_tickangle=-45)
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("International Visitor data is not available.")
-            
-            with col2:
-                # Create a map or chart showing international appeal by region
-                if 'Region' in df.columns and 'International Visitors (%)' in df.columns:
-                    # Calculate average international visitor percentage by region
-                    region_international = df.groupby('Region')['International Visitors (%)'].mean().reset_index()
-                    region_international = region_international.sort_values('International Visitors (%)', ascending=False)
-                    
-                    # Create bar chart
-                    fig = px.bar(
-                        region_international,
-                        x='Region',
-                        y='International Visitors (%)',
-                        color='Region',
-                        title='Average International Visitors by Region',
-                        color_discrete_sequence=get_color_palette(len(region_international)),
-                        text='International Visitors (%)'
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("International Visitor data is not available.")
+        # Calculate total tourism revenue
+        total_revenue = 0
+        if 'Tourism Revenue (USD millions)' in df.columns:
+            total_revenue = df['Tourism Revenue (USD millions)'].sum()
+            col1.metric("Total Tourism Revenue", f"${total_revenue:.1f}B" if total_revenue > 1000 else f"${total_revenue:.0f}M")
+        else:
+            col1.metric("Total Tourism Revenue", "Data N/A")
             
-            # Add a section on UNESCO World Heritage Sites
-            st.subheader("UNESCO World Heritage Sites")
+        # Calculate total employment
+        total_employment = 0
+        if 'Employment Generated (thousands)' in df.columns:
+            total_employment = df['Employment Generated (thousands)'].sum()
+            col2.metric("Total Employment", f"{total_employment/1000:.2f}M" if total_employment > 1000 else f"{total_employment:.0f}K")
+        else:
+            col2.metric("Total Employment", "Data N/A")
             
-            if 'UNESCO Status' in df.columns:
-                # Filter for UNESCO sites
-                unesco_sites = df[df['UNESCO Status'] == 'World Heritage Site']
+        # Calculate GDP contribution (estimated at 9.2% for India's tourism sector)
+        col3.metric("GDP Contribution", "9.2%")
+        
+        # Calculate average growth rate
+        avg_growth = 0
+        if 'Growth Potential (%)' in df.columns:
+            avg_growth = df['Growth Potential (%)'].mean()
+            col4.metric("Avg. Annual Growth", f"{avg_growth:.1f}%")
+        else:
+            col4.metric("Avg. Annual Growth", "Data N/A")
+        
+        # Create two-column layout for charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Create a bar chart of revenue by tourism type
+            if 'Tourism Type' in df.columns and 'Tourism Revenue (USD millions)' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_type_revenue_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Tourism Type or Revenue data is not available.")
                 
-                if not unesco_sites.empty:
-                    # Display count of UNESCO sites
-                    st.metric("Total UNESCO World Heritage Sites", f"{len(unesco_sites)}")
-                    
-                    # Create a pie chart of UNESCO sites by type
-                    if 'Tourism Type' in unesco_sites.columns:
-                        unesco_types = unesco_sites.groupby('Tourism Type').size().reset_index(name='Count')
-                        
-                        fig = px.pie(
-                            unesco_types,
-                            values='Count',
-                            names='Tourism Type',
-                            title='UNESCO Sites by Type',
-                            color_discrete_sequence=get_color_palette(len(unesco_types))
-                        )
-                        fig = apply_dark_theme(fig)
-                        st.plotly_chart(fig, use_container_width=True)
-                    
-                    # Display UNESCO sites in a table
-                    st.markdown("### List of UNESCO World Heritage Sites")
+        with col2:
+            # Create a pie chart of revenue by region
+            if 'Region' in df.columns and 'Tourism Revenue (USD millions)' in df.columns:
+                # Built and encoded once per data version
+                show_chart(cached_figure(build_region_revenue_figure, dataset_ref(df), df), use_container_width=True)
+            else:
+                st.warning("Region or Revenue data is not available.")
+        
+        # Create employment visualization
+        st.subheader("Employment Generation from Tourism")
+        
+        if 'Employment Generated (thousands)' in df.columns and 'Tourism Type' in df.columns:
+            # Built and encoded once per data version
+            show_chart(cached_figure(build_type_employment_figure, dataset_ref(df), df), use_container_width=True)
+        else:
+            st.warning("Employment data is not available.")
+        
+        # Add insights about economic impact
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>Economic Impact Insights:</strong>
+        <ul>
+          <li><strong>Revenue Generation:</strong> Tourism contributes significantly to India's economy, with heritage and religious tourism being the largest revenue generators.</li>
+          <li><strong>Employment:</strong> The sector provides employment to millions, particularly in hospitality, transportation, and handicrafts.</li>
+          <li><strong>Regional Disparity:</strong> Tourism revenue is unevenly distributed, with North and West India capturing the largest share.</li>
+          <li><strong>Growth Trajectory:</strong> The sector has shown resilient growth despite global challenges, with potential for further expansion.</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    except Exception as e:
+        st.error(f"Error displaying economic impact: {e}")
+
+# Function to render the Seasonal Patterns tab
+def render_seasonal_patterns_tab(df):
+    """Renders the Seasonal Patterns tab"""
+    st.subheader("Seasonal Tourism Patterns")
+    
+    try:
+        # Process seasonal data
+        if 'Peak Season' in df.columns:
+            # Extract seasons from peak season data
+            seasons = []
+            for season in df['Peak Season']:
+                if pd.isna(season) or not isinstance(season, str):
+                    continue
                     
-                    for _, row in unesco_sites.iterrows():
-                        st.markdown(f"""
-                        <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 10px;">
-                            <h4 style="margin-top: 0; color: #FF9933;">{row['Destination']}</h4>
-                            <p><strong>Type:</strong> {row['Tourism Type']} | <strong>State:</strong> {row['State']}</p>
-                            <p><strong>Year Established:</strong> {row['Year Established'] if 'Year Established' in row and not pd.isna(row['Year Established']) else 'Unknown'}</p>
-                            <p>{row['Description'] if 'Description' in row and not pd.isna(row['Description']) else 'No description available.'}</p>
-                        </div>
-                        """, unsafe_allow_html=True)
+                # Split by comma or hyphen if multiple seasons
+                if ',' in season:
+                    parts = [s.strip() for s in season.split(',')]
+                    seasons.extend(parts)
+                elif '-' in season:
+                    parts = [s.strip() for s in season.split('-')]
+                    seasons.extend(parts)
                 else:
-                    st.warning("No UNESCO World Heritage Sites found in the data.")
-            else:
-                st.warning("UNESCO Status data is not available.")
+                    seasons.append(season.strip())
             
-            # Add insights about international tourism
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>International Tourism Insights:</strong>
-            <ul>
-              <li><strong>Golden Triangle:</strong> Delhi-Agra-Jaipur circuit attracts the highest number of international tourists.</li>
-              <li><strong>Source Countries:</strong> USA, UK, and European countries are the top sources of international tourists, followed by Southeast Asian countries.</li>
-              <li><strong>UNESCO Appeal:</strong> India's World Heritage Sites are major draws for international tourists seeking cultural experiences.</li>
-              <li><strong>Medical Tourism:</strong> India is becoming a hub for medical tourism, with visitors coming for affordable, high-quality medical treatments.</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
+            # Count occurrences of each month
+            months = ['January', 'February', 'March', 'April', 'May', 'June', 
+                     'July', 'August', 'September', 'October', 'November', 'December']
             
-        except Exception as e:
-            st.error(f"Error displaying international appeal: {e}")
-    
-    # Tab 4: Economic Impact
-    with tabs[3]:
-        st.subheader("Economic Impact of Tourism in India")
-        
-        try:
-            # Create main metrics row
-            col1, col2, col3, col4 = st.columns(4)
+            month_counts = {month: 0 for month in months}
             
-            # Calculate total tourism revenue
-            total_revenue = 0
-            if 'Tourism Revenue (USD millions)' in df.columns:
-                total_revenue = df['Tourism Revenue (USD millions)'].sum()
-                col1.metric("Total Tourism Revenue", f"${total_revenue:.1f}B" if total_revenue > 1000 else f"${total_revenue:.0f}M")
-            else:
-                col1.metric("Total Tourism Revenue", "Data N/A")
-                
-            # Calculate total employment
-            total_employment = 0
-            if 'Employment Generated (thousands)' in df.columns:
-                total_employment = df['Employment Generated (thousands)'].sum()
-                col2.metric("Total Employment", f"{total_employment/1000:.2f}M" if total_employment > 1000 else f"{total_employment:.0f}K")
-            else:
-                col2.metric("Total Employment", "Data N/A")
-                
-            # Calculate GDP contribution (estimated at 9.2% for India's tourism sector)
-            col3.metric("GDP Contribution", "9.2%")
+            for season in seasons:
+                for month in months:
+                    if month.lower() in season.lower():
+                        month_counts[month] += 1
             
-            # Calculate average growth rate
-            avg_growth = 0
-            if 'Growth Potential (%)' in df.columns:
-                avg_growth = df['Growth Potential (%)'].mean()
-                col4.metric("Avg. Annual Growth", f"{avg_growth:.1f}%")
-            else:
-                col4.metric("Avg. Annual Growth", "Data N/A")
+            # Check if we have any real counts (not all zeros)
+            if sum(month_counts.values()) == 0:
+                # Use default counts if all are zero
+                month_counts = {
+                    'January': 18, 'February': 15, 'March': 12, 
+                    'April': 8, 'May': 6, 'June': 4,
+                    'July': 5, 'August': 7, 'September': 9,
+                    'October': 14, 'November': 17, 'December': 20
+                }
             
-            # Create two-column layout for charts
-            col1, col2 = st.columns(2)
+            # Create dataframe for visualization
+            season_df = pd.DataFrame({
+                'Month': list(month_counts.keys()),
+                'Count': list(month_counts.values())
+            })
             
-            with col1:
-                # Create a bar chart of revenue by tourism type
-                if 'Tourism Type' in df.columns and 'Tourism Revenue (USD millions)' in df.columns:
-                    # Group by tourism type and sum revenue
-                    type_revenue = df.groupby('Tourism Type')['Tourism Revenue (USD millions)'].sum().reset_index()
-                    type_revenue = type_revenue.sort_values('Tourism Revenue (USD millions)', ascending=False)
-                    
-                    # Create bar chart
-                    fig = px.bar(
-                        type_revenue,
-                        x='Tourism Type',
-                        y='Tourism Revenue (USD millions)',
-                        color='Tourism Type',
-                        title='Tourism Revenue by Type (USD Millions)',
-                        color_discrete_sequence=get_color_palette(len(type_revenue)),
-                        text='Tourism Revenue (USD millions)'
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(texttemplate='$%{text:.0f}M', textposition='outside')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Tourism Type or Revenue data is not available.")
-                    
-            with col2:
-                # Create a pie chart of revenue by region
-                if 'Region' in df.columns and 'Tourism Revenue (USD millions)' in df.columns:
-                    # Group by region and sum revenue
-                    region_revenue = df.groupby('Region')['Tourism Revenue (USD millions)'].sum().reset_index()
-                    region_revenue = region_revenue.sort_values('Tourism Revenue (USD millions)', ascending=False)
-                    
-                    # Create pie chart
-                    fig = px.pie(
-                        region_revenue,
-                        values='Tourism Revenue (USD millions)',
-                        names='Region',
-                        title='Tourism Revenue Distribution by Region',
-                        color_discrete_sequence=get_color_palette(len(region_revenue)),
-                        hole=0.3
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(textinfo='percent+label')
-                    st.plotly_chart(fig, use_container_width=True)
-                else:
-                    st.warning("Region or Revenue data is not available.")
+            # Add numeric month for proper sorting
+            month_to_num = {month: i+1 for i, month in enumerate(months)}
+            season_df['Month_Num'] = season_df['Month'].map(month_to_num)
+            season_df = season_df.sort_values('Month_Num')
             
-            # Create employment visualization
-            st.subheader("Employment Generation from Tourism")
+            # Create seasonal pattern visualization
+            fig = px.line(
+                season_df,
+                x='Month',
+                y='Count',
+                title='Tourist Season Distribution Throughout the Year',
+                markers=True,
+                line_shape='spline',
+                color_discrete_sequence=['#FF9933']
+            )
+            fig = apply_dark_theme(fig)
+            fig.update_traces(line=dict(width=3), marker=dict(size=10))
+            fig.update_layout(xaxis_title='Month', yaxis_title='Number of Destinations')
+            show_chart(fig, use_container_width=True)
             
-            if 'Employment Generated (thousands)' in df.columns and 'Tourism Type' in df.columns:
-                # Group by tourism type and sum employment
-                type_employment = df.groupby('Tourism Type')['Employment Generated (thousands)'].sum().reset_index()
-                type_employment = type_employment.sort_values('Employment Generated (thousands)', ascending=False)
+            # Create seasonal patterns by region
+            if 'Region' in df.columns:
+                # Process data by region
+                region_season_data = []
                 
-                # Create bar chart
-                fig = px.bar(
-                    type_employment,
-                    x='Tourism Type',
-                    y='Employment Generated (thousands)',
-                    color='Tourism Type',
-                    title='Employment Generation by Tourism Type (Thousands of Jobs)',
-                    color_discrete_sequence=get_color_palette(len(type_employment)),
-                    text='Employment Generated (thousands)'
-                )
-                fig = apply_dark_theme(fig)
-                fig.update_traces(texttemplate='%{text:.0f}K', textposition='outside')
-                st.plotly_chart(fig, use_container_width=True)
-            else:
-                st.warning("Employment data is not available.")
-            
-            # Add insights about economic impact
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>Economic Impact Insights:</strong>
-            <ul>
-              <li><strong>Revenue Generation:</strong> Tourism contributes significantly to India's economy, with heritage and religious tourism being the largest revenue generators.</li>
-              <li><strong>Employment:</strong> The sector provides employment to millions, particularly in hospitality, transportation, and handicrafts.</li>
-              <li><strong>Regional Disparity:</strong> Tourism revenue is unevenly distributed, with North and West India capturing the largest share.</li>
-              <li><strong>Growth Trajectory:</strong> The sector has shown resilient growth despite global challenges, with potential for further expansion.</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
-        except Exception as e:
-            st.error(f"Error displaying economic impact: {e}")
-    
-    # Tab 5: Seasonal Patterns
-    with tabs[4]:
-        st.subheader("Seasonal Tourism Patterns")
-        
-        try:
-            # Process seasonal data
-            if 'Peak Season' in df.columns:
-                # Extract seasons from peak season data
-                seasons = []
-                for season in df['Peak Season']:
-                    if pd.isna(season) or not isinstance(season, str):
+                for region in df['Region'].unique():
+                    region_df = df[df['Region'] == region]
+                    if 'Peak Season' not in region_df.columns:
                         continue
                         
-                    # Split by comma or hyphen if multiple seasons
-                    if ',' in season:
-                        parts = [s.strip() for s in season.split(',')]
-                        seasons.extend(parts)
-                    elif '-' in season:
-                        parts = [s.strip() for s in season.split('-')]
-                        seasons.extend(parts)
-                    else:
-                        seasons.append(season.strip())
-                
-                # Count occurrences of each month
-                months = ['January', 'February', 'March', 'April', 'May', 'June', 
-                         'July', 'August', 'September', 'October', 'November', 'December']
-                
-                month_counts = {month: 0 for month in months}
-                
-                for season in seasons:
-                    for month in months:
-                        if month.lower() in season.lower():
-                            month_counts[month] += 1
-                
-                # Check if we have any real counts (not all zeros)
-                if sum(month_counts.values()) == 0:
-                    # Use default counts if all are zero
-                    month_counts = {
-                        'January': 18, 'February': 15, 'March': 12, 
-                        'April': 8, 'May': 6, 'June': 4,
-                        'July': 5, 'August': 7, 'September': 9,
-                        'October': 14, 'November': 17, 'December': 20
-                    }
-                
-                # Create dataframe for visualization
-                season_df = pd.DataFrame({
-                    'Month': list(month_counts.keys()),
-                    'Count': list(month_counts.values())
-                })
+                    region_seasons = []
+                    for season in region_df['Peak Season']:
+                        if pd.isna(season) or not isinstance(season, str):
+                            continue
+                            
+                        # Split by comma or hyphen if multiple seasons
+                        if ',' in season:
+                            parts = [s.strip() for s in season.split(',')]
+                            region_seasons.extend(parts)
+                        elif '-' in season:
+                            parts = [s.strip() for s in season.split('-')]
+                            region_seasons.extend(parts)
+                        else:
+                            region_seasons.append(season.strip())
+                    
+                    # Count occurrences of each month for this region
+                    region_month_counts = {month: 0 for month in months}
+                    
+                    for season in region_seasons:
+                        for month in months:
+                            if month.lower() in season.lower():
+                                region_month_counts[month] += 1
+                    
+                    # Check if all counts are zero for this region
+                    if sum(region_month_counts.values()) == 0:
+                        # Use default region-specific seasonal patterns
+                        if region == 'North':
+                            region_month_counts = {
+                                'January': 20, 'February': 18, 'March': 15, 
+                                'April': 10, 'May': 5, 'June': 3,
+                                'July': 2, 'August': 4, 'September': 8,
+                                'October': 14, 'November': 18, 'December': 22
+                            }
+                        elif region == 'South':
+                            region_month_counts = {
+                                'January': 15, 'February': 14, 'March': 12, 
+                                'April': 10, 'May': 8, 'June': 6,
+                                'July': 7, 'August': 8, 'September': 10,
+                                'October': 12, 'November': 14, 'December': 16
+                            }
+                        elif region == 'East':
+                            region_month_counts = {
+                                'January': 16, 'February': 14, 'March': 12, 
+                                'April': 9, 'May': 6, 'June': 4,
+                                'July': 5, 'August': 8, 'September': 10,
+                                'October': 13, 'November': 15, 'December': 17
+                            }
+                        elif region == 'West':
+                            region_month_counts = {
+                                'January': 18, 'February': 16, 'March': 14, 
+                                'April': 10, 'May': 7, 'June': 5,
+                                'July': 6, 'August': 8, 'September': 10,
+                                'October': 14, 'November': 16, 'December': 19
+                            }
+                        elif region == 'Central':
+                            region_month_counts = {
+                                'January': 17, 'February': 15, 'March': 13, 
+                                'April': 9, 'May': 6, 'June': 4,
+                                'July': 5, 'August': 7, 'September': 10,
+                                'October': 13, 'November': 16, 'December': 18
+                            }
+                        elif region == 'Northeast':
+                            region_month_counts = {
+                                'January': 14, 'February': 12, 'March': 13, 
+                                'April': 11, 'May': 9, 'June': 7,
+                                'July': 6, 'August': 8, 'September': 10,
+                                'October': 12, 'November': 13, 'December': 15
+                            }
+                        else:  # Islands or Other
+                            region_month_counts = {
+                                'January': 16, 'February': 15, 'March': 13, 
+                                'April': 11, 'May': 9, 'June': 8,
+                                'July': 8, 'August': 9, 'September': 10,
+                                'October': 12, 'November': 14, 'December': 16
+                            }
+                    
+                    # Add to data collection
+                    for month, count in region_month_counts.items():
+                        region_season_data.append({
+                            'Region': region,
+                            'Month': month,
+                            'Count': count,
+                            'Month_Num': month_to_num[month]
+                        })
                 
-                # Add numeric month for proper sorting
-                month_to_num = {month: i+1 for i, month in enumerate(months)}
-                season_df['Month_Num'] = season_df['Month'].map(month_to_num)
-                season_df = season_df.sort_values('Month_Num')
+                # Create dataframe
+                region_season_df = pd.DataFrame(region_season_data)
+                region_season_df = region_season_df.sort_values('Month_Num')
                 
-                # Create seasonal pattern visualization
+                # Create region-wise seasonal pattern visualization
                 fig = px.line(
-                    season_df,
+                    region_season_df,
                     x='Month',
                     y='Count',
-                    title='Tourist Season Distribution Throughout the Year',
+                    color='Region',
+                    title='Seasonal Tourism Patterns by Region',
                     markers=True,
                     line_shape='spline',
-                    color_discrete_sequence=['#FF9933']
+                    color_discrete_sequence=get_color_palette(len(region_season_df['Region'].unique()))
                 )
                 fig = apply_dark_theme(fig)
-                fig.update_traces(line=dict(width=3), marker=dict(size=10))
+                fig.update_traces(line=dict(width=2), marker=dict(size=8))
                 fig.update_layout(xaxis_title='Month', yaxis_title='Number of Destinations')
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # Create seasonal patterns by region
-                if 'Region' in df.columns:
-                    # Process data by region
-                    region_season_data = []
-                    
-                    for region in df['Region'].unique():
-                        region_df = df[df['Region'] == region]
-                        if 'Peak Season' not in region_df.columns:
-                            continue
-                            
-                        region_seasons = []
-                        for season in region_df['Peak Season']:
-                            if pd.isna(season) or not isinstance(season, str):
-                                continue
-                                
-                            # Split by comma or hyphen if multiple seasons
-                            if ',' in season:
-                                parts = [s.strip() for s in season.split(',')]
-                                region_seasons.extend(parts)
-                            elif '-' in season:
-                                parts = [s.strip() for s in season.split('-')]
-                                region_seasons.extend(parts)
-                            else:
-                                region_seasons.append(season.strip())
-                        
-                        # Count occurrences of each month for this region
-                        region_month_counts = {month: 0 for month in months}
-                        
-                        for season in region_seasons:
-                            for month in months:
-                                if month.lower() in season.lower():
-                                    region_month_counts[month] += 1
-                        
-                        # Check if all counts are zero for this region
-                        if sum(region_month_counts.values()) == 0:
-                            # Use default region-specific seasonal patterns
-                            if region == 'North':
-                                region_month_counts = {
-                                    'January': 20, 'February': 18, 'March': 15, 
-                                    'April': 10, 'May': 5, 'June': 3,
-                                    'July': 2, 'August': 4, 'September': 8,
-                                    'October': 14, 'November': 18, 'December': 22
-                                }
-                            elif region == 'South':
-                                region_month_counts = {
-                                    'January': 15, 'February': 14, 'March': 12, 
-                                    'April': 10, 'May': 8, 'June': 6,
-                                    'July': 7, 'August': 8, 'September': 10,
-                                    'October': 12, 'November': 14, 'December': 16
-                                }
-                            elif region == 'East':
-                                region_month_counts = {
-                                    'January': 16, 'February': 14, 'March': 12, 
-                                    'April': 9, 'May': 6, 'June': 4,
-                                    'July': 5, 'August': 8, 'September': 10,
-                                    'October': 13, 'November': 15, 'December': 17
-                                }
-                            elif region == 'West':
-                                region_month_counts = {
-                                    'January': 18, 'February': 16, 'March': 14, 
-                                    'April': 10, 'May': 7, 'June': 5,
-                                    'July': 6, 'August': 8, 'September': 10,
-                                    'October': 14, 'November': 16, 'December': 19
-                                }
-                            elif region == 'Central':
-                                region_month_counts = {
-                                    'January': 17, 'February': 15, 'March': 13, 
-                                    'April': 9, 'May': 6, 'June': 4,
-                                    'July': 5, 'August': 7, 'September': 10,
-                                    'October': 13, 'November': 16, 'December': 18
-                                }
-                            elif region == 'Northeast':
-                                region_month_counts = {
-                                    'January': 14, 'February': 12, 'March': 13, 
-                                    'April': 11, 'May': 9, 'June': 7,
-                                    'July': 6, 'August': 8, 'September': 10,
-                                    'October': 12, 'November': 13, 'December': 15
-                                }
-                            else:  # Islands or Other
-                                region_month_counts = {
-                                    'January': 16, 'February': 15, 'March': 13, 
-                                    'April': 11, 'May': 9, 'June': 8,
-                                    'July': 8, 'August': 9, 'September': 10,
-                                    'October': 12, 'November': 14, 'December': 16
-                                }
-                        
-                        # Add to data collection
-                        for month, count in region_month_counts.items():
-                            region_season_data.append({
-                                'Region': region,
-                                'Month': month,
-                                'Count': count,
-                                'Month_Num': month_to_num[month]
-                            })
-                    
-                    # Create dataframe
-                    region_season_df = pd.DataFrame(region_season_data)
-                    region_season_df = region_season_df.sort_values('Month_Num')
-                    
-                    # Create region-wise seasonal pattern visualization
-                    fig = px.line(
-                        region_season_df,
-                        x='Month',
-                        y='Count',
-                        color='Region',
-                        title='Seasonal Tourism Patterns by Region',
-                        markers=True,
-                        line_shape='spline',
-                        color_discrete_sequence=get_color_palette(len(region_season_df['Region'].unique()))
-                    )
-                    fig = apply_dark_theme(fig)
-                    fig.update_traces(line=dict(width=2), marker=dict(size=8))
-                    fig.update_layout(xaxis_title='Month', yaxis_title='Number of Destinations')
-                    st.plotly_chart(fig, use_container_width=True)
-            else:
-                # Display default seasonal data if Peak Season column doesn't exist
-                show_default_seasonal_patterns()
-                
-            # Create off-peak tourism suggestions
-            st.subheader("Off-Peak Tourism Opportunities")
-            
-            # Define off-peak months based on above analysis (April-September generally)
-            off_peak_months = ['April', 'May', 'June', 'July', 'August', 'September']
-            
-            # Create recommendations
-            st.markdown("""
-            <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 20px;">
-            <h4 style="margin-top: 0; color: #FF9933;">Best Places to Visit During Off-Peak Season</h4>
-            <p>Traveling during off-peak season (April-September) offers benefits like lower costs, fewer crowds, and unique experiences:</p>
-            <ul>
-                <li><strong>Hill Stations:</strong> Shimla, Darjeeling, Ooty, and Munnar offer pleasant weather during summer months</li>
-                <li><strong>Northeast India:</strong> Meghalaya, Sikkim, and Assam are beautiful during the monsoon with lush greenery</li>
-                <li><strong>Wildlife Sanctuaries:</strong> Jim Corbett, Ranthambore, and Kaziranga have unique monsoon ecosystem viewing opportunities</li>
-                <li><strong>Kerala Backwaters:</strong> Experience authentic Kerala lifestyle with reduced tourist numbers during monsoon</li>
-                <li><strong>Leh-Ladakh:</strong> June-September is actually the peak season for this high-altitude desert</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Add insights about seasonal patterns
-            st.markdown("""
-            <div class='insight-box'>
-            <strong>Seasonal Pattern Insights:</strong>
-            <ul>
-              <li><strong>Winter Dominance:</strong> October-March is the peak tourism season for most of India due to comfortable temperatures.</li>
-              <li><strong>Regional Variations:</strong> Southern India has more year-round appeal, while northern regions have more seasonal variation.</li>
-              <li><strong>Seasonal Pricing:</strong> Prices can vary by 30-50% between peak and off-peak seasons at popular destinations.</li>
-              <li><strong>Emerging Trend:</strong> Monsoon tourism is growing with special packages for rainy season experiences in Western Ghats and Northeast India.</li>
-            </ul>
-            </div>
-            """, unsafe_allow_html=True)
+                show_chart(fig, use_container_width=True)
+        else:
+            # Display default seasonal data if Peak Season column doesn't exist
+            show_default_seasonal_patterns()
             
-        except Exception as e:
-            st.error(f"Error displaying seasonal patterns: {e}")
-    
-    # Add a conclusive insight section about overall tourism trends
-    st.header("Key Tourism Trends and Future Outlook")
-    
-    st.markdown("""
-    <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 20px; margin: 20px 0;">
-    <h4 style="margin-top: 0; color: #FF9933;">India's Tourism Landscape: Present and Future</h4>
-    
-    <p>India's tourism sector has shown remarkable resilience and growth potential, with several key trends shaping its future:</p>
-    
-    <ol>
-        <li><strong>Digital Transformation:</strong> The rise of online booking platforms, virtual tours, and digital marketing is revolutionizing how tourists discover and experience India.</li>
-        <li><strong>Sustainable Tourism:</strong> Growing emphasis on eco-friendly practices, conservation efforts, and responsible tourism across destinations.</li>
-        <li><strong>Experiential Travel:</strong> Shift from sightseeing to immersive experiences like village stays, cooking classes, and cultural workshops.</li>
-        <li><strong>Infrastructure Development:</strong> Major investments in airports, highways, and tourist facilities are improving accessibility and comfort.</li>
-        <li><strong>Emerging Destinations:</strong> Lesser-known locations like Northeast India, Gujarat's Rann of Kutch, and Madhya Pradesh's heritage sites are gaining popularity.</li>
-    </ol>
-    
-    <p>With the implementation of initiatives like e-Visa facilities, the Incredible India campaign, and development of thematic circuits, India is positioned to significantly increase its share in the global tourism market in the coming years.</p>
-    </div>
-    """, unsafe_allow_html=True) 
+        # Create off-peak tourism suggestions
+        st.subheader("Off-Peak Tourism Opportunities")
+        
+        # Define off-peak months based on above analysis (April-September generally)
+        off_peak_months = ['April', 'May', 'June', 'July', 'August', 'September']
+        
+        # Create recommendations
+        st.markdown("""
+        <div style="background-color: rgba(49, 51, 63, 0.7); border-radius: 10px; padding: 15px; margin-bottom: 20px;">
+        <h4 style="margin-top: 0; color: #FF9933;">Best Places to Visit During Off-Peak Season</h4>
+        <p>Traveling during off-peak season (April-September) offers benefits like lower costs, fewer crowds, and unique experiences:</p>
+        <ul>
+            <li><strong>Hill Stations:</strong> Shimla, Darjeeling, Ooty, and Munnar offer pleasant weather during summer months</li>
+            <li><strong>Northeast India:</strong> Meghalaya, Sikkim, and Assam are beautiful during the monsoon with lush greenery</li>
+            <li><strong>Wildlife Sanctuaries:</strong> Jim Corbett, Ranthambore, and Kaziranga have unique monsoon ecosystem viewing opportunities</li>
+            <li><strong>Kerala Backwaters:</strong> Experience authentic Kerala lifestyle with reduced tourist numbers during monsoon</li>
+            <li><strong>Leh-Ladakh:</strong> June-September is actually the peak season for this high-altitude desert</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Add insights about seasonal patterns
+        st.markdown("""
+        <div class='insight-box'>
+        <strong>Seasonal Pattern Insights:</strong>
+        <ul>
+          <li><strong>Winter Dominance:</strong> October-March is the peak tourism season for most of India due to comfortable temperatures.</li>
+          <li><strong>Regional Variations:</strong> Southern India has more year-round appeal, while northern regions have more seasonal variation.</li>
+          <li><strong>Seasonal Pricing:</strong> Prices can vary by 30-50% between peak and off-peak seasons at popular destinations.</li>
+          <li><strong>Emerging Trend:</strong> Monsoon tourism is growing with special packages for rainy season experiences in Western Ghats and Northeast India.</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+    except Exception as e:
+        st.error(f"Error displaying seasonal patterns: {e}")
 
 def show_default_seasonal_patterns():
     """Display default seasonal patterns when Peak Season data is not available"""
@@ -1008,7 +983,7 @@ def show_default_seasonal_patterns():
     fig = apply_dark_theme(fig)
     fig.update_traces(line=dict(width=3), marker=dict(size=10))
     fig.update_layout(xaxis_title='Month', yaxis_title='Number of Destinations')
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig, use_container_width=True)
     
     # Create region-wise default data
     regions = ['North', 'South', 'East', 'West', 'Central', 'Northeast', 'Islands']
@@ -1054,5 +1029,5 @@ def show_default_seasonal_patterns():
     fig = apply_dark_theme(fig)
     fig.update_traces(line=dict(width=2), marker=dict(size=8))
     fig.update_layout(xaxis_title='Month', yaxis_title='Number of Destinations')
-    st.plotly_chart(fig, use_container_width=True)
+    show_chart(fig, use_container_width=True)
     st.info("Using default seasonal pattern data based on typical tourism trends in India.") 
\ No newline at end of file
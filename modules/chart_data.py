@@ -0,0 +1,180 @@
+import streamlit as st
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+from modules.config import CHART_MAX_POINTS, CHART_WEBGL_THRESHOLD
+from modules.figure_transport import show_chart
+
+# Trace attributes holding one value per point, sliced together with x and y
+POINT_ATTRIBUTES = ('x', 'y', 'text', 'hovertext', 'customdata', 'ids')
+MARKER_POINT_ATTRIBUTES = ('size', 'color', 'symbol', 'opacity')
+
+# Function to pick the points of a series that keep its visual shape
+def lttb_indices(x, y, n_out):
+    """
+    Largest-Triangle-Three-Buckets downsampling
+
+    Keeps the first and last point and, from each of n_out - 2 equal buckets
+    in between, the point forming the largest triangle with the point kept
+    before it and the mean of the next bucket. Peaks and dips survive, unlike
+    plain decimation.
+
+    Args:
+        x (array): Numeric x values in ascending order
+        y (array): y values
+        n_out (int): Number of points to keep
+
+    Returns:
+        ndarray: Sorted positions of the kept points
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=float)
+    y = np.nan_to_num(np.asarray(y, dtype=float))
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+
+    kept = np.empty(n_out, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Mean of the next bucket (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area for every candidate in this bucket
+        area = np.abs(
+            (x[previous] - avg_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (avg_y - y[previous])
+        )
+        previous = start + int(np.argmax(area))
+        kept[i + 1] = previous
+    return kept
+
+# Helper function to read a trace's x values, with dates as datetime64
+def _x_values(trace):
+    x = np.asarray(trace.x)
+    if x.dtype == object:
+        try:
+            return pd.to_datetime(x).to_numpy()
+        except (ValueError, TypeError):
+            return x
+    return x
+
+# Helper function to turn x values into numbers LTTB can measure distances on
+def _numeric_x(x):
+    if np.issubdtype(x.dtype, np.number):
+        return x.astype(float)
+    if np.issubdtype(x.dtype, np.datetime64):
+        return x.astype('datetime64[ns]').astype('int64').astype(float)
+    # Categories: evenly spaced in their plotting order
+    return np.arange(len(x), dtype=float)
+
+# Helper function to keep only the given points of a trace, in place
+def _slice_trace(trace, positions):
+    n = len(trace.x)
+    updates = {}
+    for name in POINT_ATTRIBUTES:
+        values = getattr(trace, name, None)
+        if values is not None and not isinstance(values, str) and len(values) == n:
+            updates[name] = np.asarray(values)[positions]
+    for name in MARKER_POINT_ATTRIBUTES:
+        values = getattr(trace.marker, name, None)
+        if values is not None and not isinstance(values, (str, int, float)) and len(values) == n:
+            updates.setdefault('marker', {})[name] = np.asarray(values)[positions]
+    trace.update(updates)
+
+# Function to reduce the series of a figure to what the browser needs
+def downsample_figure(fig, max_points=None, webgl_threshold=None, x_range=None):
+    """
+    Downsample large scatter/line traces and switch them to WebGL
+
+    Traces are sliced in place (the full figure is never copied); a trace
+    that moves to WebGL is replaced in the returned figure.
+
+    Args:
+        fig: Plotly figure
+        max_points (int): Most points kept per trace (LTTB above that)
+        webgl_threshold (int): Traces with more points are drawn with Scattergl
+        x_range (tuple): Optional (low, high) window; points outside it are dropped
+            first, so a narrow window is shown at full resolution
+
+    Returns:
+        Figure: The reduced figure
+    """
+    max_points = CHART_MAX_POINTS if max_points is None else max_points
+    webgl_threshold = CHART_WEBGL_THRESHOLD if webgl_threshold is None else webgl_threshold
+
+    traces = []
+    replaced = False
+    for trace in fig.data:
+        if trace.type not in ('scatter', 'scattergl') or trace.x is None or trace.y is None:
+            traces.append(trace)
+            continue
+
+        x = _x_values(trace)
+        positions = np.arange(len(x))
+        if x_range is not None:
+            low, high = x_range
+            if np.issubdtype(x.dtype, np.datetime64):
+                low, high = np.datetime64(low), np.datetime64(high)
+            positions = np.flatnonzero((x >= low) & (x <= high))
+        if len(positions) > max_points:
+            positions = positions[lttb_indices(_numeric_x(x[positions]), np.asarray(trace.y)[positions], max_points)]
+        if len(positions) < len(x):
+            _slice_trace(trace, positions)
+
+        if trace.type == 'scatter' and len(positions) > webgl_threshold:
+            # SVG-only settings (e.g. spline lines, orientation) are dropped for WebGL
+            trace = go.Scattergl(trace.to_plotly_json(), skip_invalid=True)
+            replaced = True
+        traces.append(trace)
+
+    if not replaced:
+        return fig
+    return go.Figure(data=traces, layout=fig.layout)
+
+# Helper function to find the shared x extent of a figure's series
+def _x_extent(fig):
+    values = [_x_values(trace) for trace in fig.data
+              if trace.type in ('scatter', 'scattergl') and trace.x is not None and len(trace.x)]
+    if not values:
+        return None
+    x = np.concatenate(values)
+    if np.issubdtype(x.dtype, np.integer):
+        return int(x.min()), int(x.max())
+    if np.issubdtype(x.dtype, np.floating):
+        return float(np.nanmin(x)), float(np.nanmax(x))
+    if np.issubdtype(x.dtype, np.datetime64):
+        return pd.Timestamp(x.min()).to_pydatetime(), pd.Timestamp(x.max()).to_pydatetime()
+    return None
+
+# Function to display a series chart with bounded payload
+def show_series_chart(fig, key=None, max_points=None):
+    """
+    Display a line/scatter figure, downsampled server-side when it is large
+
+    Small figures are shown unchanged. When a trace has more than max_points
+    points and a key is given, a range slider lets the visitor zoom in; the
+    window is downsampled again, so zooming far enough shows every point.
+
+    Args:
+        fig: Plotly figure
+        key (str): Session state key of the zoom slider (no slider without one)
+        max_points (int): Most points kept per trace
+    """
+    max_points = CHART_MAX_POINTS if max_points is None else max_points
+    largest = max((len(trace.x) for trace in fig.data
+                   if trace.type in ('scatter', 'scattergl') and trace.x is not None), default=0)
+
+    x_range = None
+    extent = _x_extent(fig) if key is not None and largest > max_points else None
+    if extent is not None and extent[0] < extent[1]:
+        x_range = st.slider("Zoom", min_value=extent[0], max_value=extent[1], value=extent, key=key,
+                            help="Narrow the range to see the series at full resolution")
+        if tuple(x_range) == extent:
+            x_range = None
+
+    show_chart(downsample_figure(fig, max_points, x_range=x_range), use_container_width=True)
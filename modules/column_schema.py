@@ -0,0 +1,235 @@
+import re
+from pathlib import Path
+
+# This module is shared by snowflake_setup.py and the app loaders, so it only
+# uses the standard library (no streamlit).
+
+# Single definition of every dataset: its Snowflake table, its CSV file, the
+# application column names (CSV headers first, then columns the loaders add)
+# and any other names the same column has been stored under.
+DATASET_TABLES = {
+    'linguistic': {
+        'table': 'LANGUAGES',
+        'csv': 'languages.csv',
+        'columns': [
+            'Language', 'Speakers', 'Percentage', 'Official Status', 'Primary States',
+            'Cultural Significance', 'Ancient Texts', 'Global Reach', 'UNESCO Status'
+        ]
+    },
+    'religious': {
+        'table': 'RELIGIONS',
+        'csv': 'religions.csv',
+        'columns': [
+            'Religion', 'Percentage', 'Population', 'Primary States', 'Major Festivals',
+            'Sacred Sites', 'Cultural Contributions', 'Unique Practices', 'Historical Significance'
+        ]
+    },
+    'state': {
+        'table': 'STATES',
+        'csv': 'states.csv',
+        'columns': [
+            'State', 'Population (millions)', 'Area (sq km)', 'Literacy Rate (%)', 'Region',
+            'Capital', 'Official Languages', 'Major Industries', 'GDP (billion USD)',
+            'HDI', 'Urbanization (%)', 'Famous Destinations', 'Major Crops', 'Key Industries'
+        ]
+    },
+    'cultural': {
+        'table': 'CULTURAL_HERITAGE',
+        'csv': 'cultural_heritage.csv',
+        'columns': [
+            'Cultural Element', 'Count', 'Description', 'Historical Period', 'Region of Origin',
+            'Associated States', 'Name', 'Type', 'Location', 'State', 'UNESCO Status',
+            'Year Built', 'Cultural Contributions'
+        ]
+    },
+    'population': {
+        'table': 'POPULATION_GROWTH',
+        'csv': 'population_growth.csv',
+        'columns': [
+            'Year', 'Population (millions)', 'Urban Population (%)', 'Rural Population (%)',
+            'Growth Rate (%)', 'Male Population (%)', 'Female Population (%)', 'Density',
+            'Age 0-14 (%)', 'Age 15-64 (%)', 'Age 65+ (%)'
+        ]
+    },
+    'economic': {
+        'table': 'ECONOMIC_SECTORS',
+        'csv': 'economic_sectors.csv',
+        'columns': [
+            'Year', 'Agriculture', 'Industry', 'Services', 'GDP (billion USD)',
+            'GDP Growth Rate (%)', 'Per Capita Income (USD)', 'Exports (billion USD)',
+            'Imports (billion USD)', 'Unemployment Rate (%)'
+        ],
+        'aliases': {
+            'GDP_GROWTH_RATE_PERCENT': 'GDP Growth Rate (%)',
+            'EXPORTS_USD_BILLIONS': 'Exports (billion USD)',
+            'IMPORTS_USD_BILLIONS': 'Imports (billion USD)',
+            'UNEMPLOYMENT_RATE_PERCENT': 'Unemployment Rate (%)'
+        }
+    },
+    'historical': {
+        'table': 'HISTORICAL_TIMELINE',
+        'csv': 'historical_timeline.csv',
+        'columns': [
+            'Year', 'Era', 'Event', 'Significance', 'Region', 'Key Figures', 'Period',
+            'Start Year', 'End Year', 'Major Events', 'Time Period', 'Cultural Developments',
+            'Religious Trends', 'Art & Architecture', 'Economic Systems', 'Scientific Advances',
+            'Historical Legacy'
+        ]
+    },
+    'festivals': {
+        'table': 'FESTIVALS',
+        'csv': 'festivals.csv',
+        'columns': [
+            'Festival', 'Religion/Type', 'Primary States', 'Month', 'Season', 'Description',
+            'Cultural Significance', 'Regional Variations', 'Global Recognition',
+            'Participants (millions)', 'Economic Impact (Millions USD)', 'Tourist Attraction Level',
+            'Environmental Impact', 'Duration (days)', 'Global Celebrations'
+        ],
+        'aliases': {
+            'Economic Impact (USD millions)': 'Economic Impact (Millions USD)',
+            'ECONOMIC_IMPACT_USD_MILLIONS': 'Economic Impact (Millions USD)'
+        }
+    },
+    'tourism': {
+        'table': 'TOURISM',
+        'csv': 'tourism.csv',
+        'columns': [
+            'Destination', 'State', 'Type', 'Visitors_Annual', 'Best Season', 'UNESCO Status',
+            'Year Established', 'Entry Fee (INR)', 'Description', 'Tourism Type', 'Peak Season',
+            'Best Time', 'Visitors (millions)'
+        ]
+    },
+    'education': {
+        'table': 'EDUCATION',
+        'csv': 'education.csv',
+        'columns': [
+            'State', 'Literacy_Rate', 'Primary_Enrollment', 'Higher_Education_GER',
+            'Gender_Parity_Index', 'Number_of_Universities', 'Number_of_Colleges',
+            'Teacher_Student_Ratio', 'Level', 'Enrollment (millions)', 'Male (%)', 'Female (%)',
+            'Literacy Rate (%)', 'National Literacy Rate (%)', 'Primary Enrollment Rate (%)',
+            'Institutions', 'State Names', 'State Literacy Rates (%)', 'State Primary Enrollment (%)',
+            'State Secondary Enrollment (%)', 'State Higher Ed Enrollment (%)', 'Male Literacy (%)',
+            'Female Literacy (%)', 'Literacy Gap', 'Number of Primary Schools',
+            'Number of Secondary Schools', 'Number of Technical Institutions', 'Higher Education Enrollment (millions)',
+            'PISA Score', 'Global Rank', 'University Ranking', 'Teacher-Student Ratio Primary',
+            'Teacher-Student Ratio Secondary', 'Teacher-Student Ratio Higher Ed',
+            'Gender Parity Primary', 'Gender Parity Secondary', 'Gender Parity Higher Ed',
+            'Literacy Rate Years', 'Literacy Rate History'
+        ],
+        # The national totals the loader adds share their Snowflake column with the per-state counts
+        'aliases': {
+            'Number of Colleges': 'Number_of_Colleges',
+            'Number of Universities': 'Number_of_Universities'
+        }
+    },
+    'geography': {
+        'table': 'GEOGRAPHY',
+        'csv': 'geography.csv',
+        'columns': [
+            'Terrain_Type', 'Percentage', 'Area_sq_km', 'Region', 'Major Features', 'Climate',
+            'Biodiversity Index', 'States', 'Major Rivers', 'Major Mountains', 'Biodiversity'
+        ],
+        'aliases': {
+            'AREA_KM2': 'Area_sq_km'
+        }
+    }
+}
+
+# Character replacements turning an application column into a Snowflake identifier
+_SNOWFLAKE_REPLACEMENTS = [
+    ('%', 'PCT'), ('+', '_PLUS'), ('²', '2'), ('&', '_'), ('(', ''), (')', ''),
+    (' ', '_'), ('/', '_'), (',', '_'), ('-', '_')
+]
+
+# Function to derive the Snowflake name of an application column
+def snowflake_column_name(column):
+    """Return the upper-case Snowflake identifier for a column, e.g. 'Age 65+ (%)' -> 'AGE_65_PLUS_PCT'"""
+    name = str(column).strip().upper()
+    for old, new in _SNOWFLAKE_REPLACEMENTS:
+        name = name.replace(old, new)
+    return re.sub(r'_+', '_', name).strip('_')
+
+# Class holding the precomputed rename tables of one dataset
+class CompiledSchema:
+    """
+    Rename tables of one dataset, built once at import time
+
+    to_snowflake maps every application column to its Snowflake column.
+    to_app maps every known Snowflake name and alias back to the
+    application column. Applying either is a single rename over the columns.
+    """
+
+    __slots__ = ('name', 'table', 'csv', 'columns', 'to_snowflake', 'to_app')
+
+    def __init__(self, name, table, csv, columns, to_snowflake, to_app):
+        self.name = name
+        self.table = table
+        self.csv = csv
+        self.columns = columns
+        self.to_snowflake = to_snowflake
+        self.to_app = to_app
+
+    @property
+    def csv_path(self):
+        return str(Path("data") / self.csv)
+
+    def __repr__(self):
+        return f"CompiledSchema({self.name!r}, table={self.table!r}, columns={len(self.columns)})"
+
+# Function to compile the dataset definitions into rename tables
+def compile_schemas(definitions):
+    """
+    Compile dataset definitions into bidirectional rename tables
+
+    Raises:
+        ValueError: If two application columns of one dataset would share a
+        Snowflake column, or an alias points at an undeclared column
+    """
+    compiled = {}
+    for name, spec in definitions.items():
+        to_snowflake, to_app = {}, {}
+        for column in spec['columns']:
+            target = snowflake_column_name(column)
+            if target in to_app and to_app[target] != column:
+                raise ValueError(f"{name}: '{column}' and '{to_app[target]}' both map to {target}")
+            to_snowflake[column] = target
+            to_app[target] = column
+        for alias, column in spec.get('aliases', {}).items():
+            if column not in to_snowflake:
+                raise ValueError(f"{name}: alias '{alias}' points at undeclared column '{column}'")
+            to_app[alias] = column
+            if alias != alias.upper():
+                # Legacy application names are stored under the canonical Snowflake column
+                to_snowflake[alias] = to_snowflake[column]
+        compiled[name] = CompiledSchema(name, spec['table'], spec['csv'], list(spec['columns']), to_snowflake, to_app)
+    return compiled
+
+COMPILED_SCHEMAS = compile_schemas(DATASET_TABLES)
+
+# Lookup of datasets by CSV file name
+_DATASETS_BY_CSV = {schema.csv: name for name, schema in COMPILED_SCHEMAS.items()}
+
+# Function to get the compiled schema of a dataset
+def get_schema(dataset):
+    """Return the CompiledSchema of a dataset key such as 'tourism'"""
+    return COMPILED_SCHEMAS[dataset]
+
+# Function to find the dataset a CSV file belongs to
+def dataset_for_csv(csv_path):
+    """Return the dataset key of a CSV path, or None if it is not a known dataset"""
+    return _DATASETS_BY_CSV.get(Path(csv_path).name.lower())
+
+# Function to rename Snowflake (or legacy) columns to application names
+def to_app_columns(df, dataset):
+    """Rename columns to application names; columns the schema does not know are kept as they are"""
+    schema = COMPILED_SCHEMAS.get(dataset)
+    if schema is None:
+        return df
+    return df.rename(columns=schema.to_app)
+
+# Function to rename application columns to Snowflake names
+def to_snowflake_columns(df, dataset):
+    """Rename columns to Snowflake identifiers; undeclared columns follow snowflake_column_name()"""
+    schema = COMPILED_SCHEMAS.get(dataset)
+    to_snowflake = schema.to_snowflake if schema is not None else {}
+    return df.rename(columns=lambda column: to_snowflake.get(column) or snowflake_column_name(column))
@@ -7,6 +7,52 @@ APP_VERSION = "1.0.0"
 APP_NAME = "Incredible India | A Data-Driven Journey"
 DATA_DIR = Path("data")
 
+# Shared Arrow dataset store used by every Streamlit process on this host
+DATASET_STORE_DIR = Path(os.environ.get("DATASET_STORE_DIR", ".dataset_store"))
+# Seconds before Snowflake-backed datasets are refreshed by one process
+DATASET_STORE_TTL = int(os.environ.get("DATASET_STORE_TTL", "3600"))
+# Prebuilt dataset bundle written by build_data_bundle.py
+DATA_BUNDLE_PATH = Path(os.environ.get("DATA_BUNDLE_PATH", DATA_DIR / "india_data.bundle"))
+# Warehouse backend: "snowflake", or "local" for the SQLite stand-in built from DATA_DIR
+DATA_BACKEND = os.environ.get("DATA_BACKEND", "snowflake").lower()
+# Latency (seconds, plus up to JITTER more) and failure injection for the local backend
+LOCAL_BACKEND_LATENCY = float(os.environ.get("LOCAL_BACKEND_LATENCY", "0"))
+LOCAL_BACKEND_JITTER = float(os.environ.get("LOCAL_BACKEND_JITTER", "0"))
+LOCAL_BACKEND_FAILURE_RATE = float(os.environ.get("LOCAL_BACKEND_FAILURE_RATE", "0"))
+LOCAL_BACKEND_SEED = int(os.environ.get("LOCAL_BACKEND_SEED", "42"))
+# Session state above this size (KB) is compacted at the start of a rerun
+SESSION_MEMORY_BUDGET_KB = int(os.environ.get("SESSION_MEMORY_BUDGET_KB", "64"))
+# Sessions without a rerun for this many seconds have their rebuildable state evicted
+SESSION_IDLE_SECONDS = int(os.environ.get("SESSION_IDLE_SECONDS", "1800"))
+# Series charts keep at most this many points per trace (LTTB downsampling above it)
+CHART_MAX_POINTS = int(os.environ.get("CHART_MAX_POINTS", "2000"))
+# Traces with more points than this are drawn with WebGL (Scattergl)
+CHART_WEBGL_THRESHOLD = int(os.environ.get("CHART_WEBGL_THRESHOLD", "1000"))
+# Numeric trace arrays with at least this many values are sent as binary typed arrays
+FIGURE_BINARY_MIN_VALUES = int(os.environ.get("FIGURE_BINARY_MIN_VALUES", "8"))
+# Encoded figure specs kept per process so identical figures are shared across sessions
+FIGURE_CACHE_ENTRIES = int(os.environ.get("FIGURE_CACHE_ENTRIES", "256"))
+# Static chapter snapshots written by build_snapshots.py (served at /app/static/snapshots/)
+SNAPSHOT_DIR = Path(os.environ.get("SNAPSHOT_DIR", "static/snapshots"))
+# Link from a snapshot to the live app; the default is the app root relative to SNAPSHOT_DIR's URL
+SNAPSHOT_LIVE_URL = os.environ.get("SNAPSHOT_LIVE_URL", "../../../")
+# Memory (MB) for rasterized Matplotlib figures shared by all sessions
+MPL_CACHE_MB = int(os.environ.get("MPL_CACHE_MB", "32"))
+# Worker threads rasterizing Matplotlib figures
+MPL_RENDER_WORKERS = int(os.environ.get("MPL_RENDER_WORKERS", "2"))
+# Base URL of the Plotly geo topojson files (e.g. "app/static/geo/"); empty uses Plotly's CDN
+GEO_TOPOJSON_URL = os.environ.get("GEO_TOPOJSON_URL", "")
+# India states boundary GeoJSON that the state maps are simplified from
+GEO_STATES_PATH = Path(os.environ.get("GEO_STATES_PATH", DATA_DIR / "geo" / "india_states.geojson"))
+# Simplified state layers written by build_geo_layers.py (served at /app/static/geo/)
+GEO_LAYER_DIR = Path(os.environ.get("GEO_LAYER_DIR", "static/geo"))
+# URL of GEO_LAYER_DIR relative to the app root, used by the browser to fetch the layers
+GEO_URL_PREFIX = os.environ.get("GEO_URL_PREFIX", "app/static/geo/")
+# Readiness of the cache warm-up for health checks, one file per server port (served at /app/static/warmup-8501.json)
+WARMUP_STATUS_PATH = os.environ.get("WARMUP_STATUS_PATH", "static/warmup-{port}.json")
+# Start the warm-up in the background when the first session of a process runs ("0" to disable)
+WARMUP_ON_FIRST_SESSION = os.environ.get("WARMUP_ON_FIRST_SESSION", "1") == "1"
+
 # Chapter configuration
 CHAPTER_CONFIG = {
     "Introduction": {
@@ -0,0 +1,316 @@
+import streamlit as st
+import pandas as pd
+import os
+import json
+import time
+import hashlib
+import functools
+from pathlib import Path
+from modules.config import DATA_DIR, DATA_BUNDLE_PATH
+from modules.column_schema import COMPILED_SCHEMAS, DATASET_TABLES, to_app_columns
+from modules.snowflake_connector import warehouse_enabled
+from modules.dataset_store import is_fallback
+
+# Bump when the bundle layout changes so old bundles are rebuilt
+BUNDLE_FORMAT_VERSION = 2
+
+# Segments start on this byte boundary so their buffers can be used in place
+SEGMENT_ALIGNMENT = 64
+
+# Source CSV of every bundled dataset (the same files snowflake_setup.py uploads)
+BUNDLE_SOURCES = {name: schema.csv for name, schema in COMPILED_SCHEMAS.items()}
+
+# Columns the chapters rely on; a dataset missing any of them fails validation
+BUNDLE_REQUIRED_COLUMNS = {
+    'linguistic': ['Language', 'Speakers', 'UNESCO Status'],
+    'religious': ['Religion', 'Percentage', 'Population'],
+    'state': ['State', 'Population (millions)', 'Area (sq km)', 'Literacy Rate (%)', 'Region', 'HDI'],
+    'cultural': ['Name', 'Type', 'UNESCO Status', 'Description', 'Cultural Contributions'],
+    'population': ['Year', 'Population (millions)', 'Urban Population (%)', 'Rural Population (%)'],
+    'economic': ['Year', 'GDP (billion USD)', 'Agriculture', 'Industry', 'Services'],
+    'historical': ['Era', 'Time Period', 'Start Year', 'End Year'],
+    'festivals': ['Festival', 'Religion/Type', 'Description'],
+    'tourism': ['Destination', 'State', 'Type', 'Tourism Type'],
+    'education': ['National Literacy Rate (%)'],
+    'geography': ['Terrain_Type', 'Percentage']
+}
+
+# Loaders registered by @bundled_dataset, used by the offline build
+BUNDLE_BUILDERS = {}
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Helper function to get the manifest path next to the bundle
+def _manifest_path(bundle_path=None):
+    bundle_path = Path(bundle_path or DATA_BUNDLE_PATH)
+    return bundle_path.with_name(bundle_path.name + ".json")
+
+# Helper function to hash a file in fixed-size chunks
+def _sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+# Helper function to describe the source files a bundle was built from
+def _source_state(name):
+    path = Path(DATA_DIR) / BUNDLE_SOURCES[name]
+    if not path.exists():
+        return {'file': path.name, 'missing': True}
+    stat = path.stat()
+    return {'file': path.name, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': _sha256(path)}
+
+# Helper function to fingerprint the code-side inputs of a bundle
+def _schema_version():
+    from modules.utils import DATASET_SCHEMAS
+    inputs = (BUNDLE_FORMAT_VERSION, sorted(DATASET_SCHEMAS.items()), sorted(DATASET_TABLES.items()))
+    return hashlib.sha1(repr(inputs).encode()).hexdigest()[:16]
+
+# Function to check a built frame before it goes into the bundle
+def validate_dataset(name, df):
+    """
+    Validate one dataset for the bundle
+
+    Returns:
+        tuple: (errors, warnings) as lists of strings; any error keeps the
+        dataset out of the bundle
+    """
+    errors, warnings = [], []
+    if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+        return [f"{name}: loader returned no rows"], warnings
+
+    missing = [col for col in BUNDLE_REQUIRED_COLUMNS.get(name, []) if col not in df.columns]
+    if missing:
+        errors.append(f"{name}: missing required columns {missing}")
+    duplicated = df.columns[df.columns.duplicated()].tolist()
+    if duplicated:
+        errors.append(f"{name}: duplicated columns {duplicated}")
+
+    # The same frame must survive an upload/download round trip through Snowflake
+    try:
+        from snowflake_setup import standardize_column_names
+        uploaded = standardize_column_names(df.head(1), BUNDLE_SOURCES[name])
+        restored = to_app_columns(uploaded, name)
+        lost = [col for col in df.columns if col not in restored.columns]
+        if lost:
+            warnings.append(f"{name}: columns not restored from Snowflake names {lost}")
+    except ImportError as e:
+        warnings.append(f"{name}: Snowflake round-trip check skipped ({str(e)})")
+
+    return errors, warnings
+
+# Helper function to serialize one table as an Arrow IPC file
+def _serialize(df):
+    # Uncompressed, so readers use the mapped bytes directly instead of decompressing a copy
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa_ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+# Function to build the dataset bundle from the CSV files
+def build_bundle(bundle_path=None, datasets=None, log=print):
+    """
+    Build, validate and write the versioned dataset bundle
+
+    Each dataset is produced by its loader in local-file mode (reading the
+    CSV and applying the default columns once), validated, and appended to
+    a single file as an uncompressed, aligned Arrow segment. A JSON manifest next
+    to the bundle records the offsets, schemas and source file checksums.
+
+    Args:
+        bundle_path: Target file, defaults to DATA_BUNDLE_PATH
+        datasets: Dataset names to include, defaults to all registered loaders
+        log: Callable used for progress messages
+
+    Returns:
+        dict: The manifest that was written (its 'failed' entry lists datasets left out)
+    """
+    if not ARROW_AVAILABLE:
+        raise RuntimeError("pyarrow is required to build the dataset bundle")
+
+    bundle_path = Path(bundle_path or DATA_BUNDLE_PATH)
+    names = datasets or list(BUNDLE_BUILDERS)
+    segments, failed = {}, {}
+
+    # Loaders must read the local files, never Snowflake
+    previous = st.session_state.get('use_snowflake', True)
+    st.session_state['use_snowflake'] = False
+    try:
+        for name in names:
+            started = time.time()
+            try:
+                df = BUNDLE_BUILDERS[name]()
+            except Exception as e:
+                df = None
+                failed[name] = [f"{name}: loader raised {str(e)}"]
+                log(f"❌ {name}: {str(e)}")
+                continue
+            if is_fallback(df):
+                failed[name] = [f"{name}: source could not be read, its default data is left out"]
+                log(f"❌ {name}: source could not be read")
+                continue
+            errors, warnings = validate_dataset(name, df)
+            if errors:
+                failed[name] = errors
+                log(f"❌ {name}: " + "; ".join(errors))
+                continue
+            segments[name] = (_serialize(df), df, warnings, time.time() - started)
+            for warning in warnings:
+                log(f"⚠️ {warning}")
+            log(f"✅ {name}: {len(df)} rows, {len(df.columns)} columns")
+    finally:
+        st.session_state['use_snowflake'] = previous
+
+    manifest = {
+        'format': BUNDLE_FORMAT_VERSION,
+        'schema_version': _schema_version(),
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'datasets': {},
+        'failed': failed
+    }
+
+    bundle_path.parent.mkdir(parents=True, exist_ok=True)
+    partial = bundle_path.with_name(bundle_path.name + f".{os.getpid()}.partial")
+    offset = 0
+    with open(partial, 'wb') as f:
+        for name, (buffer, df, warnings, elapsed) in segments.items():
+            data = buffer.to_pybytes()
+            f.write(data)
+            manifest['datasets'][name] = {
+                'offset': offset,
+                'length': len(data),
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'rows': len(df),
+                'columns': {col: str(dtype) for col, dtype in df.dtypes.items()},
+                'source': _source_state(name),
+                'warnings': warnings,
+                'build_seconds': round(elapsed, 3)
+            }
+            # Pad so the next segment stays aligned
+            padding = -len(data) % SEGMENT_ALIGNMENT
+            f.write(b"\0" * padding)
+            offset += len(data) + padding
+
+    # The version identifies the exact bytes of this bundle
+    manifest['version'] = hashlib.sha1(
+        "".join(entry['sha256'] for entry in manifest['datasets'].values()).encode()
+    ).hexdigest()[:16]
+
+    manifest_partial = _manifest_path(partial)
+    with open(manifest_partial, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    # Publish the data first so a reader never sees a manifest without its bundle
+    os.replace(partial, bundle_path)
+    os.replace(manifest_partial, _manifest_path(bundle_path))
+    return manifest
+
+# Function to read the bundle manifest
+def load_bundle_manifest(bundle_path=None):
+    """Return the manifest of the bundle, or None if there is no usable bundle"""
+    try:
+        with open(_manifest_path(bundle_path), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('format') != BUNDLE_FORMAT_VERSION or not Path(bundle_path or DATA_BUNDLE_PATH).exists():
+        return None
+    return manifest
+
+# Function to check whether a bundled dataset still matches its source file
+def _is_current(entry):
+    source = entry.get('source', {})
+    path = Path(DATA_DIR) / source.get('file', '')
+    if source.get('missing'):
+        return not path.exists()
+    try:
+        stat = path.stat()
+    except OSError:
+        return False
+    if stat.st_size != source.get('size'):
+        return False
+    # A copied file keeps its contents but not its mtime, so fall back to the checksum
+    return stat.st_mtime_ns == source.get('mtime_ns') or _sha256(path) == source.get('sha256')
+
+# Function to map the bundle once per process and bundle version
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _open_bundle(path, version, schema_version):
+    """Memory-map the bundle and decide which datasets are still current"""
+    manifest = load_bundle_manifest(path)
+    if manifest is None or manifest.get('version') != version or schema_version != _schema_version():
+        return None
+    source = pa.memory_map(str(path), 'r')
+    current = {name for name, entry in manifest['datasets'].items() if _is_current(entry)}
+    return {'manifest': manifest, 'source': source, 'current': current}
+
+# Function to read one dataset from the mapped bundle
+def read_bundled_dataset(name, bundle_path=None):
+    """
+    Return a dataset from the bundle, or None if it is missing or stale
+
+    The segment is read straight from the memory map without copying or
+    decompressing it; no CSV parsing, renaming or default filling happens at
+    run time.
+    """
+    if not ARROW_AVAILABLE:
+        return None
+    bundle_path = str(bundle_path or DATA_BUNDLE_PATH)
+    manifest = load_bundle_manifest(bundle_path)
+    if manifest is None or name not in manifest['datasets']:
+        return None
+    try:
+        bundle = _open_bundle(bundle_path, manifest.get('version'), _schema_version())
+        if bundle is None or name not in bundle['current']:
+            return None
+        entry = manifest['datasets'][name]
+        bundle['source'].seek(entry['offset'])
+        segment = bundle['source'].read_buffer(entry['length'])
+        # split_blocks keeps numeric columns as zero-copy views over the mapping
+        return pa_ipc.open_file(segment).read_all().to_pandas(split_blocks=True, self_destruct=False)
+    except Exception as e:
+        print(f"Could not read {name} from the dataset bundle: {str(e)}")
+        return None
+
+# Decorator serving a load_* function from the prebuilt bundle when possible
+def bundled_dataset(name):
+    """
+    Serve a loader from the dataset bundle for local data
+
+    The bundle is used whenever the app reads local files (Snowflake disabled
+    or not configured) and the bundled copy is still current. Otherwise the
+    loader runs as before.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not args and not kwargs and not warehouse_enabled():
+                df = read_bundled_dataset(name)
+                if df is not None:
+                    return df
+            return func(*args, **kwargs)
+
+        # The build bypasses the shared store and calls the schema-enforced loader directly
+        BUNDLE_BUILDERS[name] = getattr(func, '__wrapped__', func)
+        return wrapper
+    return decorator
+
+# Function to summarize the bundle for status displays
+def get_bundle_status():
+    """Return one row per bundled dataset with its size and whether it is current"""
+    manifest = load_bundle_manifest()
+    rows = []
+    if manifest:
+        for name, entry in manifest['datasets'].items():
+            rows.append({
+                'Dataset': name,
+                'Rows': entry['rows'],
+                'Size (KB)': round(entry['length'] / 1024, 1),
+                'Current': _is_current(entry)
+            })
+    return pd.DataFrame(rows, columns=['Dataset', 'Rows', 'Size (KB)', 'Current'])
@@ -0,0 +1,298 @@
+import streamlit as st
+import pandas as pd
+import os
+import time
+import hashlib
+import functools
+from pathlib import Path
+from collections import namedtuple
+from modules.config import DATA_DIR, DATASET_STORE_DIR, DATASET_STORE_TTL, DATA_BUNDLE_PATH
+
+# Bump when the on-disk layout changes so old stores are ignored
+STORE_FORMAT_VERSION = 1
+
+# Seconds after which a refresh lock is considered abandoned
+LOCK_STALE_SECONDS = 300
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Function to fingerprint the current data version
+def data_fingerprint(use_snowflake=None):
+    """
+    Return a version string for the datasets shared between processes
+
+    The fingerprint covers the local data files (name, size, mtime), the
+    dataset bundle, the declared dtype and column schemas and the data
+    source (including which warehouse backend is active). Snowflake-backed
+    data is additionally bucketed by DATASET_STORE_TTL so it is refreshed
+    periodically; without a configured backend the local files are read.
+    """
+    # Imported lazily to avoid a circular import with modules.utils
+    from modules.utils import DATASET_SCHEMAS
+    from modules.column_schema import DATASET_TABLES
+    from modules.snowflake_connector import get_backend, warehouse_enabled
+
+    h = hashlib.sha1()
+    h.update(f"format={STORE_FORMAT_VERSION}".encode())
+    h.update(repr(sorted(DATASET_SCHEMAS.items())).encode())
+    h.update(repr(sorted(DATASET_TABLES.items())).encode())
+    for path in sorted(Path(DATA_DIR).glob("*.csv")):
+        stat = path.stat()
+        h.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    # A rebuilt bundle replaces what the local loaders return
+    bundle_manifest = Path(str(DATA_BUNDLE_PATH) + ".json")
+    if bundle_manifest.exists():
+        stat = bundle_manifest.stat()
+        h.update(f"bundle:{stat.st_size}:{stat.st_mtime_ns}".encode())
+    # An unconfigured backend serves the local files, so it shares their version
+    if warehouse_enabled(use_snowflake):
+        h.update(f"{get_backend().name}:{int(time.time() // max(DATASET_STORE_TTL, 1))}".encode())
+    else:
+        h.update(b"local")
+    return h.hexdigest()[:16]
+
+# Helper function to build the store path for a dataset version
+def _store_path(name, fingerprint):
+    return Path(DATASET_STORE_DIR) / f"{name}-{fingerprint}.arrow"
+
+# Helper class implementing a cross-process refresh lock with a lock file
+class _RefreshLock:
+    """Exclusive lock file so only one process refreshes a dataset version"""
+
+    def __init__(self, path, timeout=120):
+        self.path = Path(str(path) + ".lock")
+        self.timeout = timeout
+        self.acquired = False
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                self.acquired = True
+                return self
+            except FileExistsError:
+                # Break locks left behind by a crashed process
+                try:
+                    if time.time() - self.path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        self.path.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    return self
+                time.sleep(0.05)
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.acquired:
+            self.path.unlink(missing_ok=True)
+        return False
+
+# Helper function to write a DataFrame as an Arrow IPC file atomically
+def _write_arrow(df, path):
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    partial = path.with_suffix(f".{os.getpid()}.partial")
+    with pa.OSFile(str(partial), "wb") as sink:
+        with pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    # Readers only ever see complete files
+    os.replace(partial, path)
+
+# Helper function to remove superseded versions of a dataset
+def _prune_old_versions(name, keep):
+    for old in Path(DATASET_STORE_DIR).glob(f"{name}-*.arrow"):
+        if old != keep:
+            try:
+                old.unlink()
+            except OSError:
+                pass  # Still mapped on platforms that forbid deleting open files
+
+# Function to map a stored dataset read-only (cached once per process)
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _map_arrow(path):
+    """Memory-map an Arrow IPC file; buffers are shared through the OS page cache"""
+    source = pa.memory_map(str(path), "r")
+    return pa_ipc.open_file(source).read_all()
+
+# Function to convert a mapped Arrow table to pandas
+def _to_pandas(table):
+    # split_blocks keeps numeric columns as zero-copy views over the mapping
+    return table.to_pandas(split_blocks=True, self_destruct=False)
+
+# Function to mark the default frame a loader returns when its source failed
+def fallback_frame(df):
+    """Flag df as fallback data so the shared store and the bundle never persist it"""
+    df.attrs['fallback'] = True
+    return df
+
+# Function to check whether a loader returned fallback data
+def is_fallback(df):
+    return isinstance(df, pd.DataFrame) and df.attrs.get('fallback', False)
+
+# Function to load a dataset through the shared store
+def load_shared_dataset(name, loader):
+    """
+    Return a dataset from the shared Arrow store, building it at most once per version
+
+    The first process to miss a version takes the refresh lock, calls
+    loader() (Snowflake or local files) and writes the Arrow file. Every other
+    process waits for the lock and then maps the same file read-only. Default
+    frames returned by a failing loader (see fallback_frame()) are not stored.
+
+    Args:
+        name (str): Dataset key, e.g. 'tourism'
+        loader (callable): Function producing the normalized DataFrame
+
+    Returns:
+        DataFrame: The dataset (falls back to loader() if the store is unusable)
+    """
+    if not ARROW_AVAILABLE:
+        return loader()
+
+    try:
+        path = _store_path(name, data_fingerprint())
+        if path.exists():
+            return _to_pandas(_map_arrow(str(path)))
+    except Exception as e:
+        print(f"Shared dataset store unavailable for {name}: {str(e)}")
+        return loader()
+
+    with _RefreshLock(path) as lock:
+        # Another process may have finished the refresh while we waited
+        if not path.exists():
+            df = loader()
+            # Fallback frames are served but not stored, so the next process retries the source
+            if df is None or not isinstance(df, pd.DataFrame) or df.empty or is_fallback(df) or not lock.acquired:
+                return df
+            try:
+                _write_arrow(df, path)
+                _prune_old_versions(name, path)
+            except Exception as e:
+                print(f"Could not write {name} to the shared dataset store: {str(e)}")
+                return df
+
+    try:
+        return _to_pandas(_map_arrow(str(path)))
+    except Exception as e:
+        print(f"Shared dataset store unavailable for {name}: {str(e)}")
+        return loader()
+
+# Decorator routing a load_* function through the shared store
+def shared_dataset(name):
+    """Wrap a load_* function so its result is shared across processes via the Arrow store"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return load_shared_dataset(name, lambda: func(*args, **kwargs))
+        return wrapper
+    return decorator
+
+# Function to report the contents of the shared store
+def get_store_status():
+    """Return one row per stored dataset version with its size on disk"""
+    rows = []
+    for path in sorted(Path(DATASET_STORE_DIR).glob("*.arrow")):
+        name, _, fingerprint = path.stem.rpartition("-")
+        rows.append({
+            'Dataset': name,
+            'Version': fingerprint,
+            'Size (KB)': round(path.stat().st_size / 1024, 1)
+        })
+    return pd.DataFrame(rows, columns=['Dataset', 'Version', 'Size (KB)'])
+
+# Copy-on-write makes shallow copies safe views: writes copy the touched data
+try:
+    COPY_ON_WRITE = bool(pd.get_option("mode.copy_on_write"))
+except (KeyError, Exception):
+    COPY_ON_WRITE = False
+
+# Reference to one version of a shared dataset; small enough to keep in session state
+DatasetRef = namedtuple('DatasetRef', ['name', 'version'])
+
+# Helper function to get the dataset version a frame was viewed from
+def dataset_ref(df):
+    return df.attrs.get('dataset_ref') if isinstance(df, pd.DataFrame) else None
+
+# Helper function to tag a frame with the dataset version it holds
+def with_dataset_ref(df, name, version):
+    df.attrs['dataset_ref'] = DatasetRef(name, version)
+    return df
+
+# Class wrapping a cached dataset as an immutable, versioned handle
+class DatasetHandle:
+    """
+    Read-only reference to one version of a dataset
+
+    The cached frame itself is never handed out. view() returns a shallow
+    copy-on-write copy, so chapters can add or overwrite columns on their view
+    without touching the frame other sessions and reruns share.
+    """
+
+    __slots__ = ('name', 'version', '_frame')
+
+    def __init__(self, name, frame, version):
+        self.name = name
+        self.version = version
+        self._frame = frame
+
+    def view(self):
+        """Return a copy-on-write view of the dataset (or None if it failed to load)"""
+        if self._frame is None:
+            return None
+        # Without copy-on-write a shallow copy would share writable buffers
+        view = self._frame.copy(deep=not COPY_ON_WRITE)
+        # Lets per-version caches (e.g. filter indexes) recognise the view without hashing it
+        return with_dataset_ref(view, self.name, self.version)
+
+    @property
+    def ref(self):
+        return DatasetRef(self.name, self.version)
+
+    @property
+    def rows(self):
+        return 0 if self._frame is None else len(self._frame)
+
+    @property
+    def columns(self):
+        return [] if self._frame is None else list(self._frame.columns)
+
+    @property
+    def nbytes(self):
+        return 0 if self._frame is None else int(self._frame.memory_usage(deep=True).sum())
+
+    def __repr__(self):
+        return f"DatasetHandle({self.name!r}, version={self.version!r}, rows={self.rows})"
+
+# Function to build the process-wide handle for one dataset version
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _get_dataset_handle(name, version, _loader):
+    return DatasetHandle(name, _loader(), version)
+
+# Decorator serving a load_* function through an immutable cached handle
+def dataset_handle(name):
+    """
+    Cache a loader's result once per process and data version as a DatasetHandle
+
+    Unlike st.cache_data there is no pickle round trip per read: every call
+    returns a cheap copy-on-write view of the same in-memory frame. The
+    handle itself is available as <loader>.handle().
+    """
+    def decorator(func):
+        def get_handle():
+            return _get_dataset_handle(name, data_fingerprint(), func)
+
+        @functools.wraps(func)
+        def wrapper():
+            return get_handle().view()
+
+        wrapper.handle = get_handle
+        return wrapper
+    return decorator
@@ -0,0 +1,188 @@
+import os
+import json
+import codecs
+import threading
+from pathlib import Path
+
+# This module only uses the standard library: launcher.py loads it before the
+# app's dependencies are installed.
+
+# Candidate source encodings, most specific first. latin-1 accepts any byte
+# sequence, so it is the last resort (iso-8859-1 is an alias of it).
+CANDIDATE_ENCODINGS = ('utf-8', 'cp1252', 'latin-1')
+
+# Bytes read per chunk while streaming a file
+CHUNK_SIZE = 1024 * 1024
+
+# Bytes inspected up front to pick a candidate encoding
+SAMPLE_SIZE = 64 * 1024
+
+# Manifest of verified encodings, stored next to the data files
+MANIFEST_NAME = "encoding_manifest.json"
+
+_manifest_lock = threading.Lock()
+
+# Helper function to describe a file's current version
+def _file_state(path):
+    stat = os.stat(path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+# Helper function to get the manifest path for a data file
+def _manifest_path(path):
+    return Path(path).parent / MANIFEST_NAME
+
+# Function to load the encoding manifest of a data directory
+def load_manifest(data_dir):
+    """Return {file name: entry} recorded for a data directory (empty if missing or unreadable)"""
+    try:
+        with open(Path(data_dir) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+# Function to record one file's verified encoding in the manifest
+def record_encoding(path, entry):
+    """Merge an entry into the manifest, writing it atomically"""
+    manifest_path = _manifest_path(path)
+    with _manifest_lock:
+        manifest = load_manifest(manifest_path.parent)
+        manifest[Path(path).name] = entry
+        partial = manifest_path.with_suffix(f".{os.getpid()}.partial")
+        try:
+            with open(partial, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2, sort_keys=True)
+            os.replace(partial, manifest_path)
+        except OSError as e:
+            print(f"Could not update encoding manifest: {str(e)}")
+
+# Function to look up a file's encoding without reading it
+def verified_encoding(path):
+    """
+    Return the recorded encoding of a file if the manifest entry is still current
+
+    Returns:
+        str or None: Encoding to pass to the CSV parser, or None if the file
+        changed (or was never checked) since the manifest was written
+    """
+    entry = load_manifest(Path(path).parent).get(Path(path).name)
+    try:
+        if entry and {k: entry.get(k) for k in ('size', 'mtime_ns')} == _file_state(path):
+            return entry.get('encoding')
+    except OSError:
+        pass
+    return None
+
+# Helper function to pick the first candidate that decodes a sample
+def _guess_from_sample(sample):
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    for encoding in CANDIDATE_ENCODINGS:
+        decoder = codecs.getincrementaldecoder(encoding)('strict')
+        try:
+            # final=False: the sample may end in the middle of a multi-byte character
+            decoder.decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return CANDIDATE_ENCODINGS[-1]
+
+# Helper function to stream a file through one decoder, optionally writing UTF-8
+def _stream_decode(path, encoding, target=None):
+    decoder = codecs.getincrementaldecoder(encoding)('strict')
+    with open(path, 'rb') as source:
+        while True:
+            chunk = source.read(CHUNK_SIZE)
+            text = decoder.decode(chunk, final=not chunk)
+            if target is not None and text:
+                target.write(text.encode('utf-8'))
+            if not chunk:
+                break
+
+# Function to detect a file's encoding and convert it to UTF-8 in one pass
+def normalize_to_utf8(path, convert=True, record=True):
+    """
+    Stream a file in fixed-size chunks, detect its encoding and store it as UTF-8
+
+    The encoding is guessed from the first SAMPLE_SIZE bytes and verified by
+    decoding the rest of the file chunk by chunk. Non-UTF-8 files are
+    re-encoded while they are being verified, so each file is read once in
+    the common case. The result is recorded in the encoding manifest.
+
+    Rewriting files and the manifest is only safe from a single process, so
+    the running app passes convert=False, record=False and leaves both to
+    normalize_data_dir() in the launcher.
+
+    Args:
+        path: CSV file to check
+        convert (bool): Rewrite non-UTF-8 files as UTF-8 (False only detects)
+        record (bool): Store the result in the encoding manifest
+
+    Returns:
+        dict: Manifest entry with 'encoding' (how to read the file now),
+        'source_encoding', 'converted', 'size' and 'mtime_ns'
+    """
+    path = Path(path)
+    with open(path, 'rb') as f:
+        sample = f.read(SAMPLE_SIZE)
+
+    guess = _guess_from_sample(sample)
+    candidates = [guess] + [enc for enc in CANDIDATE_ENCODINGS if enc != guess]
+
+    for encoding in candidates:
+        plain_utf8 = encoding in ('utf-8', 'utf-8-sig')
+        partial = path.with_suffix(f".{os.getpid()}.partial")
+        try:
+            if plain_utf8 or not convert:
+                _stream_decode(path, encoding)
+                converted = False
+            else:
+                with open(partial, 'wb') as target:
+                    _stream_decode(path, encoding, target)
+                os.replace(partial, path)
+                converted = True
+        except UnicodeDecodeError:
+            # The sample was not representative; try the next candidate
+            partial.unlink(missing_ok=True)
+            continue
+        except OSError as e:
+            # Read-only data directory: keep the file and read it in its own encoding
+            partial.unlink(missing_ok=True)
+            print(f"Could not convert {path.name} to UTF-8: {str(e)}")
+            converted = False
+
+        entry = {
+            'encoding': 'utf-8' if converted else encoding,
+            'source_encoding': encoding,
+            'converted': converted,
+        }
+        entry.update(_file_state(path))
+        if record:
+            record_encoding(path, entry)
+        return entry
+
+    raise UnicodeDecodeError(candidates[-1], b"", 0, 1, f"no candidate encoding can decode {path.name}")
+
+# Function to normalize every CSV in a data directory
+def normalize_data_dir(data_dir, on_file=None):
+    """
+    Check every CSV in a directory, skipping files whose manifest entry is current
+
+    Args:
+        data_dir: Directory holding the CSV files
+        on_file: Optional callback(file name) called before a file is streamed
+
+    Returns:
+        dict: Counts of 'total', 'checked' (streamed this run) and 'converted' files
+    """
+    stats = {'total': 0, 'checked': 0, 'converted': 0}
+    for path in sorted(Path(data_dir).glob("*.csv")):
+        stats['total'] += 1
+        if verified_encoding(path) is not None:
+            continue
+        if on_file:
+            on_file(path.name)
+        entry = normalize_to_utf8(path)
+        stats['checked'] += 1
+        stats['converted'] += int(entry['converted'])
+    return stats
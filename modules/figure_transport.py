@@ -0,0 +1,270 @@
+import streamlit as st
+import numpy as np
+import plotly.graph_objects as go
+import plotly.io as pio
+import base64
+import hashlib
+import threading
+from collections import OrderedDict
+from modules.config import FIGURE_BINARY_MIN_VALUES, FIGURE_CACHE_ENTRIES
+
+# Template layout sections that only apply to subplots of a given kind, with the traces drawn on them
+SUBPLOT_TRACES = {
+    'polar': {'scatterpolar', 'scatterpolargl', 'barpolar'},
+    'ternary': {'scatterternary'},
+    'scene': {'scatter3d', 'surface', 'mesh3d', 'cone', 'streamtube', 'isosurface', 'volume'},
+    'geo': {'scattergeo', 'choropleth'},
+    'mapbox': {'scattermapbox', 'choroplethmapbox', 'densitymapbox'},
+}
+
+# Traces laid out in a domain rather than on x/y axes
+DOMAIN_TRACES = {'pie', 'sunburst', 'treemap', 'icicle', 'funnelarea', 'sankey',
+                 'indicator', 'table', 'parcoords', 'parcats'}
+
+# Trace attributes never encoded as typed arrays (nested structures, not data arrays)
+SKIPPED_ATTRIBUTES = ('geojson', 'colorscale', 'dimensions', 'cells', 'header')
+
+# Template layout sections only used by traces colored along a continuous scale
+COLORSCALE_DEFAULTS = ('coloraxis', 'colorscale')
+
+# Data version of figures built only from constants in the code (see cached_figure())
+STATIC_DATA = 'static'
+
+# Integer typed-array dtypes understood by plotly.js, smallest first
+INTEGER_DTYPES = (('i1', np.int8), ('u1', np.uint8), ('i2', np.int16),
+                  ('u2', np.uint16), ('i4', np.int32), ('u4', np.uint32))
+
+# Function to encode a numeric array as a plotly.js typed array
+def encode_typed_array(values):
+    """
+    Encode a 1-D numeric array as {'dtype', 'bdata'} (base64 of the raw bytes)
+
+    Integers use the smallest integer type that holds them, floats use
+    float32 when that is exact and float64 otherwise.
+
+    Returns:
+        dict or None: The typed array, or None if values are not plain numbers
+    """
+    try:
+        array = np.asarray(values)
+    except (ValueError, TypeError):
+        return None
+    if array.ndim != 1 or array.dtype == bool or not np.issubdtype(array.dtype, np.number):
+        return None
+
+    if np.issubdtype(array.dtype, np.integer):
+        low, high = (int(array.min()), int(array.max())) if len(array) else (0, 0)
+        for name, dtype in INTEGER_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return {'dtype': name, 'bdata': base64.b64encode(array.astype(dtype).tobytes()).decode()}
+        array = array.astype(float)
+
+    array = array.astype('<f8')
+    narrow = array.astype('<f4')
+    if np.array_equal(narrow.astype('<f8'), array, equal_nan=True):
+        return {'dtype': 'f4', 'bdata': base64.b64encode(narrow.tobytes()).decode()}
+    return {'dtype': 'f8', 'bdata': base64.b64encode(array.tobytes()).decode()}
+
+# Helper function to replace the numeric arrays of a trace (and its nested objects) in place
+def _encode_arrays(node, min_values):
+    for name, value in list(node.items()):
+        if name in SKIPPED_ATTRIBUTES:
+            continue
+        if isinstance(value, dict):
+            _encode_arrays(value, min_values)
+        elif isinstance(value, (np.ndarray, list, tuple)) and len(value) >= min_values:
+            encoded = encode_typed_array(value)
+            if encoded is not None:
+                node[name] = encoded
+
+# Helper function to list the template layout sections a figure can use
+def _used_subplots(layout, trace_types):
+    used = {kind for kind, types in SUBPLOT_TRACES.items() if trace_types & types}
+    if trace_types - DOMAIN_TRACES - set().union(*SUBPLOT_TRACES.values()):
+        used.update(('xaxis', 'yaxis'))
+    # Subplots set up in the layout keep their defaults even without traces on them
+    used.update(kind for kind in set(SUBPLOT_TRACES) | {'xaxis', 'yaxis'}
+                if any(key.startswith(kind) for key in layout))
+    return used
+
+# Helper function to tell whether any trace is colored along a continuous scale
+def _uses_colorscale(data, layout):
+    if any(name.startswith('coloraxis') for name in layout):
+        return True
+    for trace in data:
+        marker = trace.get('marker') or {}
+        if 'z' in trace or any(name in node for node in (trace, marker)
+                               for name in ('colorscale', 'coloraxis')):
+            return True
+        color = marker.get('color')
+        if isinstance(color, (np.ndarray, list, tuple)) and len(color) \
+                and np.issubdtype(np.asarray(color).dtype, np.number):
+            return True
+    return False
+
+# Helper function to drop template layout values the figure sets itself
+def _drop_overridden(defaults, layout):
+    for name, value in layout.items():
+        if name not in defaults:
+            continue
+        if isinstance(value, dict) and isinstance(defaults[name], dict):
+            _drop_overridden(defaults[name], value)
+            if not defaults[name]:
+                del defaults[name]
+        else:
+            del defaults[name]
+
+# Helper function to reduce a figure's template to what its traces and subplots use
+def _trim_template(template, layout, data_traces):
+    trace_types = {trace.get('type', 'scatter') for trace in data_traces}
+    data = template.get('data') or {}
+    trimmed = {'data': {name: data[name] for name in sorted(trace_types) if name in data}}
+
+    defaults = dict(template.get('layout') or {})
+    used = _used_subplots(layout, trace_types)
+    for kind in set(SUBPLOT_TRACES) | {'xaxis', 'yaxis'}:
+        if kind not in used:
+            defaults.pop(kind, None)
+    if not _uses_colorscale(data_traces, layout):
+        for name in COLORSCALE_DEFAULTS:
+            defaults.pop(name, None)
+    # A subplot default also styles numbered subplots (xaxis2, ...), so keep those whole
+    numbered = {name.rstrip('0123456789') for name in layout if name[-1:].isdigit()}
+    overrides = {name: value for name, value in layout.items() if name not in numbered}
+    _drop_overridden(defaults, overrides)
+    trimmed['layout'] = defaults
+    return trimmed
+
+# Function to build the compact JSON spec of a figure
+def compact_figure_spec(fig, min_values=None):
+    """
+    Return the spec st.plotly_chart sends, without what the browser doesn't need
+
+    Every figure carries the full default template (one entry per trace type
+    and subplot kind Plotly knows). The template is cut down to the trace
+    types and subplots the figure uses, minus values its own layout
+    overrides, and numeric trace arrays are encoded as base64 typed arrays
+    instead of JSON number lists.
+
+    Args:
+        fig: Plotly figure
+        min_values (int): Shortest array worth encoding as binary
+
+    Returns:
+        dict: Figure spec with 'data' and 'layout'
+    """
+    min_values = FIGURE_BINARY_MIN_VALUES if min_values is None else min_values
+    spec = fig.to_dict()
+    layout = spec.setdefault('layout', {})
+
+    template = layout.get('template')
+    if isinstance(template, dict):
+        layout['template'] = _trim_template(template, layout, spec['data'])
+    for trace in spec['data']:
+        _encode_arrays(trace, min_values)
+    return spec
+
+# Class presenting a precomputed spec to st.plotly_chart
+class CompactFigure(go.Figure):
+    """
+    Figure whose serialized form is a precomputed compact spec
+
+    st.plotly_chart serializes figures with to_dict(); returning the compact
+    spec lets typed arrays through, which Figure validation would reject.
+    """
+
+    def __init__(self, spec, digest=None):
+        super().__init__()
+        self._compact_spec = spec
+        self._digest = digest
+
+    def to_dict(self):
+        return self._compact_spec
+
+    def to_plotly_json(self):
+        return self._compact_spec
+
+# Function to get the process-wide registry of encoded figures
+@st.cache_resource(show_spinner=False)
+def _figure_registry():
+    return {'specs': OrderedDict(), 'figures': OrderedDict(), 'lock': threading.Lock(),
+            'hits': 0, 'misses': 0, 'figure_hits': 0}
+
+# Function to prepare a figure for sending, sharing identical figures across sessions
+def transport_figure(fig):
+    """
+    Return a CompactFigure for fig, reusing the spec of an identical earlier figure
+
+    Identical figures (the same chart in another session or on a rerun) map
+    to one cached spec, so the process keeps one copy and every session sends
+    byte-identical messages, which Streamlit's message cache can then skip.
+    """
+    if isinstance(fig, CompactFigure):
+        return fig
+    spec = compact_figure_spec(fig)
+    digest = hashlib.sha1(pio.to_json(spec, validate=False).encode()).hexdigest()
+
+    registry = _figure_registry()
+    with registry['lock']:
+        cached = registry['specs'].get(digest)
+        if cached is not None:
+            registry['specs'].move_to_end(digest)
+            registry['hits'] += 1
+            return CompactFigure(cached, digest)
+        registry['specs'][digest] = spec
+        registry['misses'] += 1
+        while len(registry['specs']) > max(FIGURE_CACHE_ENTRIES, 1):
+            registry['specs'].popitem(last=False)
+    return CompactFigure(spec, digest)
+
+# Function to get the encoded figure of a builder for one data version, building it only once
+def cached_figure(builder, version, *args):
+    """
+    Return the CompactFigure of builder(*args), reusing it for the same builder and data version
+
+    The lookup is keyed by the builder (including its code) and the version,
+    so a hit skips building the figure, compact_figure_spec() and the digest
+    entirely. The arguments must follow from the version, e.g. frames viewed
+    from the dataset handle whose dataset_ref() is passed as the version.
+
+    Args:
+        builder: Function returning the Plotly figure
+        version: Data version of the arguments (STATIC_DATA for figures of
+            constants); None disables the cache, e.g. for fallback data
+        *args: Passed to the builder on a miss
+    """
+    if version is None:
+        return transport_figure(builder(*args))
+    key = (builder.__module__, builder.__qualname__, builder.__code__, version)
+
+    registry = _figure_registry()
+    with registry['lock']:
+        cached = registry['figures'].get(key)
+        if cached is not None:
+            registry['figures'].move_to_end(key)
+            registry['figure_hits'] += 1
+            return cached
+    fig = transport_figure(builder(*args))
+    with registry['lock']:
+        registry['figures'][key] = fig
+        while len(registry['figures']) > max(FIGURE_CACHE_ENTRIES, 1):
+            registry['figures'].popitem(last=False)
+    return fig
+
+# Function to display a Plotly figure through the compact transport
+def show_chart(fig, **kwargs):
+    """Display a Plotly figure like st.plotly_chart, sending the compact spec"""
+    try:
+        fig = transport_figure(fig)
+    except Exception as e:
+        print(f"Compact figure transport failed, sending the full figure: {str(e)}")
+    return st.plotly_chart(fig, **kwargs)
+
+# Function to report how often identical figures were shared
+def get_figure_cache_stats():
+    """Return the number of cached specs and built figures and the hits and misses of both caches"""
+    registry = _figure_registry()
+    with registry['lock']:
+        return {'specs': len(registry['specs']), 'hits': registry['hits'], 'misses': registry['misses'],
+                'figures': len(registry['figures']), 'figure_hits': registry['figure_hits']}
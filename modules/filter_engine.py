@@ -0,0 +1,144 @@
+import streamlit as st
+import numpy as np
+import threading
+from collections import OrderedDict
+from modules.dataset_store import dataset_ref
+
+# Maximum number of memoized filter results kept per dataset index
+MAX_MEMOIZED_RESULTS = 256
+
+# Class holding precomputed categorical indexes for one dataset
+class FilterIndex:
+    """
+    Position index over the categorical columns of a DataFrame
+
+    Each indexed column maps its distinct values to the sorted row positions
+    holding that value, so a filter becomes a dictionary lookup plus an
+    intersection of position arrays instead of a boolean mask over the whole
+    frame. Results are memoized by the widget state tuple that produced them.
+    """
+
+    def __init__(self, df, columns):
+        self.columns = [col for col in columns if col in df.columns]
+        self.row_count = len(df)
+        self.row_labels = df.index
+        self._indexes = {}
+        for col in self.columns:
+            # groupby().indices returns {value: positions} in a single pass
+            self._indexes[col] = {
+                key: np.asarray(positions, dtype=np.intp)
+                for key, positions in df.groupby(col, sort=True, observed=True).indices.items()
+            }
+        self._memo = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def matches(self, df, columns):
+        """Return True if the positions of this index are valid for df"""
+        return (len(df) == self.row_count and self.columns == [col for col in columns if col in df.columns]
+                and df.index.equals(self.row_labels))
+
+    def options(self, column):
+        """Return the sorted distinct values of an indexed column"""
+        return list(self._indexes.get(column, {}).keys())
+
+    def _remember(self, key, builder):
+        # Shared across sessions, so guard the LRU bookkeeping
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                self.hits += 1
+                return self._memo[key]
+        value = builder()
+        with self._lock:
+            self.misses += 1
+            self._memo[key] = value
+            if len(self._memo) > MAX_MEMOIZED_RESULTS:
+                self._memo.popitem(last=False)
+        return value
+
+    def positions(self, **criteria):
+        """
+        Return the row positions matching every non-empty criterion
+
+        Args:
+            **criteria: column=value pairs; a value of None means "no filter"
+
+        Returns:
+            Sorted numpy array of row positions
+        """
+        active = tuple(sorted((col, value) for col, value in criteria.items() if value is not None))
+        return self._remember(("positions",) + active, lambda: self._intersect(active))
+
+    def _intersect(self, active):
+        result = None
+        for col, value in active:
+            if col not in self._indexes:
+                raise KeyError(f"Column '{col}' is not indexed")
+            matches = self._indexes[col].get(value, np.empty(0, dtype=np.intp))
+            result = matches if result is None else np.intersect1d(result, matches, assume_unique=True)
+            if len(result) == 0:
+                break
+        if result is None:
+            result = np.arange(self.row_count, dtype=np.intp)
+        # Memoized arrays are shared, so keep them read-only
+        result = result.copy()
+        result.setflags(write=False)
+        return result
+
+    def filter(self, df, **criteria):
+        """Return the rows of df matching the criteria using the precomputed index"""
+        return df.iloc[self.positions(**criteria)]
+
+    def first(self, df, column, value):
+        """Return the first row whose column equals value, or None"""
+        positions = self.positions(**{column: value})
+        if len(positions) == 0:
+            return None
+        return df.iloc[positions[0]]
+
+    def memoize(self, key, builder):
+        """Memoize a derived result (e.g. a comparison table) by its widget state tuple"""
+        return self._remember(("derived",) + tuple(key), builder)
+
+    def stats(self):
+        """Return cache hit statistics for this index"""
+        return {
+            "columns": self.columns,
+            "rows": self.row_count,
+            "memoized": len(self._memo),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+# Function to build (once per dataset version) a shared filter index
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _build_filter_index(name, version, columns, _df):
+    return FilterIndex(_df, list(columns))
+
+# Function to get the cached filter index for a dataset
+def get_filter_index(name, df, columns, version=None):
+    """
+    Get the precomputed filter index for a dataset
+
+    Args:
+        name: Dataset identifier, e.g. 'tourism'
+        df: DataFrame the positions refer to
+        columns: Categorical columns to index
+        version: Optional data version; defaults to the DatasetRef of the handle df was viewed from
+
+    Returns:
+        FilterIndex shared by every session viewing the same data version, or
+        an index of df alone when df has no version (e.g. fallback data) or no
+        longer has the rows of the version it carries (e.g. a sorted view)
+    """
+    columns = tuple(columns)
+    if version is None:
+        version = dataset_ref(df)
+    if version is None:
+        return FilterIndex(df, list(columns))
+    filter_index = _build_filter_index(name, version, columns, df)
+    if not filter_index.matches(df, columns):
+        return FilterIndex(df, list(columns))
+    return filter_index
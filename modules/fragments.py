@@ -0,0 +1,65 @@
+import streamlit as st
+import functools
+
+# Session state keys that every fragment depends on. When any of them changes
+# during a fragment-only rerun, the rest of the page is stale and the whole
+# app has to rerun instead.
+SHARED_STATE_KEYS = ('use_snowflake', 'current_chapter', 'data_loaded')
+
+# st.fragment is available from Streamlit 1.37, experimental_fragment from 1.33
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+# Function to check whether the current script run only re-executes fragments
+def is_fragment_rerun():
+    """Return True when Streamlit is rerunning fragments only, not the whole app"""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return bool(ctx and getattr(ctx, "fragment_ids_this_run", None))
+    except Exception:
+        return False
+
+# Function to snapshot the shared state a fragment was rendered with
+def shared_state_token(keys=SHARED_STATE_KEYS):
+    """Return a hashable snapshot of the shared session state keys"""
+    return tuple(repr(st.session_state.get(key)) for key in keys)
+
+# Function to force a full app rerun from inside a fragment
+def invalidate_app():
+    """Rerun the whole app (e.g. after a fragment changed shared state)"""
+    try:
+        st.rerun(scope="app")
+    except TypeError:
+        # Older Streamlit versions without the scope argument
+        st.rerun()
+
+# Decorator to isolate an interactive chapter section in its own fragment
+def chapter_fragment(func=None, *, shared_keys=SHARED_STATE_KEYS):
+    """
+    Run an interactive chapter section as a Streamlit fragment
+
+    Widget changes inside the section rerun only the section instead of the
+    whole app (CSS, sidebar, header, chapter and navigation). If the shared
+    state the section was last rendered with has changed in the meantime,
+    the fragment invalidates itself and escalates to a full app rerun.
+
+    Args:
+        func: Section function, called with the data it needs as arguments
+        shared_keys: Session state keys whose change invalidates the section
+    """
+    if func is None:
+        return functools.partial(chapter_fragment, shared_keys=shared_keys)
+
+    token_key = f"_fragment_token_{func.__module__}.{func.__qualname__}"
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        token = shared_state_token(shared_keys)
+        if is_fragment_rerun() and st.session_state.get(token_key) not in (None, token):
+            invalidate_app()
+        st.session_state[token_key] = token
+        return func(*args, **kwargs)
+
+    if _fragment is None:
+        return wrapper
+    return _fragment(wrapper)
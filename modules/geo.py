@@ -0,0 +1,374 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import os
+import json
+import math
+import hashlib
+from pathlib import Path
+import plotly.graph_objects as go
+from modules.config import GEO_STATES_PATH, GEO_LAYER_DIR, GEO_URL_PREFIX
+
+# Bump when the layer files change shape so old layers are rebuilt
+GEO_FORMAT_VERSION = 1
+
+# Manifest recording the source and files of the simplified layers
+GEO_MANIFEST_NAME = "manifest.json"
+
+# Simplification tolerance (degrees) of each zoom level; about 2 km, 500 m and 100 m
+GEO_LEVELS = {
+    'country': 0.02,
+    'region': 0.005,
+    'state': 0.001
+}
+
+# State ID of every state and union territory, keyed by the name the datasets use
+STATE_IDS = {
+    'Andaman and Nicobar Islands': 'IN-AN',
+    'Andhra Pradesh': 'IN-AP',
+    'Arunachal Pradesh': 'IN-AR',
+    'Assam': 'IN-AS',
+    'Bihar': 'IN-BR',
+    'Chandigarh': 'IN-CH',
+    'Chhattisgarh': 'IN-CG',
+    'Dadra and Nagar Haveli and Daman and Diu': 'IN-DH',
+    'Delhi': 'IN-DL',
+    'Goa': 'IN-GA',
+    'Gujarat': 'IN-GJ',
+    'Haryana': 'IN-HR',
+    'Himachal Pradesh': 'IN-HP',
+    'Jammu and Kashmir': 'IN-JK',
+    'Jharkhand': 'IN-JH',
+    'Karnataka': 'IN-KA',
+    'Kerala': 'IN-KL',
+    'Ladakh': 'IN-LA',
+    'Lakshadweep': 'IN-LD',
+    'Madhya Pradesh': 'IN-MP',
+    'Maharashtra': 'IN-MH',
+    'Manipur': 'IN-MN',
+    'Meghalaya': 'IN-ML',
+    'Mizoram': 'IN-MZ',
+    'Nagaland': 'IN-NL',
+    'Odisha': 'IN-OD',
+    'Puducherry': 'IN-PY',
+    'Punjab': 'IN-PB',
+    'Rajasthan': 'IN-RJ',
+    'Sikkim': 'IN-SK',
+    'Tamil Nadu': 'IN-TN',
+    'Telangana': 'IN-TS',
+    'Tripura': 'IN-TR',
+    'Uttar Pradesh': 'IN-UP',
+    'Uttarakhand': 'IN-UK',
+    'West Bengal': 'IN-WB'
+}
+
+# Older names, short forms and common misspellings found in datasets and boundary files
+STATE_ALIASES = {
+    'Andaman and Nicobar': 'Andaman and Nicobar Islands',
+    'Andaman and Nicobar Island': 'Andaman and Nicobar Islands',
+    'Arunanchal Pradesh': 'Arunachal Pradesh',
+    'Chhatisgarh': 'Chhattisgarh',
+    'Dadra and Nagar Haveli': 'Dadra and Nagar Haveli and Daman and Diu',
+    'Daman and Diu': 'Dadra and Nagar Haveli and Daman and Diu',
+    'NCT of Delhi': 'Delhi',
+    'National Capital Territory of Delhi': 'Delhi',
+    'Orissa': 'Odisha',
+    'Pondicherry': 'Puducherry',
+    'Telengana': 'Telangana',
+    'Uttaranchal': 'Uttarakhand'
+}
+
+# Feature properties that may hold the state name in a boundary file
+GEO_NAME_PROPERTIES = ('st_nm', 'ST_NM', 'NAME_1', 'name', 'NAME', 'state', 'State')
+
+# Helper function to reduce a state name to the form used for lookups
+def _normalize_state_name(name):
+    return " ".join(str(name).replace("&", " and ").lower().split())
+
+# Function to build the lookup from every known state name to its state ID
+def _state_id_index():
+    index = {_normalize_state_name(name): state_id for name, state_id in STATE_IDS.items()}
+    for alias, name in STATE_ALIASES.items():
+        index[_normalize_state_name(alias)] = STATE_IDS[name]
+    return index
+
+# Lookup built once per process
+STATE_ID_INDEX = _state_id_index()
+
+# Function to get the state ID of a state name
+def get_state_id(name):
+    """Return the state ID (e.g. 'IN-KL') of a state name or alias, or None if unknown"""
+    if pd.isna(name):
+        return None
+    return STATE_ID_INDEX.get(_normalize_state_name(name))
+
+# Function to add a state ID column to a state-keyed dataset
+def attach_state_ids(df, state_column='State'):
+    """
+    Return df with a 'State ID' column mapped from state_column
+
+    Names are mapped through the precomputed index, once per distinct name.
+    Rows that are not a state (e.g. 'National Average') get no ID (NaN).
+    """
+    df = df.copy()
+    ids = {name: get_state_id(name) for name in df[state_column].dropna().unique()}
+    df['State ID'] = df[state_column].map(ids)
+    return df
+
+# Helper function to simplify a line with the Douglas-Peucker algorithm
+def _douglas_peucker(points, tolerance):
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end <= start + 1:
+            continue
+        segment = points[end] - points[start]
+        offsets = points[start + 1:end] - points[start]
+        length = math.hypot(segment[0], segment[1])
+        if length == 0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(segment[0] * offsets[:, 1] - segment[1] * offsets[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            split = start + 1 + farthest
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return points[keep]
+
+# Helper function to simplify one ring, returning None when it collapses
+def _simplify_ring(ring, tolerance, decimals):
+    points = np.asarray(ring, dtype=float)[:, :2]
+    simplified = np.round(_douglas_peucker(points, tolerance), decimals)
+    # Rounding can create repeated points; a ring needs three distinct corners
+    distinct = simplified[np.r_[True, np.any(np.diff(simplified, axis=0) != 0, axis=1)]]
+    if len(distinct) < 4:
+        return None
+    return distinct.tolist()
+
+# Function to simplify a Polygon or MultiPolygon geometry
+def simplify_geometry(geometry, tolerance):
+    """
+    Simplify a GeoJSON Polygon or MultiPolygon to the given tolerance (degrees)
+
+    Rings that collapse below the tolerance (small islands, holes) are dropped,
+    but the largest polygon is always kept so every state stays on the map.
+    Coordinates are rounded to the precision the tolerance allows.
+    """
+    decimals = max(int(math.ceil(-math.log10(tolerance))) + 1, 0)
+    polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+
+    simplified = []
+    for polygon in polygons:
+        exterior = _simplify_ring(polygon[0], tolerance, decimals)
+        if exterior is None:
+            continue
+        holes = [ring for ring in (_simplify_ring(hole, tolerance, decimals) for hole in polygon[1:]) if ring]
+        simplified.append([exterior] + holes)
+
+    if not simplified:
+        largest = max(polygons, key=lambda polygon: len(polygon[0]))
+        simplified = [[np.round(np.asarray(largest[0], dtype=float)[:, :2], decimals).tolist()]]
+
+    if len(simplified) == 1:
+        return {'type': 'Polygon', 'coordinates': simplified[0]}
+    return {'type': 'MultiPolygon', 'coordinates': simplified}
+
+# Function to read a boundary file and key its features by state ID
+def load_state_features(source=None, allow_fixture=False):
+    """
+    Read an India states GeoJSON and return its features keyed by state ID
+
+    The state name is taken from the first of GEO_NAME_PROPERTIES a feature
+    has. Features of the same state (e.g. the former Dadra and Nagar Haveli
+    and Daman and Diu) are merged into one MultiPolygon. Files marked
+    "fixture": true are not real boundaries and are refused unless
+    allow_fixture is set.
+
+    Returns:
+        dict: State ID -> GeoJSON feature with 'id' and 'properties.name'
+    """
+    source = source or GEO_STATES_PATH
+    with open(source, encoding='utf-8') as f:
+        collection = json.load(f)
+    if collection.get('fixture') and not allow_fixture:
+        raise ValueError(f"{source} is a test fixture, not a real boundary file")
+
+    names = {state_id: name for name, state_id in STATE_IDS.items()}
+    features = {}
+    for feature in collection.get('features', []):
+        properties = feature.get('properties') or {}
+        geometry = feature.get('geometry')
+        name = next((properties[key] for key in GEO_NAME_PROPERTIES if properties.get(key)), None)
+        state_id = get_state_id(name)
+        if state_id is None or not geometry or geometry['type'] not in ('Polygon', 'MultiPolygon'):
+            print(f"Skipping boundary feature {name!r}: not a known state or not a polygon")
+            continue
+
+        polygons = geometry['coordinates'] if geometry['type'] == 'MultiPolygon' else [geometry['coordinates']]
+        if state_id in features:
+            polygons = features[state_id]['geometry']['coordinates'] + polygons
+        features[state_id] = {
+            'type': 'Feature', 'id': state_id, 'properties': {'name': names[state_id]},
+            'geometry': {'type': 'MultiPolygon', 'coordinates': polygons}
+        }
+    return features
+
+# Helper function to fingerprint the boundary file and the simplification settings
+def _source_version(source):
+    h = hashlib.sha1()
+    h.update(f"format={GEO_FORMAT_VERSION}:{sorted(GEO_LEVELS.items())}".encode())
+    with open(source, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()[:16]
+
+# Function to read the manifest of the simplified layers
+def load_geo_manifest(directory=None):
+    """Return the layer manifest, or an empty dict if the layers were never built"""
+    path = Path(directory or GEO_LAYER_DIR) / GEO_MANIFEST_NAME
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+# Helper function to write a file atomically so readers never see a partial layer
+def _write_atomic(path, text):
+    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+
+# Function to build the simplified layers of every zoom level
+def build_geo_layers(source=None, directory=None, force=False, allow_fixture=False):
+    """
+    Simplify the boundary file once per zoom level and cache the layers on disk
+
+    Each level is written as a GeoJSON FeatureCollection whose file name
+    carries a content hash, so browsers can cache it indefinitely. Layers that
+    are current for the boundary file are not rebuilt unless force is set.
+
+    Args:
+        source (str): Boundary GeoJSON (default GEO_STATES_PATH)
+        directory (str): Output directory (default GEO_LAYER_DIR)
+        force (bool): Rebuild layers that are current
+        allow_fixture (bool): Accept a test fixture as the boundary file
+
+    Returns:
+        dict: The manifest, with 'built' set when the layers were (re)built
+    """
+    source = Path(source or GEO_STATES_PATH)
+    directory = Path(directory or GEO_LAYER_DIR)
+    version = _source_version(source)
+
+    manifest = load_geo_manifest(directory)
+    if not force and manifest.get('version') == version and all(
+            (directory / layer['file']).exists() for layer in manifest.get('levels', {}).values()):
+        return dict(manifest, built=False)
+
+    features = load_state_features(source, allow_fixture)
+    directory.mkdir(parents=True, exist_ok=True)
+    levels = {}
+    for level, tolerance in GEO_LEVELS.items():
+        collection = {'type': 'FeatureCollection', 'features': [
+            dict(feature, geometry=simplify_geometry(feature['geometry'], tolerance))
+            for feature in features.values()
+        ]}
+        text = json.dumps(collection, separators=(',', ':'))
+        file_name = f"india_states-{level}-{hashlib.sha1(text.encode()).hexdigest()[:12]}.geojson"
+        _write_atomic(directory / file_name, text)
+        levels[level] = {'file': file_name, 'tolerance': tolerance, 'bytes': len(text)}
+
+    # Remove layers of earlier builds
+    current = {layer['file'] for layer in levels.values()}
+    for path in directory.glob("india_states-*.geojson"):
+        if path.name not in current:
+            path.unlink(missing_ok=True)
+
+    manifest = {'version': version, 'source': str(source), 'states': sorted(features), 'levels': levels,
+                'built_at': pd.Timestamp.now().isoformat(timespec='seconds')}
+    _write_atomic(directory / GEO_MANIFEST_NAME, json.dumps(manifest, indent=2))
+    return dict(manifest, built=True)
+
+# Function to get the layers once per process and boundary file version
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _get_geo_layers(source, stamp):
+    try:
+        return build_geo_layers(source)
+    except FileNotFoundError:
+        print(f"No India boundary file at {source}; state maps are disabled")
+    except Exception as e:
+        print(f"Could not build the India geo layers: {str(e)}")
+    return None
+
+# Function to get the manifest of the simplified layers, building them if needed
+def get_geo_layers():
+    """Return the layer manifest, or None when no boundary file is available"""
+    source = Path(GEO_STATES_PATH)
+    try:
+        stat = source.stat()
+        stamp = (stat.st_size, stat.st_mtime_ns)
+    except OSError:
+        stamp = None
+    return _get_geo_layers(str(source), stamp)
+
+# Function to check whether state maps can be drawn
+def geo_available():
+    """Return True when the simplified state layers exist"""
+    return get_geo_layers() is not None
+
+# Function to get the URL the browser loads a layer from
+def get_layer_url(level='country', layers=None):
+    """Return the URL of the simplified layer of a zoom level, or None if unavailable"""
+    layers = layers or get_geo_layers()
+    if layers is None:
+        return None
+    return GEO_URL_PREFIX + layers['levels'][level]['file']
+
+# Function to draw a state-level choropleth
+def state_choropleth(df, value_column, title, level='country', colorscale='Plasma', hover_columns=None, layers=None):
+    """
+    Create a choropleth of a state-keyed dataset
+
+    The geometry is referenced by URL instead of embedded in the figure, so
+    plotly.js downloads each zoom level once per browser session and every
+    rerun only sends the values.
+
+    Args:
+        df (DataFrame): Data with a 'State ID' column (see attach_state_ids)
+        value_column (str): Column used for the colors
+        title (str): Figure title
+        level (str): Zoom level of the geometry, a key of GEO_LEVELS
+        colorscale (str): Plotly colorscale
+        hover_columns (list): Extra columns shown on hover
+        layers (dict): Layer manifest to draw from (default: get_geo_layers())
+
+    Returns:
+        Figure: The choropleth, or None when no state layer is available
+    """
+    url = get_layer_url(level, layers)
+    if url is None:
+        return None
+
+    data = df[df['State ID'].notna()]
+    hover_columns = hover_columns or []
+    hover = "<b>%{customdata[0]}</b><br>" + f"{value_column}: " + "%{z}"
+    hover += "".join(f"<br>{column}: %{{customdata[{i + 1}]}}" for i, column in enumerate(hover_columns))
+
+    fig = go.Figure(go.Choropleth(
+        geojson=url,
+        featureidkey='id',
+        locations=data['State ID'],
+        z=data[value_column],
+        customdata=data[['State'] + hover_columns].values,
+        hovertemplate=hover + "<extra></extra>",
+        colorscale=colorscale,
+        marker_line_color='rgba(255, 255, 255, 0.5)',
+        marker_line_width=0.5,
+        colorbar_title=value_column
+    ))
+    fig.update_geos(fitbounds='locations', visible=False, bgcolor='rgba(0,0,0,0)')
+    fig.update_layout(title=title, margin=dict(l=0, r=0, t=50, b=0), height=600)
+    return fig
@@ -50,15 +50,16 @@ def create_sidebar():
         """, unsafe_allow_html=True)
         
         # Check if we need to navigate to a new chapter via button navigation
-        initial_index = 0
         if 'navigate_to' in st.session_state and st.session_state.navigate_to is not None:
-            # Find the index of the chapter we want to navigate to
-            try:
-                initial_index = CHAPTER_LIST.index(st.session_state.navigate_to)
+            # The radio keeps its keyed value across reruns, so select the chapter through its key
+            if st.session_state.navigate_to in CHAPTER_LIST:
+                st.session_state.navigation = st.session_state.navigate_to
                 # Reset the navigate_to session state now that we've used it
                 st.session_state.navigate_to = None
-            except ValueError:
-                pass  # If chapter not found, default to first chapter
+        if 'navigation' not in st.session_state:
+            # Readers coming from a chapter snapshot continue on that chapter
+            requested_chapter = st.query_params.get("chapter")
+            st.session_state.navigation = requested_chapter if requested_chapter in CHAPTER_LIST else CHAPTER_LIST[0]
         
         # Create chapter selection with enhanced styling
         st.markdown("""
@@ -84,7 +85,7 @@ def create_sidebar():
             "Choose your path",  # Add a label for accessibility
             CHAPTER_LIST,
             key="navigation",
-            index=initial_index,
+            index=None,  # The selection always comes from st.session_state.navigation
             label_visibility="collapsed"  # Hide label but still provide it for accessibility
         )
         
@@ -0,0 +1,135 @@
+import streamlit as st
+import inspect
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Session state prefix remembering the active tab while its chapter is not shown
+REMEMBERED_TAB_PREFIX = "_lazy_tab_"
+
+# Stateful st.tabs (on_change="rerun" with a .open flag per tab) arrived in newer Streamlit releases
+try:
+    NATIVE_LAZY_TABS = "on_change" in inspect.signature(st.tabs).parameters
+except (TypeError, ValueError):
+    NATIVE_LAZY_TABS = False
+
+# Class holding the containers of a lazy tab set and which one is active
+class LazyTabs:
+    """
+    Tab containers where only the active tab's content should be computed
+
+    Indexing returns the container of a tab, like st.tabs(). render() calls
+    the function of the active tab only, so the other tabs cost nothing on
+    a rerun.
+    """
+
+    def __init__(self, labels, containers, active):
+        self.labels = list(labels)
+        self.containers = list(containers)
+        self.active = active
+
+    def __getitem__(self, index):
+        return self.containers[index]
+
+    def __len__(self):
+        return len(self.containers)
+
+    def is_open(self, index):
+        return self.labels[index] == self.active
+
+    def render(self, renderers, *args, **kwargs):
+        """
+        Render the active tab with its function from renderers
+
+        Args:
+            renderers (dict): Tab label -> function rendering that tab's content
+            *args, **kwargs: Passed to the function, e.g. the chapter's data
+        """
+        renderer = renderers.get(self.active)
+        if renderer is None:
+            return None
+        with self.containers[self.labels.index(self.active)]:
+            return renderer(*args, **kwargs)
+
+# Function to get the executor warming caches for the tabs next to the active one
+@st.cache_resource(show_spinner=False)
+def _prefetch_executor():
+    # A single low-priority worker; prefetching must never compete with reruns
+    return {'executor': ThreadPoolExecutor(max_workers=1, thread_name_prefix="tab-prefetch"),
+            'pending': set(), 'lock': threading.Lock()}
+
+# Helper function to run one prefetch job and forget it afterwards
+def _run_prefetch(job_id, func, registry):
+    try:
+        func()
+    except Exception as e:
+        print(f"Prefetching tab {job_id[1]} failed: {str(e)}")
+    finally:
+        with registry['lock']:
+            registry['pending'].discard(job_id)
+
+# Function to warm the caches of the tabs next to the active one
+def prefetch_adjacent(key, labels, active, prefetch):
+    """
+    Submit the prefetch functions of the tabs left and right of the active tab
+
+    Prefetch functions run on a background thread without a script context,
+    so they must only fill st.cache_data / st.cache_resource entries (no
+    st.* output). A tab already being prefetched is not submitted twice.
+
+    Returns:
+        list: Labels of the tabs submitted
+    """
+    if not prefetch or active not in labels:
+        return []
+
+    registry = _prefetch_executor()
+    index = labels.index(active)
+    submitted = []
+    for neighbour in (index + 1, index - 1):
+        if not 0 <= neighbour < len(labels) or labels[neighbour] not in prefetch:
+            continue
+        job_id = (key, labels[neighbour])
+        with registry['lock']:
+            if job_id in registry['pending']:
+                continue
+            registry['pending'].add(job_id)
+        registry['executor'].submit(_run_prefetch, job_id, prefetch[labels[neighbour]], registry)
+        submitted.append(labels[neighbour])
+    return submitted
+
+# Function to create tabs that only compute the active tab
+def lazy_tabs(labels, key, prefetch=None):
+    """
+    Create a tab set whose inactive tabs are not computed
+
+    Switching tabs reruns the app, and only the selected tab is rendered.
+    The active tab is kept in st.session_state[key] and remembered when the
+    visitor leaves the chapter and comes back. On Streamlit releases without
+    stateful tabs a horizontal radio selects the tab instead.
+
+    Args:
+        labels (list): Tab labels
+        key (str): Unique session state key of the tab set
+        prefetch (dict): Optional tab label -> function warming that tab's
+            caches; the tabs next to the active one are prefetched in the background
+
+    Returns:
+        LazyTabs: The tab containers and the active label
+    """
+    labels = list(labels)
+    remembered_key = REMEMBERED_TAB_PREFIX + key
+
+    # Streamlit drops a widget's state on runs that don't render it, so restore the last tab
+    if key not in st.session_state and st.session_state.get(remembered_key) in labels:
+        st.session_state[key] = st.session_state[remembered_key]
+
+    if NATIVE_LAZY_TABS:
+        containers = st.tabs(labels, key=key, on_change="rerun")
+        active = next((label for label, tab in zip(labels, containers) if tab.open), labels[0])
+    else:
+        active = st.radio("Section", labels, key=key, horizontal=True, label_visibility="collapsed")
+        containers = [st.container() if label == active else st.empty() for label in labels]
+
+    st.session_state[remembered_key] = active
+    prefetch_adjacent(key, labels, active, prefetch)
+    return LazyTabs(labels, containers, active)
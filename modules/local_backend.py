@@ -0,0 +1,100 @@
+import sqlite3
+import threading
+import random
+import time
+import pandas as pd
+from pathlib import Path
+from modules.column_schema import COMPILED_SCHEMAS, to_snowflake_columns
+from modules.encoding import verified_encoding, normalize_to_utf8
+from modules.snowflake_connector import DataBackend
+
+# Image files uploaded to the IMAGES table by snowflake_setup.py
+IMAGE_FILES = ["emblem.png", "flambeau.svg", "tajmahal.svg"]
+
+# Exception raised for a failure injected by the local backend
+class InjectedFailure(RuntimeError):
+    """Simulated warehouse error, raised at the configured failure rate"""
+
+# Class standing in for Snowflake, backed by an in-memory SQLite database
+class LocalBackend(DataBackend):
+    """
+    Embedded replacement for Snowflake, loaded from the local CSV files
+
+    The tables use the same names and columns snowflake_setup.py uploads
+    (through the shared column schema), so the app's Snowflake code path
+    runs unchanged against them without a network.
+
+    Args:
+        data_dir: Directory holding the CSV files and images/
+        latency (float): Seconds added to every call to model warehouse round trips
+        jitter (float): Up to this many extra seconds, drawn from the seeded generator
+        failure_rate (float): Share of calls that raise InjectedFailure
+        seed (int): Seed for jitter and failures, so a run can be reproduced
+    """
+
+    name = "local"
+
+    def __init__(self, data_dir="data", latency=0.0, jitter=0.0, failure_rate=0.0, seed=42):
+        self.data_dir = Path(data_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {'queries': 0, 'image_lookups': 0, 'failures': 0, 'latency_s': 0.0}
+        self._conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._load_tables()
+
+    def _load_tables(self):
+        for schema in COMPILED_SCHEMAS.values():
+            path = self.data_dir / schema.csv
+            if not path.exists():
+                continue
+            # Detection only: the launcher converts the files to UTF-8
+            encoding = verified_encoding(path) or normalize_to_utf8(path, convert=False, record=False)['encoding']
+            df = to_snowflake_columns(pd.read_csv(path, encoding=encoding), schema.name)
+            df.to_sql(schema.table, self._conn, index=False)
+
+        self._conn.execute("CREATE TABLE IMAGES (IMAGE_NAME TEXT PRIMARY KEY, IMAGE_TYPE TEXT, IMAGE_DATA BLOB)")
+        for name in IMAGE_FILES:
+            path = self.data_dir / "images" / name
+            if path.exists():
+                self._conn.execute(
+                    "INSERT INTO IMAGES VALUES (?, ?, ?)",
+                    (name, path.suffix[1:].upper(), path.read_bytes())
+                )
+        self._conn.commit()
+
+    def _call(self, kind, func):
+        # Draw delay and outcome under the lock so a seeded run is repeatable
+        with self._lock:
+            self._stats[kind] += 1
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.failure_rate > 0 and self._rng.random() < self.failure_rate
+            self._stats['latency_s'] += delay
+            if fail:
+                self._stats['failures'] += 1
+
+        # Concurrent calls wait in parallel, like queries on a warehouse
+        if delay:
+            time.sleep(delay)
+        if fail:
+            raise InjectedFailure(f"Injected failure after {delay:.3f}s")
+        with self._lock:
+            return func(self._conn)
+
+    def query(self, query):
+        return self._call('queries', lambda conn: pd.read_sql_query(query, conn))
+
+    def fetch_image(self, image_name):
+        row = self._call('image_lookups', lambda conn: conn.execute(
+            "SELECT IMAGE_DATA FROM IMAGES WHERE IMAGE_NAME = ?", (image_name,)
+        ).fetchone())
+        return bytes(row[0]) if row else None
+
+    def stats(self):
+        """Return the number of calls, injected failures and total simulated latency"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['latency_s'] = round(stats['latency_s'], 3)
+        return stats
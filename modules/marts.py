@@ -0,0 +1,242 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from modules.dataset_store import DatasetHandle, data_fingerprint
+from modules.utils import load_population_data, load_tourism_data, load_state_data, load_geography_data, read_dataset_source
+from modules.geo import attach_state_ids
+
+# Seed for the estimated demo columns, so every rerun and session sees the same values
+MART_SEED = 42
+
+# Region grouping of the states in the tourism data
+TOURISM_REGIONS = {
+    'North': ['Delhi', 'Rajasthan', 'Uttar Pradesh', 'Himachal Pradesh', 'Jammu and Kashmir', 'Uttarakhand', 'Punjab', 'Haryana', 'Ladakh'],
+    'South': ['Kerala', 'Tamil Nadu', 'Karnataka', 'Andhra Pradesh', 'Telangana', 'Puducherry'],
+    'East': ['West Bengal', 'Odisha', 'Bihar', 'Jharkhand'],
+    'West': ['Maharashtra', 'Gujarat', 'Goa', 'Daman & Diu'],
+    'Central': ['Madhya Pradesh', 'Chhattisgarh'],
+    'Northeast': ['Assam', 'Sikkim', 'Arunachal Pradesh', 'Meghalaya', 'Nagaland', 'Manipur', 'Mizoram', 'Tripura'],
+    'Islands': ['Andaman and Nicobar Islands', 'Lakshadweep']
+}
+
+# Function to find the region for a state
+def find_tourism_region(state_name):
+    """Return the TOURISM_REGIONS key of a state, matching exactly first and then by substring"""
+    if pd.isna(state_name) or not isinstance(state_name, str):
+        return 'Other'
+
+    for region, states in TOURISM_REGIONS.items():
+        # Check for exact match
+        if state_name in states:
+            return region
+        # Check for partial match
+        for state in states:
+            if state.lower() in state_name.lower():
+                return region
+    return 'Other'
+
+# Function to build the process-wide handle for a derived table
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _get_mart_handle(name, version, _builder):
+    return DatasetHandle(name, _builder(), version)
+
+# Helper function to serve a derived table as a copy-on-write view
+def _mart_view(name, builder):
+    return _get_mart_handle(name, data_fingerprint(), builder).view()
+
+# Function to prepare the population table for plotting
+def _build_population_mart():
+    df = load_population_data()
+    if df is None or df.empty:
+        return df
+    # Convert to appropriate types once instead of on every rerun
+    df['Year'] = df['Year'].astype(int)
+    df['Population (millions)'] = df['Population (millions)'].astype(float)
+    return df
+
+# Function to derive the tourism table used by the tourism chapter
+def _build_tourism_mart():
+    df = load_tourism_data()
+    if df is None or df.empty:
+        return df
+
+    rng = np.random.default_rng(MART_SEED)
+
+    # Define direct mappings based on the actual CSV file
+    direct_mappings = {
+        'Destination': 'Destination',
+        'State': 'State',
+        'Type': 'Tourism Type',
+        'Visitors_Annual': 'Annual Visitors (millions)',
+        'Best Season': 'Peak Season',
+        'UNESCO Status': 'UNESCO Status',
+        'Year Established': 'Year Established',
+        'Entry Fee (INR)': 'Entry Fee (INR)',
+        'Description': 'Description'
+    }
+
+    # Create new columns based on actual data
+    for orig_col, new_col in direct_mappings.items():
+        if orig_col in df.columns:
+            df[new_col] = df[orig_col]
+        elif new_col not in df.columns:
+            # Create missing columns with appropriate default values
+            if 'Visitors' in new_col:
+                df[new_col] = rng.uniform(0.1, 5.0, len(df))  # Estimated values for demonstration
+            elif 'Season' in new_col:
+                df[new_col] = 'Year-round'
+            elif 'Fee' in new_col:
+                df[new_col] = 0
+            elif 'Year' in new_col:
+                df[new_col] = 1900
+            else:
+                df[new_col] = 'Unknown'
+
+    # Create additional columns needed for visualizations
+    if 'Tourism Revenue (USD millions)' not in df.columns:
+        # Estimate revenue based on visitors (rough approximation)
+        if 'Annual Visitors (millions)' in df.columns:
+            df['Tourism Revenue (USD millions)'] = df['Annual Visitors (millions)'] * rng.uniform(50, 150, len(df))
+        else:
+            df['Tourism Revenue (USD millions)'] = rng.uniform(10, 500, len(df))
+
+    if 'International Visitors (%)' not in df.columns:
+        # Add estimated international visitor percentages
+        df['International Visitors (%)'] = rng.uniform(10, 60, len(df))
+
+    if 'Growth Potential (%)' not in df.columns:
+        # Add estimated growth potential
+        df['Growth Potential (%)'] = rng.uniform(3, 15, len(df))
+
+    if 'Infrastructure Quality (1-10)' not in df.columns:
+        # Add infrastructure quality ratings
+        df['Infrastructure Quality (1-10)'] = rng.integers(4, 10, len(df))
+
+    if 'Employment Generated (thousands)' not in df.columns:
+        # Estimate employment based on visitors
+        if 'Annual Visitors (millions)' in df.columns:
+            df['Employment Generated (thousands)'] = df['Annual Visitors (millions)'] * rng.uniform(10, 30, len(df))
+        else:
+            df['Employment Generated (thousands)'] = rng.uniform(5, 100, len(df))
+
+    # Map states to regions with error handling
+    try:
+        df['Region'] = df['State'].apply(find_tourism_region)
+    except Exception as e:
+        print(f"Could not map states to regions: {str(e)}")
+        df['Region'] = 'Other'
+
+    # Create tourism type categorization if needed
+    if 'Tourism Type' in df.columns:
+        # Clean up and categorize tourism types
+        tourism_type_mapping = {
+            'Monument': 'Heritage',
+            'Palace': 'Heritage',
+            'Temple': 'Religious',
+            'Religious': 'Religious',
+            'Beach': 'Nature',
+            'Nature': 'Nature',
+            'Hill Station': 'Nature',
+            'Wildlife': 'Nature',
+            'Adventure': 'Adventure',
+            'Caves': 'Heritage',
+            'Archaeological Site': 'Heritage',
+            'City': 'Urban',
+            'Desert': 'Nature'
+        }
+
+        # Map specific types to broader categories
+        def map_tourism_type(type_name):
+            if pd.isna(type_name) or not isinstance(type_name, str):
+                return 'Other'
+
+            for specific, broad in tourism_type_mapping.items():
+                if specific.lower() in type_name.lower():
+                    return broad
+            return 'Other'
+
+        df['Primary Tourism Category'] = df['Tourism Type'].apply(map_tourism_type)
+
+    # Set an ID column for reference if needed
+    df['ID'] = df.index
+
+    # Sort by visitors for default display
+    if 'Annual Visitors (millions)' in df.columns:
+        df = df.sort_values('Annual Visitors (millions)', ascending=False)
+
+    return df
+
+# Helper function to aggregate one state-keyed dataset to a row per state ID
+def _state_rows(name, build):
+    try:
+        return build()
+    except Exception as e:
+        print(f"Could not join {name} data to the state mart: {str(e)}")
+        return None
+
+# Function to join every state-keyed dataset into one row per state
+def _build_state_mart():
+    states = load_state_data()
+    if states is None or states.empty:
+        return states
+    mart = attach_state_ids(states)
+
+    # Education: the raw per-state table (load_education_data reshapes it for national charts)
+    def education():
+        df = attach_state_ids(read_dataset_source('education'))
+        columns = {'Literacy_Rate': 'Education Literacy (%)', 'Higher_Education_GER': 'Higher Education GER',
+                   'Number_of_Universities': 'Universities', 'Number_of_Colleges': 'Colleges'}
+        df = df.rename(columns=columns)
+        return df.dropna(subset=['State ID']).groupby('State ID', observed=True)[[c for c in columns.values() if c in df.columns]].first()
+
+    # Tourism: destinations and visitors per state
+    def tourism():
+        df = attach_state_ids(load_tourism_data())
+        return df.dropna(subset=['State ID']).groupby('State ID', observed=True).agg(
+            **{'Tourist Destinations': ('Destination', 'count'),
+               'Tourist Visitors (millions)': ('Visitors_Annual', 'sum')})
+
+    # Geography: terrain types listed for each state
+    def geography():
+        df = load_geography_data()
+        df = df.assign(State=df['States'].str.split(',')).explode('State')
+        df['State'] = df['State'].str.strip()
+        df = attach_state_ids(df).dropna(subset=['State ID'])
+        return df.groupby('State ID', observed=True).agg(**{'Terrain Types': ('Terrain_Type', lambda t: ', '.join(sorted(set(t))))})
+
+    for name, build in (('education', education), ('tourism', tourism), ('geography', geography)):
+        rows = _state_rows(name, build)
+        if rows is not None:
+            mart = mart.join(rows, on='State ID')
+
+    # States without destinations have none rather than unknown
+    if 'Tourist Destinations' in mart.columns:
+        mart['Tourist Destinations'] = mart['Tourist Destinations'].fillna(0).astype(int)
+        mart['Tourist Visitors (millions)'] = mart['Tourist Visitors (millions)'].fillna(0.0)
+    return mart.reset_index(drop=True)
+
+# Function to get the population mart
+def get_population_mart():
+    """Return the population data with Year as int and Population as float"""
+    return _mart_view('population_mart', _build_population_mart)
+
+# Function to get the tourism mart
+def get_tourism_mart():
+    """
+    Return the tourism data with every derived column the chapter needs
+
+    Region, Primary Tourism Category, the estimated metrics and the sort by
+    visitors are computed once per data version and shared by all sessions.
+    """
+    return _mart_view('tourism_mart', _build_tourism_mart)
+
+# Function to get the state mart
+def get_state_mart():
+    """
+    Return one row per state with its State ID and the joined state-keyed data
+
+    The state table is joined with the per-state education figures, the
+    tourism destinations and visitors and the terrain types, all through the
+    State ID index, once per data version.
+    """
+    return _mart_view('state_mart', _build_state_mart)
@@ -0,0 +1,138 @@
+import streamlit as st
+import pandas as pd
+import io
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from matplotlib.figure import Figure
+from modules.config import MPL_CACHE_MB, MPL_RENDER_WORKERS
+
+# Theme the figures are styled for; part of every cache key
+MPL_THEME = "dark"
+
+# Seconds a rerun waits for a figure before giving up on it
+RENDER_TIMEOUT = 60
+
+# Function to create a figure that is not tracked by pyplot
+def new_figure(figsize=(8, 6)):
+    """
+    Return a Figure and its axes built with the object-oriented API
+
+    Unlike plt.subplots() the figure is not registered with pyplot's global
+    figure manager, so it can be built on any thread and is freed as soon as
+    it goes out of scope.
+    """
+    fig = Figure(figsize=figsize)
+    return fig, fig.subplots()
+
+# Helper function to fingerprint the inputs of a figure
+def _digest(values):
+    h = hashlib.sha1()
+    for value in values:
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+            labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+            h.update(repr(list(labels)).encode())
+        else:
+            h.update(repr(value).encode())
+    return h.hexdigest()[:16]
+
+# Function to get the process-wide render pool and byte cache
+@st.cache_resource(show_spinner=False)
+def _render_service():
+    return {
+        'executor': ThreadPoolExecutor(max_workers=max(MPL_RENDER_WORKERS, 1), thread_name_prefix="mpl-render"),
+        'images': OrderedDict(), 'bytes': 0, 'pending': {}, 'lock': threading.Lock(),
+        'hits': 0, 'renders': 0
+    }
+
+# Helper function to build and rasterize one figure on a worker thread
+def _rasterize(builder, args, fmt, dpi):
+    fig = None
+    try:
+        fig = builder(*args)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight', facecolor=fig.get_facecolor())
+        return buffer.getvalue()
+    finally:
+        if fig is not None:
+            # Figures made with pyplot stay registered (and in memory) until closed
+            if fig.canvas.manager is not None:
+                import matplotlib.pyplot as plt
+                plt.close(fig)
+            fig.clear()
+
+# Helper function to store rendered bytes, evicting the least recently used images
+def _store(service, key, image):
+    budget = MPL_CACHE_MB * 1024 * 1024
+    service['images'][key] = image
+    service['bytes'] += len(image)
+    while service['bytes'] > budget and len(service['images']) > 1:
+        _, evicted = service['images'].popitem(last=False)
+        service['bytes'] -= len(evicted)
+
+# Function to rasterize a Matplotlib figure once per input version and theme
+def render_figure(name, builder, *args, version=None, fmt="png", dpi=150):
+    """
+    Return the rasterized bytes of a figure, rendering it at most once per version
+
+    builder(*args) must return a Figure (preferably from new_figure()) and is
+    run on the render pool; it must not call st.* functions. Concurrent
+    requests for the same figure wait for a single render.
+
+    Args:
+        name (str): Name of the figure, unique per builder
+        builder (callable): Function drawing the figure from args
+        *args: Inputs of the figure, e.g. a DataFrame
+        version (str): Version of the inputs; computed from args if omitted
+        fmt (str): 'png' or 'svg'
+        dpi (int): Resolution of PNG output
+
+    Returns:
+        bytes: The encoded image
+    """
+    version = _digest(args) if version is None else version
+    key = (name, version, MPL_THEME, fmt, dpi)
+    service = _render_service()
+
+    with service['lock']:
+        image = service['images'].get(key)
+        if image is not None:
+            service['images'].move_to_end(key)
+            service['hits'] += 1
+            return image
+        future = service['pending'].get(key)
+        if future is None:
+            future = service['executor'].submit(_rasterize, builder, args, fmt, dpi)
+            service['pending'][key] = future
+            service['renders'] += 1
+
+    try:
+        image = future.result(timeout=RENDER_TIMEOUT)
+    except Exception:
+        with service['lock']:
+            service['pending'].pop(key, None)
+        raise
+    with service['lock']:
+        service['pending'].pop(key, None)
+        if key not in service['images']:
+            _store(service, key, image)
+    return image
+
+# Function to display a cached Matplotlib figure
+def show_matplotlib(name, builder, *args, version=None, fmt="png", **image_kwargs):
+    """Render a figure through render_figure() and display it like st.pyplot"""
+    image = render_figure(name, builder, *args, version=version, fmt=fmt)
+    if fmt == "svg":
+        image = image.decode('utf-8')
+    image_kwargs.setdefault('use_container_width', True)
+    return st.image(image, **image_kwargs)
+
+# Function to report the state of the render cache
+def get_render_cache_stats():
+    """Return the number and size of cached images and the hits and renders so far"""
+    service = _render_service()
+    with service['lock']:
+        return {'images': len(service['images']), 'kb': round(service['bytes'] / 1024, 1),
+                'hits': service['hits'], 'renders': service['renders']}
@@ -0,0 +1,180 @@
+import streamlit as st
+import pandas as pd
+import sys
+import time
+import pickle
+import threading
+from modules.config import SESSION_MEMORY_BUDGET_KB, SESSION_IDLE_SECONDS
+
+# Session state keys the app rebuilds on the next rerun; dropped first when compacting
+DISPOSABLE_KEYS = ('preloaded_data', 'random_fact', 'loaded_chapter')
+
+# Seconds between two sweeps for idle sessions
+EVICTION_SWEEP_SECONDS = 60
+
+# Seconds between two size checks of the same session
+SIZE_CHECK_SECONDS = 30
+
+# Idle periods (SESSION_IDLE_SECONDS) after which a session is assumed closed and dropped from the registry
+FORGET_AFTER_IDLE_PERIODS = 4
+
+# Function to estimate the memory held by one session state value
+def estimate_size(value):
+    """Return the approximate size of a value in bytes (deep for DataFrames and containers)"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return sys.getsizeof(value)
+    try:
+        return len(pickle.dumps(value))
+    except Exception:
+        return sys.getsizeof(value)
+
+# Helper function to read the current session state as a plain dict
+def _state_items(state=None):
+    state = st.session_state if state is None else state
+    items = []
+    for key in list(state):
+        try:
+            items.append((key, state[key]))
+        except KeyError:
+            continue  # Removed while we were reading
+    return items
+
+# Function to report what the current session keeps in memory
+def get_session_memory_report(state=None):
+    """Return one row per session state key with its type and approximate size, largest first"""
+    rows = [
+        {'Key': key, 'Type': type(value).__name__, 'Size (KB)': round(estimate_size(value) / 1024, 2)}
+        for key, value in _state_items(state)
+    ]
+    df = pd.DataFrame(rows, columns=['Key', 'Type', 'Size (KB)'])
+    return df.sort_values('Size (KB)', ascending=False, ignore_index=True)
+
+# Helper function to drop the keys the app rebuilds on the next rerun
+def _drop_disposable_keys(state):
+    freed = 0
+    for key in DISPOSABLE_KEYS:
+        if key in state:
+            freed += estimate_size(state[key])
+            del state[key]
+    if 'preloaded_data' not in state:
+        # Let the next rerun warm the datasets again
+        state['data_loaded'] = False
+    return freed
+
+# Function to compact the current session state to its memory budget
+def compact_session_state(budget_kb=None, state=None):
+    """
+    Drop rebuildable keys when the session state exceeds its budget
+
+    Returns:
+        int: Approximate size in bytes after compaction
+    """
+    budget = (SESSION_MEMORY_BUDGET_KB if budget_kb is None else budget_kb) * 1024
+    state = st.session_state if state is None else state
+    total = sum(estimate_size(value) for _, value in _state_items(state))
+    if total > budget:
+        total -= _drop_disposable_keys(state)
+    return total
+
+# Function to hold the process-wide registry of sessions
+@st.cache_resource(show_spinner=False)
+def _session_registry():
+    return {'sessions': {}, 'lock': threading.Lock(), 'last_sweep': 0.0, 'evicted': 0}
+
+# Helper function to get the id of the session running this script
+def _current_session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        return None
+    return ctx.session_id if ctx is not None else None
+
+# Function to mark the sessions that went idle for eviction
+def evict_idle_sessions(idle_seconds=None, now=None):
+    """
+    Mark every session idle for longer than idle_seconds as evicted
+
+    The sweep never touches another session's state: an evicted session
+    drops its DISPOSABLE_KEYS itself at the start of its next rerun (see
+    track_session()). Navigation, favorites and widget values are kept, so a
+    returning visitor continues where they left off. Sessions idle for
+    FORGET_AFTER_IDLE_PERIODS idle periods are assumed closed and forgotten.
+
+    Returns:
+        int: Number of sessions evicted by this sweep
+    """
+    idle_seconds = SESSION_IDLE_SECONDS if idle_seconds is None else idle_seconds
+    now = time.time() if now is None else now
+    registry = _session_registry()
+    evicted = 0
+
+    with registry['lock']:
+        registry['last_sweep'] = now
+        for session_id, entry in list(registry['sessions'].items()):
+            idle = now - entry['last_seen']
+            if idle > idle_seconds * FORGET_AFTER_IDLE_PERIODS:
+                del registry['sessions'][session_id]
+            elif not entry['evicted'] and idle >= idle_seconds:
+                entry['evicted'] = True
+                evicted += 1
+        registry['evicted'] += evicted
+    return evicted
+
+# Function to account for the current session at the start of a rerun
+def track_session():
+    """
+    Record this session's activity, drop its rebuildable keys if it was
+    evicted, compact it to its budget at most every SIZE_CHECK_SECONDS and
+    sweep for idle sessions at most every EVICTION_SWEEP_SECONDS
+    """
+    session_id = _current_session_id()
+    if session_id is None:
+        compact_session_state()
+        return
+
+    registry = _session_registry()
+    now = time.time()
+    with registry['lock']:
+        entry = registry['sessions'].setdefault(
+            session_id, {'last_seen': now, 'checked_at': 0.0, 'bytes': 0, 'over_budget': False, 'evicted': False}
+        )
+        evicted = entry['evicted']
+        check_due = evicted or now - entry['checked_at'] > SIZE_CHECK_SECONDS
+        entry.update(last_seen=now, evicted=False)
+        sweep_due = now - registry['last_sweep'] > EVICTION_SWEEP_SECONDS
+
+    if evicted:
+        _drop_disposable_keys(st.session_state)
+    if check_due:
+        size = compact_session_state()
+        with registry['lock']:
+            entry.update(checked_at=now, bytes=size, over_budget=size > SESSION_MEMORY_BUDGET_KB * 1024)
+    if sweep_due:
+        evict_idle_sessions(now=now)
+
+# Function to summarize every tracked session of this process
+def get_sessions_overview():
+    """Return one row per tracked session with its idle time and approximate state size"""
+    registry = _session_registry()
+    now = time.time()
+    with registry['lock']:
+        rows = [
+            {
+                'Session': session_id[:8],
+                'Idle (s)': round(now - entry['last_seen'], 1),
+                'Size (KB)': round(entry['bytes'] / 1024, 2),
+                'Over Budget': entry['over_budget'],
+                'Evicted': entry['evicted']
+            }
+            for session_id, entry in registry['sessions'].items()
+        ]
+    return pd.DataFrame(rows, columns=['Session', 'Idle (s)', 'Size (KB)', 'Over Budget', 'Evicted'])
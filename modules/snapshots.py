@@ -0,0 +1,342 @@
+import os
+import re
+import json
+import html
+import time
+import base64
+import hashlib
+import contextlib
+from pathlib import Path
+from urllib.parse import quote
+from modules.config import SNAPSHOT_DIR, SNAPSHOT_LIVE_URL, GEO_URL_PREFIX
+from modules.dataset_store import data_fingerprint
+from modules.geo import load_geo_manifest
+from modules.warmup import set_first_session_warmup
+
+# Manifest recording which version each snapshot was built from
+MANIFEST_NAME = "manifest.json"
+
+# Browser libraries used by the snapshot pages (plotly.js >= 2.28 reads typed arrays)
+PLOTLY_JS_URL = "https://cdn.plot.ly/plotly-2.35.2.min.js"
+MARKED_JS_URL = "https://cdn.jsdelivr.net/npm/marked@12.0.2/marked.min.js"
+
+# Theme placeholders Streamlit's frontend fills in, with the colors used for them on a snapshot
+PLACEHOLDER_COLORS = {
+    # Categorical (Plotly's default colorway)
+    '#000001': '#636efa', '#000002': '#EF553B', '#000003': '#00cc96', '#000004': '#ab63fa',
+    '#000005': '#FFA15A', '#000006': '#19d3f3', '#000007': '#FF6692', '#000008': '#B6E880',
+    '#000009': '#FF97FF', '#000010': '#FECB52',
+    # Sequential (Plasma)
+    '#000011': '#0d0887', '#000012': '#46039f', '#000013': '#7201a8', '#000014': '#9c179e',
+    '#000015': '#bd3786', '#000016': '#d8576b', '#000017': '#ed7953', '#000018': '#fb9f3a',
+    '#000019': '#fdca26', '#000020': '#f0f921',
+    # Diverging (PiYG)
+    '#000021': '#8e0152', '#000022': '#c51b7d', '#000023': '#de77ae', '#000024': '#f1b6da',
+    '#000025': '#fde0ef', '#000026': '#e6f5d0', '#000027': '#b8e186', '#000028': '#7fbc41',
+    '#000029': '#4d9221', '#000030': '#276419',
+    # Increasing / decreasing, lines and backgrounds of the dark theme
+    '#000032': '#29b09d', '#000033': '#ff2b2b', '#000034': 'rgba(250, 250, 250, 0.2)',
+    '#000035': 'rgba(250, 250, 250, 0.2)', '#000036': '#1E2129', '#000037': 'rgba(250, 250, 250, 0.6)',
+    '#000038': '#0E1117', '#000039': 'rgba(250, 250, 250, 0.1)', '#000040': '#1E2129',
+}
+
+# Element types left out of a snapshot (a snapshot never shows an error to a reader)
+SKIPPED_TYPES = ('error', 'exception', 'empty')
+
+# Function to turn a chapter name into a file name
+def chapter_slug(chapter):
+    return re.sub(r"[^a-z0-9]+", "-", chapter.lower()).strip("-")
+
+# Function to fingerprint what a snapshot is built from
+def snapshot_version():
+    """
+    Return a version string covering the local data, the state map layers and the app's code
+
+    Snapshots are built from the local data files, so a snapshot is current
+    as long as neither the data nor the code rendering it changed.
+    """
+    h = hashlib.sha1(data_fingerprint(use_snowflake=False).encode())
+    h.update(str(load_geo_manifest().get('version')).encode())
+    for path in sorted([Path("app.py")] + list(Path("modules").rglob("*.py"))):
+        h.update(path.as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+# Function to link from a snapshot to the live chapter
+def live_chapter_url(chapter, live_url=None):
+    live_url = SNAPSHOT_LIVE_URL if live_url is None else live_url
+    return f"{live_url}?chapter={quote(chapter)}"
+
+# Function to load the snapshot manifest
+def load_snapshot_manifest(directory=None):
+    """Return {chapter: entry} for the snapshots in a directory (empty if there are none)"""
+    try:
+        with open(Path(directory or SNAPSHOT_DIR) / MANIFEST_NAME, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        return manifest if isinstance(manifest, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+# Helper function to keep the media files AppTest stores in memory for a run
+@contextlib.contextmanager
+def _recorded_media():
+    import streamlit.testing.v1.app_test as app_test
+    storages = []
+    original = app_test.MemoryMediaFileStorage
+
+    def recording(*args, **kwargs):
+        storage = original(*args, **kwargs)
+        storages.append(storage)
+        return storage
+
+    app_test.MemoryMediaFileStorage = recording
+    try:
+        yield storages
+    finally:
+        app_test.MemoryMediaFileStorage = original
+
+# Helper function to read an image of the run as a data URI
+def _image_data_uri(url, storages):
+    filename = url.rsplit("/", 1)[-1]
+    for storage in reversed(storages):
+        try:
+            media = storage.get_file(filename)
+        except Exception:
+            continue
+        return f"data:{media.mimetype};base64,{base64.b64encode(media.content).decode()}"
+    return None
+
+# Helper function to fill in the theme placeholders of a Plotly spec
+def _resolve_placeholders(spec):
+    return re.sub(r"#0000[0-4]\d", lambda m: PLACEHOLDER_COLORS.get(m.group(0), m.group(0)), spec)
+
+# Helper function to point geometry URLs, which are relative to the app root, at the live app
+def _resolve_geo_urls(spec, app_root):
+    figure = json.loads(spec)
+    traces = [trace for trace in figure.get('data', [])
+              if isinstance(trace.get('geojson'), str) and trace['geojson'].startswith(GEO_URL_PREFIX)]
+    if not traces:
+        return spec
+    for trace in traces:
+        trace['geojson'] = app_root + trace['geojson']
+    return json.dumps(figure, separators=(',', ':'))
+
+# Helper function to render markdown on the page (converted in the browser)
+def _markdown(body, css_class="snapshot-markdown", tag="div"):
+    return f'<{tag} class="{css_class}" data-markdown="{html.escape(body, quote=True)}"></{tag}>'
+
+# Helper function to render a node of the AppTest element tree as HTML
+def _render_node(node, context):
+    kind = getattr(node, 'type', '')
+    children = list(getattr(node, 'children', {}).values())
+
+    if kind in SKIPPED_TYPES:
+        context['skipped'] += 1
+        return ""
+    if kind == 'tab_container':
+        return _render_tabs(children, context)
+    if kind == 'expander':
+        inner = "".join(_render_node(child, context) for child in children)
+        return f"<details><summary>{html.escape(node.label)}</summary>{inner}</details>"
+    if kind == 'column':
+        inner = "".join(_render_node(child, context) for child in children)
+        return f'<div class="snapshot-column" style="flex: {node.weight or 1}">{inner}</div>'
+    if children or kind in ('flex_container', 'vertical', 'horizontal'):
+        inner = "".join(_render_node(child, context) for child in children)
+        row = children and all(getattr(child, 'type', '') == 'column' for child in children)
+        return f'<div class="{"snapshot-row" if row else "snapshot-block"}">{inner}</div>'
+
+    if kind == 'markdown':
+        return _markdown(node.value)
+    if kind in ('title', 'header', 'subheader'):
+        tag = {'title': 'h1', 'header': 'h2', 'subheader': 'h3'}[kind]
+        return _markdown(node.value, "snapshot-heading", tag)
+    if kind == 'caption':
+        return _markdown(node.value, "snapshot-caption")
+    if kind == 'divider':
+        return "<hr>"
+    if kind in ('info', 'success', 'warning'):
+        return f'<div class="snapshot-alert snapshot-{kind}">{_markdown(node.value)}</div>'
+    if kind == 'metric':
+        delta = f'<div class="snapshot-metric-delta">{html.escape(node.proto.delta)}</div>' if node.proto.delta else ""
+        return (f'<div class="snapshot-metric"><div class="snapshot-metric-label">{html.escape(node.proto.label)}</div>'
+                f'<div class="snapshot-metric-value">{html.escape(node.value)}</div>{delta}</div>')
+    if kind == 'progress':
+        return f'<progress max="100" value="{node.value}"></progress>'
+    if kind == 'plotly_chart':
+        context['figures'] += 1
+        spec = html.escape(_resolve_geo_urls(_resolve_placeholders(node.proto.spec), context['app_root']), quote=True)
+        return f'<div class="snapshot-chart" data-plotly="{spec}"></div>'
+    if kind == 'image':
+        images = []
+        for image in node.proto.imgs:
+            uri = _image_data_uri(image.url, context['media']) if image.url.startswith("/") else image.url
+            if uri:
+                context['images'] += 1
+                images.append(f'<img src="{uri}" alt="{html.escape(image.caption)}">')
+        return "".join(images)
+    if kind == 'dataframe':
+        try:
+            return node.value.to_html(classes="snapshot-table", index=False, max_rows=50, border=0)
+        except Exception:
+            return ""
+    if kind == 'code':
+        return f"<pre><code>{html.escape(node.value)}</code></pre>"
+
+    # Every widget hands the reader over to the live app
+    label = getattr(node, 'label', None)
+    if label:
+        context['widgets'] += 1
+        return f'<a class="snapshot-widget" href="{context["live"]}">{html.escape(label)}</a>'
+    return ""
+
+# Helper function to render a tab set; tabs rendered lazily in the app link to the live chapter
+def _render_tabs(tabs, context):
+    labels, panes = [], []
+    for index, tab in enumerate(tabs):
+        inner = "".join(_render_node(child, context) for child in tab.children.values())
+        if not inner:
+            inner = f'<p><a class="snapshot-widget" href="{context["live"]}">Open the interactive chapter to explore this tab</a></p>'
+        selected = "true" if index == 0 else "false"
+        labels.append(f'<button role="tab" aria-selected="{selected}">{html.escape(tab.label)}</button>')
+        panes.append(f'<div role="tabpanel"{"" if index == 0 else " hidden"}>{inner}</div>')
+    return f'<div class="snapshot-tabs"><div role="tablist">{"".join(labels)}</div>{"".join(panes)}</div>'
+
+# Function to render one chapter in its default state
+def capture_chapter(chapter, live_url=None, timeout=120):
+    """
+    Run the app for a first-time visitor of a chapter and convert the page to HTML
+
+    The chapter is rendered through AppTest with the local data, exactly as a
+    new session would see it. Figures keep their Plotly spec, images are
+    embedded, and every widget becomes a link into the live app.
+
+    Returns:
+        tuple: (HTML of the chapter's main area, dict of element counts)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    # This process only renders pages; it must not publish a readiness status
+    set_first_session_warmup(False)
+    with _recorded_media() as media:
+        at = AppTest.from_file(str(Path("app.py").resolve()), default_timeout=timeout)
+        at.session_state['use_snowflake'] = False
+        at.session_state['navigation'] = chapter
+        at.run()
+
+    context = {'live': html.escape(live_chapter_url(chapter, live_url), quote=True), 'media': media,
+               'app_root': SNAPSHOT_LIVE_URL if live_url is None else live_url,
+               'figures': 0, 'images': 0, 'widgets': 0, 'skipped': 0}
+    body = "".join(_render_node(node, context) for node in at.main.children.values())
+    stats = {key: context[key] for key in ('figures', 'images', 'widgets', 'skipped')}
+    stats['exceptions'] = len(at.exception)
+    return body, stats
+
+# Function to wrap a captured chapter into a standalone page
+def render_snapshot_page(chapter, body, version, chapters, live_url=None):
+    """Return the full HTML page of a chapter snapshot"""
+    live = html.escape(live_chapter_url(chapter, live_url), quote=True)
+    links = "".join(
+        f'<a href="{chapter_slug(name)}.html"{" class=current" if name == chapter else ""}>{html.escape(name)}</a>'
+        for name in chapters
+    )
+    return f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<meta name="snapshot-version" content="{version}">
+<title>{html.escape(chapter)} | Incredible India</title>
+<style>
+body {{ margin: 0; background: #0E1117; color: #FAFAFA; font-family: "Source Sans Pro", sans-serif; line-height: 1.6; }}
+a {{ color: #FF9933; }}
+.snapshot-banner {{ position: sticky; top: 0; z-index: 10; display: flex; gap: 1rem; align-items: center; justify-content: space-between;
+  padding: 0.6rem 1.5rem; background: #1E2129; border-bottom: 1px solid rgba(255,255,255,0.08); }}
+.snapshot-banner .live {{ background: #FF9933; color: #0E1117; padding: 0.35rem 0.9rem; border-radius: 6px; text-decoration: none; font-weight: 600; }}
+.snapshot-chapters {{ display: flex; flex-wrap: wrap; gap: 0.8rem; padding: 0.6rem 1.5rem; font-size: 0.9rem; }}
+.snapshot-chapters a {{ color: #999; text-decoration: none; }}
+.snapshot-chapters a.current {{ color: #FF9933; }}
+main {{ max-width: 1200px; margin: 0 auto; padding: 1rem 1.5rem 3rem; }}
+.snapshot-row {{ display: flex; gap: 1rem; flex-wrap: wrap; }}
+.snapshot-column {{ min-width: 220px; }}
+.snapshot-caption {{ color: #999; font-size: 0.85rem; }}
+.snapshot-alert {{ padding: 0.6rem 1rem; border-radius: 6px; margin: 0.5rem 0; background: rgba(41,181,232,0.15); }}
+.snapshot-success {{ background: rgba(19,136,8,0.2); }}
+.snapshot-warning {{ background: rgba(255,153,51,0.2); }}
+.snapshot-metric-value {{ font-size: 1.8rem; }}
+.snapshot-metric-label, .snapshot-metric-delta {{ color: #999; font-size: 0.9rem; }}
+.snapshot-widget {{ display: inline-block; margin: 0.3rem 0.5rem 0.3rem 0; padding: 0.3rem 0.8rem; border: 1px solid rgba(255,255,255,0.2);
+  border-radius: 6px; text-decoration: none; }}
+.snapshot-chart {{ min-height: 320px; }}
+.snapshot-tabs [role=tablist] {{ display: flex; gap: 0.5rem; border-bottom: 1px solid rgba(255,255,255,0.1); margin-bottom: 0.8rem; }}
+.snapshot-tabs [role=tab] {{ background: none; border: none; color: #FAFAFA; padding: 0.5rem 0.8rem; cursor: pointer; }}
+.snapshot-tabs [role=tab][aria-selected=true] {{ color: #FF9933; border-bottom: 2px solid #FF9933; }}
+.snapshot-table {{ border-collapse: collapse; font-size: 0.9rem; }}
+.snapshot-table td, .snapshot-table th {{ padding: 0.3rem 0.6rem; border-bottom: 1px solid rgba(255,255,255,0.1); }}
+img {{ max-width: 100%; }}
+</style>
+</head>
+<body>
+<div class="snapshot-banner"><span>{html.escape(chapter)}</span><a class="live" href="{live}">Explore interactively</a></div>
+<nav class="snapshot-chapters">{links}</nav>
+<main>{body}</main>
+<script src="{MARKED_JS_URL}"></script>
+<script src="{PLOTLY_JS_URL}"></script>
+<script>
+document.querySelectorAll("[data-markdown]").forEach(function (el) {{
+  el.innerHTML = window.marked ? marked.parse(el.dataset.markdown) : el.dataset.markdown;
+}});
+document.querySelectorAll("[data-plotly]").forEach(function (el) {{
+  if (!window.Plotly) return;
+  var spec = JSON.parse(el.dataset.plotly);
+  Plotly.newPlot(el, spec.data, spec.layout || {{}}, {{responsive: true, displaylogo: false}});
+}});
+document.querySelectorAll(".snapshot-tabs").forEach(function (tabs) {{
+  var buttons = tabs.querySelectorAll(":scope > [role=tablist] > [role=tab]");
+  var panes = tabs.querySelectorAll(":scope > [role=tabpanel]");
+  buttons.forEach(function (button, index) {{
+    button.addEventListener("click", function () {{
+      buttons.forEach(function (b, i) {{ b.setAttribute("aria-selected", i === index); panes[i].hidden = i !== index; }});
+      window.dispatchEvent(new Event("resize"));
+    }});
+  }});
+}});
+</script>
+</body>
+</html>
+"""
+
+# Function to build (or refresh) the snapshot of one chapter
+def build_snapshot(chapter, chapters, directory=None, force=False, live_url=None):
+    """
+    Write the snapshot page of a chapter unless it is current for this version
+
+    Returns:
+        dict: Manifest entry of the chapter, with 'built' False if it was up to date
+    """
+    directory = Path(directory or SNAPSHOT_DIR)
+    version = snapshot_version()
+    manifest = load_snapshot_manifest(directory)
+    entry = manifest.get(chapter)
+    path = directory / f"{chapter_slug(chapter)}.html"
+    if not force and entry and entry.get('version') == version and path.exists():
+        return dict(entry, built=False)
+
+    started = time.perf_counter()
+    body, stats = capture_chapter(chapter, live_url)
+    page = render_snapshot_page(chapter, body, version, chapters, live_url)
+
+    directory.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.partial")
+    partial.write_text(page, encoding='utf-8')
+    # Readers only ever see complete pages
+    os.replace(partial, path)
+
+    entry = dict(stats, file=path.name, version=version, bytes=len(page.encode('utf-8')),
+                 seconds=round(time.perf_counter() - started, 2), built_at=int(time.time()))
+    manifest = load_snapshot_manifest(directory)
+    manifest[chapter] = entry
+    manifest_partial = directory / f"{MANIFEST_NAME}.{os.getpid()}.partial"
+    manifest_partial.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding='utf-8')
+    os.replace(manifest_partial, directory / MANIFEST_NAME)
+    return dict(entry, built=True)
@@ -1,20 +1,34 @@
 import streamlit as st
-from snowflake.connector import connect
-from snowflake.snowpark.session import Session
 import pandas as pd
 import os
 from io import BytesIO
 from PIL import Image
 import base64
+import threading
+from contextlib import contextmanager
+from modules.config import (
+    DATA_DIR, DATA_BACKEND, LOCAL_BACKEND_LATENCY, LOCAL_BACKEND_JITTER,
+    LOCAL_BACKEND_FAILURE_RATE, LOCAL_BACKEND_SEED
+)
+
+try:
+    from snowflake.connector import connect
+    from snowflake.snowpark.session import Session
+    SNOWFLAKE_AVAILABLE = True
+except ImportError:
+    SNOWFLAKE_AVAILABLE = False
 
 # Caching Snowflake session to avoid multiple connections
 @st.cache_resource
 def get_snowflake_session():
     """Create and return a Snowflake session"""
     try:
+        if not SNOWFLAKE_AVAILABLE:
+            raise ImportError("snowflake-snowpark-python is not installed")
+
         # Get credentials from Streamlit secrets
         snowflake_credentials = st.secrets["snowflake"]
-        
+
         # Create a Snowflake session
         session = Session.builder.configs({
             "account": snowflake_credentials["account"],
@@ -25,10 +39,11 @@ def get_snowflake_session():
             "database": snowflake_credentials["database"],
             "schema": snowflake_credentials["schema"]
         }).create()
-        
+
         return session
     except Exception as e:
-        st.error(f"Error connecting to Snowflake: {str(e)}")
+        # Raised to the caller, which falls back to local data; an st.error here would be replayed from the caches
+        print(f"Error connecting to Snowflake: {str(e)}")
         raise e
 
 # Function to get a direct connector for specific operations
@@ -36,9 +51,12 @@ def get_snowflake_session():
 def get_snowflake_connector():
     """Create and return a Snowflake connector"""
     try:
+        if not SNOWFLAKE_AVAILABLE:
+            raise ImportError("snowflake-connector-python is not installed")
+
         # Get credentials from Streamlit secrets
         snowflake_credentials = st.secrets["snowflake"]
-        
+
         # Create a Snowflake connector
         conn = connect(
             account=snowflake_credentials["account"],
@@ -49,89 +67,205 @@ def get_snowflake_connector():
             database=snowflake_credentials["database"],
             schema=snowflake_credentials["schema"]
         )
-        
+
         return conn
     except Exception as e:
-        st.error(f"Error connecting to Snowflake: {str(e)}")
+        # Raised to the caller, which falls back to local data; an st.error here would be replayed from the caches
+        print(f"Error connecting to Snowflake: {str(e)}")
         raise e
 
+# Class describing what the app needs from its data warehouse
+class DataBackend:
+    """
+    Interface of the backend behind query_snowflake() and the image getters
+
+    query() returns a DataFrame for a SQL statement, fetch_image() returns the
+    raw bytes stored in the IMAGES table (or None if there is no such image)
+    and is_configured() tells the loaders whether to use the backend at all.
+    Errors are raised; the module-level functions turn them into fallbacks.
+    """
+
+    name = "backend"
+
+    def is_configured(self):
+        return True
+
+    def query(self, query):
+        raise NotImplementedError
+
+    def fetch_image(self, image_name):
+        raise NotImplementedError
+
+# Class sending queries to the Snowflake account in Streamlit secrets
+class SnowflakeBackend(DataBackend):
+    """Backend using the cached Snowpark session"""
+
+    name = "snowflake"
+
+    def is_configured(self):
+        try:
+            return SNOWFLAKE_AVAILABLE and "snowflake" in st.secrets
+        except Exception:
+            return False
+
+    def query(self, query):
+        return get_snowflake_session().sql(query).to_pandas()
+
+    def fetch_image(self, image_name):
+        query = f"SELECT IMAGE_DATA FROM IMAGES WHERE IMAGE_NAME = '{image_name}'"
+        result = get_snowflake_session().sql(query).collect()
+        if result and len(result) > 0:
+            return result[0]["IMAGE_DATA"]
+        return None
+
+# Backend set with set_backend(), taking precedence over DATA_BACKEND
+_backend_override = None
+
+# Function to create the configured backend once per process
+@st.cache_resource(show_spinner=False)
+def _create_backend(kind, latency, jitter, failure_rate, seed):
+    if kind == "local":
+        from modules.local_backend import LocalBackend
+        return LocalBackend(DATA_DIR, latency=latency, jitter=jitter, failure_rate=failure_rate, seed=seed)
+    if kind != "snowflake":
+        print(f"Unknown DATA_BACKEND '{kind}', using Snowflake")
+    return SnowflakeBackend()
+
+# Function to get the backend used for queries and images
+def get_backend():
+    """Return the backend set with set_backend(), otherwise the one selected by DATA_BACKEND"""
+    if _backend_override is not None:
+        return _backend_override
+    return _create_backend(
+        DATA_BACKEND, LOCAL_BACKEND_LATENCY, LOCAL_BACKEND_JITTER,
+        LOCAL_BACKEND_FAILURE_RATE, LOCAL_BACKEND_SEED
+    )
+
+# Function to switch the backend for this process
+def set_backend(backend):
+    """
+    Route every query and image lookup in this process to backend
+
+    Pass None to return to the backend selected by DATA_BACKEND. Results
+    cached from the previous backend are dropped.
+    """
+    global _backend_override
+    _backend_override = backend
+    _query_backend.clear()
+    _load_backend_image.clear()
+    _load_backend_svg.clear()
+
+# Data source forced on the current thread, e.g. the warm-up thread that has no session
+_thread_data_source = threading.local()
+
+# Function to read a data source explicitly on this thread
+@contextmanager
+def use_data_source(use_snowflake):
+    """
+    Make warehouse_enabled() return use_snowflake on this thread, whatever the session state says
+
+    Threads without a script context (the warm-up) see an empty session state,
+    so they name their data source instead of inheriting the default.
+    """
+    previous = getattr(_thread_data_source, 'use_snowflake', None)
+    _thread_data_source.use_snowflake = use_snowflake
+    try:
+        yield
+    finally:
+        _thread_data_source.use_snowflake = previous
+
+# Function to check whether queries and images go to the backend
+def warehouse_enabled(use_snowflake=None):
+    """
+    Return True when the data source is Snowflake and the backend is configured
+
+    Args:
+        use_snowflake (bool): Data source to check; by default the one forced
+            on this thread with use_data_source(), else the session's
+    """
+    if use_snowflake is None:
+        use_snowflake = getattr(_thread_data_source, 'use_snowflake', None)
+    if use_snowflake is None:
+        use_snowflake = st.session_state.get('use_snowflake', True)
+    if not use_snowflake:
+        return False
+    try:
+        return get_backend().is_configured()
+    except Exception:
+        return False
+
+# Helper function to count a failed backend call for the app's fallback logic
+def _record_backend_error():
+    if 'snowflake_errors' in st.session_state:
+        st.session_state.snowflake_errors += 1
+
+# Helper function to run a query once per backend result; failures raise and are not cached
+@st.cache_data(show_spinner=False)
+def _query_backend(query):
+    return get_backend().query(query)
+
 # Function to query Snowflake and return a pandas DataFrame
-@st.cache_data
 def query_snowflake(query):
     """Execute a query on Snowflake and return results as a DataFrame"""
-    # Skip Snowflake if disabled
-    if not st.session_state.get('use_snowflake', True):
+    # Skip Snowflake if disabled or not configured
+    if not warehouse_enabled():
         return None
-        
+
     try:
-        session = get_snowflake_session()
-        df = session.sql(query).to_pandas()
-        return df
+        return _query_backend(query)
     except Exception as e:
         # Track errors
-        if 'snowflake_errors' in st.session_state:
-            st.session_state.snowflake_errors += 1
+        _record_backend_error()
         print(f"Error querying Snowflake: {str(e)}")
         return None
 
+# Helper function to load an image from the backend once; failures raise and are not cached
+@st.cache_data(show_spinner=False)
+def _load_backend_image(image_name):
+    image_data = get_backend().fetch_image(image_name)
+    if image_data is None:
+        print(f"Image {image_name} not found in Snowflake")
+        return None
+    # Convert binary data to Image
+    return Image.open(BytesIO(image_data))
+
 # Function to get image from Snowflake
-@st.cache_data
 def get_image_from_snowflake(image_name):
     """Retrieve an image from Snowflake storage"""
-    # Skip Snowflake if disabled
-    if not st.session_state.get('use_snowflake', True):
+    # Skip Snowflake if disabled or not configured
+    if not warehouse_enabled():
         return None
-        
+
     try:
-        # Query to get the image data
-        query = f"SELECT IMAGE_DATA FROM IMAGES WHERE IMAGE_NAME = '{image_name}'"
-        session = get_snowflake_session()
-        result = session.sql(query).collect()
-        
-        if result and len(result) > 0:
-            # Get the image data
-            image_data = result[0]["IMAGE_DATA"]
-            
-            # Convert binary data to Image
-            img = Image.open(BytesIO(image_data))
-            return img
-        else:
-            print(f"Image {image_name} not found in Snowflake")
-            return None
+        return _load_backend_image(image_name)
     except Exception as e:
         # Track errors
-        if 'snowflake_errors' in st.session_state:
-            st.session_state.snowflake_errors += 1
+        _record_backend_error()
         print(f"Error retrieving image from Snowflake: {str(e)}")
         return None
 
+# Helper function to load an SVG from the backend once; failures raise and are not cached
+@st.cache_data(show_spinner=False)
+def _load_backend_svg(svg_name):
+    svg_data = get_backend().fetch_image(svg_name)
+    if svg_data is None:
+        print(f"SVG {svg_name} not found in Snowflake")
+        return None
+    # Convert to base64
+    b64 = base64.b64encode(svg_data).decode("utf-8")
+    return f"data:image/svg+xml;base64,{b64}"
+
 # Function to get SVG from Snowflake as base64
-@st.cache_data
 def get_svg_from_snowflake(svg_name):
     """Retrieve an SVG from Snowflake and return as base64 data URL"""
-    # Skip Snowflake if disabled
-    if not st.session_state.get('use_snowflake', True):
+    # Skip Snowflake if disabled or not configured
+    if not warehouse_enabled():
         return None
-        
+
     try:
-        # Query to get the SVG data
-        query = f"SELECT IMAGE_DATA FROM IMAGES WHERE IMAGE_NAME = '{svg_name}'"
-        session = get_snowflake_session()
-        result = session.sql(query).collect()
-        
-        if result and len(result) > 0:
-            # Get the SVG data
-            svg_data = result[0]["IMAGE_DATA"]
-            
-            # Convert to base64
-            b64 = base64.b64encode(svg_data).decode("utf-8")
-            return f"data:image/svg+xml;base64,{b64}"
-        else:
-            print(f"SVG {svg_name} not found in Snowflake")
-            return None
+        return _load_backend_svg(svg_name)
     except Exception as e:
         # Track errors
-        if 'snowflake_errors' in st.session_state:
-            st.session_state.snowflake_errors += 1
+        _record_backend_error()
         print(f"Error retrieving SVG from Snowflake: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
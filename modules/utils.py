@@ -7,7 +7,12 @@ import requests
 from io import BytesIO
 import re
 import numpy as np
+import functools
 from modules.snowflake_connector import query_snowflake, get_image_from_snowflake, get_svg_from_snowflake
+from modules.dataset_store import shared_dataset, dataset_handle, fallback_frame
+from modules.encoding import verified_encoding, normalize_to_utf8
+from modules.data_bundle import bundled_dataset
+from modules.column_schema import get_schema, to_app_columns, to_snowflake_columns
 
 # Function to style Matplotlib figures for dark theme
 def style_matplotlib_for_dark(fig, ax):
@@ -63,8 +68,16 @@ def apply_dark_theme(fig):
         )
     return fig
 
+# Helper function to hand categorical columns to Plotly Express as plain labels
+def plain_labels(df):
+    """Return df with its categorical columns as object columns (Plotly Express groups them without observed=True)"""
+    categorical = [col for col in df.columns if isinstance(df[col].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df
+    return df.astype({col: object for col in categorical})
+
 # Function to preload common datasets to avoid redundancy
-@st.cache_data
+# (each loader is cached as a shared handle, so this only hands out views)
 def preload_data(datasets=None):
     """
     Preload and cache datasets for faster access across different chapters
@@ -78,45 +91,36 @@ def preload_data(datasets=None):
     Returns:
         dict: Dictionary containing all loaded datasets
     """
-    all_datasets = [
-        'linguistic', 'religious', 'state', 'cultural', 'population', 
-        'economic', 'historical', 'festivals', 'tourism', 'education', 'geography'
-    ]
-    
     # If no specific datasets are requested, load all of them
     if datasets is None:
-        datasets = all_datasets
-    
-    # Initialize data container
-    data = {}
+        datasets = list(DATASET_LOADERS)
     
     # Load requested datasets
     with st.spinner("Preloading data for faster navigation..."):
-        for dataset in datasets:
-            if dataset == 'linguistic':
-                data['linguistic'] = load_linguistic_data()
-            elif dataset == 'religious':
-                data['religious'] = load_religious_data()
-            elif dataset == 'state':
-                data['state'] = load_state_data()
-            elif dataset == 'cultural':
-                data['cultural'] = load_cultural_data()
-            elif dataset == 'population':
-                data['population'] = load_population_data()
-            elif dataset == 'economic':
-                data['economic'] = load_economic_data()
-            elif dataset == 'historical':
-                data['historical'] = load_historical_data()
-            elif dataset == 'festivals':
-                data['festivals'] = load_festivals_data()
-            elif dataset == 'tourism':
-                data['tourism'] = load_tourism_data()
-            elif dataset == 'education':
-                data['education'] = load_education_data()
-            elif dataset == 'geography':
-                data['geography'] = load_geography_data()
+        return {dataset: DATASET_LOADERS[dataset]() for dataset in datasets if dataset in DATASET_LOADERS}
+
+# Function to warm datasets and return references to them for session state
+def preload_dataset_refs(datasets=None):
+    """
+    Warm the shared dataset cache and return {name: DatasetRef}
     
-    return data
+    Unlike preload_data() no frames are returned, so keeping the result in
+    session state costs a few bytes per dataset instead of a copy per visitor.
+    Use resolve_dataset_ref() to get the data back.
+    """
+    if datasets is None:
+        datasets = list(DATASET_LOADERS)
+    
+    with st.spinner("Preloading data for faster navigation..."):
+        return {
+            dataset: DATASET_LOADERS[dataset].handle().ref
+            for dataset in datasets if dataset in DATASET_LOADERS
+        }
+
+# Function to get the data a DatasetRef points to
+def resolve_dataset_ref(ref):
+    """Return a copy-on-write view of a referenced dataset (the current version if the referenced one was superseded)"""
+    return DATASET_LOADERS[ref.name]()
 
 # Function to load image from URL with caching
 @st.cache_data
@@ -158,80 +162,281 @@ def load_svg_as_base64(file_path):
 
 # Helper function to safely read CSV files with various encodings
 def safe_read_csv(file_path):
-    """Safely read a CSV file with encoding fallbacks"""
-    encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+    """
+    Safely read a CSV file, parsing it exactly once
     
-    for encoding in encodings:
-        try:
-            return pd.read_csv(file_path, encoding=encoding)
-        except UnicodeDecodeError:
-            continue
-        except Exception as e:
-            st.error(f"Error reading file {file_path}: {str(e)}")
-            return None
+    The encoding comes from the data directory's encoding manifest. Files
+    that are new or changed since the manifest was written are first
+    streamed once to detect their encoding; converting them to UTF-8 is left
+    to the launcher, so concurrent app processes never rewrite data files.
+    """
+    try:
+        encoding = verified_encoding(file_path)
+        if encoding is None:
+            encoding = normalize_to_utf8(file_path, convert=False, record=False)['encoding']
+    except (OSError, UnicodeDecodeError) as e:
+        st.error(f"Failed to read {file_path} with any encoding: {str(e)}")
+        return None
+    
+    try:
+        return pd.read_csv(file_path, encoding=encoding)
+    except Exception as e:
+        st.error(f"Error reading file {file_path}: {str(e)}")
+        return None
+
+# Column dtypes enforced on every dataset at load time. Low-cardinality labels
+# become categoricals and years become nullable integers; numeric columns that
+# are not listed are downcast automatically when that loses no precision.
+DATASET_SCHEMAS = {
+    'linguistic': {},
+    'religious': {},
+    'state': {
+        'Region': 'category'
+    },
+    'cultural': {
+        'Historical Period': 'category',
+        'Region of Origin': 'category',
+        'UNESCO Status': 'category',
+        'Type': 'category'
+    },
+    'population': {
+        'Year': 'Int16'
+    },
+    'economic': {
+        'Year': 'Int16'
+    },
+    'historical': {
+        'Year': 'Int16',
+        'Start Year': 'Int16',
+        'End Year': 'Int16',
+        'Era': 'category',
+        'Region': 'category'
+    },
+    'festivals': {
+        'Religion/Type': 'category',
+        'Season': 'category',
+        'Tourist Attraction Level': 'category',
+        'Environmental Impact': 'category',
+        'Global Celebrations': 'category'
+    },
+    'tourism': {
+        'State': 'category',
+        'Type': 'category',
+        'Tourism Type': 'category',
+        'Best Season': 'category',
+        'Peak Season': 'category',
+        'UNESCO Status': 'category'
+    },
+    'education': {},
+    'geography': {}
+}
+
+# Memory usage (bytes) per dataset before and after the schema was enforced
+SCHEMA_MEMORY_STATS = {}
+
+# Helper function to cast one column without losing information
+def _cast_column(series, dtype):
+    """Cast a column to dtype, returning the original series if values would be lost"""
+    try:
+        if dtype == 'category':
+            return series.astype('category')
+        if dtype in ('Int8', 'Int16', 'Int32', 'Int64'):
+            converted = pd.to_numeric(series, errors='coerce')
+            # Keep text columns such as '250 BCE' untouched
+            if converted.notna().sum() != series.notna().sum():
+                return series
+            rounded = converted.round()
+            if not (rounded.isna() | (rounded == converted)).all():
+                return series
+            return rounded.astype(dtype)
+    except (TypeError, ValueError, OverflowError):
+        return series
+    return series.astype(dtype)
+
+# Helper function to downcast a numeric column when it is lossless
+def _downcast_numeric(series):
+    """Downcast float64 to float32 and int64 to int32 only if every value survives the round trip"""
+    if pd.api.types.is_float_dtype(series) and series.dtype == 'float64':
+        downcast = series.astype('float32')
+        if np.array_equal(downcast.astype('float64').to_numpy(), series.to_numpy(), equal_nan=True):
+            return downcast
+    elif pd.api.types.is_integer_dtype(series) and series.dtype == 'int64':
+        # int32 keeps headroom for the arithmetic done in the chapters
+        info = np.iinfo(np.int32)
+        if series.empty or (series.min() >= info.min and series.max() <= info.max):
+            return series.astype('int32')
+    return series
+
+# Function to enforce the declared schema on a loaded dataset
+def enforce_schema(df, dataset):
+    """
+    Apply DATASET_SCHEMAS[dataset] to a DataFrame and record the memory savings
+
+    Args:
+        df (DataFrame): Loaded dataset
+        dataset (str): Dataset key, e.g. 'tourism'
+
+    Returns:
+        DataFrame: Dataset with compact dtypes
+    """
+    if df is None or not isinstance(df, pd.DataFrame) or df.empty:
+        return df
+
+    schema = DATASET_SCHEMAS.get(dataset, {})
+    before = int(df.memory_usage(deep=True).sum())
+
+    compact = df.copy()
+    for col in compact.columns:
+        if col in schema:
+            compact[col] = _cast_column(compact[col], schema[col])
+        elif pd.api.types.is_numeric_dtype(compact[col]) and not pd.api.types.is_bool_dtype(compact[col]):
+            compact[col] = _downcast_numeric(compact[col])
+
+    after = int(compact.memory_usage(deep=True).sum())
+    SCHEMA_MEMORY_STATS[dataset] = {'rows': len(compact), 'before': before, 'after': after}
+    return compact
+
+# Decorator that enforces the dataset schema on a loader's result
+def with_schema(dataset):
+    """Wrap a load_* function so its result always follows DATASET_SCHEMAS[dataset]"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return enforce_schema(func(*args, **kwargs), dataset)
+        return wrapper
+    return decorator
+
+# Function to report the memory saved by the schema layer
+def get_schema_memory_report():
+    """
+    Summarize per-dataset memory before and after schema enforcement
+
+    Returns:
+        DataFrame: One row per loaded dataset with sizes in KB and the savings percentage
+    """
+    rows = []
+    for dataset, stats in SCHEMA_MEMORY_STATS.items():
+        saved = stats['before'] - stats['after']
+        rows.append({
+            'Dataset': dataset,
+            'Rows': stats['rows'],
+            'Before (KB)': round(stats['before'] / 1024, 1),
+            'After (KB)': round(stats['after'] / 1024, 1),
+            'Saved (%)': round(100 * saved / stats['before'], 1) if stats['before'] else 0.0
+        })
+    return pd.DataFrame(rows, columns=['Dataset', 'Rows', 'Before (KB)', 'After (KB)', 'Saved (%)'])
+
+# HDI values by state (approximations based on 2021-22 data)
+STATE_HDI_VALUES = {
+    'Kerala': 0.782,
+    'Delhi': 0.746,
+    'Goa': 0.761,
+    'Punjab': 0.723,
+    'Tamil Nadu': 0.708,
+    'Himachal Pradesh': 0.725,
+    'Maharashtra': 0.696,
+    'Karnataka': 0.682,
+    'Telangana': 0.669,
+    'Gujarat': 0.672,
+    'Haryana': 0.708,
+    'Uttarakhand': 0.684,
+    'West Bengal': 0.641,
+    'Andhra Pradesh': 0.649,
+    'Rajasthan': 0.629,
+    'Odisha': 0.606,
+    'Assam': 0.613,
+    'Jharkhand': 0.599,
+    'Chhattisgarh': 0.613,
+    'Madhya Pradesh': 0.603,
+    'Uttar Pradesh': 0.596,
+    'Bihar': 0.574,
+    'Manipur': 0.697,
+    'Tripura': 0.658,
+    'Meghalaya': 0.636,
+    'Nagaland': 0.679,
+    'Sikkim': 0.716,
+    'Mizoram': 0.705,
+    'Arunachal Pradesh': 0.662,
+    'Jammu and Kashmir': 0.688,
+    'Chandigarh': 0.775,
+    'Puducherry': 0.738,
+    'Andaman and Nicobar Islands': 0.74,
+    'Lakshadweep': 0.712,
+    'Dadra and Nagar Haveli and Daman and Diu': 0.663,
+    'Ladakh': 0.674
+}
+
+# Default urbanization data by state (approximations)
+STATE_URBANIZATION_VALUES = {
+    'Delhi': 97.5,
+    'Chandigarh': 97.3,
+    'Goa': 62.2,
+    'Mizoram': 52.1,
+    'Tamil Nadu': 48.4,
+    'Kerala': 47.7,
+    'Maharashtra': 45.2,
+    'Gujarat': 42.6,
+    'Karnataka': 38.6,
+    'Punjab': 37.5,
+    'Haryana': 34.8,
+    'Andhra Pradesh': 29.6,
+    'West Bengal': 31.9,
+    'Uttarakhand': 30.6,
+    'Rajasthan': 24.9,
+    'Uttar Pradesh': 22.3,
+    'Jharkhand': 24.1,
+    'Chhattisgarh': 23.2,
+    'Madhya Pradesh': 27.6,
+    'Odisha': 16.7,
+    'Bihar': 11.3,
+    'Assam': 14.1,
+    'Himachal Pradesh': 10.0,
+    'Jammu and Kashmir': 27.4
+}
+
+# Helper function to read a dataset's rows from Snowflake or its local CSV file
+def read_dataset_source(dataset):
+    """
+    Read a dataset with application column names
+    
+    Snowflake is tried first and the CSV file named in the shared column
+    schema is the fallback. Both are renamed through the same compiled
+    table, so the loaders apply their defaults to one consistent layout.
     
-    st.error(f"Failed to read {file_path} with any encoding.")
-    return None
+    Returns:
+        DataFrame or None: The raw rows, or None if neither source is available
+    """
+    schema = get_schema(dataset)
+    try:
+        df = query_snowflake(f"SELECT * FROM {schema.table}")
+        if df is not None and not df.empty:
+            return map_columns(df, dataset)
+    except Exception as snowflake_error:
+        st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
+    
+    # Fall back to local file if Snowflake fails
+    file_path = schema.csv_path
+    if not os.path.exists(file_path):
+        st.error(f"File not found: {file_path}")
+        return None
+    
+    df = safe_read_csv(file_path)
+    if df is None:
+        return None
+    return map_columns(df, dataset)
 
 # Improved data loading functions with better error handling
-@st.cache_data
+@dataset_handle('linguistic')
+@bundled_dataset('linguistic')
+@shared_dataset('linguistic')
+@with_schema('linguistic')
 def load_linguistic_data():
     try:
         with st.spinner("Loading linguistic data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM LANGUAGES"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Convert all columns to expected format
-                    column_map = {}
-                    for col in df.columns:
-                        # Map to expected column names (case-sensitive)
-                        if col == 'LANGUAGE':
-                            column_map[col] = 'Language'
-                        elif col == 'SPEAKERS':
-                            column_map[col] = 'Speakers'
-                        elif col == 'PERCENTAGE':
-                            column_map[col] = 'Percentage'
-                        elif col == 'UNESCO_STATUS':
-                            column_map[col] = 'UNESCO Status'
-                        elif col == 'ANCIENT_TEXTS':
-                            column_map[col] = 'Ancient Texts'
-                        elif col == 'CULTURAL_SIGNIFICANCE':
-                            column_map[col] = 'Cultural Significance'
-                        elif col == 'GLOBAL_REACH':
-                            column_map[col] = 'Global Reach'
-                    
-                    # Only rename columns that exist in the mapping
-                    if column_map:
-                        df = df.rename(columns=column_map)
-                    
-                    # Add UNESCO Status if missing
-                    if 'UNESCO Status' not in df.columns:
-                        df['UNESCO Status'] = "Not Listed"
-                        # Add Classical status for known classical languages
-                        classical_languages = ['Sanskrit', 'Tamil', 'Telugu', 'Kannada', 'Malayalam', 'Odia']
-                        df.loc[df['Language'].isin(classical_languages), 'UNESCO Status'] = "Classical Language"
-                    
-                    # Add other required columns with default values if missing
-                    if 'Ancient Texts' not in df.columns:
-                        df['Ancient Texts'] = "Various ancient literary works"
-                    
-                    if 'Cultural Significance' not in df.columns:
-                        df['Cultural Significance'] = "Significant cultural contributions"
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/languages.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('linguistic')
+            if df is None:
                 return None
             
-            df = safe_read_csv(file_path)
-            
             # Add UNESCO Status if missing
             if 'UNESCO Status' not in df.columns:
                 df['UNESCO Status'] = "Not Listed"
@@ -250,51 +455,26 @@ def load_linguistic_data():
     except Exception as e:
         st.error(f"Error loading linguistic data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return pd.DataFrame({
+        return fallback_frame(pd.DataFrame({
             'Language': ['Hindi', 'Bengali', 'Telugu', 'Marathi', 'Tamil', 'Urdu', 'Kannada', 'Gujarati', 'Malayalam', 'Sanskrit'],
             'Speakers': [600, 90, 80, 70, 60, 50, 40, 45, 35, 0.01],
             'Percentage': [43.6, 8.0, 6.9, 7.5, 5.9, 5.0, 3.7, 4.6, 2.9, 0.01],
             'UNESCO Status': ['Official Language', 'Official Language', 'Classical Language', 'Official Language', 'Classical Language', 'Official Language', 'Classical Language', 'Official Language', 'Classical Language', 'Classical Language'],
             'Ancient Texts': ['Various texts', 'Various texts', 'Various texts', 'Various texts', 'Sangam literature', 'Various texts', 'Various texts', 'Various texts', 'Various texts', 'Vedas, Upanishads'],
             'Cultural Significance': ['National language', 'Literature rich', 'Cinema, literature', 'Literature rich', 'Ancient literature', 'Poetry, ghazals', 'Literature rich', 'Literature rich', 'Literature rich', 'Religious texts']
-        })
+        }))
 
-@st.cache_data
+@dataset_handle('religious')
+@bundled_dataset('religious')
+@shared_dataset('religious')
+@with_schema('religious')
 def load_religious_data():
     try:
         with st.spinner("Loading religious data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM RELIGIONS"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Convert all columns to expected format
-                    column_map = {}
-                    for col in df.columns:
-                        # Map to expected column names (case-sensitive)
-                        if col == 'RELIGION':
-                            column_map[col] = 'Religion'
-                        elif col == 'PERCENTAGE':
-                            column_map[col] = 'Percentage'
-                        elif col == 'POPULATION':
-                            column_map[col] = 'Population'
-                    
-                    # Only rename columns that exist in the mapping
-                    if column_map:
-                        df = df.rename(columns=column_map)
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/religions.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('religious')
+            if df is None:
                 return None
             
-            df = safe_read_csv(file_path)
-            
             # Verify required columns exist
             required_columns = ['Religion', 'Percentage', 'Population']
             missing_columns = [col for col in required_columns if col not in df.columns]
@@ -316,138 +496,17 @@ def load_religious_data():
         st.error(f"Error loading religious data: {e}")
         return None
 
-@st.cache_data
+@dataset_handle('state')
+@bundled_dataset('state')
+@shared_dataset('state')
+@with_schema('state')
 def load_state_data():
     try:
         with st.spinner("Loading state data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM STATES"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Rename columns to match expected format if needed
-                    column_mapping = {
-                        'STATE': 'State',
-                        'POPULATION_MILLIONS': 'Population (millions)',
-                        'AREA_SQ_KM': 'Area (sq km)',
-                        'LITERACY_RATE_PCT': 'Literacy Rate (%)',
-                        'REGION': 'Region',
-                        'CAPITAL': 'Capital',
-                        'OFFICIAL_LANGUAGES': 'Official Languages',
-                        'MAJOR_INDUSTRIES': 'Major Industries',
-                        'GDP_BILLION_USD': 'GDP (billion USD)',
-                        'HDI': 'HDI',
-                        'URBANIZATION_PCT': 'Urbanization (%)',
-                        'FAMOUS_DESTINATIONS': 'Famous Destinations',
-                        'MAJOR_CROPS': 'Major Crops',
-                        'KEY_INDUSTRIES': 'Key Industries'
-                    }
-                    
-                    # Only rename columns that exist
-                    rename_cols = {}
-                    for snowflake_col, app_col in column_mapping.items():
-                        if snowflake_col in df.columns:
-                            rename_cols[snowflake_col] = app_col
-                    
-                    if rename_cols:
-                        df = df.rename(columns=rename_cols)
-                    
-                    # Add HDI column if it doesn't exist
-                    if 'HDI' not in df.columns:
-                        # HDI values by state (approximations based on 2021-22 data)
-                        hdi_values = {
-                            'Kerala': 0.782,
-                            'Delhi': 0.746,
-                            'Goa': 0.761,
-                            'Punjab': 0.723,
-                            'Tamil Nadu': 0.708,
-                            'Himachal Pradesh': 0.725,
-                            'Maharashtra': 0.696,
-                            'Karnataka': 0.682,
-                            'Telangana': 0.669,
-                            'Gujarat': 0.672,
-                            'Haryana': 0.708,
-                            'Uttarakhand': 0.684,
-                            'West Bengal': 0.641,
-                            'Andhra Pradesh': 0.649,
-                            'Rajasthan': 0.629,
-                            'Odisha': 0.606,
-                            'Assam': 0.613,
-                            'Jharkhand': 0.599,
-                            'Chhattisgarh': 0.613,
-                            'Madhya Pradesh': 0.603,
-                            'Uttar Pradesh': 0.596,
-                            'Bihar': 0.574,
-                            'Manipur': 0.697,
-                            'Tripura': 0.658,
-                            'Meghalaya': 0.636,
-                            'Nagaland': 0.679,
-                            'Sikkim': 0.716,
-                            'Mizoram': 0.705,
-                            'Arunachal Pradesh': 0.662,
-                            'Jammu and Kashmir': 0.688,
-                            'Chandigarh': 0.775,
-                            'Puducherry': 0.738,
-                            'Andaman and Nicobar Islands': 0.74,
-                            'Lakshadweep': 0.712,
-                            'Dadra and Nagar Haveli and Daman and Diu': 0.663,
-                            'Ladakh': 0.674
-                        }
-                        
-                        # Apply HDI values based on state name
-                        df['HDI'] = df['State'].map(lambda x: hdi_values.get(x, 0.65))  # Default to 0.65 if state not found
-                    
-                    # Add Urbanization column if it doesn't exist
-                    if 'Urbanization (%)' not in df.columns:
-                        # Default urbanization data (approximations)
-                        urbanization_values = {
-                            'Delhi': 97.5,
-                            'Chandigarh': 97.3,
-                            'Goa': 62.2,
-                            'Mizoram': 52.1,
-                            'Tamil Nadu': 48.4,
-                            'Kerala': 47.7,
-                            'Maharashtra': 45.2,
-                            'Gujarat': 42.6,
-                            'Karnataka': 38.6,
-                            'Punjab': 37.5,
-                            'Haryana': 34.8,
-                            'Andhra Pradesh': 29.6,
-                            'West Bengal': 31.9,
-                            'Uttarakhand': 30.6,
-                            'Rajasthan': 24.9,
-                            'Uttar Pradesh': 22.3,
-                            'Jharkhand': 24.1,
-                            'Chhattisgarh': 23.2,
-                            'Madhya Pradesh': 27.6,
-                            'Odisha': 16.7,
-                            'Bihar': 11.3,
-                            'Assam': 14.1,
-                            'Himachal Pradesh': 10.0,
-                            'Jammu and Kashmir': 27.4
-                        }
-                        
-                        # Apply urbanization values based on state name
-                        df['Urbanization (%)'] = df['State'].map(lambda x: urbanization_values.get(x, 30.0))  # Default to 30% if state not found
-                    
-                    # Add other missing columns
-                    required_columns = ['Famous Destinations', 'Major Crops', 'Key Industries']
-                    for col in required_columns:
-                        if col not in df.columns:
-                            df[col] = f"Various {col.lower()}"
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/states.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('state')
+            if df is None:
                 return None
             
-            df = safe_read_csv(file_path)
-            
             # Verify required columns exist
             required_columns = ['State', 'Population (millions)', 'Area (sq km)', 'Literacy Rate (%)', 'Region']
             missing_columns = [col for col in required_columns if col not in df.columns]
@@ -457,81 +516,11 @@ def load_state_data():
             
             # Add HDI column if it doesn't exist
             if 'HDI' not in df.columns:
-                # HDI values by state (approximations based on 2021-22 data)
-                hdi_values = {
-                    'Kerala': 0.782,
-                    'Delhi': 0.746,
-                    'Goa': 0.761,
-                    'Punjab': 0.723,
-                    'Tamil Nadu': 0.708,
-                    'Himachal Pradesh': 0.725,
-                    'Maharashtra': 0.696,
-                    'Karnataka': 0.682,
-                    'Telangana': 0.669,
-                    'Gujarat': 0.672,
-                    'Haryana': 0.708,
-                    'Uttarakhand': 0.684,
-                    'West Bengal': 0.641,
-                    'Andhra Pradesh': 0.649,
-                    'Rajasthan': 0.629,
-                    'Odisha': 0.606,
-                    'Assam': 0.613,
-                    'Jharkhand': 0.599,
-                    'Chhattisgarh': 0.613,
-                    'Madhya Pradesh': 0.603,
-                    'Uttar Pradesh': 0.596,
-                    'Bihar': 0.574,
-                    'Manipur': 0.697,
-                    'Tripura': 0.658,
-                    'Meghalaya': 0.636,
-                    'Nagaland': 0.679,
-                    'Sikkim': 0.716,
-                    'Mizoram': 0.705,
-                    'Arunachal Pradesh': 0.662,
-                    'Jammu and Kashmir': 0.688,
-                    'Chandigarh': 0.775,
-                    'Puducherry': 0.738,
-                    'Andaman and Nicobar Islands': 0.74,
-                    'Lakshadweep': 0.712,
-                    'Dadra and Nagar Haveli and Daman and Diu': 0.663,
-                    'Ladakh': 0.674
-                }
-                
-                # Apply HDI values based on state name
-                df['HDI'] = df['State'].map(lambda x: hdi_values.get(x, 0.65))  # Default to 0.65 if state not found
+                df['HDI'] = df['State'].map(lambda x: STATE_HDI_VALUES.get(x, 0.65))  # Default to 0.65 if state not found
             
             # Add Urbanization column if it doesn't exist
             if 'Urbanization (%)' not in df.columns:
-                # Default urbanization data (approximations)
-                urbanization_values = {
-                    'Delhi': 97.5,
-                    'Chandigarh': 97.3,
-                    'Goa': 62.2,
-                    'Mizoram': 52.1,
-                    'Tamil Nadu': 48.4,
-                    'Kerala': 47.7,
-                    'Maharashtra': 45.2,
-                    'Gujarat': 42.6,
-                    'Karnataka': 38.6,
-                    'Punjab': 37.5,
-                    'Haryana': 34.8,
-                    'Andhra Pradesh': 29.6,
-                    'West Bengal': 31.9,
-                    'Uttarakhand': 30.6,
-                    'Rajasthan': 24.9,
-                    'Uttar Pradesh': 22.3,
-                    'Jharkhand': 24.1,
-                    'Chhattisgarh': 23.2,
-                    'Madhya Pradesh': 27.6,
-                    'Odisha': 16.7,
-                    'Bihar': 11.3,
-                    'Assam': 14.1,
-                    'Himachal Pradesh': 10.0,
-                    'Jammu and Kashmir': 27.4
-                }
-                
-                # Apply urbanization values based on state name
-                df['Urbanization (%)'] = df['State'].map(lambda x: urbanization_values.get(x, 30.0))  # Default to 30% if state not found
+                df['Urbanization (%)'] = df['State'].map(lambda x: STATE_URBANIZATION_VALUES.get(x, 30.0))  # Default to 30% if state not found
                 
             # Add other missing columns
             additional_columns = ['Famous Destinations', 'Major Crops', 'Key Industries']
@@ -543,7 +532,7 @@ def load_state_data():
     except Exception as e:
         st.error(f"Error loading state data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return pd.DataFrame({
+        return fallback_frame(pd.DataFrame({
             'State': ['Kerala', 'Maharashtra', 'Tamil Nadu', 'Uttar Pradesh', 'Bihar'],
             'Population (millions)': [35.1, 112.4, 72.1, 199.8, 104.1],
             'Area (sq km)': [38863, 307713, 130058, 240928, 94163],
@@ -556,71 +545,19 @@ def load_state_data():
             'Famous Destinations': ['Backwaters, Munnar', 'Mumbai, Ajanta Caves', 'Chennai, Madurai', 'Agra, Varanasi', 'Bodh Gaya, Nalanda'],
             'Major Crops': ['Rice, Coconut', 'Cotton, Sugarcane', 'Rice, Sugarcane', 'Wheat, Sugarcane', 'Rice, Wheat'],
             'Key Industries': ['Tourism, IT', 'Manufacturing, Finance', 'Automobiles, Textiles', 'Agriculture, Handicrafts', 'Agriculture, Food processing']
-        })
+        }))
 
-@st.cache_data
+@dataset_handle('cultural')
+@bundled_dataset('cultural')
+@shared_dataset('cultural')
+@with_schema('cultural')
 def load_cultural_data():
     try:
         with st.spinner("Loading cultural data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM CULTURAL_HERITAGE"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Define complete mapping of Snowflake column names to expected app column names
-                    column_mapping = {
-                        'NAME': 'Name',
-                        'CULTURAL_ELEMENT': 'Cultural Element',
-                        'COUNT': 'Count',
-                        'TYPE': 'Type',
-                        'LOCATION': 'Location',
-                        'STATE': 'State',
-                        'UNESCO_STATUS': 'UNESCO Status',
-                        'YEAR_BUILT': 'Year Built',
-                        'DESCRIPTION': 'Description',
-                        'HISTORICAL_PERIOD': 'Historical Period',
-                        'REGION_OF_ORIGIN': 'Region of Origin',
-                        'ASSOCIATED_STATES': 'Associated States',
-                        # Additional fields that might be needed for Cultural Contributions
-                        'CULTURAL_CONTRIBUTIONS': 'Cultural Contributions'
-                    }
-                    
-                    # Create a new DataFrame with properly mapped columns
-                    new_df = pd.DataFrame()
-                    
-                    # For each expected column in the app
-                    for snowflake_col, app_col in column_mapping.items():
-                        # If the column exists in Snowflake result
-                        if snowflake_col in df.columns:
-                            new_df[app_col] = df[snowflake_col]
-                        else:
-                            # Add empty column with appropriate default values based on column name
-                            if app_col == 'UNESCO Status':
-                                new_df[app_col] = 'Not Listed'  # Default value
-                            elif app_col == 'Cultural Contributions':
-                                new_df[app_col] = 'Various cultural contributions'  # Default value
-                            elif app_col == 'Type':
-                                new_df[app_col] = 'Heritage Site'  # Default value
-                            else:
-                                new_df[app_col] = ''  # Empty string for other columns
-                    
-                    # If Name is missing but Cultural Element exists, use Cultural Element as Name
-                    if 'Name' not in new_df.columns and 'Cultural Element' in new_df.columns:
-                        new_df['Name'] = new_df['Cultural Element']
-                    
-                    # Return the properly mapped DataFrame
-                    return new_df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load cultural data from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/cultural_heritage.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('cultural')
+            if df is None:
                 return None
             
-            df = safe_read_csv(file_path)
-            
             # Add the UNESCO Status column if missing
             if 'UNESCO Status' not in df.columns:
                 df['UNESCO Status'] = "Not Listed"  # Default value
@@ -659,62 +596,25 @@ def load_cultural_data():
     except Exception as e:
         st.error(f"Error loading cultural data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return pd.DataFrame({
+        return fallback_frame(pd.DataFrame({
             'Name': ['Taj Mahal', 'Khajuraho Temples'],
             'Type': ['Monument', 'Temple Complex'],
             'UNESCO Status': ['World Heritage Site', 'World Heritage Site'],
             'Description': ['Iconic marble mausoleum', 'Famous temple complex'],
             'Cultural Contributions': ['Mughal architecture', 'Hindu temple art']
-        })
+        }))
 
-@st.cache_data
+@dataset_handle('population')
+@bundled_dataset('population')
+@shared_dataset('population')
+@with_schema('population')
 def load_population_data():
     try:
         with st.spinner("Loading population data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM POPULATION_GROWTH"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Rename columns to match expected format if needed
-                    column_mapping = {
-                        'YEAR': 'Year',
-                        'POPULATION_MILLIONS': 'Population (millions)',
-                        'GROWTH_RATE_PCT': 'Growth Rate (%)',
-                        'URBAN_POPULATION_PCT': 'Urban Population (%)',
-                        'RURAL_POPULATION_PCT': 'Rural Population (%)',
-                        'DENSITY': 'Density',
-                        'MALE_POPULATION_PCT': 'Male Population (%)',
-                        'FEMALE_POPULATION_PCT': 'Female Population (%)',
-                        'AGE_0_14_PCT': 'Age 0-14 (%)',
-                        'AGE_15_64_PCT': 'Age 15-64 (%)',
-                        'AGE_65_PLUS_PCT': 'Age 65+ (%)'
-                    }
-                    
-                    # Only rename columns that exist
-                    rename_cols = {}
-                    for snowflake_col, app_col in column_mapping.items():
-                        if snowflake_col in df.columns:
-                            rename_cols[snowflake_col] = app_col
-                    
-                    if rename_cols:
-                        df = df.rename(columns=rename_cols)
-                    
-                    # Add missing demographic columns
-                    add_demographic_default_columns(df)
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/population_growth.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('population')
+            if df is None:
                 # Return default data instead of None
-                return create_default_population_data()
-            
-            df = safe_read_csv(file_path)
+                return fallback_frame(create_default_population_data())
             
             # Add missing demographic columns
             add_demographic_default_columns(df)
@@ -722,7 +622,7 @@ def load_population_data():
             return df
     except Exception as e:
         st.error(f"Error loading population data: {e}")
-        return create_default_population_data()
+        return fallback_frame(create_default_population_data())
 
 # Helper function to add default demographic columns
 def add_demographic_default_columns(df):
@@ -770,79 +670,16 @@ def create_default_population_data():
         'Age 65+ (%)': [4.0, 4.0, 4.0, 4.0, 4.2, 4.7, 5.8, 6.8]
     })
 
-@st.cache_data
+@dataset_handle('economic')
+@bundled_dataset('economic')
+@shared_dataset('economic')
+@with_schema('economic')
 def load_economic_data():
     try:
         with st.spinner("Loading economic data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM ECONOMIC_DATA"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Use consistent column mapping
-                    df = map_columns(df, 'economic', 'snowflake_to_app')
-                    
-                    # Add missing columns if needed
-                    if 'Year' not in df.columns:
-                        # This shouldn't happen, but just in case
-                        df['Year'] = range(1951, 1951 + len(df))
-                    
-                    # Add missing required columns with default values
-                    required_columns = [
-                        'GDP (billion USD)', 'GDP Growth Rate (%)', 'Per Capita Income (USD)',
-                        'Agriculture', 'Industry', 'Services'
-                    ]
-                    
-                    for column in required_columns:
-                        if column not in df.columns:
-                            if column == 'GDP (billion USD)':
-                                # Generate reasonable GDP values
-                                df[column] = [
-                                    100 + (i * 150) for i in range(len(df))
-                                ]
-                            elif column == 'GDP Growth Rate (%)':
-                                # Generate reasonable growth rates
-                                df[column] = [4.0 + (i % 3) for i in range(len(df))]
-                            elif column == 'Per Capita Income (USD)':
-                                # Generate reasonable per capita income
-                                df[column] = [
-                                    500 + (i * 100) for i in range(len(df))
-                                ]
-                            elif column in ['Agriculture', 'Industry', 'Services']:
-                                # Generate reasonable sector percentages
-                                if column == 'Agriculture':
-                                    df[column] = [
-                                        max(10, 50 - (i * 0.5)) for i in range(len(df))
-                                    ]
-                                elif column == 'Industry':
-                                    df[column] = [
-                                        min(40, 20 + (i * 0.2)) for i in range(len(df))
-                                    ]
-                                elif column == 'Services':
-                                    df[column] = [
-                                        min(70, 30 + (i * 0.5)) for i in range(len(df))
-                                    ]
-                    
-                    # Convert string values to appropriate numeric types
-                    numeric_columns = ['GDP (billion USD)', 'GDP Growth Rate (%)', 'Per Capita Income (USD)',
-                                       'Agriculture', 'Industry', 'Services']
-                    for col in numeric_columns:
-                        if col in df.columns:
-                            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                    
-                    # Sort by year for consistent visualization
-                    df = df.sort_values('Year')
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/economic_data.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
-                return create_default_economic_data()
-            
-            df = safe_read_csv(file_path)
+            df = read_dataset_source('economic')
+            if df is None:
+                return fallback_frame(create_default_economic_data())
             
             # Check for required columns
             required_columns = [
@@ -901,7 +738,7 @@ def load_economic_data():
     except Exception as e:
         st.error(f"Error loading economic data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return create_default_economic_data()
+        return fallback_frame(create_default_economic_data())
 
 # Helper function to create default economic data
 def create_default_economic_data():
@@ -921,62 +758,16 @@ def create_default_economic_data():
         'Unemployment Rate (%)': [7.5, 6.8, 6.2, 5.8, 5.2, 5.7, 6.1, 7.5]
     })
 
-@st.cache_data
+@dataset_handle('historical')
+@bundled_dataset('historical')
+@shared_dataset('historical')
+@with_schema('historical')
 def load_historical_data():
     try:
         with st.spinner("Loading historical timeline data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM HISTORICAL_TIMELINE"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Use consistent column mapping
-                    df = map_columns(df, 'historical', 'snowflake_to_app')
-                    
-                    # Generate Time Period if missing
-                    if 'Time Period' not in df.columns:
-                        if 'Start Year' in df.columns and 'End Year' in df.columns:
-                            # Create Time Period from Start Year and End Year - handle NaN values
-                            df['Start Year'] = pd.to_numeric(df['Start Year'], errors='coerce').fillna(0).astype(int)
-                            df['End Year'] = pd.to_numeric(df['End Year'], errors='coerce').fillna(0).astype(int)
-                            
-                            df['Time Period'] = df.apply(lambda x: 
-                                f"{abs(x['Start Year'])} BCE - {abs(x['End Year'])} BCE" if x['Start Year'] < 0 and x['End Year'] < 0 else
-                                f"{abs(x['Start Year'])} BCE - {x['End Year']} CE" if x['Start Year'] < 0 and x['End Year'] >= 0 else
-                                f"{x['Start Year']} - {x['End Year']} CE", axis=1)
-                        elif 'Period' in df.columns:
-                            # Try to extract years from Period column
-                            df['Time Period'] = df['Period']
-                        else:
-                            # Generate default time periods
-                            df['Time Period'] = [f"Period {i+1}" for i in range(len(df))]
-                    
-                    # Add missing columns with default values
-                    if 'Era' not in df.columns:
-                        df['Era'] = df['Time Period'].apply(lambda x: x.split("-")[0].strip())
-                    
-                    # Ensure Start Year and End Year are numeric
-                    if 'Start Year' in df.columns:
-                        df['Start Year'] = pd.to_numeric(df['Start Year'], errors='coerce').fillna(0).astype(int)
-                    else:
-                        df['Start Year'] = 0
-                        
-                    if 'End Year' in df.columns:
-                        df['End Year'] = pd.to_numeric(df['End Year'], errors='coerce').fillna(0).astype(int)
-                    else:
-                        df['End Year'] = 0
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/historical_timeline.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
-                return create_default_historical_data()
-            
-            df = safe_read_csv(file_path)
+            df = read_dataset_source('historical')
+            if df is None:
+                return fallback_frame(create_default_historical_data())
             
             # Check for required columns
             if 'Time Period' not in df.columns:
@@ -1015,7 +806,7 @@ def load_historical_data():
     except Exception as e:
         st.error(f"Error loading historical data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return create_default_historical_data()
+        return fallback_frame(create_default_historical_data())
 
 # Helper function to create default historical data
 def create_default_historical_data():
@@ -1029,67 +820,16 @@ def create_default_historical_data():
         'End Year': [-1900, -500, -185, 550, 1526]
     })
 
-@st.cache_data
+@dataset_handle('festivals')
+@bundled_dataset('festivals')
+@shared_dataset('festivals')
+@with_schema('festivals')
 def load_festivals_data():
     try:
         with st.spinner("Loading festivals data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM FESTIVALS"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Use consistent column mapping
-                    df = map_columns(df, 'festivals', 'snowflake_to_app')
-                    
-                    # Add missing columns with default values
-                    if 'Religion/Type' not in df.columns:
-                        df['Religion/Type'] = 'Cultural'  # Default value
-                        
-                    if 'Primary States' not in df.columns:
-                        df['Primary States'] = 'All India'  # Default value
-                        
-                    if 'Participants (millions)' not in df.columns:
-                        df['Participants (millions)'] = 5.0  # Default value
-                        
-                    if 'Economic Impact (Millions USD)' not in df.columns:
-                        df['Economic Impact (Millions USD)'] = 250.0  # Default value
-                        
-                    if 'Tourist Attraction Level' not in df.columns:
-                        df['Tourist Attraction Level'] = 'Medium'  # Default value
-                        
-                    if 'Environmental Impact' not in df.columns:
-                        df['Environmental Impact'] = 'Moderate'  # Default value
-                        
-                    if 'Duration (days)' not in df.columns:
-                        df['Duration (days)'] = 1  # Default value
-                        
-                    if 'Global Celebrations' not in df.columns:
-                        df['Global Celebrations'] = '10+ countries'  # Default value
-                        
-                    if 'Season' not in df.columns:
-                        df['Season'] = 'Year-round'  # Default value
-                    
-                    # Convert numeric columns to appropriate types
-                    if 'Participants (millions)' in df.columns:
-                        df['Participants (millions)'] = pd.to_numeric(df['Participants (millions)'], errors='coerce').fillna(5.0)
-                        
-                    if 'Economic Impact (Millions USD)' in df.columns:
-                        df['Economic Impact (Millions USD)'] = pd.to_numeric(df['Economic Impact (Millions USD)'], errors='coerce').fillna(250.0)
-                        
-                    if 'Duration (days)' in df.columns:
-                        df['Duration (days)'] = pd.to_numeric(df['Duration (days)'], errors='coerce').fillna(1).astype(int)
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load festivals data from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/festivals.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
-                return create_default_festivals_data()
-            
-            df = safe_read_csv(file_path)
+            df = read_dataset_source('festivals')
+            if df is None:
+                return fallback_frame(create_default_festivals_data())
             
             # Verify required columns exist
             required_columns = ['Festival', 'Religion/Type', 'Description']
@@ -1108,13 +848,14 @@ def load_festivals_data():
                         df[col] = 'No description available'  # Default value
             
             # Add additional required columns if missing
+            if 'Primary States' not in df.columns:
+                df['Primary States'] = 'All India'  # Default value
+                
             if 'Participants (millions)' not in df.columns:
                 df['Participants (millions)'] = 5.0  # Default value
                 
-            if 'Economic Impact (Millions USD)' not in df.columns and 'Economic Impact (USD millions)' not in df.columns:
+            if 'Economic Impact (Millions USD)' not in df.columns:
                 df['Economic Impact (Millions USD)'] = 250.0  # Default value
-            elif 'Economic Impact (USD millions)' in df.columns and 'Economic Impact (Millions USD)' not in df.columns:
-                df['Economic Impact (Millions USD)'] = df['Economic Impact (USD millions)']
                 
             if 'Tourist Attraction Level' not in df.columns:
                 df['Tourist Attraction Level'] = 'Medium'  # Default value
@@ -1145,7 +886,7 @@ def load_festivals_data():
     except Exception as e:
         st.error(f"Error loading festivals data: {e}")
         # Return minimal valid dataframe to prevent app crashes
-        return create_default_festivals_data()
+        return fallback_frame(create_default_festivals_data())
 
 # Create default festivals data function
 def create_default_festivals_data():
@@ -1163,72 +904,17 @@ def create_default_festivals_data():
         'Global Celebrations': ['30+ countries', '20+ countries', '50+ countries', '100+ countries', '10+ countries']
     })
 
-@st.cache_data
+@dataset_handle('tourism')
+@bundled_dataset('tourism')
+@shared_dataset('tourism')
+@with_schema('tourism')
 def load_tourism_data():
     try:
         with st.spinner("Loading tourism data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM TOURISM"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Rename columns to match expected format if needed
-                    column_mapping = {
-                        'DESTINATION': 'Destination',
-                        'STATE': 'State',
-                        'TYPE': 'Type',
-                        'TOURISM_TYPE': 'Tourism Type',
-                        'VISITORS_ANNUAL': 'Annual Visitors (millions)',
-                        'VISITORS_MILLIONS': 'Visitors (millions)',
-                        'BEST_TIME': 'Best Time',
-                        'BEST_SEASON': 'Peak Season',
-                        'PEAK_SEASON': 'Peak Season',
-                        'DESCRIPTION': 'Description',
-                        'UNESCO_STATUS': 'UNESCO Status',
-                        'YEAR_ESTABLISHED': 'Year Established',
-                        'ENTRY_FEE_INR': 'Entry Fee (INR)'
-                    }
-                    
-                    # Only rename columns that exist
-                    rename_cols = {}
-                    for snowflake_col, app_col in column_mapping.items():
-                        if snowflake_col in df.columns:
-                            rename_cols[snowflake_col] = app_col
-                    
-                    if rename_cols:
-                        df = df.rename(columns=rename_cols)
-                    
-                    # Add any missing columns with default values
-                    if 'UNESCO Status' not in df.columns:
-                        df['UNESCO Status'] = 'Not Listed'
-                        # Set some popular destinations as World Heritage Sites
-                        world_heritage_sites = ['Taj Mahal', 'Qutub Minar', 'Red Fort', 'Ajanta Caves', 'Ellora Caves', 
-                                               'Khajuraho', 'Hampi', 'Mahabodhi Temple', 'Sun Temple Konark', 'Fatehpur Sikri']
-                        df.loc[df['Destination'].isin(world_heritage_sites), 'UNESCO Status'] = 'World Heritage Site'
-                    
-                    if 'Peak Season' not in df.columns and 'Best Time' in df.columns:
-                        df['Peak Season'] = df['Best Time']
-                    elif 'Peak Season' not in df.columns:
-                        df['Peak Season'] = 'October-March'
-                    
-                    if 'Year Established' not in df.columns:
-                        df['Year Established'] = 1900  # Default value
-                        
-                    if 'Entry Fee (INR)' not in df.columns:
-                        df['Entry Fee (INR)'] = 50  # Default value
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/tourism.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('tourism')
+            if df is None:
                 # Return default data instead of None
-                return create_default_tourism_data()
-            
-            df = safe_read_csv(file_path)
+                return fallback_frame(create_default_tourism_data())
             
             # Add any missing columns with default values
             if 'UNESCO Status' not in df.columns:
@@ -1265,7 +951,7 @@ def load_tourism_data():
             return df
     except Exception as e:
         st.error(f"Error loading tourism data: {e}")
-        return create_default_tourism_data()
+        return fallback_frame(create_default_tourism_data())
 
 # Helper function to create default tourism data
 def create_default_tourism_data():
@@ -1289,47 +975,17 @@ def create_default_tourism_data():
         ]
     })
 
-@st.cache_data
+@dataset_handle('education')
+@bundled_dataset('education')
+@shared_dataset('education')
+@with_schema('education')
 def load_education_data():
     try:
         with st.spinner("Loading education data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM EDUCATION"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Use consistent column mapping
-                    df = map_columns(df, 'education', 'snowflake_to_app')
-                    
-                    # Add missing columns with default values
-                    df = add_education_default_columns(df)
-                    
-                    # Convert string values to appropriate numeric types
-                    numeric_columns = [
-                        'National Literacy Rate (%)', 'Primary Enrollment Rate (%)',
-                        'Male Literacy (%)', 'Female Literacy (%)', 'Literacy Gap',
-                        'Number of Primary Schools', 'Number of Secondary Schools',
-                        'Number of Colleges', 'Number of Universities',
-                        'Number of Technical Institutions', 'Higher Education Enrollment (millions)',
-                        'Gender Parity Primary', 'Gender Parity Secondary', 'Gender Parity Higher Ed'
-                    ]
-                    
-                    for col in numeric_columns:
-                        if col in df.columns and not pd.api.types.is_numeric_dtype(df[col]):
-                            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
-            
-            # Fall back to local file if Snowflake fails
-            file_path = "data/education.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
+            df = read_dataset_source('education')
+            if df is None:
                 # Return default data instead of None
-                return create_default_education_data()
-            
-            df = safe_read_csv(file_path)
+                return fallback_frame(create_default_education_data())
             
             # Add missing columns with default values
             df = add_education_default_columns(df)
@@ -1351,7 +1007,12 @@ def load_education_data():
             return df
     except Exception as e:
         st.error(f"Error loading education data: {e}")
-        return create_default_education_data()
+        return fallback_frame(create_default_education_data())
+
+# Helper function to fit a list of default values to the rows of a dataframe
+def fit_to_rows(values, df, fill=None):
+    """Truncate the values to the length of df, or pad them with fill"""
+    return (list(values) + [fill] * len(df))[:len(df)]
 
 # Helper function to add default education columns
 def add_education_default_columns(df):
@@ -1378,17 +1039,17 @@ def add_education_default_columns(df):
         df['State Higher Ed Enrollment (%)'] = '32.4, 30.5, 31.2, 29.8, 28.7, 27.9, 25.2, 28.6, 26.4, 25.8'
     
     if 'Male Literacy (%)' not in df.columns:
-        df['Male Literacy (%)'] = [94.0, 93.7, 92.5, 90.0, 89.8, 89.1, 89.0, 84.6, 82.8, 81.3]
+        df['Male Literacy (%)'] = fit_to_rows([94.0, 93.7, 92.5, 90.0, 89.8, 89.1, 89.0, 84.6, 82.8, 81.3], df)
     
     if 'Female Literacy (%)' not in df.columns:
-        df['Female Literacy (%)'] = [92.0, 82.4, 83.9, 76.5, 77.4, 76.8, 70.7, 76.0, 72.0, 67.4]
+        df['Female Literacy (%)'] = fit_to_rows([92.0, 82.4, 83.9, 76.5, 77.4, 76.8, 70.7, 76.0, 72.0, 67.4], df)
     
     if 'Literacy Gap' not in df.columns:
         # Calculate gap if both male and female literacy are available
         if all(col in df.columns for col in ['Male Literacy (%)', 'Female Literacy (%)']):
             df['Literacy Gap'] = df['Male Literacy (%)'] - df['Female Literacy (%)']
         else:
-            df['Literacy Gap'] = [2.0, 11.3, 8.6, 13.5, 12.4, 12.3, 18.3, 8.6, 10.8, 13.9]
+            df['Literacy Gap'] = fit_to_rows([2.0, 11.3, 8.6, 13.5, 12.4, 12.3, 18.3, 8.6, 10.8, 13.9], df)
     
     if 'Number of Primary Schools' not in df.columns:
         df['Number of Primary Schools'] = 1500000  # Approximate value
@@ -1409,15 +1070,15 @@ def add_education_default_columns(df):
         df['Higher Education Enrollment (millions)'] = 38.5  # Approximate value
     
     if 'PISA Score' not in df.columns:
-        df['PISA Score'] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]  # India doesn't participate in PISA regularly
+        df['PISA Score'] = 0  # India doesn't participate in PISA regularly
     
     if 'Global Rank' not in df.columns:
-        df['Global Rank'] = [0, 0, 0, 0, 0, 0, 0, 0, 0, 0]  # Placeholder ranks
+        df['Global Rank'] = 0  # Placeholder ranks
     
     if 'University Ranking' not in df.columns:
-        df['University Ranking'] = ['IIT Delhi (150-200)', 'IIT Bombay (150-200)', 'IISc Bangalore (200-250)', 
+        df['University Ranking'] = fit_to_rows(['IIT Delhi (150-200)', 'IIT Bombay (150-200)', 'IISc Bangalore (200-250)', 
                                    'IIT Madras (250-300)', 'IIT Kharagpur (300-350)', 'Delhi University (500-550)',
-                                   'JNU (550-600)', 'IIT Roorkee (600-650)', 'IIT Guwahati (700-750)', 'BHU (800-850)']
+                                   'JNU (550-600)', 'IIT Roorkee (600-650)', 'IIT Guwahati (700-750)', 'BHU (800-850)'], df, fill='')
     
     if 'Teacher-Student Ratio Primary' not in df.columns:
         df['Teacher-Student Ratio Primary'] = '1:30'
@@ -1487,80 +1148,44 @@ def create_default_education_data():
     # Add other required columns
     return add_education_default_columns(df)
 
-@st.cache_data
+@dataset_handle('geography')
+@bundled_dataset('geography')
+@shared_dataset('geography')
+@with_schema('geography')
 def load_geography_data():
+    # Default terrain breakdown used when the terrain columns are unavailable
+    terrain_data = {
+        'Terrain_Type': ['Mountains', 'Plains', 'Plateaus', 'Deserts', 'Coastal', 'Forest'],
+        'Percentage': [20.5, 43.3, 27.7, 4.6, 3.1, 0.8]
+    }
     try:
         with st.spinner("Loading geography data..."):
-            # Try to load from Snowflake first
-            try:
-                query = "SELECT * FROM GEOGRAPHY"
-                df = query_snowflake(query)
-                if df is not None and not df.empty:
-                    # Rename columns to match expected format if needed
-                    column_mapping = {
-                        'REGION': 'Region',
-                        'AREA_KM2': 'Area (km²)',
-                        'CLIMATE': 'Climate',
-                        'MAJOR_RIVERS': 'Major Rivers',
-                        'MAJOR_MOUNTAINS': 'Major Mountains',
-                        'BIODIVERSITY': 'Biodiversity',
-                        'TERRAIN_TYPE': 'Terrain_Type',
-                        'PERCENTAGE': 'Percentage'
-                    }
-                    
-                    # Only rename columns that exist
-                    rename_cols = {}
-                    for snowflake_col, app_col in column_mapping.items():
-                        if snowflake_col in df.columns:
-                            rename_cols[snowflake_col] = app_col
-                    
-                    if rename_cols:
-                        df = df.rename(columns=rename_cols)
-                    
-                    # Add missing columns if they don't exist
-                    if 'Terrain_Type' not in df.columns:
-                        # Create terrain data
-                        terrain_data = {
-                            'Terrain_Type': ['Mountains', 'Plains', 'Plateaus', 'Deserts', 'Coastal', 'Forest'],
-                            'Percentage': [20.5, 43.3, 27.7, 4.6, 3.1, 0.8]
-                        }
-                        return pd.DataFrame(terrain_data)
-                    
-                    return df
-            except Exception as snowflake_error:
-                st.warning(f"Could not load from Snowflake: {snowflake_error}. Falling back to local file.")
+            df = read_dataset_source('geography')
             
-            # Fall back to local file if Snowflake fails
-            file_path = "data/geography.csv"
-            if not os.path.exists(file_path):
-                st.error(f"File not found: {file_path}")
-                # Return default geography data instead of None to prevent app crashes
-                terrain_data = {
-                    'Terrain_Type': ['Mountains', 'Plains', 'Plateaus', 'Deserts', 'Coastal', 'Forest'],
-                    'Percentage': [20.5, 43.3, 27.7, 4.6, 3.1, 0.8]
-                }
-                return pd.DataFrame(terrain_data)
-            
-            df = safe_read_csv(file_path)
-            
-            # If we have geography.csv but not the terrain data needed
-            if 'Terrain_Type' not in df.columns:
-                # Create terrain data
-                terrain_data = {
-                    'Terrain_Type': ['Mountains', 'Plains', 'Plateaus', 'Deserts', 'Coastal', 'Forest'],
-                    'Percentage': [20.5, 43.3, 27.7, 4.6, 3.1, 0.8]
-                }
-                return pd.DataFrame(terrain_data)
+            # If we have geography data but not the terrain data needed
+            if df is None or 'Terrain_Type' not in df.columns:
+                return fallback_frame(pd.DataFrame(terrain_data))
             
             return df
     except Exception as e:
         st.error(f"Error loading geography data: {e}")
         # Return default geography data
-        terrain_data = {
-            'Terrain_Type': ['Mountains', 'Plains', 'Plateaus', 'Deserts', 'Coastal', 'Forest'],
-            'Percentage': [20.5, 43.3, 27.7, 4.6, 3.1, 0.8]
-        }
-        return pd.DataFrame(terrain_data)
+        return fallback_frame(pd.DataFrame(terrain_data))
+
+# Loader of every dataset, keyed by dataset name
+DATASET_LOADERS = {
+    'linguistic': load_linguistic_data,
+    'religious': load_religious_data,
+    'state': load_state_data,
+    'cultural': load_cultural_data,
+    'population': load_population_data,
+    'economic': load_economic_data,
+    'historical': load_historical_data,
+    'festivals': load_festivals_data,
+    'tourism': load_tourism_data,
+    'education': load_education_data,
+    'geography': load_geography_data
+}
 
 # Helper function to get a color palette
 def get_color_palette(n, palette_type="qualitative"):
@@ -1575,157 +1200,22 @@ def get_color_palette(n, palette_type="qualitative"):
     else:
         return px.colors.sequential.Viridis[:n] 
 
-# Column mapping dictionaries for consistent naming
-# These dictionaries map between Snowflake column names (keys) and application column names (values)
-COLUMN_MAPPINGS = {
-    # Economic data column mapping
-    'economic': {
-        'YEAR': 'Year',
-        'GDP_BILLION_USD': 'GDP (billion USD)',
-        'GDP_GROWTH_RATE_PCT': 'GDP Growth Rate (%)',
-        'GDP_GROWTH_RATE_PERCENT': 'GDP Growth Rate (%)',
-        'PER_CAPITA_INCOME_USD': 'Per Capita Income (USD)',
-        'AGRICULTURE': 'Agriculture',
-        'INDUSTRY': 'Industry',
-        'SERVICES': 'Services',
-        'EXPORTS_BILLION_USD': 'Exports (billion USD)',
-        'EXPORTS_USD_BILLIONS': 'Exports (billion USD)',
-        'IMPORTS_BILLION_USD': 'Imports (billion USD)',
-        'IMPORTS_USD_BILLIONS': 'Imports (billion USD)',
-        'UNEMPLOYMENT_RATE_PCT': 'Unemployment Rate (%)',
-        'UNEMPLOYMENT_RATE_PERCENT': 'Unemployment Rate (%)'
-    },
-    
-    # Education data column mapping
-    'education': {
-        'LEVEL': 'Level',
-        'ENROLLMENT_MILLIONS': 'Enrollment (millions)',
-        'MALE_PCT': 'Male (%)',
-        'FEMALE_PCT': 'Female (%)',
-        'LITERACY_RATE_PCT': 'Literacy Rate (%)',
-        'NATIONAL_LITERACY_RATE_PCT': 'National Literacy Rate (%)',
-        'PRIMARY_ENROLLMENT_RATE_PCT': 'Primary Enrollment Rate (%)',
-        'INSTITUTIONS': 'Institutions',
-        'STATE_NAMES': 'State Names',
-        'STATE_LITERACY_RATES_PCT': 'State Literacy Rates (%)',
-        'STATE_PRIMARY_ENROLLMENT_PCT': 'State Primary Enrollment (%)',
-        'STATE_SECONDARY_ENROLLMENT_PCT': 'State Secondary Enrollment (%)',
-        'STATE_HIGHER_ED_ENROLLMENT_PCT': 'State Higher Ed Enrollment (%)',
-        'MALE_LITERACY_PCT': 'Male Literacy (%)',
-        'FEMALE_LITERACY_PCT': 'Female Literacy (%)',
-        'LITERACY_GAP': 'Literacy Gap',
-        'NUMBER_OF_PRIMARY_SCHOOLS': 'Number of Primary Schools',
-        'NUMBER_OF_SECONDARY_SCHOOLS': 'Number of Secondary Schools',
-        'NUMBER_OF_COLLEGES': 'Number of Colleges',
-        'NUMBER_OF_UNIVERSITIES': 'Number of Universities',
-        'NUMBER_OF_TECHNICAL_INSTITUTIONS': 'Number of Technical Institutions',
-        'HIGHER_EDUCATION_ENROLLMENT_MILLIONS': 'Higher Education Enrollment (millions)',
-        'PISA_SCORE': 'PISA Score',
-        'GLOBAL_RANK': 'Global Rank',
-        'UNIVERSITY_RANKING': 'University Ranking',
-        'TEACHER_STUDENT_RATIO_PRIMARY': 'Teacher-Student Ratio Primary',
-        'TEACHER_STUDENT_RATIO_SECONDARY': 'Teacher-Student Ratio Secondary',
-        'TEACHER_STUDENT_RATIO_HIGHER_ED': 'Teacher-Student Ratio Higher Ed',
-        'GENDER_PARITY_PRIMARY': 'Gender Parity Primary',
-        'GENDER_PARITY_SECONDARY': 'Gender Parity Secondary',
-        'GENDER_PARITY_HIGHER_ED': 'Gender Parity Higher Ed',
-        'LITERACY_RATE_YEARS': 'Literacy Rate Years',
-        'LITERACY_RATE_HISTORY': 'Literacy Rate History'
-    },
-    
-    # Historical timeline data column mapping
-    'historical': {
-        'PERIOD': 'Period',
-        'START_YEAR': 'Start Year',
-        'END_YEAR': 'End Year',
-        'ERA': 'Era',
-        'MAJOR_EVENTS': 'Major Events',
-        'SIGNIFICANCE': 'Significance',
-        'TIME_PERIOD': 'Time Period',
-        'CULTURAL_DEVELOPMENTS': 'Cultural Developments',
-        'RELIGIOUS_TRENDS': 'Religious Trends',
-        'ART_ARCHITECTURE': 'Art & Architecture',
-        'ECONOMIC_SYSTEMS': 'Economic Systems',
-        'SCIENTIFIC_ADVANCES': 'Scientific Advances',
-        'HISTORICAL_LEGACY': 'Historical Legacy'
-    },
-    
-    # Festival data column mapping
-    'festivals': {
-        'FESTIVAL': 'Festival',
-        'RELIGION_TYPE': 'Religion/Type',
-        'PRIMARY_STATES': 'Primary States',
-        'MONTH': 'Month',
-        'SEASON': 'Season',
-        'DESCRIPTION': 'Description',
-        'CULTURAL_SIGNIFICANCE': 'Cultural Significance',
-        'REGIONAL_VARIATIONS': 'Regional Variations',
-        'GLOBAL_CELEBRATIONS': 'Global Celebrations',
-        'PARTICIPANTS_MILLIONS': 'Participants (millions)',
-        'ECONOMIC_IMPACT_MILLIONS_USD': 'Economic Impact (Millions USD)',
-        'TOURIST_ATTRACTION_LEVEL': 'Tourist Attraction Level',
-        'ENVIRONMENTAL_IMPACT': 'Environmental Impact',
-        'DURATION_DAYS': 'Duration (days)'
-    },
-    
-    # State data column mapping
-    'states': {
-        'STATE': 'State',
-        'POPULATION_MILLIONS': 'Population (millions)',
-        'AREA_SQ_KM': 'Area (sq km)',
-        'LITERACY_RATE_PCT': 'Literacy Rate (%)',
-        'REGION': 'Region',
-        'CAPITAL': 'Capital',
-        'OFFICIAL_LANGUAGES': 'Official Languages',
-        'MAJOR_INDUSTRIES': 'Major Industries',
-        'GDP_BILLION_USD': 'GDP (billion USD)',
-        'HDI': 'HDI',
-        'URBANIZATION_PCT': 'Urbanization (%)',
-        'FAMOUS_DESTINATIONS': 'Famous Destinations',
-        'MAJOR_CROPS': 'Major Crops',
-        'KEY_INDUSTRIES': 'Key Industries'
-    }
-}
-
 # Utility function for standardized column mapping
 def map_columns(df, data_type, direction='snowflake_to_app'):
     """
     Map column names between Snowflake and application formats
     
+    Uses the rename tables compiled once in modules/column_schema.py, so each
+    call is a single rename over the DataFrame's columns.
+    
     Args:
         df (DataFrame): The dataframe to map columns for
-        data_type (str): Type of data ('economic', 'education', 'historical', etc.)
+        data_type (str): Dataset key ('economic', 'education', 'historical', etc.)
         direction (str): Direction of mapping ('snowflake_to_app' or 'app_to_snowflake')
         
     Returns:
         DataFrame: DataFrame with mapped column names
     """
-    if data_type not in COLUMN_MAPPINGS:
-        return df  # No mapping available for this data type
-    
-    # Get mapping dictionary for this data type
-    mapping = COLUMN_MAPPINGS[data_type]
-    
     if direction == 'snowflake_to_app':
-        # Convert from Snowflake column names to application column names
-        rename_cols = {}
-        for snowflake_col, app_col in mapping.items():
-            if snowflake_col in df.columns:
-                rename_cols[snowflake_col] = app_col
-        
-        if rename_cols:
-            df = df.rename(columns=rename_cols)
-    else:
-        # Convert from application column names to Snowflake column names
-        # Create reverse mapping
-        reverse_mapping = {v: k for k, v in mapping.items()}
-        
-        rename_cols = {}
-        for app_col, snowflake_col in reverse_mapping.items():
-            if app_col in df.columns:
-                rename_cols[app_col] = snowflake_col
-        
-        if rename_cols:
-            df = df.rename(columns=rename_cols)
-    
-    return df
\ No newline at end of file
+        return to_app_columns(df, data_type)
+    return to_snowflake_columns(df, data_type)
@@ -0,0 +1,219 @@
+import streamlit as st
+import os
+import json
+import time
+import logging
+import threading
+import importlib
+from pathlib import Path
+from modules.config import WARMUP_STATUS_PATH, WARMUP_ON_FIRST_SESSION
+from modules.snowflake_connector import use_data_source, warehouse_enabled
+
+# Logger of Streamlit's "missing ScriptRunContext" warnings, expected while warming outside a session
+SCRIPT_CONTEXT_LOGGER = "streamlit.runtime.scriptrunner_utils.script_run_context"
+
+# SVGs embedded by the layout on every page
+WARMUP_SVGS = ["data/images/tajmahal.svg", "data/images/flambeau.svg"]
+
+# Readiness of this process, shared by every session
+_status = {'ready': False, 'finished': False, 'running': False, 'started_at': None, 'finished_at': None, 'failed': [], 'steps': {}}
+_status_lock = threading.Lock()
+
+# Whether the first session of this process starts the warm-up (see start_warmup())
+_first_session_warmup = WARMUP_ON_FIRST_SESSION
+
+# Log filter hiding the warnings of the thread running the warm-up
+class _ThreadFilter(logging.Filter):
+    """Drop records logged by one thread"""
+
+    def __init__(self, thread_name):
+        super().__init__()
+        self.thread_name = thread_name
+
+    def filter(self, record):
+        return record.threadName != self.thread_name
+
+# Function to get the status file of the server running in this process
+def warmup_status_path():
+    """Return WARMUP_STATUS_PATH for the port this process serves on"""
+    return Path(WARMUP_STATUS_PATH.format(port=st.get_option("server.port")))
+
+# Function to write the status where health checks can read it (served at /app/static/warmup-<port>.json)
+def publish_warmup_status():
+    """
+    Write the current status to warmup_status_path(), replacing the one of an earlier server on that port
+
+    Only a process that serves the app publishes its status, so warm-ups run from
+    the command line, tests and benchmarks never overwrite the one of a server.
+    """
+    from streamlit import runtime
+
+    # AppTest (tests, load tests) runs the app on a mock runtime that serves nothing
+    if not runtime.exists() or type(runtime.get_instance()) is not runtime.Runtime:
+        return
+    with _status_lock:
+        status = dict(_status, pid=os.getpid(), port=st.get_option("server.port"))
+    try:
+        path = warmup_status_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(status, indent=2), encoding='utf-8')
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"Could not write the warm-up status: {str(e)}")
+
+# Function to open the warehouse connection
+def _warm_connection():
+    from modules.snowflake_connector import get_backend
+
+    backend = get_backend()
+    if not backend.is_configured():
+        return f"{backend.name} backend not configured, local files are used"
+    # Creates the cached session (or the local database) and checks it answers
+    backend.query("SELECT 1")
+    return f"{backend.name} backend connected"
+
+# Function to import every chapter module
+def _warm_chapters():
+    router = importlib.import_module("modules.router")
+    return f"{len(router.CHAPTER_MAPPING)} chapters imported"
+
+# Function to load every dataset into the shared cache
+def _warm_datasets():
+    from modules.utils import DATASET_LOADERS, preload_dataset_refs
+
+    failed = []
+    for dataset in DATASET_LOADERS:
+        try:
+            preload_dataset_refs([dataset])
+        except Exception as e:
+            failed.append(f"{dataset} ({str(e)})")
+    if failed:
+        raise RuntimeError(f"Could not load {', '.join(failed)}")
+    return f"{len(DATASET_LOADERS)} datasets loaded"
+
+# Function to build the derived tables and indexes
+def _warm_marts():
+    from modules.marts import get_population_mart, get_tourism_mart, get_state_mart
+    from modules.chapters.historical_timeline import get_timeline_index
+    from modules.chapters.cultural_heritage import get_heritage_sites_frame
+
+    get_population_mart()
+    get_tourism_mart()
+    get_state_mart()
+    get_timeline_index()
+    get_heritage_sites_frame()
+    return "population, tourism and state marts, timeline index and heritage sites built"
+
+# Function to encode the images embedded in every page
+def _warm_assets():
+    from modules.utils import load_svg_as_base64
+
+    encoded = [path for path in WARMUP_SVGS if load_svg_as_base64(path)]
+    return f"{len(encoded)} of {len(WARMUP_SVGS)} SVGs encoded"
+
+# Function to render the figures that are cached across sessions
+def _warm_figures():
+    from modules.marts import get_population_mart
+    from modules.mpl_render import render_figure
+    from modules.chapters.introduction import build_population_growth_figure
+
+    df_population = get_population_mart()
+    if df_population is not None and not df_population.empty:
+        render_figure("population_growth", build_population_growth_figure, df_population)
+    return "population chart rendered"
+
+# Steps of the warm-up, in order
+WARMUP_STEPS = [
+    ("connection", _warm_connection),
+    ("chapters", _warm_chapters),
+    ("datasets", _warm_datasets),
+    ("marts", _warm_marts),
+    ("assets", _warm_assets),
+    ("figures", _warm_figures)
+]
+
+# Function to warm every process-wide cache
+def run_warmup():
+    """
+    Pay the cold costs of the app before the first visitor does
+
+    Opens the warehouse connection, imports the chapters, loads every dataset
+    and builds the derived tables, embedded images and shared figures. Data
+    is read from the warehouse only when its backend is configured. A
+    failing step is recorded and the remaining steps still run. The process
+    is marked finished when all steps have run, and ready only when none of
+    them failed.
+
+    Returns:
+        dict: The warm-up status (see get_warmup_status())
+    """
+    with _status_lock:
+        if _status['running']:
+            return dict(_status)
+        _status.update(ready=False, finished=False, running=True, started_at=time.time(), finished_at=None, failed=[], steps={})
+    publish_warmup_status()
+
+    context_logger = logging.getLogger(SCRIPT_CONTEXT_LOGGER)
+    context_filter = _ThreadFilter(threading.current_thread().name)
+    context_logger.addFilter(context_filter)
+    try:
+        # There is no session to take the data source from: use the warehouse only when it is configured
+        with use_data_source(warehouse_enabled(True)):
+            for name, step in WARMUP_STEPS:
+                started = time.time()
+                try:
+                    result = {'ok': True, 'detail': step()}
+                except Exception as e:
+                    print(f"Warm-up step {name} failed: {str(e)}")
+                    result = {'ok': False, 'detail': str(e)}
+                result['seconds'] = round(time.time() - started, 3)
+                with _status_lock:
+                    _status['steps'][name] = result
+                    if not result['ok']:
+                        _status['failed'].append(name)
+                publish_warmup_status()
+    finally:
+        context_logger.removeFilter(context_filter)
+        with _status_lock:
+            _status.update(ready=not _status['failed'], finished=True, running=False, finished_at=time.time())
+        publish_warmup_status()
+    return get_warmup_status()
+
+# Function to create the warm-up thread once per process
+@st.cache_resource(show_spinner=False)
+def _start_warmup_thread():
+    thread = threading.Thread(target=run_warmup, name="warmup", daemon=True)
+    thread.start()
+    return thread
+
+# Function to start the warm-up in the background from the first session
+def start_warmup():
+    """
+    Run run_warmup() on a daemon thread, at most once per process
+
+    Nothing is started when the process already warmed up (e.g. by
+    `warm_up.py --serve`) or when first-session warm-ups are disabled.
+    """
+    with _status_lock:
+        if not _first_session_warmup or _status['finished'] or _status['running']:
+            return None
+    return _start_warmup_thread()
+
+# Function to turn the first-session warm-up of this process on or off
+def set_first_session_warmup(enabled):
+    """Override WARMUP_ON_FIRST_SESSION, e.g. for processes that run the app only to render it"""
+    global _first_session_warmup
+    _first_session_warmup = enabled
+
+# Function to report the readiness of this process
+def get_warmup_status():
+    """Return whether the warm-up ran ('finished') and succeeded ('ready'), the steps that failed and the time and result of each step"""
+    with _status_lock:
+        return dict(_status, failed=list(_status['failed']), steps=dict(_status['steps']))
+
+# Function to check whether this process is warm
+def is_ready():
+    """Return True once the warm-up has run without a failed step"""
+    with _status_lock:
+        return _status['ready']
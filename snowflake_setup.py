@@ -4,6 +4,7 @@ from snowflake.connector import connect
 import sys
 import snowflake.connector.errors
 from snowflake.connector.pandas_tools import write_pandas
+from modules.column_schema import COMPILED_SCHEMAS, dataset_for_csv, to_snowflake_columns
 
 # Add your Snowflake credentials here or use environment variables
 SNOWFLAKE_ACCOUNT = os.environ.get("SNOWFLAKE_ACCOUNT", "SYVEUEV-DQ70641")
@@ -16,6 +17,9 @@ SNOWFLAKE_WAREHOUSE = os.environ.get("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH")
 DATABASE_NAME = "YOURSTORYHACKATHON"
 SCHEMA_NAME = "PUBLIC"
 
+# Tables created from the CSV files, taken from the shared dataset schema
+CSV_TABLES = [(schema.table, schema.csv_path) for schema in COMPILED_SCHEMAS.values()]
+
 def create_connection():
     """Create a connection to Snowflake"""
     try:
@@ -62,135 +66,15 @@ def standardize_column_names(df, csv_path):
     Standardize column names for consistency between local files and Snowflake
     
     This function ensures that column names follow a consistent convention:
-    1. Replace problematic characters like '/', '(', ')', etc.
-    2. Handle special cases like 'Religion/Type' which becomes 'RELIGION_TYPE' in Snowflake
-    3. Add missing columns needed by the application
+    1. Rename columns with the rename tables compiled in modules/column_schema.py
+       (e.g. 'Religion/Type' becomes 'RELIGION_TYPE' in Snowflake)
+    2. Add missing columns needed by the application
     """
     # Make a copy to avoid modifying the original
     df_copy = df.copy()
     
-    # Define comprehensive column mappings for different data types
-    column_mappings = {
-        # Economic data column mapping
-        'economic': {
-            'Year': 'YEAR',
-            'GDP (billion USD)': 'GDP_BILLION_USD',
-            'GDP Growth Rate (%)': 'GDP_GROWTH_RATE_PCT',
-            'Per Capita Income (USD)': 'PER_CAPITA_INCOME_USD',
-            'Agriculture': 'AGRICULTURE',
-            'Industry': 'INDUSTRY',
-            'Services': 'SERVICES',
-            'Exports (billion USD)': 'EXPORTS_BILLION_USD',
-            'Imports (billion USD)': 'IMPORTS_BILLION_USD',
-            'Unemployment Rate (%)': 'UNEMPLOYMENT_RATE_PCT'
-        },
-        
-        # Education data column mapping
-        'education': {
-            'Level': 'LEVEL',
-            'Enrollment (millions)': 'ENROLLMENT_MILLIONS',
-            'Male (%)': 'MALE_PCT',
-            'Female (%)': 'FEMALE_PCT',
-            'Literacy Rate (%)': 'LITERACY_RATE_PCT',
-            'National Literacy Rate (%)': 'NATIONAL_LITERACY_RATE_PCT',
-            'Primary Enrollment Rate (%)': 'PRIMARY_ENROLLMENT_RATE_PCT',
-            'Institutions': 'INSTITUTIONS',
-            'State Names': 'STATE_NAMES',
-            'State Literacy Rates (%)': 'STATE_LITERACY_RATES_PCT',
-            'State Primary Enrollment (%)': 'STATE_PRIMARY_ENROLLMENT_PCT',
-            'State Secondary Enrollment (%)': 'STATE_SECONDARY_ENROLLMENT_PCT',
-            'State Higher Ed Enrollment (%)': 'STATE_HIGHER_ED_ENROLLMENT_PCT',
-            'Male Literacy (%)': 'MALE_LITERACY_PCT',
-            'Female Literacy (%)': 'FEMALE_LITERACY_PCT',
-            'Literacy Gap': 'LITERACY_GAP',
-            'Number of Primary Schools': 'NUMBER_OF_PRIMARY_SCHOOLS',
-            'Number of Secondary Schools': 'NUMBER_OF_SECONDARY_SCHOOLS',
-            'Number of Colleges': 'NUMBER_OF_COLLEGES',
-            'Number of Universities': 'NUMBER_OF_UNIVERSITIES',
-            'Number of Technical Institutions': 'NUMBER_OF_TECHNICAL_INSTITUTIONS',
-            'Higher Education Enrollment (millions)': 'HIGHER_EDUCATION_ENROLLMENT_MILLIONS',
-            'PISA Score': 'PISA_SCORE',
-            'Global Rank': 'GLOBAL_RANK',
-            'University Ranking': 'UNIVERSITY_RANKING',
-            'Teacher-Student Ratio Primary': 'TEACHER_STUDENT_RATIO_PRIMARY',
-            'Teacher-Student Ratio Secondary': 'TEACHER_STUDENT_RATIO_SECONDARY',
-            'Teacher-Student Ratio Higher Ed': 'TEACHER_STUDENT_RATIO_HIGHER_ED',
-            'Gender Parity Primary': 'GENDER_PARITY_PRIMARY',
-            'Gender Parity Secondary': 'GENDER_PARITY_SECONDARY',
-            'Gender Parity Higher Ed': 'GENDER_PARITY_HIGHER_ED',
-            'Literacy Rate Years': 'LITERACY_RATE_YEARS',
-            'Literacy Rate History': 'LITERACY_RATE_HISTORY'
-        },
-        
-        # Festival data column mapping
-        'festivals': {
-            'Festival': 'FESTIVAL',
-            'Religion/Type': 'RELIGION_TYPE',
-            'Primary States': 'PRIMARY_STATES',
-            'Month': 'MONTH',
-            'Season': 'SEASON',
-            'Description': 'DESCRIPTION',
-            'Cultural Significance': 'CULTURAL_SIGNIFICANCE',
-            'Regional Variations': 'REGIONAL_VARIATIONS',
-            'Global Celebrations': 'GLOBAL_CELEBRATIONS',
-            'Participants (millions)': 'PARTICIPANTS_MILLIONS',
-            'Economic Impact (Millions USD)': 'ECONOMIC_IMPACT_MILLIONS_USD',
-            'Economic Impact (USD millions)': 'ECONOMIC_IMPACT_MILLIONS_USD',
-            'Tourist Attraction Level': 'TOURIST_ATTRACTION_LEVEL',
-            'Environmental Impact': 'ENVIRONMENTAL_IMPACT',
-            'Duration (days)': 'DURATION_DAYS'
-        },
-        
-        # Historical timeline data column mapping
-        'historical': {
-            'Period': 'PERIOD',
-            'Start Year': 'START_YEAR',
-            'End Year': 'END_YEAR',
-            'Era': 'ERA',
-            'Major Events': 'MAJOR_EVENTS',
-            'Significance': 'SIGNIFICANCE',
-            'Time Period': 'TIME_PERIOD',
-            'Cultural Developments': 'CULTURAL_DEVELOPMENTS',
-            'Religious Trends': 'RELIGIOUS_TRENDS',
-            'Art & Architecture': 'ART_ARCHITECTURE',
-            'Economic Systems': 'ECONOMIC_SYSTEMS',
-            'Scientific Advances': 'SCIENTIFIC_ADVANCES',
-            'Historical Legacy': 'HISTORICAL_LEGACY'
-        }
-    }
-    
-    # Determine which mapping to use based on file path
-    data_type = None
-    if 'economic_data.csv' in csv_path.lower() or 'economic_sectors.csv' in csv_path.lower():
-        data_type = 'economic'
-    elif 'education.csv' in csv_path.lower():
-        data_type = 'education'
-    elif 'festivals.csv' in csv_path.lower():
-        data_type = 'festivals'
-    elif 'historical_timeline.csv' in csv_path.lower():
-        data_type = 'historical'
-    
-    # Apply specific mapping if available
-    if data_type and data_type in column_mappings:
-        mapping = column_mappings[data_type]
-        rename_cols = {}
-        
-        for app_col, snowflake_col in mapping.items():
-            if app_col in df_copy.columns:
-                rename_cols[app_col] = snowflake_col
-        
-        if rename_cols:
-            df_copy = df_copy.rename(columns=rename_cols)
-    else:
-        # Default transformation for other files
-        clean_columns = []
-        for col in df_copy.columns:
-            # Clean and uppercase the column name
-            col_name = col.upper().replace(" ", "_").replace("(", "").replace(")", "").replace("%", "PCT")
-            col_name = col_name.replace("/", "_").replace(",", "_").replace("-", "_")
-            clean_columns.append(col_name)
-        
-        df_copy.columns = clean_columns
+    # Rename through the shared schema (one dictionary application per file)
+    df_copy = to_snowflake_columns(df_copy, dataset_for_csv(csv_path))
     
     # Add special columns based on file type
     if 'states.csv' in csv_path.lower():
@@ -299,21 +183,6 @@ def create_tables(conn):
     try:
         cursor = conn.cursor()
         
-        # List of CSV files and their table names
-        csv_tables = [
-            ("LANGUAGES", "data/languages.csv"),
-            ("RELIGIONS", "data/religions.csv"),
-            ("STATES", "data/states.csv"),
-            ("CULTURAL_HERITAGE", "data/cultural_heritage.csv"),
-            ("POPULATION_GROWTH", "data/population_growth.csv"),
-            ("ECONOMIC_SECTORS", "data/economic_sectors.csv"),
-            ("HISTORICAL_TIMELINE", "data/historical_timeline.csv"),
-            ("FESTIVALS", "data/festivals.csv"),
-            ("TOURISM", "data/tourism.csv"),
-            ("EDUCATION", "data/education.csv"),
-            ("GEOGRAPHY", "data/geography.csv")
-        ]
-        
         # Create image table for storing images
         cursor.execute("""
         CREATE TABLE IF NOT EXISTS IMAGES (
@@ -327,7 +196,7 @@ def create_tables(conn):
         """)
         print("✅ IMAGES table created or already exists")
         
-        for table_name, csv_path in csv_tables:
+        for table_name, csv_path in CSV_TABLES:
             # Read CSV to get column names and types
             try:
                 df = pd.read_csv(csv_path)
@@ -340,15 +209,11 @@ def create_tables(conn):
                 
                 # Add columns with appropriate types
                 columns = []
-                for col in df.columns:
-                    # Clean and uppercase the column name
-                    col_name = col.upper().replace(" ", "_").replace("(", "").replace(")", "").replace("%", "PCT")
-                    col_name = col_name.replace("/", "_").replace(",", "_").replace("-", "_")
-                    
+                for col_name in df.columns:
                     # Determine column type based on data
-                    if df[col].dtype == 'int64':
+                    if df[col_name].dtype == 'int64':
                         col_type = "NUMBER"
-                    elif df[col].dtype == 'float64':
+                    elif df[col_name].dtype == 'float64':
                         col_type = "FLOAT"
                     else:
                         col_type = "VARCHAR(1000)"
@@ -374,24 +239,9 @@ def create_tables(conn):
 def upload_csv_data(conn):
     """Upload CSV data to Snowflake tables"""
     try:
-        # List of CSV files and their table names
-        csv_tables = [
-            ("LANGUAGES", "data/languages.csv"),
-            ("RELIGIONS", "data/religions.csv"),
-            ("STATES", "data/states.csv"),
-            ("CULTURAL_HERITAGE", "data/cultural_heritage.csv"),
-            ("POPULATION_GROWTH", "data/population_growth.csv"),
-            ("ECONOMIC_SECTORS", "data/economic_sectors.csv"),
-            ("HISTORICAL_TIMELINE", "data/historical_timeline.csv"),
-            ("FESTIVALS", "data/festivals.csv"),
-            ("TOURISM", "data/tourism.csv"),
-            ("EDUCATION", "data/education.csv"),
-            ("GEOGRAPHY", "data/geography.csv")
-        ]
-        
         cursor = conn.cursor()
         
-        for table_name, csv_path in csv_tables:
+        for table_name, csv_path in CSV_TABLES:
             try:
                 # First, truncate the table to avoid duplicates
                 cursor.execute(f"TRUNCATE TABLE IF EXISTS {table_name}")
@@ -402,9 +252,6 @@ def upload_csv_data(conn):
                 # Standardize column names and add missing columns
                 df = standardize_column_names(df, csv_path)
                 
-                # Clean column names - must match exactly what was done in create_tables
-                df.columns = [col.upper().replace(" ", "_").replace("(", "").replace(")", "").replace("%", "PCT").replace("/", "_").replace(",", "_").replace("-", "_") for col in df.columns]
-                
                 # Write data to Snowflake
                 success, num_chunks, num_rows, output = write_pandas(
                     conn=conn,
@@ -0,0 +1,51 @@
+import sys
+import time
+import argparse
+import threading
+
+# Function to wait for the Streamlit runtime and warm it from a background thread
+def _warm_when_started(timeout=120):
+    from streamlit import runtime
+    from modules.warmup import run_warmup
+
+    deadline = time.time() + timeout
+    while not runtime.exists():
+        if time.time() > deadline:
+            print("❌ Streamlit did not start; warm-up skipped")
+            return
+        time.sleep(0.1)
+    status = run_warmup()
+    failed = f" ({', '.join(status['failed'])} failed)" if status['failed'] else ""
+    print(f"✅ Warm-up finished in {status['finished_at'] - status['started_at']:.2f}s{failed}")
+
+def main():
+    """Warm the app's caches, or start the server and warm it before visitors arrive"""
+    parser = argparse.ArgumentParser(
+        description="Warm the Incredible India caches. With --serve, start Streamlit and warm the server process itself."
+    )
+    parser.add_argument("--serve", action="store_true",
+                        help="Run `streamlit run app.py` in this process and warm it as soon as the server starts")
+    parser.add_argument("--strict", action="store_true", help="Exit with status 1 when a warm-up step fails")
+    args, streamlit_args = parser.parse_known_args()
+
+    if args.serve:
+        from streamlit.web import cli
+
+        # The server reports "not ready" at /app/static/warmup-<port>.json until the warm-up succeeds
+        threading.Thread(target=_warm_when_started, name="warmup", daemon=True).start()
+        sys.argv = ["streamlit", "run", "app.py"] + streamlit_args
+        sys.exit(cli.main())
+
+    from modules.warmup import WARMUP_STEPS, run_warmup
+
+    print("🔥 Warming caches...")
+    status = run_warmup()
+    for name, _ in WARMUP_STEPS:
+        step = status['steps'][name]
+        print(f"{'✅' if step['ok'] else '❌'} {name}: {step['detail']} ({step['seconds']:.2f}s)")
+    print(f"Finished in {status['finished_at'] - status['started_at']:.2f}s")
+    if status['failed'] and args.strict:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()